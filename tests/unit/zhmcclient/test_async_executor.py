@@ -0,0 +1,214 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _async_executor module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import sys
+import warnings
+import pytest
+
+import zhmcclient
+from zhmcclient_mock import FakedSession
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 5),
+    reason="AsyncExecutorSession requires Python 3.5 or higher")
+
+if sys.version_info >= (3, 5):
+    import asyncio  # pylint: disable=import-error
+
+
+CPC_NAME = 'fake-cpc1-name'
+PART_NAMES = ['part-{}'.format(i) for i in range(1, 6)]
+
+
+class TestAsyncExecutorSession(object):
+    """All tests for AsyncExecutorSession and AsyncExecutorClient."""
+
+    def setup_method(self):
+        """
+        Setup that is called by pytest before each test method.
+
+        Set up a faked session with a CPC in DPM mode that has some
+        partitions, and an event loop.
+        """
+        # pylint: disable=attribute-defined-outside-init
+
+        self.session = FakedSession('fake-host', 'fake-hmc', '2.13.1', '1.8')
+        self.faked_cpc = self.session.hmc.cpcs.add({
+            'object-id': 'fake-cpc1-oid',
+            'parent': None,
+            'class': 'cpc',
+            'name': CPC_NAME,
+            'description': 'CPC #1 (DPM mode)',
+            'status': 'active',
+            'dpm-enabled': True,
+            'is-ensemble-member': False,
+            'iml-mode': 'dpm',
+        })
+        for name in PART_NAMES:
+            self.faked_cpc.partitions.add({
+                'object-id': '{}-oid'.format(name),
+                'parent': self.faked_cpc.uri,
+                'class': 'partition',
+                'name': name,
+                'description': 'Partition {}'.format(name),
+                'status': 'active',
+                'type': 'linux',
+                'ifl-processors': 2,
+                'initial-memory': 4096,
+                'maximum-memory': 8192,
+            })
+
+        self.asession = zhmcclient.AsyncExecutorSession(
+            self.session, max_workers=4)
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def teardown_method(self):
+        """
+        Teardown that is called by pytest after each test method.
+        """
+        self.asession.close()
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def run(self, awaitable):
+        """Run an awaitable to completion and return its result."""
+        return self.loop.run_until_complete(awaitable)
+
+    def test_asession_initial_attrs(self):
+        """Test initial attributes of AsyncExecutorSession."""
+
+        assert self.asession.session is self.session
+        assert self.asession.max_workers == 4
+        assert self.asession.retry_timeout_config is \
+            self.session.retry_timeout_config
+        assert self.asession.time_stats_keeper is \
+            self.session.time_stats_keeper
+        assert 'AsyncExecutorSession' in repr(self.asession)
+
+    def test_asession_get(self):
+        """Test AsyncExecutorSession.get()."""
+
+        result = self.run(self.asession.get(self.faked_cpc.uri))
+
+        assert result['name'] == CPC_NAME
+
+    def test_asession_get_concurrent(self):
+        """Test concurrent AsyncExecutorSession.get() calls, in order."""
+
+        uris = ['{}-oid'.format(n) for n in PART_NAMES]
+        uris = ['/api/partitions/{}'.format(oid) for oid in uris]
+
+        results = self.run(asyncio.gather(
+            *[self.asession.get(uri) for uri in uris]))
+
+        assert [r['name'] for r in results] == PART_NAMES
+
+    def test_asession_get_error(self):
+        """Test AsyncExecutorSession.get() for a non-existing resource."""
+
+        with pytest.raises(zhmcclient.HTTPError) as exc_info:
+            self.run(self.asession.get('/api/partitions/invalid-oid'))
+
+        assert exc_info.value.http_status == 404
+
+    def test_asession_run(self):
+        """Test AsyncExecutorSession.run() with a synchronous method."""
+
+        client = zhmcclient.Client(self.session)
+
+        cpcs = self.run(self.asession.run(client.cpcs.list))
+
+        assert [cpc.name for cpc in cpcs] == [CPC_NAME]
+
+    def test_asession_no_current_loop(self):
+        """Test AsyncExecutorSession without a current event loop."""
+
+        asyncio.set_event_loop(None)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+
+            # Creating the coroutine does not need an event loop
+            coro = self.asession.get(self.faked_cpc.uri)
+            result = self.run(coro)
+
+        assert result['name'] == CPC_NAME
+
+    def test_asession_context_manager(self):
+        """Test AsyncExecutorSession as a context manager."""
+
+        with zhmcclient.AsyncExecutorSession(self.session) as asession:
+            result = self.run(asession.get(self.faked_cpc.uri))
+
+        assert result['name'] == CPC_NAME
+
+    def test_aclient_list_find(self):
+        """Test AsyncExecutorClient.list() and AsyncExecutorClient.find()."""
+
+        aclient = zhmcclient.AsyncExecutorClient(self.asession)
+        assert aclient.executor_session is self.asession
+
+        cpcs = self.run(aclient.list(aclient.client.cpcs))
+        assert len(cpcs) == 1
+        cpc = cpcs[0]
+
+        partitions = self.run(aclient.list(cpc.partitions))
+        assert sorted(p.name for p in partitions) == PART_NAMES
+
+        partition = self.run(aclient.find(cpc.partitions, name='part-2'))
+        assert partition.name == 'part-2'
+
+        partitions = self.run(
+            aclient.findall(cpc.partitions, name='part-.*', status='active'))
+        assert len(partitions) == len(PART_NAMES)
+
+    def test_aclient_find_not_found(self):
+        """Test AsyncExecutorClient.find() for a non-existing resource."""
+
+        aclient = zhmcclient.AsyncExecutorClient(self.asession)
+        cpc = self.run(aclient.find(aclient.client.cpcs, name=CPC_NAME))
+
+        with pytest.raises(zhmcclient.NotFound):
+            self.run(aclient.find(cpc.partitions, name='foo'))
+
+    def test_aclient_pull_full_properties(self):
+        """Test concurrent AsyncExecutorClient.pull_full_properties() calls."""
+
+        aclient = zhmcclient.AsyncExecutorClient(self.asession)
+        cpc = self.run(aclient.find(aclient.client.cpcs, name=CPC_NAME))
+        partitions = self.run(aclient.list(cpc.partitions))
+        assert not any(p.full_properties for p in partitions)
+
+        self.run(asyncio.gather(
+            *[aclient.pull_full_properties(p) for p in partitions]))
+
+        assert all(p.full_properties for p in partitions)
+        for p in partitions:
+            assert p.properties['initial-memory'] == 4096
+
+    def test_aclient_query_api_version(self):
+        """Test AsyncExecutorClient.query_api_version()."""
+
+        aclient = zhmcclient.AsyncExecutorClient(self.asession)
+
+        version = self.run(aclient.query_api_version())
+
+        assert version['api-major-version'] == 1
+        assert version['api-minor-version'] == 8
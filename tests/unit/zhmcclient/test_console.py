@@ -254,6 +254,28 @@ class TestConsole(object):
 
         # TODO: Verify log items once mocked security log is supported
 
+    def test_console_iter_audit_log(self):
+        """Test Console.iter_audit_log()."""
+
+        console_mgr = self.client.consoles
+        console = console_mgr.find(name=self.faked_console.name)
+
+        # Execute the code to be tested.
+        log_items = list(console.iter_audit_log())
+
+        assert log_items == []
+
+    def test_console_iter_security_log(self):
+        """Test Console.iter_security_log()."""
+
+        console_mgr = self.client.consoles
+        console = console_mgr.find(name=self.faked_console.name)
+
+        # Execute the code to be tested.
+        log_items = list(console.iter_security_log())
+
+        assert log_items == []
+
     @pytest.mark.parametrize(
         "name, exp_cpc_names, prop_names", [
             (None,
@@ -0,0 +1,148 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _federated_client module of the zhmcclient package.
+"""
+
+from __future__ import absolute_import, print_function
+
+import time
+import threading
+import pytest
+
+from zhmcclient import FederatedClient, FederatedResult, Client, \
+    OperationTimeout, HTTPError
+from zhmcclient_mock import FakedSession
+
+HOSTS = ['hmc1', 'hmc2', 'hmc3']
+
+
+def make_clients():
+    """
+    Return clients for faked HMCs in HOSTS, each managing one CPC named
+    after the HMC.
+    """
+    clients = []
+    for host in HOSTS:
+        session = FakedSession(host, 'fake-hmc', '2.13.1', '1.8')
+        session.hmc.cpcs.add({
+            'object-id': 'cpc-{}'.format(host),
+            'parent': None,
+            'class': 'cpc',
+            'name': 'CPC-{}'.format(host),
+            'dpm-enabled': True,
+        })
+        clients.append(Client(session))
+    return clients
+
+
+def test_federated_client_init():
+    """
+    Test the initialization of FederatedClient.
+    """
+    clients = make_clients()
+    fed_client = FederatedClient(clients, timeout=10)
+
+    assert fed_client.clients == clients
+    assert fed_client.hosts == HOSTS
+    assert fed_client.timeout == 10
+    assert repr(fed_client).startswith('FederatedClient(')
+
+    with pytest.raises(ValueError):
+        FederatedClient(clients + clients[:1])
+
+
+@pytest.mark.parametrize(
+    "max_workers", [None, 1, 2]
+)
+def test_federated_client_list_cpcs(max_workers):
+    """
+    Test listing the CPCs of multiple HMCs.
+    """
+    fed_client = FederatedClient(make_clients(), max_workers=max_workers)
+
+    # The code to be tested
+    result = fed_client.list_cpcs()
+
+    assert isinstance(result, FederatedResult)
+    assert result.hosts == HOSTS
+    assert result.errors == {}
+    assert sorted(result.results) == HOSTS
+    assert [(host, cpc.name) for host, cpc in result.items()] == \
+        [(host, 'CPC-{}'.format(host)) for host in HOSTS]
+
+
+def test_federated_client_errors():
+    """
+    Test that failed and timed out queries are reported per HMC, without
+    waiting for the timed out query.
+    """
+    fed_client = FederatedClient(make_clients(), timeout=0.2)
+    release = threading.Event()
+
+    def query(client):
+        """Query that fails on hmc2 and hangs on hmc3."""
+        host = client.session.host
+        if host == 'hmc2':
+            raise HTTPError({'http-status': 500, 'reason': 1,
+                             'message': 'failed'})
+        if host == 'hmc3':
+            release.wait(10)
+        return [host]
+
+    start_time = time.time()
+
+    # The code to be tested
+    result = fed_client.map(query)
+
+    duration = time.time() - start_time
+    release.set()
+    assert duration < 5
+    assert result.items() == [('hmc1', 'hmc1')]
+    assert isinstance(result.errors['hmc2'], HTTPError)
+    assert isinstance(result.errors['hmc3'], OperationTimeout)
+    assert result.errors['hmc3'].operation_timeout == 0.2
+
+
+def test_federated_client_queued_timeout():
+    """
+    Test that queries waiting for a worker thread time out and are not
+    started, when the worker threads are blocked by a slow HMC.
+    """
+    fed_client = FederatedClient(make_clients(), max_workers=1, timeout=0.2)
+    release = threading.Event()
+    started_hosts = []
+
+    def query(client):
+        """Query that hangs on hmc1."""
+        host = client.session.host
+        started_hosts.append(host)
+        if host == 'hmc1':
+            release.wait(10)
+        return [host]
+
+    start_time = time.time()
+
+    # The code to be tested
+    result = fed_client.map(query)
+
+    duration = time.time() - start_time
+    release.set()
+    assert duration < 5
+    assert result.results == {}
+    assert sorted(result.errors) == HOSTS
+    for exc in result.errors.values():
+        assert isinstance(exc, OperationTimeout)
+    assert started_hosts == ['hmc1']
@@ -0,0 +1,185 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _job_updater module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import time
+import requests_mock
+from mock import patch
+
+from zhmcclient import Session, Job, RetryTimeoutConfig
+
+from .test_notification import MockedStompConnection
+from .test_session import mock_server_1
+
+JOB_URI = '/api/jobs/fake-job-uri'
+
+
+def job_completion_headers(job_uri):
+    """Return the JMS headers of a job completion notification."""
+    return {
+        'notification-type': 'job-completion',
+        'job-uri': job_uri,
+    }
+
+
+class TestJobUpdater(object):
+    """
+    Test the JobUpdater class and its use by Session and Job.
+    """
+
+    @patch(target='stomp.Connection', new=MockedStompConnection)
+    def test_job_updater_wait_for_job(self):
+        """Test JobUpdater.wait_for_job()."""
+
+        with requests_mock.mock() as m:
+            mock_server_1(m)
+            session = Session('fake-host', 'fake-user', 'fake-pw')
+            assert not session.job_updates_subscribed()
+
+            session.subscribe_job_updates()
+
+            assert session.job_updates_subscribed()
+            updater = session.job_updater
+            stomp_conn = updater._conn  # pylint: disable=protected-access
+            # pylint: disable=no-member
+            assert stomp_conn._subscriptions[0][0] == \
+                '/topic/test-job-topic.1'
+
+            stomp_conn.mock_add_message(
+                job_completion_headers(JOB_URI), '{}')
+            stomp_conn.mock_add_message(
+                {'notification-type': 'job-completion'}, '{}')
+            stomp_conn.mock_add_message(
+                {'notification-type': 'foo', 'job-uri': '/api/jobs/foo'},
+                '{}')
+            stomp_conn.mock_start()
+
+            assert updater.wait_for_job(JOB_URI, 5) is True
+
+            start_time = time.time()
+            assert updater.wait_for_job('/api/jobs/foo', 0.5) is False
+            assert time.time() - start_time >= 0.4
+
+            updater.forget_job(JOB_URI)
+            assert updater.wait_for_job(JOB_URI, 0.1) is False
+
+            session.unsubscribe_job_updates()
+
+            assert not session.job_updates_subscribed()
+            assert session.job_updater is None
+
+    @patch(target='stomp.Connection', new=MockedStompConnection)
+    def test_job_wait_for_completion_notified(self):
+        """Test Job.wait_for_completion() with a job completion
+        notification that arrives before the next poll."""
+
+        with requests_mock.mock() as m:
+            mock_server_1(m)
+            rt_config = RetryTimeoutConfig(
+                poll_min_interval=10, poll_max_interval=10)
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              retry_timeout_config=rt_config)
+            session.subscribe_job_updates()
+            job = Job(session, JOB_URI, 'POST', '/api/foo')
+            exp_op_result = {'foo': 'bar'}
+            m.get(JOB_URI,
+                  [
+                      {'json': {'status': 'running'}},
+                      {'json': {'status': 'complete',
+                                'job-status-code': 200,
+                                'job-results': exp_op_result}},
+                  ])
+            m.delete(JOB_URI, status_code=204)
+
+            # pylint: disable=no-member
+            stomp_conn = session.job_updater._conn
+            stomp_conn.mock_add_message(
+                job_completion_headers(JOB_URI), '{}')
+            stomp_conn.mock_start()
+
+            start_time = time.time()
+            op_result = job.wait_for_completion()
+            duration = time.time() - start_time
+
+            assert op_result == exp_op_result
+            assert duration < 5
+
+            session.unsubscribe_job_updates()
+
+    @patch(target='stomp.Connection', new=MockedStompConnection)
+    def test_job_wait_for_completion_notified_running(self):
+        """Test Job.wait_for_completion() with a job completion
+        notification that arrives while the job status is not yet
+        'complete'."""
+
+        with requests_mock.mock() as m:
+            mock_server_1(m)
+            rt_config = RetryTimeoutConfig(
+                poll_min_interval=0.3, poll_max_interval=0.3)
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              retry_timeout_config=rt_config)
+            session.subscribe_job_updates()
+            job = Job(session, JOB_URI, 'POST', '/api/foo')
+            responses = [{'json': {'status': 'running'}}] * 3
+            responses.append(
+                {'json': {'status': 'complete', 'job-status-code': 204}})
+            get_mock = m.get(JOB_URI, responses)
+            m.delete(JOB_URI, status_code=204)
+
+            # pylint: disable=no-member
+            stomp_conn = session.job_updater._conn
+            stomp_conn.mock_add_message(
+                job_completion_headers(JOB_URI), '{}')
+            stomp_conn.mock_start()
+
+            start_time = time.time()
+            op_result = job.wait_for_completion()
+            duration = time.time() - start_time
+
+            assert op_result is None
+            assert get_mock.call_count == 4
+            # The notification shortens at most one poll interval
+            assert duration >= 0.5
+
+            session.unsubscribe_job_updates()
+
+
+def test_job_wait_for_completion_backoff():
+    """Test the poll intervals of Job.wait_for_completion() when not
+    subscribed for job updates."""
+
+    with requests_mock.mock() as m:
+        mock_server_1(m)
+        rt_config = RetryTimeoutConfig(
+            poll_min_interval=0.1, poll_max_interval=0.3)
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          retry_timeout_config=rt_config)
+        job = Job(session, JOB_URI, 'POST', '/api/foo')
+        responses = [{'json': {'status': 'running'}}] * 4
+        responses.append(
+            {'json': {'status': 'complete', 'job-status-code': 204}})
+        m.get(JOB_URI, responses)
+        m.delete(JOB_URI, status_code=204)
+
+        with patch('time.sleep') as sleep_mock:
+            op_result = job.wait_for_completion()
+
+        assert op_result is None
+        intervals = [c[0][0] for c in sleep_mock.call_args_list]
+        assert intervals == [0.1, 0.2, 0.3, 0.3]
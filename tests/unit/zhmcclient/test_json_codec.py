@@ -0,0 +1,118 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _json_codec module of the zhmcclient package.
+"""
+
+from __future__ import absolute_import, print_function
+
+import json
+import pytest
+
+from zhmcclient import JsonCodec, get_json_codec
+
+# Packages of the optional JSON codecs, by codec name
+CODEC_PACKAGES = {
+    'json': 'json',
+    'orjson': 'orjson',
+    'ujson': 'ujson',
+    'simdjson': 'simdjson',
+}
+
+JSON_OBJ = {
+    'name': u'part-é',
+    'object-uri': '/api/partitions/fake-oid',
+    'ifl-processors': 2,
+    'initial-memory': 4096.5,
+    'autogenerate-partition-id': True,
+    'boot-device': None,
+    'nic-uris': ['/api/partitions/fake-oid/nics/1'],
+    'nested': {'a': [1, {'b': False}]},
+}
+
+
+@pytest.mark.parametrize(
+    "name", sorted(CODEC_PACKAGES)
+)
+def test_json_codec_roundtrip(name):
+    """Test loads() and dumps() of the JSON codecs."""
+    pytest.importorskip(CODEC_PACKAGES[name])
+
+    # The function to be tested
+    codec = get_json_codec(name)
+
+    assert isinstance(codec, JsonCodec)
+    assert codec.name == name
+    assert name in repr(codec)
+
+    # The functions to be tested
+    json_str = codec.dumps(JSON_OBJ)
+    obj_from_str = codec.loads(json_str)
+    obj_from_bytes = codec.loads(json_str.encode('utf-8'))
+
+    assert json.loads(json_str) == JSON_OBJ
+    assert obj_from_str == JSON_OBJ
+    assert obj_from_bytes == JSON_OBJ
+
+
+@pytest.mark.parametrize(
+    "name", sorted(CODEC_PACKAGES)
+)
+def test_json_codec_loads_error(name):
+    """Test loads() of the JSON codecs with invalid JSON."""
+    pytest.importorskip(CODEC_PACKAGES[name])
+    codec = get_json_codec(name)
+
+    with pytest.raises(ValueError):
+
+        # The function to be tested
+        codec.loads('{"name": ')
+
+
+def test_json_codec_default():
+    """Test the default JSON codec."""
+
+    # The functions to be tested
+    codec = get_json_codec()
+    obj = codec.loads('{"b": 1, "a": 2}')
+
+    assert type(codec) is JsonCodec  # pylint: disable=unidiomatic-typecheck
+    assert list(obj.keys()) == ['b', 'a']
+
+
+def test_json_codec_auto():
+    """Test the 'auto' JSON codec name."""
+
+    # The function to be tested
+    codec = get_json_codec('auto')
+
+    for name in ('orjson', 'ujson', 'simdjson'):
+        try:
+            __import__(CODEC_PACKAGES[name])
+        except ImportError:
+            continue
+        assert codec.name == name
+        break
+    else:
+        assert codec.name == 'json'
+
+
+def test_json_codec_invalid():
+    """Test get_json_codec() with an invalid codec name."""
+
+    with pytest.raises(ValueError):
+
+        # The function to be tested
+        get_json_codec('foo')
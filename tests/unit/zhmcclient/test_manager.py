@@ -477,6 +477,35 @@ class TestManager2(object):
         assert resource.uri == self.resource2.uri
         assert resource.name == self.resource2.name
 
+    def test_find_many_by_name(self):
+        """Test BaseManager.find_many_by_name() with existing and
+        non-existing names, and that at most one list() is performed."""
+        names = [self.resource1.name, "not-exists-1", self.resource2.name,
+                 "not-exists-2"]
+
+        resources, not_found = self.manager.find_many_by_name(names)
+
+        assert self.manager._list_called == 1
+        assert sorted(resources) == [self.resource1.name, self.resource2.name]
+        assert resources[self.resource1.name].uri == self.resource1.uri
+        assert resources[self.resource2.name].uri == self.resource2.uri
+        assert not_found == {"not-exists-1", "not-exists-2"}
+
+        # All existing names are cached now
+        resources, not_found = self.manager.find_many_by_name(
+            [self.resource2.name])
+
+        assert self.manager._list_called == 1
+        assert resources[self.resource2.name].uri == self.resource2.uri
+        assert not_found == set()
+
+        # Empty list of names
+        resources, not_found = self.manager.find_many_by_name([])
+
+        assert self.manager._list_called == 1
+        assert resources == {}
+        assert not_found == set()
+
 
 class TestNameUriCache(object):
     """All tests for the _NameUriCache class."""
@@ -19,9 +19,14 @@ Unit tests for _metrics module.
 from __future__ import absolute_import, print_function
 
 import re
+from array import array
+import mock
+import six
 import pytest
 
-from zhmcclient import Client, MetricsContext, HTTPError, NotFound
+from zhmcclient import Client, MetricsContext, HTTPError, NotFound, \
+    MetricsResponse, ColumnarMetricsResponse, MetricGroupDefinition, \
+    MetricDefinition, datetime_from_timestamp
 from zhmcclient_mock import FakedSession
 from tests.common.utils import assert_resources
 
@@ -355,3 +360,195 @@ class TestMetricsContext(object):
             # Check that the metrics context no longer exists
             with pytest.raises(NotFound) as exc_info:
                 metricscontext_mgr.find(name=faked_metricscontext.name)
+
+
+# Metric group definitions and metrics response string for the tests of
+# metrics responses
+MR_MG_DEFS = {
+    'partition-usage': MetricGroupDefinition(
+        'partition-usage', 'partition', {
+            'processor-usage': MetricDefinition(0, 'processor-usage', int,
+                                                '%'),
+            'ratio': MetricDefinition(1, 'ratio', float, None),
+            'flag': MetricDefinition(2, 'flag', bool, None),
+            'text': MetricDefinition(3, 'text', six.text_type, None),
+        }),
+    'dpm-system-usage-overview': MetricGroupDefinition(
+        'dpm-system-usage-overview', 'cpc', {
+            'processor-usage': MetricDefinition(0, 'processor-usage', int,
+                                                '%'),
+        }),
+}
+MR_STR = (
+    '"partition-usage"\n'
+    '"/api/partitions/p1"\n'
+    '1680000000000\n'
+    '10,1.5,true,"abc"\n'
+    '\n'
+    '"/api/partitions/p2"\n'
+    '1680000001000\n'
+    '20,2.5,false,"x\\u00e9"\n'
+    '\n'
+    '"/api/partitions/p1"\n'
+    '1680000015000\n'
+    '11,-1.0,TRUE,""\n'
+    '\n'
+    '\n'
+    '"dpm-system-usage-overview"\n'
+    '\n'
+    '\n'
+)
+
+
+def mr_metrics_context():
+    """
+    Return a metrics context for the tests of metrics responses.
+    """
+    return mock.Mock(metric_group_definitions=MR_MG_DEFS)
+
+
+def test_columnar_metrics_response():
+    """
+    Test ColumnarMetricsResponse with the array module, and compare its
+    values with those of MetricsResponse.
+    """
+    mr = MetricsResponse(mr_metrics_context(), MR_STR)
+
+    # The code to be tested
+    cmr = ColumnarMetricsResponse(mr_metrics_context(), MR_STR,
+                                  use_numpy=False)
+
+    assert cmr.use_numpy is False
+    assert [mgc.name for mgc in cmr.metric_group_columns] == \
+        ['partition-usage', 'dpm-system-usage-overview']
+    mgc = cmr.metric_group_columns[0]
+    assert len(mgc) == 3
+    assert mgc.resource_uris == ['/api/partitions/p1', '/api/partitions/p2']
+    assert list(mgc.row_uri_indexes) == [0, 1, 0]
+    assert list(mgc.timestamps) == \
+        [1680000000000, 1680000001000, 1680000015000]
+    assert mgc.rows('/api/partitions/p1') == [0, 2]
+    assert mgc.rows('/api/partitions/p3') == []
+    assert isinstance(mgc.columns['processor-usage'], array)
+    assert isinstance(mgc.columns['ratio'], array)
+    assert isinstance(mgc.columns['text'], list)
+
+    ovs = mr.metric_group_values[0].object_values
+    for i, ov in enumerate(ovs):
+        assert mgc.resource_uris[mgc.row_uri_indexes[i]] == ov.resource_uri
+        for m_name, value in ov.metrics.items():
+            assert mgc.columns[m_name][i] == value
+
+    empty_mgc = cmr.metric_group_columns[1]
+    assert len(empty_mgc) == 0
+    assert empty_mgc.resource_uris == []
+    assert list(empty_mgc.columns['processor-usage']) == []
+
+
+def test_columnar_metrics_response_numpy():
+    """
+    Test ColumnarMetricsResponse with NumPy.
+    """
+    numpy = pytest.importorskip('numpy')
+
+    # The code to be tested
+    cmr = ColumnarMetricsResponse(mr_metrics_context(), MR_STR)
+
+    assert cmr.use_numpy is True
+    mgc = cmr.metric_group_columns[0]
+    assert mgc.columns['processor-usage'].dtype == numpy.int64
+    assert mgc.columns['flag'].tolist() == [True, False, True]
+    assert mgc.timestamps.tolist() == \
+        [1680000000000, 1680000001000, 1680000015000]
+
+
+def test_columnar_metrics_response_error():
+    """
+    Test ColumnarMetricsResponse with an invalid metric value.
+    """
+    mr_str = MR_STR.replace('20,2.5,false', '20,2.5,maybe')
+
+    with pytest.raises(ValueError):
+        ColumnarMetricsResponse(mr_metrics_context(), mr_str, use_numpy=False)
+
+
+def test_metrics_response_lazy():
+    """
+    Test that MetricsResponse parses only the metric groups that are
+    accessed.
+    """
+    # An invalid metric value in the first metric group
+    mr_str = MR_STR.replace('20,2.5,false', '20,2.5,maybe')
+    mr_str = mr_str.replace(
+        '"dpm-system-usage-overview"\n\n',
+        '"dpm-system-usage-overview"\n"/api/cpcs/c1"\n1680000000000\n'
+        '42\n\n\n')
+
+    # The code to be tested
+    mr = MetricsResponse(mr_metrics_context(), mr_str)
+
+    assert mr.metric_group_names == \
+        ['partition-usage', 'dpm-system-usage-overview']
+    mgv = mr.get_metric_group_values('dpm-system-usage-overview')
+    assert mgv.name == 'dpm-system-usage-overview'
+    assert [(ov.resource_uri, ov.metrics) for ov in mgv.object_values] == \
+        [('/api/cpcs/c1', {'processor-usage': 42})]
+    assert mr.get_metric_group_values('dpm-system-usage-overview') is mgv
+    with pytest.raises(KeyError):
+        mr.get_metric_group_values('channel-usage')
+    with pytest.raises(ValueError):
+        mr.get_metric_group_values('partition-usage')
+    with pytest.raises(ValueError):
+        _ = mr.metric_group_values
+
+
+def test_metrics_response_iter_rows():
+    """
+    Test MetricsResponse.iter_rows().
+    """
+    mr = MetricsResponse(mr_metrics_context(), MR_STR)
+
+    # The code to be tested
+    rows = list(mr.iter_rows())
+
+    assert [(mg_name, uri, metrics['processor-usage'])
+            for mg_name, uri, _, metrics in rows] == [
+                ('partition-usage', '/api/partitions/p1', 10),
+                ('partition-usage', '/api/partitions/p2', 20),
+                ('partition-usage', '/api/partitions/p1', 11),
+    ]
+    assert rows[1][2] == datetime_from_timestamp(1680000001000)
+    assert rows[1][3] == \
+        {'processor-usage': 20, 'ratio': 2.5, 'flag': False, 'text': u'x\xe9'}
+    assert list(mr.iter_rows(['dpm-system-usage-overview', 'unknown'])) == []
+
+
+def test_metrics_response_iter_rows_no_objects():
+    """
+    Test that MetricsResponse.iter_rows() does not create
+    MetricGroupValues and MetricObjectValues objects.
+    """
+    mr = MetricsResponse(mr_metrics_context(), MR_STR)
+
+    with mock.patch('zhmcclient._metrics.MetricGroupValues') as mgv_mock, \
+            mock.patch('zhmcclient._metrics.MetricObjectValues') as ov_mock:
+
+        # The code to be tested
+        rows = list(mr.iter_rows())
+
+    assert len(rows) == 3
+    assert mgv_mock.call_count == 0
+    assert ov_mock.call_count == 0
+
+
+def test_metrics_response_unknown_group():
+    """
+    Test that MetricsResponse raises KeyError upon construction for a metric
+    group that is not defined in the metrics context.
+    """
+    mr_str = MR_STR.replace('"dpm-system-usage-overview"', '"foo-usage"')
+
+    with pytest.raises(KeyError):
+
+        # The code to be tested
+        MetricsResponse(mr_metrics_context(), mr_str)
@@ -0,0 +1,340 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _name_uri_cache module of the zhmcclient package.
+"""
+
+from __future__ import absolute_import, print_function
+
+import json
+import time
+import threading
+import requests_mock
+import mock
+import pytest
+
+from zhmcclient import NameUriCache, Session, Client, NotFound
+from zhmcclient._resource_updater import _UpdateListener
+from zhmcclient._utils import run_concurrently
+
+CPC_SCOPE = (None, 'cpc', False)
+PART_SCOPE = ('/api/cpcs/c1', 'partition', False)
+USER_SCOPE = ('/api/console', 'user', True)
+
+
+def test_name_uri_cache_lookup_put():
+    """
+    Test lookup and put, including expiration per resource class and case
+    insensitive names.
+    """
+    cache = NameUriCache(ttls={'cpc': None}, default_ttl=60,
+                         negative_ttl=5)
+
+    with mock.patch('time.time', return_value=1000.0):
+        assert cache.lookup(CPC_SCOPE, 'CPC1') == (False, None)
+        cache.put(CPC_SCOPE, 'CPC1', '/api/cpcs/c1')
+        cache.put(PART_SCOPE, 'part1', '/api/partitions/p1')
+        cache.put(PART_SCOPE, 'missing', None)
+        cache.put(USER_SCOPE, 'Admin', '/api/users/u1')
+        cache.put(PART_SCOPE, None, '/api/partitions/p2')
+        assert len(cache) == 4
+
+        assert cache.lookup(CPC_SCOPE, 'CPC1') == (True, '/api/cpcs/c1')
+        assert cache.lookup(CPC_SCOPE, 'cpc1') == (False, None)
+        assert cache.lookup(USER_SCOPE, 'ADMIN') == (True, '/api/users/u1')
+        assert cache.lookup(PART_SCOPE, 'missing') == (True, None)
+
+    with mock.patch('time.time', return_value=1010.0):
+        assert cache.lookup(PART_SCOPE, 'missing') == (False, None)
+        assert cache.lookup(PART_SCOPE, 'part1') == \
+            (True, '/api/partitions/p1')
+
+    with mock.patch('time.time', return_value=1100.0):
+        assert cache.lookup(PART_SCOPE, 'part1') == (False, None)
+        assert cache.lookup(CPC_SCOPE, 'CPC1') == (True, '/api/cpcs/c1')
+
+    assert cache.hits == 5
+    assert cache.misses == 4
+
+
+def test_name_uri_cache_lru():
+    """
+    Test that the least recently used entry is removed.
+    """
+    cache = NameUriCache(maxsize=2)
+    cache.put(PART_SCOPE, 'part1', '/api/partitions/p1')
+    cache.put(PART_SCOPE, 'part2', '/api/partitions/p2')
+    cache.lookup(PART_SCOPE, 'part1')
+    cache.put(PART_SCOPE, 'part3', '/api/partitions/p3')
+
+    assert len(cache) == 2
+    assert cache.lookup(PART_SCOPE, 'part2') == (False, None)
+    assert cache.lookup(PART_SCOPE, 'part1')[0]
+    assert cache.lookup(PART_SCOPE, 'part3')[0]
+
+
+def test_name_uri_cache_invalidate():
+    """
+    Test deleting entries and invalidating a scope.
+    """
+    cache = NameUriCache()
+    cache.put(CPC_SCOPE, 'CPC1', '/api/cpcs/c1')
+    cache.put(PART_SCOPE, 'part1', '/api/partitions/p1')
+    cache.put(PART_SCOPE, 'part2', '/api/partitions/p2')
+
+    cache.delete(PART_SCOPE, 'part1')
+    assert cache.lookup(PART_SCOPE, 'part1') == (False, None)
+
+    cache.invalidate_scope(PART_SCOPE)
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_name_uri_cache_update_scope():
+    """
+    Test updating the entries of a scope from a complete resource list.
+    """
+    cache = NameUriCache()
+    cache.put(CPC_SCOPE, 'CPC1', '/api/cpcs/c1')
+    cache.put(PART_SCOPE, 'part1', '/api/partitions/p1')
+    cache.put(PART_SCOPE, 'part2', '/api/partitions/p2')
+    cache.put(PART_SCOPE, 'part3', None)
+    cache.put(PART_SCOPE, 'part4', None)
+
+    cache.update_scope(PART_SCOPE, {'part1': '/api/partitions/p1-new',
+                                    'part3': '/api/partitions/p3'})
+
+    assert cache.lookup(PART_SCOPE, 'part1') == \
+        (True, '/api/partitions/p1-new')
+    assert cache.lookup(PART_SCOPE, 'part2') == (False, None)
+    assert cache.lookup(PART_SCOPE, 'part3') == (True, '/api/partitions/p3')
+    assert cache.lookup(PART_SCOPE, 'part4') == (True, None)
+    assert cache.lookup(CPC_SCOPE, 'CPC1') == (True, '/api/cpcs/c1')
+
+
+def test_name_uri_cache_notifications():
+    """
+    Test the incremental updates from inventory change and property change
+    notifications received by the session.
+    """
+    cache = NameUriCache()
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      name_uri_cache=cache)
+    assert session.name_uri_cache is cache
+    updater = mock.Mock()
+    updater.registered_objects.return_value = []
+    listener = _UpdateListener(updater, session)
+    cache.put(PART_SCOPE, 'part1', '/api/partitions/p1')
+    cache.put(PART_SCOPE, 'part2', '/api/partitions/p2')
+    cache.put(PART_SCOPE, 'part3', None)
+    cache.put(PART_SCOPE, 'part4', None)
+
+    listener.on_message(
+        {'notification-type': 'property-change',
+         'object-uri': '/api/partitions/p1'},
+        json.dumps({'change-reports': [
+            {'property-name': 'name', 'new-value': 'part1-new'}]}))
+    listener.on_message(
+        {'notification-type': 'inventory-change', 'action': 'remove',
+         'object-uri': '/api/partitions/p2'}, '')
+    listener.on_message(
+        {'notification-type': 'inventory-change', 'action': 'add',
+         'object-uri': '/api/partitions/p3', 'class': 'partition',
+         'name': 'part3'}, '')
+
+    assert cache.lookup(PART_SCOPE, 'part1') == (False, None)
+    assert cache.lookup(PART_SCOPE, 'part1-new') == \
+        (True, '/api/partitions/p1')
+    assert cache.lookup(PART_SCOPE, 'part2') == (False, None)
+    assert cache.lookup(PART_SCOPE, 'part3') == (False, None)
+    assert cache.lookup(PART_SCOPE, 'part4') == (True, None)
+
+
+def test_name_uri_cache_manager():
+    """
+    Test the use of a session-wide Name-URI cache by resource managers,
+    including remembering names that were not found.
+    """
+    cache = NameUriCache()
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id', name_uri_cache=cache)
+    with requests_mock.mock() as m:
+        list_mock = m.get('/api/cpcs', json={'cpcs': [
+            {'object-uri': '/api/cpcs/c1', 'name': 'CPC1'},
+        ]})
+
+        # The code to be tested
+        cpc = Client(session).cpcs.find_by_name('CPC1')
+        assert cpc.uri == '/api/cpcs/c1'
+        cpc = Client(session).cpcs.find_by_name('CPC1')
+        assert list_mock.call_count == 1
+
+        for _ in range(2):
+            with pytest.raises(NotFound):
+                Client(session).cpcs.find_by_name('CPC2')
+        assert list_mock.call_count == 2
+
+        cache.resource_added('cpc', 'CPC2')
+        with pytest.raises(NotFound):
+            Client(session).cpcs.find_by_name('CPC2')
+        assert list_mock.call_count == 3
+
+        Client(session).cpcs.invalidate_cache()
+        assert len(cache) == 0
+
+
+def test_name_uri_cache_find_many_by_name():
+    """
+    Test find_many_by_name() with a session-wide Name-URI cache, including
+    names that are remembered as not existing.
+    """
+    cache = NameUriCache()
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id', name_uri_cache=cache)
+    cache.put(CPC_SCOPE, 'CPC3', None)
+    with requests_mock.mock() as m:
+        list_mock = m.get('/api/cpcs', json={'cpcs': [
+            {'object-uri': '/api/cpcs/c1', 'name': 'CPC1'},
+            {'object-uri': '/api/cpcs/c2', 'name': 'CPC2'},
+        ]})
+
+        # The code to be tested
+        cpcs, not_found = Client(session).cpcs.find_many_by_name(
+            ['CPC1', 'CPC2', 'CPC3', 'CPC4'])
+        assert list_mock.call_count == 1
+        assert sorted(cpcs) == ['CPC1', 'CPC2']
+        assert cpcs['CPC2'].uri == '/api/cpcs/c2'
+        assert not_found == {'CPC3', 'CPC4'}
+
+        cpcs, not_found = Client(session).cpcs.find_many_by_name(
+            ['CPC1', 'CPC4'])
+        assert list_mock.call_count == 1
+        assert sorted(cpcs) == ['CPC1']
+        assert not_found == {'CPC4'}
+
+
+def test_name_uri_cache_maxsize_exceeded():
+    """
+    Test finding resources by name when the scope has more resources than
+    the maximum size of the session-wide Name-URI cache.
+    """
+    cache = NameUriCache(maxsize=2)
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id', name_uri_cache=cache)
+    with requests_mock.mock() as m:
+        m.get('/api/cpcs', json={'cpcs': [
+            {'object-uri': '/api/cpcs/c{}'.format(i), 'name': 'CPC{}'.format(i)}
+            for i in range(5)
+        ]})
+
+        # The code to be tested
+        cpc = Client(session).cpcs.find_by_name('CPC0')
+        assert cpc.uri == '/api/cpcs/c0'
+        cpcs, not_found = Client(session).cpcs.find_many_by_name(
+            ['CPC1', 'CPC2', 'CPC9'])
+
+    assert sorted(cpcs) == ['CPC1', 'CPC2']
+    assert not_found == {'CPC9'}
+    assert len(cache) == 2
+    assert cache.lookup(CPC_SCOPE, 'CPC0') != (True, None)
+
+
+def test_name_uri_cache_concurrent():
+    """
+    Test concurrent lookups of different names in the same scope, each of
+    which refreshes the session-wide Name-URI cache.
+    """
+    cache = NameUriCache()
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id', name_uri_cache=cache)
+    names = ['CPC{}'.format(i) for i in range(8)]
+
+    def list_callback(request, context):
+        # pylint: disable=unused-argument
+        time.sleep(0.05)
+        return {'cpcs': [{'object-uri': '/api/cpcs/{}'.format(name),
+                          'name': name} for name in names]}
+
+    with requests_mock.mock() as m:
+        m.get('/api/cpcs', json=list_callback)
+
+        # The code to be tested
+        cpcs = run_concurrently(
+            lambda name: Client(session).cpcs.find_by_name(name),
+            names, len(names))
+
+    assert [cpc.uri for cpc in cpcs] == \
+        ['/api/cpcs/{}'.format(name) for name in names]
+
+
+def test_name_uri_cache_concurrent_refresh():
+    """
+    Test that a refresh of the session-wide Name-URI cache by another thread
+    between the refresh and the lookup of a thread does not cause the
+    resource not to be found.
+    """
+    cache = NameUriCache()
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id', name_uri_cache=cache)
+    a_ready = threading.Event()
+    a_done = threading.Event()
+    b_listing = threading.Event()
+    lookup_counts = {}
+    orig_lookup = NameUriCache.lookup
+
+    def lookup(self, scope, name):
+        """Before its lookup after a refresh, let thread A wait for the
+        refresh of thread B to begin."""
+        if threading.current_thread().name == 'thread-a':
+            lookup_counts[name] = lookup_counts.get(name, 0) + 1
+            if lookup_counts[name] == 2:
+                a_ready.set()
+                b_listing.wait(5)
+        return orig_lookup(self, scope, name)
+
+    def list_callback(request, context):
+        # pylint: disable=unused-argument
+        if threading.current_thread().name != 'thread-a':
+            b_listing.set()
+            a_done.wait(5)
+        return {'cpcs': [{'object-uri': '/api/cpcs/c1', 'name': 'CPC1'}]}
+
+    results = {}
+
+    def find(name):
+        """Find a CPC by name and record its URI."""
+        try:
+            results[name] = Client(session).cpcs.find_by_name(name).uri
+        except NotFound:
+            results[name] = None
+        finally:
+            if threading.current_thread().name == 'thread-a':
+                a_ready.set()
+                a_done.set()
+
+    thread_a = threading.Thread(target=find, args=('CPC1',), name='thread-a')
+    with requests_mock.mock() as m:
+        m.get('/api/cpcs', json=list_callback)
+        with mock.patch.object(NameUriCache, 'lookup', lookup):
+
+            # The code to be tested
+            thread_a.start()
+            a_ready.wait(5)
+            find('CPC2')
+            thread_a.join()
+
+    assert results == {'CPC1': '/api/cpcs/c1', 'CPC2': None}
@@ -20,12 +20,17 @@ from __future__ import absolute_import, print_function
 
 import re
 import copy
+import time
+import threading
 import pytest
+from mock import patch
 
-from zhmcclient import Client, Partition, HTTPError, NotFound
+from zhmcclient import Client, Partition, HTTPError, NotFound, StatusTimeout
 from zhmcclient_mock import FakedSession
 from tests.common.utils import assert_resources
 
+from .test_notification import MockedStompConnection
+
 
 # Object IDs and names of our faked partitions:
 PART1_OID = 'part1-oid'
@@ -38,6 +43,28 @@ PART3_NAME = 'part 3'
 CPC_NAME = 'fake-cpc1-name'
 
 
+class FakedJob(object):
+    # pylint: disable=too-few-public-methods
+    """
+    A replacement for zhmcclient.Job for asynchronous operations that are not
+    supported by the faked HMC. The job completes when its status is checked,
+    and then sets the status of its faked resource.
+    """
+
+    def __init__(self, faked_resource, new_status, exc=None):
+        self.uri = '/api/jobs/{}'.format(faked_resource.oid)
+        self.faked_resource = faked_resource
+        self.new_status = new_status
+        self.exc = exc
+
+    def check_for_completion(self):
+        """Mocks the same-named method of zhmcclient.Job."""
+        if self.exc:
+            raise self.exc
+        self.faked_resource.properties['status'] = self.new_status
+        return 'complete', None
+
+
 class TestPartition(object):
     """All tests for the Partition and PartitionManager classes."""
 
@@ -172,6 +199,101 @@ class TestPartition(object):
 
         assert_resources(partitions, exp_faked_partitions, prop_names)
 
+    def test_pm_list_full_properties_concurrent(self):
+        """Test PartitionManager.list() with full_properties and
+        concurrently retrieved properties."""
+
+        # Add three faked partitions
+        faked_partition1 = self.add_partition1()
+        faked_partition2 = self.add_partition2()
+        faked_partition3 = self.add_partition3()
+
+        exp_faked_partitions = [
+            faked_partition1, faked_partition2, faked_partition3]
+        partition_mgr = self.cpc.partitions
+        self.session.retry_timeout_config.max_workers = 4
+
+        # Execute the code to be tested
+        partitions = partition_mgr.list(full_properties=True)
+
+        assert_resources(partitions, exp_faked_partitions,
+                         ['name', 'initial-memory'])
+        for partition in partitions:
+            assert partition.full_properties
+
+    @pytest.mark.parametrize(
+        "api_version, exp_get_count", [
+            ('1.8', 3),  # list + 2 retrievals (no 'Get Inventory' in mock)
+            ('4.10', 1),  # list with additional properties
+        ]
+    )
+    def test_pm_list_additional_properties(self, api_version, exp_get_count):
+        """Test PartitionManager.list() with additional_properties and
+        client-side filtering."""
+
+        self.session.hmc.api_version = api_version
+        self.add_partition1()
+        self.add_partition2()
+        partition_mgr = self.cpc.partitions
+        self.client.version_info()  # Retrieve and cache the API version
+
+        with patch.object(self.session, 'get',
+                          wraps=self.session.get) as get_mock:
+
+            # Execute the code to be tested
+            partitions = partition_mgr.list(
+                filter_args={'description': 'Partition #1'},
+                additional_properties=['maximum-memory'])
+
+        assert get_mock.call_count == exp_get_count
+        for call in get_mock.call_args_list[1:]:
+            # Only the needed properties are retrieved
+            uri = call[0][0]
+            assert uri.endswith('?properties=maximum-memory,description')
+        assert [p.name for p in partitions] == [PART1_NAME]
+        partition = partitions[0]
+        assert partition.properties['description'] == 'Partition #1'
+        assert partition.properties['maximum-memory'] == 8192
+
+    def test_pm_list_additional_properties_inventory(self):
+        """Test PartitionManager.list() with additional_properties on an HMC
+        that does not support the 'additional-properties' query parameter,
+        retrieving the properties with 'Get Inventory'."""
+
+        self.session.hmc.api_version = '1.8'
+        faked_partition1 = self.add_partition1()
+        faked_partition2 = self.add_partition2()
+        partition_mgr = self.cpc.partitions
+        self.client.version_info()  # Retrieve and cache the API version
+
+        inventory = [
+            {'class': 'partition', 'object-uri': '/api/partitions/other',
+             'name': 'other', 'description': 'Partition #1'},
+            {'class': 'nic', 'element-uri': faked_partition1.uri + '/nics/1',
+             'description': 'Partition #1'},
+            {'class': 'inventory-error', 'inventory-error-code': 1},
+        ]
+        for faked_partition in (faked_partition1, faked_partition2):
+            props = dict(faked_partition.properties)
+            inventory.append(props)
+
+        with patch.object(self.session, 'get',
+                          wraps=self.session.get) as get_mock:
+            with patch.object(self.client, 'iter_inventory',
+                              return_value=iter(inventory)) as inv_mock:
+
+                # Execute the code to be tested
+                partitions = partition_mgr.list(
+                    filter_args={'description': 'Partition #1'},
+                    additional_properties=['maximum-memory'])
+
+        inv_mock.assert_called_once_with(['partition'])
+        assert get_mock.call_count == 1  # only the list operation
+        assert [p.name for p in partitions] == [PART1_NAME]
+        partition = partitions[0]
+        assert partition.properties['description'] == 'Partition #1'
+        assert partition.properties['maximum-memory'] == 8192
+
     @pytest.mark.parametrize(
         "filter_args, exp_names", [
             ({'object-id': PART1_OID},
@@ -320,6 +442,73 @@ class TestPartition(object):
                     exp_value = input_props[prop_name]
                     assert value == exp_value
 
+    @pytest.mark.parametrize(
+        "max_parallel", [None, 1, 2]
+    )
+    def test_pm_start_many(self, max_parallel):
+        """Test PartitionManager.start_many()."""
+
+        faked_partitions = [self.add_partition1(), self.add_partition2(),
+                            self.add_partition3()]
+        for faked_partition in faked_partitions:
+            faked_partition.properties['status'] = 'stopped'
+        partitions = [self.cpc.partitions.find(name=fp.name)
+                      for fp in faked_partitions]
+        self.session.retry_timeout_config.poll_min_interval = 0.01
+        self.session.retry_timeout_config.poll_max_interval = 0.01
+        fail_exc = HTTPError({'http-status': 409, 'reason': 1,
+                              'message': 'fake failure'})
+        started = []
+
+        def start(partition, wait_for_completion):
+            """Replacement for Partition.start()."""
+            assert wait_for_completion is False
+            # Verify the parallelism cap: The partitions whose status has not
+            # been reached yet (and that did not fail) are still in progress.
+            in_progress = [fp for fp in started
+                           if fp.name != PART2_NAME]
+            in_progress = [fp for fp in in_progress
+                           if fp.properties['status'] != 'active']
+            if max_parallel:
+                assert len(in_progress) < max_parallel
+            faked_partition = self.faked_cpc.partitions.lookup_by_oid(
+                partition.get_property('object-id'))
+            started.append(faked_partition)
+            exc = fail_exc if faked_partition.name == PART2_NAME else None
+            return FakedJob(faked_partition, 'active', exc)
+
+        with patch.object(Partition, 'start', start):
+
+            # Execute the code to be tested
+            outcomes = self.cpc.partitions.start_many(
+                partitions, max_parallel=max_parallel)
+
+        assert outcomes[0] == 'active'
+        assert outcomes[1] is fail_exc
+        assert outcomes[2] == 'active'
+        assert len(started) == 3
+
+    def test_pm_stop_many_status_timeout(self):
+        """Test PartitionManager.stop_many() with a status timeout."""
+
+        faked_partition = self.add_partition1()
+        partition = self.cpc.partitions.find(name=faked_partition.name)
+        self.session.retry_timeout_config.poll_min_interval = 0.01
+
+        def stop(partition, wait_for_completion):
+            # pylint: disable=unused-argument
+            """Replacement for Partition.stop() that keeps the status."""
+            return FakedJob(faked_partition, 'active')
+
+        with patch.object(Partition, 'stop', stop):
+
+            # Execute the code to be tested
+            outcomes = self.cpc.partitions.stop_many(
+                [partition], status_timeout=0.2)
+
+        assert isinstance(outcomes[0], StatusTimeout)
+        assert outcomes[0].actual_status == 'active'
+
     def test_pm_resource_object(self):
         """
         Test PartitionManager.resource_object().
@@ -346,6 +535,31 @@ class TestPartition(object):
     # TODO: Test for initial Partition attributes (nics, hbas,
     #       virtual_functions)
 
+    def test_partition_pull_properties(self):
+        """
+        Test Partition.pull_properties() and get_property(partial=True).
+        """
+        partition_mgr = self.cpc.partitions
+        self.add_partition1()
+        partition = partition_mgr.find(name=PART1_NAME)
+        assert 'initial-memory' not in partition.properties
+
+        # Execute the code to be tested
+        partition.pull_properties(['initial-memory', 'ifl-processors'])
+
+        assert partition.properties['initial-memory'] == 4096
+        assert partition.properties['ifl-processors'] == 2
+        assert 'maximum-memory' not in partition.properties
+        assert partition.full_properties is False
+
+        # Execute the code to be tested
+        maximum_memory = partition.get_property('maximum-memory',
+                                                partial=True)
+
+        assert maximum_memory == 8192
+        assert 'description' not in partition.properties
+        assert partition.full_properties is False
+
     def test_partition_repr(self):
         """Test Partition.__repr__()."""
 
@@ -949,7 +1163,76 @@ class TestPartition(object):
 
     # TODO: Test for Partition.send_os_command()
 
-    # TODO: Test for Partition.wait_for_status()
+    @pytest.mark.parametrize(
+        "initial_status, status, exp_exc", [
+            ('active', 'active', None),
+            ('active', ['stopped', 'active'], None),
+            ('stopped', 'active', StatusTimeout),
+        ]
+    )
+    def test_partition_wait_for_status(self, initial_status, status, exp_exc):
+        """Test Partition.wait_for_status() with polling."""
+
+        faked_partition = self.add_partition1()
+        faked_partition.properties['status'] = initial_status
+        partition = self.cpc.partitions.find(name=faked_partition.name)
+        self.session.retry_timeout_config.poll_min_interval = 0.1
+
+        if exp_exc:
+            with pytest.raises(exp_exc):
+
+                # Execute the code to be tested
+                partition.wait_for_status(status, status_timeout=0.5)
+
+        else:
+
+            # Execute the code to be tested
+            partition.wait_for_status(status, status_timeout=0.5)
+
+    @patch(target='stomp.Connection', new=MockedStompConnection)
+    def test_partition_wait_for_status_notified(self):
+        """Test Partition.wait_for_status() with a status notification."""
+
+        faked_partition = self.add_partition1()
+        faked_partition.properties['status'] = 'starting'
+        partition = self.cpc.partitions.find(name=faked_partition.name)
+        self.session.retry_timeout_config.poll_min_interval = 10
+        self.session.subscribe_auto_update()
+        # pylint: disable=protected-access
+        stomp_conn = self.session.resource_updater._conn
+        # pylint: disable=no-member
+        stomp_conn.mock_add_message(
+            {
+                'notification-type': 'status-change',
+                'object-uri': partition.uri,
+            },
+            {
+                'change-reports': [
+                    {
+                        'old-status': 'starting',
+                        'new-status': 'active',
+                    },
+                ]
+            })
+
+        def change_status():
+            """Change the status on the faked HMC and notify about it."""
+            time.sleep(0.5)
+            faked_partition.properties['status'] = 'active'
+            stomp_conn.mock_start()
+
+        thread = threading.Thread(target=change_status)
+        thread.start()
+        start_time = time.time()
+
+        # Execute the code to be tested
+        partition.wait_for_status('active', status_timeout=5)
+
+        duration = time.time() - start_time
+        thread.join()
+        self.session.unsubscribe_auto_update()
+
+        assert duration < 4
 
     # TODO: Test for Partition.increase_crypto_config()
 
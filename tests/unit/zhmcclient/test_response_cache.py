@@ -0,0 +1,314 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _response_cache module of the zhmcclient package.
+"""
+
+from __future__ import absolute_import, print_function
+
+import requests_mock
+import mock
+import pytest
+
+from zhmcclient import ResponseCache, Session
+
+TTLS = [
+    ('/api/version', None),
+    ('/api/cpcs/[^/]+/adapters', 60),
+    ('/api/partitions/[^/]+', 10),
+    ('/api/cpcs/[^/]+', 0),
+]
+
+
+@pytest.mark.parametrize(
+    "uri, exp_ttl", [
+        ('/api/version', None),
+        ('/api/cpcs/c1/adapters', 60),
+        ('/api/cpcs/c1/adapters?name=a1', 60),
+        ('/api/cpcs/c1/adapters/x', 5),
+        ('/api/cpcs/c1', 0),
+        ('/api/partitions/p1', 10),
+        ('/api/console', 5),
+        ('/api/jobs/j1', 0),
+        ('/api/sessions/operations/get-notification-topics', 0),
+        ('/api/services/metrics/context', 0),
+        ('/api/services/metrics/context/mc1', 0),
+        ('/api/console/operations/get-audit-log?begin-time=1', 0),
+        ('/api/console/operations/get-security-log', 0),
+    ]
+)
+def test_response_cache_ttl(uri, exp_ttl):
+    """
+    Test the time to live by URI pattern.
+    """
+    cache = ResponseCache(ttls=TTLS, default_ttl=5)
+
+    assert cache.ttl(uri) == exp_ttl
+
+
+def test_response_cache_get_put():
+    """
+    Test caching of results, including expiration and copying.
+    """
+    cache = ResponseCache(ttls=TTLS)
+    result = {'adapters': [{'name': 'a1'}]}
+
+    with mock.patch('time.time', return_value=1000.0):
+        assert cache.get('/api/cpcs/c1/adapters') == (False, None)
+        cache.put('/api/cpcs/c1/adapters', result)
+        cache.put('/api/version', {'api-major-version': 4})
+        cache.put('/api/console', {'name': 'hmc1'})  # not cached (TTL 0)
+        assert len(cache) == 2
+
+        result['adapters'].append({'name': 'a2'})
+        found, cached_result = cache.get('/api/cpcs/c1/adapters')
+        assert found
+        assert cached_result == {'adapters': [{'name': 'a1'}]}
+        cached_result['adapters'].append({'name': 'a3'})
+        assert cache.get('/api/cpcs/c1/adapters') == \
+            (True, {'adapters': [{'name': 'a1'}]})
+        assert cache.get('/api/console') == (False, None)
+
+    with mock.patch('time.time', return_value=1060.0):
+        assert cache.get('/api/cpcs/c1/adapters') == (False, None)
+        assert cache.get('/api/version') == \
+            (True, {'api-major-version': 4})
+
+    assert cache.hits == 3
+    assert cache.misses == 2
+
+
+def test_response_cache_lru():
+    """
+    Test that the least recently used result is removed.
+    """
+    cache = ResponseCache(default_ttl=None, maxsize=2)
+    cache.put('/api/console', 1)
+    cache.put('/api/cpcs', 2)
+    cache.get('/api/console')
+    cache.put('/api/partitions/p1', 3)
+
+    assert len(cache) == 2
+    assert cache.get('/api/cpcs') == (False, None)
+    assert cache.get('/api/console') == (True, 1)
+    assert cache.get('/api/partitions/p1') == (True, 3)
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize(
+    "write_uri, exp_invalidated", [
+        ('/api/partitions/p1/operations/start',
+         ['/api/partitions/p1', '/api/partitions/p1/nics/n1',
+          '/api/cpcs/c1/partitions', '/api/cpcs/c1/partitions?name=p1',
+          '/api/partitions']),
+        ('/api/partitions/p1/nics/n1',
+         ['/api/partitions/p1', '/api/partitions/p1/nics/n1',
+          '/api/partitions']),
+        ('/api/cpcs/c1/partitions',
+         ['/api/cpcs', '/api/cpcs/c1', '/api/cpcs/c1/partitions',
+          '/api/cpcs/c1/partitions?name=p1']),
+        ('/api/console/operations/reorder-user-patterns', ['/api/console']),
+    ]
+)
+def test_response_cache_invalidate(write_uri, exp_invalidated):
+    """
+    Test invalidation of results for a POST or DELETE request.
+    """
+    uris = [
+        '/api/version',
+        '/api/console',
+        '/api/cpcs',
+        '/api/cpcs/c1',
+        '/api/cpcs/c1/partitions',
+        '/api/cpcs/c1/partitions?name=p1',
+        '/api/partitions',
+        '/api/partitions/p1',
+        '/api/partitions/p1/nics/n1',
+        '/api/partitions/p2',
+        '/api/cpcs/c1/adapters',
+    ]
+    cache = ResponseCache(default_ttl=None)
+    for uri in uris:
+        cache.put(uri, uri)
+
+    cache.invalidate(write_uri)
+
+    for uri in uris:
+        found, _ = cache.get(uri)
+        assert found == (uri not in exp_invalidated), uri
+
+
+@pytest.mark.parametrize(
+    "write_uri, exp_stored", [
+        ('/api/partitions/p1', False),
+        ('/api/partitions/p1/operations/start', False),
+        ('/api/partitions/p1/nics/n1', False),  # child resource
+        ('/api/partitions/p2', True),
+        ('/api/cpcs/c1/adapters/a1', True),
+    ]
+)
+def test_response_cache_put_generation(write_uri, exp_stored):
+    """
+    Test that a result is not stored if an invalidation for its URI happened
+    after the specified generation.
+    """
+    cache = ResponseCache(default_ttl=None)
+    uri = '/api/partitions/p1'
+    generation = cache.generation
+
+    cache.invalidate(write_uri)
+    assert cache.generation == generation + 1
+    cache.put(uri, 'result', generation)
+
+    found, _ = cache.get(uri)
+    assert found == exp_stored
+
+    # The current generation does not prevent storing the result
+    cache.put(uri, 'result', cache.generation)
+    found, _ = cache.get(uri)
+    assert found
+
+
+def test_response_cache_put_generation_history():
+    """
+    Test that a result is not stored if the invalidations since the specified
+    generation are no longer remembered.
+    """
+    cache = ResponseCache(default_ttl=None)
+    uri = '/api/partitions/p1'
+    generation = cache.generation
+
+    for _ in range(1000):
+        cache.invalidate('/api/cpcs/c1/adapters/a1')
+    cache.put(uri, 'result', generation)
+
+    found, _ = cache.get(uri)
+    assert not found
+
+
+@pytest.mark.parametrize(
+    "coalesce_gets", [False, True]
+)
+def test_response_cache_session_get_delete(coalesce_gets):
+    """
+    Test that the result of a GET request that is in progress while a DELETE
+    request of the same session invalidates its URI is not cached.
+    """
+    cache = ResponseCache(ttls=[('/api/partitions/[^/]+/nics/[^/]+', 60)])
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id', response_cache=cache,
+                      coalesce_gets=coalesce_gets)
+    nic_uri = '/api/partitions/p1/nics/n1'
+    real_do_get = session._do_get
+
+    def do_get(uri, logon_required, relogon=True):
+        """GET request during which a DELETE request completes"""
+        result = real_do_get(uri, logon_required, relogon)
+        session.delete(nic_uri)
+        return result
+
+    with requests_mock.mock() as m:
+        get_mock = m.get(nic_uri, json={'name': 'n1'})
+        m.delete(nic_uri, status_code=204)
+
+        # The code to be tested
+        with mock.patch.object(session, '_do_get', side_effect=do_get):
+            result = session.get(nic_uri)
+
+        assert result == {'name': 'n1'}
+        assert len(cache) == 0
+        session.get(nic_uri)
+        assert get_mock.call_count == 2
+        assert len(cache) == 1
+
+
+def test_response_cache_session():
+    """
+    Test the use of a response cache by a Session.
+    """
+    cache = ResponseCache(ttls=[('/api/partitions/[^/]+', 60)])
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id', response_cache=cache)
+    assert session.response_cache is cache
+    part_uri = '/api/partitions/p1'
+    with requests_mock.mock() as m:
+        get_mock = m.get(part_uri, json={'name': 'p1', 'status': 'stopped'})
+        m.post(part_uri + '/operations/start', status_code=202,
+               json={'job-uri': '/api/jobs/j1'})
+        m.get('/api/jobs/j1', json={'status': 'complete',
+                                    'job-status-code': 204})
+        m.delete('/api/jobs/j1', status_code=204)
+
+        # The code to be tested
+        assert session.get(part_uri) == {'name': 'p1', 'status': 'stopped'}
+        assert session.get(part_uri) == {'name': 'p1', 'status': 'stopped'}
+        assert get_mock.call_count == 1
+
+        job = session.post(part_uri + '/operations/start')
+        session.get(part_uri)
+        assert get_mock.call_count == 2
+
+        job.check_for_completion()
+        session.get(part_uri)
+        session.get(part_uri)
+        assert get_mock.call_count == 3
+
+
+def test_response_cache_session_metrics():
+    """
+    Test that metric samples retrieved by a Session are not cached, even
+    with a non-zero default time to live.
+    """
+    cache = ResponseCache(default_ttl=60)
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id', response_cache=cache)
+    metrics_uri = '/api/services/metrics/context/mc1'
+    headers = {'content-type': 'application/vnd.ibm-z-zmanager-metrics'}
+    with requests_mock.mock() as m:
+        get_mock = m.get(metrics_uri, [
+            {'text': '"sample1"\n', 'headers': headers},
+            {'text': '"sample2"\n', 'headers': headers},
+        ])
+
+        # The code to be tested
+        assert session.get(metrics_uri) != session.get(metrics_uri)
+        assert get_mock.call_count == 2
+        assert len(cache) == 0
+
+
+def test_response_cache_session_logged_off():
+    """
+    Test that cached results are not used for a logged-off Session.
+    """
+    cache = ResponseCache(default_ttl=60)
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      response_cache=cache)
+    console_uri = '/api/console'
+    cache.put(console_uri, {'name': 'cached'})
+    with requests_mock.mock() as m:
+        logon_mock = m.post('/api/sessions', json={
+            'api-session': 'fake-session-id',
+            'notification-topic': 'fake-topic-1',
+            'job-notification-topic': 'fake-topic-2',
+        })
+        m.get(console_uri, json={'name': 'hmc'})
+
+        # The code to be tested
+        assert session.get(console_uri) == {'name': 'hmc'}
+        assert logon_mock.call_count == 1
+        assert session.get(console_uri) == {'name': 'hmc'}
+        assert logon_mock.call_count == 1
@@ -0,0 +1,162 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _scheduler module of the zhmcclient package.
+"""
+
+from __future__ import absolute_import, print_function
+
+import time
+import threading
+import requests_mock
+import pytest
+
+from zhmcclient import RequestScheduler, RequestLane, request_lane, Session
+
+
+def make_scheduler(**kwargs):
+    """
+    Return a request scheduler with an interactive and a batch lane.
+    """
+    return RequestScheduler(
+        lanes=[
+            RequestLane('batch', priority=0, max_concurrency=1),
+            RequestLane('interactive', priority=10),
+        ],
+        **kwargs)
+
+
+def wait_until(condition, timeout=2):
+    """
+    Wait until a condition function returns True.
+    """
+    end_time = time.time() + timeout
+    while not condition():
+        assert time.time() < end_time, "Timeout waiting for condition"
+        time.sleep(0.005)
+
+
+def test_scheduler_lane_name():
+    """
+    Test the selection of the lane for a request.
+    """
+    scheduler = make_scheduler(default_lane='interactive')
+    assert scheduler.default_lane == 'interactive'
+
+    assert scheduler.lane_name() == 'interactive'
+    assert scheduler.lane_name('batch') == 'batch'
+    with request_lane('batch'):
+        assert scheduler.lane_name() == 'batch'
+        with request_lane(None):
+            assert scheduler.lane_name() == 'interactive'
+        assert scheduler.lane_name() == 'batch'
+    assert scheduler.lane_name() == 'interactive'
+
+    with pytest.raises(ValueError):
+        scheduler.lane_name('unknown')
+
+    assert make_scheduler().default_lane == 'batch'
+
+
+@pytest.mark.parametrize(
+    "lanes, default_lane", [
+        ([], None),
+        ([RequestLane('a'), RequestLane('a')], None),
+        ([RequestLane('a')], 'b'),
+    ]
+)
+def test_scheduler_init_error(lanes, default_lane):
+    """
+    Test invalid init parameters of RequestScheduler.
+    """
+    with pytest.raises(ValueError):
+        RequestScheduler(lanes, default_lane=default_lane)
+
+
+def test_scheduler_priority():
+    """
+    Test that waiting requests of a higher priority lane are started first.
+    """
+    scheduler = make_scheduler(max_concurrency=1)
+    started = []
+
+    def request(lane):
+        with scheduler.slot(lane):
+            started.append(lane)
+
+    name = scheduler.acquire('interactive')
+    threads = []
+    for lane in ('batch', 'batch', 'interactive'):
+        thread = threading.Thread(target=request, args=(lane,))
+        thread.start()
+        threads.append(thread)
+        wait_until(
+            lambda n=len(threads): sum(
+                scheduler.waiting_count(ln)
+                for ln in ('batch', 'interactive')) == n)
+
+    scheduler.release(name)
+    for thread in threads:
+        thread.join()
+
+    assert started == ['interactive', 'batch', 'batch']
+
+
+def test_scheduler_lane_max_concurrency():
+    """
+    Test that the maximum concurrency of a lane does not block other lanes.
+    """
+    scheduler = make_scheduler()
+    scheduler.acquire('batch')
+    thread = threading.Thread(target=scheduler.acquire, args=('batch',))
+    thread.start()
+    wait_until(lambda: scheduler.waiting_count('batch') == 1)
+
+    scheduler.acquire('interactive')
+    assert scheduler.active_count('interactive') == 1
+    assert scheduler.active_count('batch') == 1
+
+    scheduler.release('batch')
+    thread.join()
+    assert scheduler.active_count('batch') == 1
+    assert scheduler.waiting_count('batch') == 0
+
+
+def test_scheduler_session():
+    """
+    Test the use of a request scheduler by a Session, including the lane of
+    worker threads.
+    """
+    scheduler = make_scheduler(default_lane='interactive')
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id',
+                      request_scheduler=scheduler)
+    assert session.request_scheduler is scheduler
+    session.time_stats_keeper.enable()
+    uris = ['/api/nics/nic-{}'.format(i) for i in range(4)]
+    with requests_mock.mock() as m:
+        for uri in uris:
+            m.get(uri, json={})
+        m.get('/api/console', json={})
+
+        # The code to be tested
+        session.get('/api/console')
+        with request_lane('batch'):
+            session.get_many(uris, max_workers=4)
+
+    snapshot = session.time_stats_keeper.snapshot()
+    assert snapshot['scheduler-wait interactive'].count == 1
+    assert snapshot['scheduler-wait batch'].count == 4
+    assert scheduler.active_count('batch') == 0
@@ -20,14 +20,19 @@ from __future__ import absolute_import, print_function
 
 import time
 import json
+import threading
 import re
+from copy import deepcopy
 import requests
 import requests_mock
 import mock
 import pytest
 
 from zhmcclient import Session, ParseError, Job, HTTPError, OperationTimeout, \
-    ClientAuthError, DEFAULT_HMC_PORT
+    ClientAuthError, DEFAULT_HMC_PORT, RetryTimeoutConfig, \
+    DEFAULT_POOL_MAXSIZE, DEFAULT_POOL_BLOCK, JsonCodec
+from zhmcclient._session import _iter_json_array
+from zhmcclient._utils import run_concurrently
 
 # Default value for the 'verify_cert' parameter of the Session class:
 DEFAULT_VERIFY_CERT = True
@@ -391,6 +396,583 @@ def test_session_get_error_html_1():
         assert exc.request_method == 'GET'
 
 
+@pytest.mark.parametrize(
+    "max_workers", [None, 1, 4]
+)
+def test_session_get_many(max_workers):
+    """
+    This tests Session.get_many() with successful and failing GETs.
+    """
+    session = Session('fake-host', 'fake-user', 'fake-pw')
+    session.time_stats_keeper.enable()
+    with requests_mock.mock() as m:
+        mock_server_1(m)
+        uris = ['/api/nics/nic-{}'.format(i) for i in range(8)]
+        for i, uri in enumerate(uris):
+            if i == 3:
+                m.get(uri, status_code=404,
+                      json={'http-status': 404, 'reason': 1,
+                            'message': 'fake message'})
+            else:
+                m.get(uri, json={'object-uri': uri, 'index': i})
+
+        # The code to be tested
+        results = session.get_many(uris, max_workers=max_workers)
+
+        assert session.session_id == 'test-session-id'
+        assert len(results) == len(uris)
+        for i, result in enumerate(results):
+            if i == 3:
+                assert isinstance(result, HTTPError)
+                assert result.http_status == 404
+            else:
+                assert result == {'object-uri': uris[i], 'index': i}
+
+        snapshot = session.time_stats_keeper.snapshot()
+        for uri in uris:
+            assert snapshot['get ' + uri].count == 1
+
+
+def test_session_get_many_empty():
+    """
+    This tests Session.get_many() with no URIs, which does not log on.
+    """
+    session = Session('fake-host', 'fake-user', 'fake-pw')
+    with requests_mock.mock():
+
+        # The code to be tested
+        results = session.get_many([])
+
+        assert results == []
+        assert session.session_id is None
+
+
+@pytest.mark.parametrize(
+    "rt_config, exp_pool_maxsize, exp_pool_block", [
+        (None, DEFAULT_POOL_MAXSIZE, DEFAULT_POOL_BLOCK),
+        (RetryTimeoutConfig(pool_maxsize=32), 32, DEFAULT_POOL_BLOCK),
+        (RetryTimeoutConfig(pool_maxsize=4, pool_block=True), 4, True),
+    ]
+)
+def test_session_pool_config(rt_config, exp_pool_maxsize, exp_pool_block):
+    """
+    This tests that the connection pool settings of the retry/timeout
+    configuration are used for the HTTP adapters of the session.
+    """
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id',
+                      retry_timeout_config=rt_config)
+
+    # pylint: disable=protected-access
+    adapter = session._session.get_adapter(session.base_url)
+
+    assert adapter._pool_maxsize == exp_pool_maxsize
+    assert adapter._pool_block == exp_pool_block
+
+
+def test_session_relogon_concurrent():
+    """
+    This tests that concurrent requests that all find the session token
+    expired cause only a single re-logon.
+    """
+    session = Session('fake-host', 'fake-user', 'fake-pw')
+    logon_count = [0]
+
+    def logon_callback(request, context):
+        # pylint: disable=unused-argument
+        logon_count[0] += 1
+        time.sleep(0.1)
+        return {
+            'api-session': 'test-session-id-{}'.format(logon_count[0]),
+            'notification-topic': 'test-obj-topic.1',
+            'job-notification-topic': 'test-job-topic.1',
+        }
+
+    def get_callback(request, context):
+        if request.headers['X-API-Session'] == 'test-session-id-1':
+            context.status_code = 403
+            return {'http-status': 403, 'reason': 5,
+                    'message': 'fake message'}
+        return {'object-uri': request.path}
+
+    with requests_mock.mock() as m:
+        m.post('/api/sessions', json=logon_callback)
+        uris = ['/api/nics/nic-{}'.format(i) for i in range(8)]
+        for uri in uris:
+            m.get(uri, json=get_callback)
+        session.logon()
+
+        # The code to be tested
+        results = session.get_many(uris, max_workers=8)
+
+        assert results == [{'object-uri': uri} for uri in uris]
+        assert logon_count[0] == 2
+        assert session.session_id == 'test-session-id-2'
+
+
+def test_session_keepalive():
+    """
+    This tests that the keepalive issues requests while the session is idle
+    and logged on, and is stopped when the session is logged off.
+    """
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      keepalive_interval=0.1)
+    assert session.keepalive_interval == 0.1
+    with requests_mock.mock() as m:
+        mock_server_1(m)
+        topics_uri = '/api/sessions/operations/get-notification-topics'
+        topics_mock = m.get(topics_uri, json={'topics': []})
+
+        # The code to be tested
+        session.logon()
+        keepalive_thread = session._keepalive_thread
+        time.sleep(0.35)
+        session.logoff()
+
+        assert not keepalive_thread.is_alive()
+        keepalive_count = topics_mock.call_count
+        assert keepalive_count >= 2
+
+        time.sleep(0.25)
+
+        assert topics_mock.call_count == keepalive_count
+        assert session.session_id is None
+
+
+@pytest.mark.parametrize(
+    "keepalive_relogon, exp_logon_count", [
+        (True, 2),
+        (False, 1),
+    ]
+)
+def test_session_keepalive_expired(keepalive_relogon, exp_logon_count):
+    """
+    This tests that the keepalive re-logs on (only) if enabled when the HMC
+    session token has expired.
+    """
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      keepalive_interval=0.1,
+                      keepalive_relogon=keepalive_relogon)
+    assert session.keepalive_relogon == keepalive_relogon
+    with requests_mock.mock() as m:
+        mock_server_1(m)
+        logon_mock = m.post('/api/sessions', [
+            {'json': {'api-session': 'fake-session-id-{}'.format(i),
+                      'notification-topic': 'fake-topic-1',
+                      'job-notification-topic': 'fake-topic-2'}}
+            for i in range(1, 4)])
+        topics_uri = '/api/sessions/operations/get-notification-topics'
+        topics_mock = m.get(topics_uri, [
+            {'status_code': 403,
+             'json': {'http-status': 403, 'reason': 5, 'message': 'expired'}},
+            {'json': {'topics': []}},
+        ])
+
+        # The code to be tested
+        session.logon()
+        time.sleep(0.35)
+        session_id = session.session_id
+        session.logoff()
+
+        assert topics_mock.call_count >= 2
+        assert logon_mock.call_count == exp_logon_count
+        assert session_id == 'fake-session-id-{}'.format(exp_logon_count)
+        if keepalive_relogon:
+            # The keepalive after the re-logon used the new session-id
+            last_headers = topics_mock.last_request.headers
+            assert last_headers['X-API-Session'] == 'fake-session-id-2'
+
+
+def test_session_keepalive_disabled():
+    """
+    This tests that no keepalive is performed by default.
+    """
+    session = Session('fake-host', 'fake-user', 'fake-pw')
+    assert session.keepalive_interval is None
+    with requests_mock.mock() as m:
+        mock_server_1(m)
+        topics_uri = '/api/sessions/operations/get-notification-topics'
+        topics_mock = m.get(topics_uri, json={'topics': []})
+
+        # The code to be tested
+        session.logon()
+        time.sleep(0.2)
+
+        assert topics_mock.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "coalesce_gets, status_code, exp_call_count", [
+        (False, 200, 8),
+        (True, 200, 1),
+        (True, 404, 1),
+    ]
+)
+def test_session_coalesce_gets(coalesce_gets, status_code, exp_call_count):
+    """
+    This tests coalescing of concurrent identical GET requests.
+    """
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      coalesce_gets=coalesce_gets)
+    assert session.coalesce_gets == coalesce_gets
+    uri = '/api/cpcs'
+
+    def get_callback(request, context):
+        # pylint: disable=unused-argument
+        time.sleep(0.2)
+        context.status_code = status_code
+        if status_code != 200:
+            return {'http-status': status_code, 'reason': 1,
+                    'message': 'fake message'}
+        return {'cpcs': [{'name': 'cpc1'}]}
+
+    with requests_mock.mock() as m:
+        mock_server_1(m)
+        get_mock = m.get(uri, json=get_callback)
+        session.logon()
+
+        # The code to be tested
+        results = session.get_many([uri] * 8, max_workers=8)
+
+        assert get_mock.call_count == exp_call_count
+        for result in results:
+            if status_code == 200:
+                assert result == {'cpcs': [{'name': 'cpc1'}]}
+            else:
+                assert isinstance(result, HTTPError)
+                assert result.http_status == status_code
+                assert result.message == 'fake message'
+        # Each caller gets its own result or exception object
+        assert len(set(id(r) for r in results)) == len(results)
+        if status_code == 200:
+            # Coalescing applies only to requests in progress
+            session.get(uri)
+            assert get_mock.call_count == exp_call_count + 1
+
+
+def test_session_coalesce_gets_changed_result():
+    """
+    This tests that changes to the result returned to the caller of a
+    coalesced GET request do not affect the results of the other callers.
+    """
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      coalesce_gets=True)
+    uri = '/api/cpcs'
+    exp_result = {'cpcs': [{'name': 'cpc1'}]}
+
+    def get_callback(request, context):
+        # pylint: disable=unused-argument
+        time.sleep(0.2)
+        return exp_result
+
+    def slow_deepcopy(obj):
+        """Copy slowly, so that callers change their results meanwhile."""
+        time.sleep(0.1)
+        return deepcopy(obj)
+
+    def get_and_change():
+        """Get the URI and change the result."""
+        result = session.get(uri)
+        snapshot = json.dumps(result, sort_keys=True)
+        result['cpcs'].append({'name': 'changed'})
+        result.clear()
+        return snapshot
+
+    with requests_mock.mock() as m:
+        mock_server_1(m)
+        m.get(uri, json=get_callback)
+        session.logon()
+
+        with mock.patch('zhmcclient._session.deepcopy', slow_deepcopy):
+
+            # The code to be tested
+            snapshots = run_concurrently(
+                lambda _: get_and_change(), range(8), 8)
+
+    assert snapshots == [json.dumps(exp_result, sort_keys=True)] * 8
+
+
+@pytest.mark.parametrize(
+    "busy_retries, exp_status", [
+        (0, 503),
+        (1, 429),
+        (2, 200),
+    ]
+)
+def test_session_busy_retries(busy_retries, exp_status):
+    """
+    This tests the retrying of requests rejected by the HMC as busy.
+    """
+    rt_config = RetryTimeoutConfig(busy_retries=busy_retries,
+                                   busy_min_interval=0.01)
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id',
+                      retry_timeout_config=rt_config)
+    session.time_stats_keeper.enable()
+    uri = '/api/cpcs'
+    busy_body = {'http-status': 503, 'reason': 1, 'message': 'fake message'}
+    with requests_mock.mock() as m:
+        get_mock = m.get(uri, [
+            {'status_code': 503, 'json': busy_body},
+            {'status_code': 429,
+             'json': dict(busy_body, **{'http-status': 429}),
+             'headers': {'Retry-After': '0'}},
+            {'status_code': 200, 'json': {'cpcs': []}},
+        ])
+
+        # The code to be tested
+        if exp_status == 200:
+            result = session.get(uri)
+            assert result == {'cpcs': []}
+        else:
+            with pytest.raises(HTTPError) as exc_info:
+                session.get(uri)
+            assert exc_info.value.http_status == exp_status
+
+        assert get_mock.call_count == busy_retries + 1
+        snapshot = session.time_stats_keeper.snapshot()
+        if busy_retries:
+            assert snapshot['busy-retry get ' + uri].count == busy_retries
+        else:
+            assert 'busy-retry get ' + uri not in snapshot
+
+
+def test_session_rate_limit():
+    """
+    This tests that the rate limit of the session delays requests.
+    """
+    rt_config = RetryTimeoutConfig(rate_limit=20, rate_limit_burst=2)
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id',
+                      retry_timeout_config=rt_config)
+    session.time_stats_keeper.enable()
+    with requests_mock.mock() as m:
+        m.get('/api/console', json={})
+
+        # The code to be tested
+        start_time = time.time()
+        for _ in range(6):
+            session.get('/api/console')
+        duration = time.time() - start_time
+
+        # The burst allows 2 requests at once, the other 4 are delayed by
+        # 1/20 s each.
+        assert duration >= 0.18
+        snapshot = session.time_stats_keeper.snapshot()
+        assert snapshot['throttle-wait'].count == 6
+
+
+def test_session_max_in_flight():
+    """
+    This tests that the number of concurrent requests of the session is
+    limited.
+    """
+    rt_config = RetryTimeoutConfig(max_in_flight=2)
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id',
+                      retry_timeout_config=rt_config)
+    in_flight = [0]
+    max_seen = [0]
+    lock = threading.Lock()
+
+    def fake_get(url, **kwargs):
+        # pylint: disable=unused-argument
+        with lock:
+            in_flight[0] += 1
+            max_seen[0] = max(max_seen[0], in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['content-type'] = 'application/json'
+        response._content = b'{}'  # pylint: disable=protected-access
+        return response
+
+    uris = ['/api/nics/nic-{}'.format(i) for i in range(6)]
+    with mock.patch.object(requests.Session, 'get', side_effect=fake_get):
+
+        # The code to be tested
+        results = session.get_many(uris, max_workers=6)
+
+    assert results == [{}] * 6
+    assert max_seen[0] == 2
+
+
+@pytest.mark.parametrize(
+    "json_codec", ['json', 'orjson', 'ujson', 'simdjson']
+)
+def test_session_json_codec(json_codec):
+    """
+    This tests the use of the JSON codec of a session for request and
+    response bodies.
+    """
+    pytest.importorskip(json_codec)
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      json_codec=json_codec)
+    assert session.json_codec.name == json_codec
+    with requests_mock.mock() as m:
+        mock_server_1(m)
+        uri = '/api/partitions/fake-part-id-1'
+        props = {'object-uri': uri, 'name': 'fake-part-1', 'nic-uris': []}
+        m.get(uri, json=props)
+        m.post(uri, status_code=204)
+
+        # The code to be tested
+        result = session.get(uri)
+        session.post(uri, body={'description': 'fake-desc'})
+
+        assert result == props
+        assert json.loads(m.last_request.text) == {'description': 'fake-desc'}
+
+
+def test_session_iter_get():
+    """
+    This tests Session.iter_get() with a JSON array response that is read in
+    small chunks.
+    """
+    session = Session('fake-host', 'fake-user', 'fake-pw')
+    entries = [{'event-id': str(i), 'event-name': u'\u00e9vent-{}'.format(i)}
+               for i in range(100)]
+    with requests_mock.mock() as m:
+        mock_server_1(m)
+        uri = '/api/console/operations/get-audit-log'
+        m.get(uri, content=json.dumps(entries).encode('utf-8'),
+              headers={'content-type': 'application/json'})
+
+        with mock.patch('zhmcclient._session._STREAM_CHUNK_SIZE', 7):
+
+            # The code to be tested
+            result = session.iter_get(uri)
+
+            assert list(result) == entries
+
+
+def test_session_iter_post_relogon():
+    """
+    This tests Session.iter_post() with an expired session token, which
+    causes a re-logon and retry.
+    """
+    session = Session('fake-host', 'fake-user', 'fake-pw')
+    resources = [{'class': 'partition', 'name': 'part-{}'.format(i)}
+                 for i in range(3)]
+    with requests_mock.mock() as m:
+        mock_server_1(m)
+        uri = '/api/services/inventory'
+        m.post(uri, [
+            {'status_code': 403,
+             'json': {'http-status': 403, 'reason': 5,
+                      'message': 'fake message'}},
+            {'status_code': 200, 'json': resources},
+        ])
+        session.logon()
+
+        # The code to be tested
+        result = session.iter_post(uri, body={'resources': ['partition']})
+
+        assert list(result) == resources
+        assert json.loads(m.last_request.text) == {'resources': ['partition']}
+
+
+@pytest.mark.parametrize(
+    "content", [b'{"a": 1}', b'[1, 2', b'[1 2]', b'[1] x']
+)
+def test_session_iter_get_parse_error(content):
+    """
+    This tests Session.iter_get() with an invalid JSON array response.
+    """
+    session = Session('fake-host', 'fake-user', 'fake-pw')
+    with requests_mock.mock() as m:
+        mock_server_1(m)
+        uri = '/api/console/operations/get-audit-log'
+        m.get(uri, content=content,
+              headers={'content-type': 'application/json'})
+
+        # The code to be tested
+        result = session.iter_get(uri)
+
+        with pytest.raises(ParseError):
+            list(result)
+
+
+@pytest.mark.parametrize(
+    "chunks, exp_items", [
+        ([b'[2.', b'5]'], [2.5]),
+        ([b'[1e', b'3]'], [1000.0]),
+        ([b'[1', b'2, -', b'3 ', b', 4]'], [12, -3, 4]),
+        ([b'[tr', b'ue, nu', b'll]'], [True, None]),
+        ([b'[{"a": 1.', b'5}, "b', b'"]'], [{'a': 1.5}, 'b']),
+        ([b'[1.5', b']'], [1.5]),
+        ([b' [ ', b' ] '], []),
+        ([b'["a\\', b'"b", "c\\\\', b'"]'], ['a"b', 'c\\']),
+        ([b'["],[{", "', b'}"]'], ['],[{', '}']),
+        ([b'[[[[[1, {"a": [', b'2]}]]]], [', b']]'],
+         [[[[[1, {'a': [2]}]]]], []]),
+        ([b'["\xc3', b'\xa4"]'], [u'\xe4']),
+    ]
+)
+def test_iter_json_array_split(chunks, exp_items):
+    """
+    This tests _iter_json_array() with array items that are split across
+    chunks.
+    """
+
+    # The code to be tested
+    items = list(_iter_json_array(chunks))
+
+    assert items == exp_items
+
+
+@pytest.mark.parametrize(
+    "chunk", [b'[1,]', b'[,1]', b'[{]', b'[}', b'[[1}', b'[1] 2', b'{}']
+)
+def test_iter_json_array_invalid(chunk):
+    """
+    This tests that _iter_json_array() detects invalid JSON text without
+    waiting for the end of the text.
+    """
+    chunks = iter([chunk, b' '])
+
+    with pytest.raises(ValueError):
+
+        # The code to be tested
+        list(_iter_json_array(chunks))
+
+    assert list(chunks) == [b' ']
+
+
+def test_iter_json_array_codec():
+    """
+    This tests that _iter_json_array() decodes each item once using the
+    specified JSON codec, also if an item is split across many chunks.
+    """
+
+    class CountingCodec(JsonCodec):
+        """JSON codec that records the decoded texts."""
+
+        def __init__(self):
+            self.loaded = []
+
+        def loads(self, data):
+            self.loaded.append(data)
+            return super(CountingCodec, self).loads(data)
+
+    item = {'name': 'x' * 100,
+            'uris': ['/api/{}'.format(i) for i in range(50)]}
+    text = json.dumps([item, 1]).encode('utf-8')
+    chunks = [text[i:i + 10] for i in range(0, len(text), 10)]
+    codec = CountingCodec()
+
+    # The code to be tested
+    items = list(_iter_json_array(chunks, codec))
+
+    assert items == [item, 1]
+    decoded_items = []
+    for data in codec.loaded:
+        decoded_items.extend(json.loads(data))
+    assert decoded_items == [item, 1]
+
+
 JOB_URI = '/api/jobs/fake-job-uri'
 
 
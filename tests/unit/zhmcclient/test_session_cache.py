@@ -0,0 +1,253 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _session_cache module of the zhmcclient package.
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import stat
+import requests_mock
+import pytest
+
+from zhmcclient import SessionCache, Session, Client, DEFAULT_HMC_PORT
+
+SESSION_ENTRY = {
+    'session-id': 'cached-session-id',
+    'notification-topic': 'cached-obj-topic.1',
+    'job-notification-topic': 'cached-job-topic.1',
+}
+
+API_VERSION = {
+    'api-major-version': 4,
+    'api-minor-version': 10,
+    'hmc-version': '2.16.0',
+    'hmc-name': 'fake-hmc',
+}
+
+
+def mock_logon(m, session_id):
+    """
+    Set up the mocked responses for logon and logoff.
+    """
+    m.post('/api/sessions', json={
+        'api-session': session_id,
+        'notification-topic': 'test-obj-topic.1',
+        'job-notification-topic': 'test-job-topic.1',
+    })
+    m.delete('/api/sessions/this-session', status_code=204)
+
+
+def test_session_cache_entries(tmpdir):
+    """
+    Test updating, getting and removing cache entries.
+    """
+    filepath = str(tmpdir.join('cache.json'))
+    cache = SessionCache(filepath)
+    assert cache.filepath == filepath
+
+    assert cache.get_entry('hmc1', 6794, 'user1') is None
+
+    cache.update_entry('hmc1', 6794, 'user1', session_id='sid-1')
+    cache.update_entry('hmc1', 6794, 'user1', api_version=API_VERSION)
+    cache.update_entry('hmc2', 6794, 'user1', session_id='sid-2')
+
+    assert cache.get_entry('hmc1', 6794, 'user1') == \
+        {'session-id': 'sid-1', 'api-version': API_VERSION}
+    assert cache.get_entry('hmc2', 6794, 'user1') == {'session-id': 'sid-2'}
+    assert cache.get_entry('hmc1', 6794, 'user2') is None
+    assert cache.get_entry('hmc1', 1234, 'user1') is None
+
+    # A new cache object on the same file sees the entries
+    assert SessionCache(filepath).get_entry('hmc2', 6794, 'user1') == \
+        {'session-id': 'sid-2'}
+
+    cache.update_entry('hmc1', 6794, 'user1', session_id=None)
+    assert cache.get_entry('hmc1', 6794, 'user1') == \
+        {'api-version': API_VERSION}
+
+    cache.remove_entry('hmc1', 6794, 'user1')
+    assert cache.get_entry('hmc1', 6794, 'user1') is None
+    assert cache.get_entry('hmc2', 6794, 'user1') == {'session-id': 'sid-2'}
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="Requires POSIX permissions")
+def test_session_cache_permissions(tmpdir):
+    """
+    Test that the cache file is accessible only by its owner.
+    """
+    filepath = str(tmpdir.join('cache.json'))
+    cache = SessionCache(filepath)
+
+    cache.update_entry('hmc1', 6794, 'user1', session_id='sid-1')
+
+    mode = stat.S_IMODE(os.stat(filepath).st_mode)
+    assert mode == 0o600
+    assert os.listdir(str(tmpdir)) == ['cache.json']
+
+
+@pytest.mark.parametrize(
+    "content", ['', 'invalid', '[1, 2]']
+)
+def test_session_cache_invalid_file(tmpdir, content):
+    """
+    Test that an invalid cache file is treated as an empty cache.
+    """
+    filepath = str(tmpdir.join('cache.json'))
+    with open(filepath, 'w') as fp:
+        fp.write(content)
+    cache = SessionCache(filepath)
+
+    assert cache.get_entry('hmc1', 6794, 'user1') is None
+
+    cache.update_entry('hmc1', 6794, 'user1', session_id='sid-1')
+
+    assert cache.get_entry('hmc1', 6794, 'user1') == {'session-id': 'sid-1'}
+
+
+def test_session_cache_session(tmpdir):
+    """
+    Test the use of a session cache by Session objects.
+    """
+    filepath = str(tmpdir.join('cache.json'))
+    cache = SessionCache(filepath)
+    with requests_mock.mock() as m:
+        mock_logon(m, 'new-session-id')
+        m.get('/api/console', json={})
+
+        session1 = Session('hmc1', 'user1', 'pw1', session_cache=cache)
+        assert session1.session_cache is cache
+        assert session1.session_id is None
+
+        session1.logon()
+
+        assert cache.get_entry('hmc1', session1.port, 'user1') == {
+            'session-id': 'new-session-id',
+            'notification-topic': 'test-obj-topic.1',
+            'job-notification-topic': 'test-job-topic.1',
+        }
+
+        # A new session picks up the cached session without logging on
+        logon_count = m.call_count
+        session2 = Session('hmc1', 'user1', 'pw1', session_cache=cache)
+
+        assert session2.session_id == 'new-session-id'
+        assert session2.object_topic == 'test-obj-topic.1'
+        session2.get('/api/console')
+        assert m.call_count == logon_count + 1
+        assert m.last_request.headers['X-API-Session'] == 'new-session-id'
+
+        session2.logoff()
+
+        assert cache.get_entry('hmc1', session2.port, 'user1') == {}
+
+
+def test_session_cache_expired(tmpdir):
+    """
+    Test that an expired cached session-id causes a re-logon that updates
+    the session cache.
+    """
+    filepath = str(tmpdir.join('cache.json'))
+    cache = SessionCache(filepath)
+    cache.update_entry('hmc1', DEFAULT_HMC_PORT, 'user1', **{
+        k.replace('-', '_'): v for k, v in SESSION_ENTRY.items()})
+
+    session = Session('hmc1', 'user1', 'pw1', session_cache=cache)
+    assert session.session_id == 'cached-session-id'
+    with requests_mock.mock() as m:
+        mock_logon(m, 'new-session-id')
+        m.get('/api/console', [
+            {'status_code': 403,
+             'json': {'http-status': 403, 'reason': 5,
+                      'message': 'fake message'}},
+            {'status_code': 200, 'json': {}},
+        ])
+
+        session.get('/api/console')
+
+        assert session.session_id == 'new-session-id'
+        assert cache.get_entry('hmc1', session.port, 'user1')['session-id'] \
+            == 'new-session-id'
+
+
+def test_session_cache_api_version(tmpdir):
+    """
+    Test that Client.version_info() uses the API version information cached
+    for a reused HMC session, and that Client.query_api_version() always
+    contacts the HMC.
+    """
+    filepath = str(tmpdir.join('cache.json'))
+    cache = SessionCache(filepath)
+    with requests_mock.mock() as m:
+        mock_logon(m, 'new-session-id')
+        version_mock = m.get('/api/version', json=API_VERSION)
+
+        session1 = Session('hmc1', 'user1', 'pw1', session_cache=cache)
+        session1.logon()
+        client = Client(session1)
+        assert client.version_info() == (4, 10)
+        assert version_mock.call_count == 1
+        assert cache.get_entry('hmc1', session1.port, 'user1')[
+            'api-version'] == API_VERSION
+
+        # A new session reuses the cached HMC session and API version
+        client = Client(Session('hmc1', 'user1', 'pw1', session_cache=cache))
+        assert client.version_info() == (4, 10)
+        assert version_mock.call_count == 1
+
+        # query_api_version() and wait_for_available() contact the HMC
+        assert client.query_api_version() == API_VERSION
+        assert version_mock.call_count == 2
+        client.wait_for_available()
+        assert version_mock.call_count == 3
+
+        client.session.logoff()
+
+    assert cache.get_entry('hmc1', DEFAULT_HMC_PORT, 'user1') == {}
+
+
+def test_session_cache_api_version_relogon(tmpdir):
+    """
+    Test that a re-logon for a rejected cached HMC session invalidates the
+    cached API version information.
+    """
+    filepath = str(tmpdir.join('cache.json'))
+    cache = SessionCache(filepath)
+    cache.update_entry('hmc1', DEFAULT_HMC_PORT, 'user1',
+                       api_version=API_VERSION, **{
+                           k.replace('-', '_'): v
+                           for k, v in SESSION_ENTRY.items()})
+    new_api_version = dict(API_VERSION, **{'api-minor-version': 11})
+    with requests_mock.mock() as m:
+        mock_logon(m, 'new-session-id')
+        version_mock = m.get('/api/version', json=new_api_version)
+        m.get('/api/console', [
+            {'status_code': 403,
+             'json': {'http-status': 403, 'reason': 5,
+                      'message': 'fake message'}},
+            {'status_code': 200, 'json': {}},
+        ])
+
+        client = Client(Session('hmc1', 'user1', 'pw1', session_cache=cache))
+        assert client.version_info() == (4, 10)
+        assert version_mock.call_count == 0
+
+        client.session.get('/api/console')
+
+        assert 'api-version' not in cache.get_entry(
+            'hmc1', DEFAULT_HMC_PORT, 'user1')
+        assert client.version_info() == (4, 11)
+        assert version_mock.call_count == 1
@@ -0,0 +1,163 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _session_pool module of the zhmcclient package.
+"""
+
+from __future__ import absolute_import, print_function
+
+import requests
+import requests_mock
+import mock
+import pytest
+
+from zhmcclient import SessionPool, Session, Client, ConnectionError
+from zhmcclient import RetryTimeoutConfig
+
+HOSTS = ['hmc1', 'hmc2']
+
+# Avoid retries and waiting for connection errors
+RT_CONFIG = RetryTimeoutConfig(connect_retries=0, read_retries=0)
+
+
+def make_pool(**kwargs):
+    """
+    Return a session pool with logged-on sessions to the HMCs in HOSTS.
+    """
+    sessions = [
+        Session(host, 'fake-user', 'fake-pw',
+                session_id='fake-session-id-{}'.format(host),
+                retry_timeout_config=RT_CONFIG)
+        for host in HOSTS]
+    return SessionPool(sessions, **kwargs)
+
+
+def url(host, uri):
+    """
+    Return the URL for a URI on an HMC.
+    """
+    return 'https://{}:6794{}'.format(host, uri)
+
+
+def test_session_pool_init():
+    """
+    Test the initialization and the delegation to the primary session.
+    """
+    pool = make_pool()
+
+    assert pool.sessions[0].host == 'hmc1'
+    assert pool.primary is pool.sessions[0]
+    assert pool.host == 'hmc1'
+    assert pool.session_id == 'fake-session-id-hmc1'
+    assert pool.is_available(pool.sessions[1])
+    assert repr(pool).startswith('SessionPool(')
+
+    with pytest.raises(ValueError):
+        SessionPool([])
+
+
+def test_session_pool_load_balancing():
+    """
+    Test that GET requests are spread across the HMCs by response time.
+    """
+    pool = make_pool()
+    # Times for selecting the HMC, and before and after the request
+    times = [0.0, 0.0, 1.0] + [10.0, 10.0, 10.1] + [20.0, 20.0, 20.1] * 4
+    with requests_mock.mock() as m:
+        for host in HOSTS:
+            m.get(url(host, '/api/cpcs'), json={'host': host})
+
+        # The code to be tested
+        with mock.patch('zhmcclient._session_pool.time') as time_mock:
+            time_mock.time.side_effect = times
+            results = [pool.get('/api/cpcs') for _ in range(6)]
+
+    # First each HMC is measured, then the faster HMC is used
+    assert [r['host'] for r in results] == \
+        ['hmc1', 'hmc2', 'hmc2', 'hmc2', 'hmc2', 'hmc2']
+
+
+def test_session_pool_failover():
+    """
+    Test that GET requests are failed over to another HMC upon connection
+    errors, and that the failed HMC is avoided for the retry interval.
+    """
+    pool = make_pool(retry_interval=60)
+    with requests_mock.mock() as m:
+        hmc1_mock = m.get(url('hmc1', '/api/cpcs'),
+                          exc=requests.exceptions.ConnectionError)
+        m.get(url('hmc2', '/api/cpcs'), json={'host': 'hmc2'})
+
+        # The code to be tested
+        assert pool.get('/api/cpcs') == {'host': 'hmc2'}
+        assert not pool.is_available(pool.sessions[0])
+        assert pool.get('/api/cpcs') == {'host': 'hmc2'}
+        assert hmc1_mock.call_count == 1
+
+        m.get(url('hmc2', '/api/cpcs'),
+              exc=requests.exceptions.ConnectionError)
+        with pytest.raises(ConnectionError):
+            pool.get('/api/cpcs')
+        assert hmc1_mock.call_count == 2
+
+
+def test_session_pool_writes():
+    """
+    Test that POST and DELETE requests are performed on the primary HMC, also
+    when it is unavailable for GET requests.
+    """
+    pool = make_pool()
+    with requests_mock.mock() as m:
+        m.get(url('hmc1', '/api/cpcs'),
+              exc=requests.exceptions.ConnectionError)
+        m.get(url('hmc2', '/api/cpcs'), json={'host': 'hmc2'})
+        post_mock = m.post(url('hmc1', '/api/cpcs/c1/operations/start'),
+                           status_code=204)
+        delete_mock = m.delete(url('hmc1', '/api/partitions/p1'),
+                               status_code=204)
+
+        # The code to be tested
+        pool.get('/api/cpcs')
+        pool.post('/api/cpcs/c1/operations/start')
+        pool.delete('/api/partitions/p1')
+
+    assert post_mock.call_count == 1
+    assert delete_mock.call_count == 1
+
+
+def test_session_pool_client():
+    """
+    Test the use of a session pool by a Client.
+    """
+    pool = make_pool()
+    with requests_mock.mock() as m:
+        m.get(url('hmc1', '/api/cpcs'),
+              exc=requests.exceptions.ConnectionError)
+        m.get(url('hmc2', '/api/cpcs'),
+              json={'cpcs': [{'object-uri': '/api/cpcs/c1', 'name': 'CPC1'}]})
+        m.get(url('hmc2', '/api/cpcs/c1'),
+              json={'object-uri': '/api/cpcs/c1', 'name': 'CPC1'})
+
+        # The code to be tested
+        client = Client(pool)
+        cpcs = client.cpcs.list()
+        cpc = cpcs[0]
+        cpc.pull_full_properties()
+        results = pool.get_many(['/api/cpcs/c1', '/api/cpcs/c1'])
+
+    assert client.session is pool
+    assert cpc.name == 'CPC1'
+    assert cpc.manager.session is pool
+    assert [r['name'] for r in results] == ['CPC1', 'CPC1']
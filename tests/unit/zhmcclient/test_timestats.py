@@ -19,6 +19,7 @@ Unit tests for _timestats module.
 from __future__ import absolute_import, print_function
 
 import time
+import threading
 import pytest
 
 from zhmcclient import TimeStatsKeeper, TimeStats
@@ -248,6 +249,29 @@ def test_timestatskeeper_measure_avg_min_max():
             (stats.max_time, max_dur, delta)
 
 
+def test_timestatskeeper_measure_threads():
+    """Test measuring the same operation concurrently in multiple threads."""
+
+    keeper = TimeStatsKeeper()
+    keeper.enable()
+    stats = keeper.get_stats('foo')
+    duration = 0.2
+    num_threads = 4
+
+    threads = [threading.Thread(target=measure, args=(stats, duration))
+               for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert stats.count == num_threads
+    # Each thread measured its own invocation, so all times are close to the
+    # duration of a single invocation.
+    assert stats.min_time >= duration * 0.9
+    assert stats.max_time < duration * num_threads
+
+
 def test_timestatskeeper_only_end():
     """Test that invoking end() before begin() has ever been called raises
     a RuntimeError exception."""
@@ -26,7 +26,8 @@ import pytz
 import pytest
 
 from zhmcclient._utils import datetime_from_timestamp, \
-    timestamp_from_datetime, datetime_to_isoformat, datetime_from_isoformat
+    timestamp_from_datetime, datetime_to_isoformat, datetime_from_isoformat, \
+    run_concurrently, matches_filters, Filter
 
 
 # The Unix epoch
@@ -410,3 +411,156 @@ def test_datetime_from_isoformat(dt_str, exp_dt):
     dt = datetime_from_isoformat(dt_str)
 
     assert dt == exp_dt
+
+
+def _square_or_fail(item):
+    """Helper function for run_concurrently() tests."""
+    if item < 0:
+        raise ValueError(item)
+    time.sleep(0.01 * (5 - item % 5))
+    return item * item
+
+
+TESTCASES_RUN_CONCURRENTLY = [
+    # Testcases for test_run_concurrently()
+    # Each list item is a testcase with the following tuple items:
+    # * items (list): Input items.
+    # * max_workers (int): max_workers argument.
+    # * return_exceptions (bool): return_exceptions argument.
+    # * exp_results (list): Expected results, with exceptions represented
+    #   by their class.
+    # * exp_exc_arg (int): Expected argument of raised ValueError, or None.
+    (
+        [], 4, False,
+        [], None
+    ),
+    (
+        [1, 2, 3], None, False,
+        [1, 4, 9], None
+    ),
+    (
+        [1, 2, 3], 1, False,
+        [1, 4, 9], None
+    ),
+    (
+        list(range(10)), 4, False,
+        [i * i for i in range(10)], None
+    ),
+    (
+        [1, -2, 3, -4], 1, False,
+        None, -2
+    ),
+    (
+        [1, -2, 3, -4], 4, False,
+        None, -2
+    ),
+    (
+        [1, -2, 3, -4], 1, True,
+        [1, ValueError, 9, ValueError], None
+    ),
+    (
+        [1, -2, 3, -4], 4, True,
+        [1, ValueError, 9, ValueError], None
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "items, max_workers, return_exceptions, exp_results, exp_exc_arg",
+    TESTCASES_RUN_CONCURRENTLY)
+def test_run_concurrently(
+        items, max_workers, return_exceptions, exp_results, exp_exc_arg):
+    """
+    Test function for run_concurrently().
+    """
+
+    if exp_exc_arg is not None:
+        with pytest.raises(ValueError) as exc_info:
+
+            # The function to be tested
+            run_concurrently(_square_or_fail, items, max_workers,
+                             return_exceptions=return_exceptions)
+
+        assert exc_info.value.args[0] == exp_exc_arg
+    else:
+
+        # The function to be tested
+        results = run_concurrently(_square_or_fail, items, max_workers,
+                                   return_exceptions=return_exceptions)
+
+        assert len(results) == len(exp_results)
+        for result, exp_result in zip(results, exp_results):
+            if isinstance(exp_result, type):
+                assert isinstance(result, exp_result)
+            else:
+                assert result == exp_result
+
+
+class _PropsResource(object):
+    # pylint: disable=too-few-public-methods
+    """Minimal resource object for testing client-side filtering."""
+
+    def __init__(self, properties):
+        self.properties = properties
+
+    def get_property(self, name):
+        """Return a property value, raising KeyError if not present."""
+        return self.properties[name]
+
+
+FILTER_PROPS = {
+    'name': 'part-1',
+    'status': 'active',
+    'ifl-processors': 2,
+    'autogenerate-partition-id': True,
+}
+
+TESTCASES_FILTER = [
+    # Each testcase is a tuple of:
+    # - filter_args: Filter arguments.
+    # - exp_match: Expected match result for FILTER_PROPS.
+    (None, True),
+    ({}, True),
+    ({'name': 'part-1'}, True),
+    ({'name': 'part-2'}, False),
+    ({'name': 'part'}, False),
+    ({'name': 'part-.'}, True),
+    ({'name': '.*-1'}, True),
+    ({'name': 'art-1'}, False),
+    ({'name': ['part-2', 'part-1']}, True),
+    ({'name': ['part-2', ['part-3', 'part-[0-9]']]}, True),
+    ({'name': []}, False),
+    ({'status': ['active', 'degraded'], 'name': 'part-1'}, True),
+    ({'status': ['stopped', 'degraded'], 'name': 'part-1'}, False),
+    ({'ifl-processors': 2}, True),
+    ({'ifl-processors': [1, 2]}, True),
+    ({'ifl-processors': 3}, False),
+    ({'ifl-processors': '2'}, False),
+    ({'autogenerate-partition-id': True}, True),
+    ({'autogenerate-partition-id': False}, False),
+    ({'foo': 'bar'}, False),
+]
+
+
+@pytest.mark.parametrize(
+    "filter_args, exp_match",
+    TESTCASES_FILTER)
+def test_filter_matches(filter_args, exp_match):
+    """
+    Test function for Filter.matches(), Filter.matches_properties() and
+    matches_filters(), for consistency with each other.
+    """
+    resource = _PropsResource(FILTER_PROPS)
+
+    # The functions to be tested
+    filter_ = Filter(filter_args)
+    match = filter_.matches(resource)
+    props_match = filter_.matches_properties(FILTER_PROPS)
+    filters_match = matches_filters(resource, filter_)
+    dict_match = matches_filters(resource, filter_args)
+
+    assert filter_.filter_args is filter_args
+    assert match is exp_match
+    assert props_match is exp_match
+    assert filters_match is exp_match
+    assert dict_match is exp_match
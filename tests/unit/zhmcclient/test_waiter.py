@@ -0,0 +1,288 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _waiter module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import threading
+import time
+import requests_mock
+import pytest
+from mock import patch
+
+from zhmcclient import Session, Job, JobSet, StatusWaiter, Client, \
+    RetryTimeoutConfig, HTTPError, OperationTimeout, StatusTimeout, \
+    CeasedExistence
+from zhmcclient_mock import FakedSession
+
+from .test_notification import MockedStompConnection
+from .test_session import mock_server_1
+
+CPC_NAME = 'fake-cpc1-name'
+
+
+def job_status(status, status_code=None, results=None):
+    """Return a mocked 'Query Job Status' response item."""
+    result = {'status': status}
+    if status_code is not None:
+        result['job-status-code'] = status_code
+        result['job-reason-code'] = 42
+        result['job-results'] = results
+    return {'json': result}
+
+
+class TestJobSet(object):
+    """All tests for the JobSet class."""
+
+    def setup_method(self):
+        """
+        Setup that is called by pytest before each test method.
+        """
+        # pylint: disable=attribute-defined-outside-init
+
+        rt_config = RetryTimeoutConfig(
+            poll_min_interval=0.05, poll_max_interval=0.1, max_workers=4)
+        self.session = Session('fake-host', 'fake-user', 'fake-pw',
+                               retry_timeout_config=rt_config)
+
+    def test_jobset_as_completed(self):
+        """Test JobSet.add() and JobSet.as_completed() for multiple jobs."""
+
+        with requests_mock.mock() as m:
+            mock_server_1(m)
+            # Jobs are started by operations that have logged on the session
+            self.session.logon()
+            jobs = []
+            for i, responses in enumerate([
+                    [job_status('running'),
+                     job_status('running'),
+                     job_status('complete', 200, {'i': 0})],
+                    [job_status('complete', 204)],
+                    [job_status('running'),
+                     job_status('complete', 500, {'message': 'fail'})],
+            ]):
+                job_uri = '/api/jobs/job-{}'.format(i)
+                m.get(job_uri, responses)
+                m.delete(job_uri, status_code=204)
+                jobs.append(Job(self.session, job_uri, 'POST', '/api/foo'))
+
+            with JobSet(self.session) as job_set:
+                futures = [job_set.add(job) for job in jobs]
+                assert job_set.futures() == futures
+
+                # The code to be tested
+                completed = list(job_set.as_completed(timeout=10))
+
+        # The order of completion depends on when the background thread polls
+        # the jobs relative to adding them, so it is not checked.
+        assert len(completed) == len(jobs)
+        assert {job for job, _ in completed} == set(jobs)
+        for job, future in completed:
+            assert future is futures[jobs.index(job)]
+            assert future.done()
+        assert futures[0].result() == {'i': 0}
+        assert futures[1].result() is None
+        with pytest.raises(HTTPError) as exc_info:
+            futures[2].result()
+        assert exc_info.value.http_status == 500
+        assert exc_info.value.message == 'fail'
+
+    @patch(target='stomp.Connection', new=MockedStompConnection)
+    def test_jobset_notified_running(self):
+        """Test JobSet with a job completion notification that arrives while
+        the job status is not yet 'complete'."""
+
+        with requests_mock.mock() as m:
+            mock_server_1(m)
+            rt_config = RetryTimeoutConfig(
+                poll_min_interval=0.3, poll_max_interval=0.3)
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              retry_timeout_config=rt_config)
+            session.subscribe_job_updates()
+            job_uri = '/api/jobs/job-1'
+            responses = [job_status('running')] * 3
+            responses.append(job_status('complete', 204))
+            get_mock = m.get(job_uri, responses)
+            m.delete(job_uri, status_code=204)
+            job = Job(session, job_uri, 'POST', '/api/foo')
+
+            # pylint: disable=no-member
+            stomp_conn = session.job_updater._conn
+            stomp_conn.mock_add_message(
+                {'notification-type': 'job-completion', 'job-uri': job_uri},
+                '{}')
+            stomp_conn.mock_start()
+
+            start_time = time.time()
+            with JobSet(session) as job_set:
+                future = job_set.add(job)
+
+                # The code to be tested
+                result = future.result(timeout=10)
+
+            duration = time.time() - start_time
+            session.unsubscribe_job_updates()
+
+        assert result is None
+        assert get_mock.call_count == 4
+        # The notification shortens at most one poll interval
+        assert duration >= 0.5
+
+    def test_jobset_timeout(self):
+        """Test JobSet with an expiring operation timeout."""
+
+        with requests_mock.mock() as m:
+            mock_server_1(m)
+            # Jobs are started by operations that have logged on the session
+            self.session.logon()
+            job_uri = '/api/jobs/job-1'
+            m.get(job_uri, json={'status': 'running'})
+            job = Job(self.session, job_uri, 'POST', '/api/foo')
+
+            with JobSet(self.session, operation_timeout=0.3) as job_set:
+                future = job_set.add(job)
+
+                # The code to be tested
+                done, not_done = job_set.wait(timeout=10)
+
+        assert done == {future}
+        assert not not_done
+        with pytest.raises(OperationTimeout):
+            future.result()
+
+    def test_jobset_close(self):
+        """Test JobSet.close() with a pending job."""
+
+        with requests_mock.mock() as m:
+            mock_server_1(m)
+            # Jobs are started by operations that have logged on the session
+            self.session.logon()
+            job_uri = '/api/jobs/job-1'
+            m.get(job_uri, json={'status': 'running'})
+            job = Job(self.session, job_uri, 'POST', '/api/foo')
+
+            job_set = JobSet(self.session)
+            future = job_set.add(job)
+
+            # The code to be tested
+            job_set.close()
+
+        assert future.cancelled()
+        with pytest.raises(RuntimeError):
+            job_set.add(job)
+
+
+class TestStatusWaiter(object):
+    """All tests for the StatusWaiter class."""
+
+    def setup_method(self):
+        """
+        Setup that is called by pytest before each test method.
+
+        Set up a faked session with a CPC in DPM mode that has three stopped
+        partitions.
+        """
+        # pylint: disable=attribute-defined-outside-init
+
+        self.session = FakedSession('fake-host', 'fake-hmc', '2.13.1', '1.8')
+        self.session.retry_timeout_config.poll_min_interval = 0.05
+        self.session.retry_timeout_config.poll_max_interval = 0.1
+        self.faked_cpc = self.session.hmc.cpcs.add({
+            'object-id': 'fake-cpc1-oid',
+            'parent': None,
+            'class': 'cpc',
+            'name': CPC_NAME,
+            'description': 'CPC #1 (DPM mode)',
+            'status': 'active',
+            'dpm-enabled': True,
+            'is-ensemble-member': False,
+            'iml-mode': 'dpm',
+        })
+        self.faked_partitions = []
+        for i in range(3):
+            self.faked_partitions.append(self.faked_cpc.partitions.add({
+                'object-id': 'part{}-oid'.format(i),
+                'parent': self.faked_cpc.uri,
+                'class': 'partition',
+                'name': 'part{}'.format(i),
+                'status': 'stopped',
+                'type': 'linux',
+            }))
+        client = Client(self.session)
+        self.cpc = client.cpcs.find(name=CPC_NAME)
+        self.partitions = sorted(self.cpc.partitions.list(),
+                                 key=lambda p: p.name)
+
+    def test_statuswaiter_as_completed(self):
+        """Test StatusWaiter.add() and StatusWaiter.as_completed()."""
+
+        def change_statuses():
+            """Change the partition statuses on the faked HMC."""
+            for i in (2, 0, 1):
+                time.sleep(0.2)
+                self.faked_partitions[i].properties['status'] = 'active'
+
+        thread = threading.Thread(target=change_statuses)
+        thread.start()
+
+        with patch.object(self.cpc.partitions, 'list',
+                          wraps=self.cpc.partitions.list) as list_mock:
+            with StatusWaiter(self.session, status_timeout=10) as waiter:
+                futures = [waiter.add(p, ['active', 'degraded'])
+                           for p in self.partitions]
+
+                # The code to be tested
+                completed = list(waiter.as_completed(timeout=10))
+
+            num_list_calls = list_mock.call_count
+        thread.join()
+
+        assert [p for p, _ in completed] == \
+            [self.partitions[2], self.partitions[0], self.partitions[1]]
+        for future in futures:
+            assert future.result() == 'active'
+        # The status of all partitions is retrieved with one list() call
+        # per round, and there are at most 0.6 s / 0.05 s rounds.
+        assert num_list_calls <= 12
+
+    def test_statuswaiter_timeout(self):
+        """Test StatusWaiter with an expiring status timeout."""
+
+        with StatusWaiter(self.session, status_timeout=0.3) as waiter:
+            future = waiter.add(self.partitions[0], 'active')
+
+            # The code to be tested
+            waiter.wait(timeout=10)
+
+        with pytest.raises(StatusTimeout) as exc_info:
+            future.result()
+        assert exc_info.value.actual_status == 'stopped'
+        assert exc_info.value.desired_statuses == ['active']
+
+    def test_statuswaiter_ceased(self):
+        """Test StatusWaiter for a resource that is deleted."""
+
+        self.faked_cpc.partitions.remove(self.faked_partitions[1].oid)
+
+        with StatusWaiter(self.session) as waiter:
+            future = waiter.add(self.partitions[1], 'active')
+
+            # The code to be tested
+            waiter.wait(timeout=10)
+
+        with pytest.raises(CeasedExistence):
+            future.result()
@@ -1073,6 +1073,22 @@ class TestGenericGetPropertiesHandler(object):
         }
         assert cpc1 == exp_cpc1
 
+    def test_generic_get_properties_qp(self):
+        """
+        Test GET on resource with GenericGetPropertiesHandler, with the
+        'properties' query parameter.
+        """
+
+        # the function to be tested:
+        cpc1 = self.urihandler.get(
+            self.hmc, '/api/cpcs/1?properties=name,status', True)
+
+        exp_cpc1 = {
+            'name': 'cpc_1',
+            'status': 'operating',
+        }
+        assert cpc1 == exp_cpc1
+
     def test_generic_get_err_disconn(self):
         """
         Test GET with disconnected HMC.
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark for client-side filtering of resources: Matching with filter
+arguments as a dict (processed again for each resource) vs. matching with a
+compiled zhmcclient._utils.Filter object.
+
+Usage: benchmark_filter.py [num_resources [repetitions]]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from zhmcclient._utils import matches_filters, Filter
+
+
+class Resource(object):
+    # pylint: disable=too-few-public-methods
+    """Resource object with local properties only."""
+
+    def __init__(self, properties):
+        self.properties = properties
+
+    def get_property(self, name):
+        """Return a property value, raising KeyError if not present."""
+        return self.properties[name]
+
+
+FILTER_ARGS = {
+    'name': ['part-1.*', 'part-2.*', 'prod-.*'],
+    'status': ['active', 'degraded', 'paused'],
+    'type': 'linux',
+    'ifl-processors': [2, 4, 8],
+}
+
+
+def main():
+    """Run the benchmark."""
+    num_resources = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    statuses = ['active', 'stopped', 'degraded', 'paused']
+    resources = [
+        Resource({
+            'name': 'part-{}'.format(i),
+            'status': statuses[i % len(statuses)],
+            'type': 'linux' if i % 3 else 'ssc',
+            'ifl-processors': 2 ** (i % 4),
+        })
+        for i in range(num_resources)]
+
+    def dict_filtering():
+        """Client-side filtering with filter arguments as a dict."""
+        return [r for r in resources if matches_filters(r, FILTER_ARGS)]
+
+    def compiled_filtering():
+        """Client-side filtering with a compiled Filter object."""
+        filter_ = Filter(FILTER_ARGS)
+        return [r for r in resources if filter_.matches(r)]
+
+    assert dict_filtering() == compiled_filtering()
+
+    dict_time = min(timeit.repeat(dict_filtering, number=1,
+                                  repeat=repetitions))
+    compiled_time = min(timeit.repeat(compiled_filtering, number=1,
+                                      repeat=repetitions))
+
+    print("Filtering {} resources (best of {}):".
+          format(num_resources, repetitions))
+    print("  dict filter arguments: {:8.2f} ms".format(dict_time * 1000))
+    print("  compiled Filter:       {:8.2f} ms".format(compiled_time * 1000))
+    print("  speedup:               {:8.2f}x".format(dict_time / compiled_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -21,16 +21,27 @@ For documentation, see TODO: Add link to RTD once available.
 
 from __future__ import absolute_import
 
+import sys
+
 from ._version import *       # noqa: F401
 from ._constants import *     # noqa: F401
 from ._exceptions import *    # noqa: F401 pylint: disable=redefined-builtin
 from ._manager import *       # noqa: F401
 from ._resource import *      # noqa: F401
 from ._logging import *       # noqa: F401
+from ._json_codec import *    # noqa: F401
+from ._session_cache import *         # noqa: F401
+from ._response_cache import *        # noqa: F401
+from ._name_uri_cache import *        # noqa: F401
+from ._scheduler import *     # noqa: F401
 from ._session import *       # noqa: F401
+from ._session_pool import *  # noqa: F401
 from ._resource_updater import *       # noqa: F401
+from ._job_updater import *   # noqa: F401
+from ._waiter import *        # noqa: F401
 from ._timestats import *     # noqa: F401
 from ._client import *        # noqa: F401
+from ._federated_client import *      # noqa: F401
 from ._cpc import *           # noqa: F401
 from ._lpar import *          # noqa: F401
 from ._partition import *     # noqa: F401
@@ -59,3 +70,5 @@ from ._storage_group_template import *          # noqa: F401
 from ._storage_volume_template import *         # noqa: F401
 from ._capacity_group import *         # noqa: F401
 from ._debug_info import *         # noqa: F401
+if sys.version_info >= (3, 5):
+    from ._async_executor import *     # noqa: F401
@@ -51,7 +51,7 @@ import copy
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._logging import logged_api_call
-from ._utils import matches_filters, divide_filter_args, \
+from ._utils import matches_filters, Filter, divide_filter_args, \
     RC_RESET_ACTIVATION_PROFILE, RC_IMAGE_ACTIVATION_PROFILE, \
     RC_LOAD_ACTIVATION_PROFILE
 
@@ -190,6 +190,7 @@ class ActivationProfileManager(BaseManager):
         else:
             query_parms, client_filters = divide_filter_args(
                 self._query_props, filter_args)
+            client_filter = Filter(client_filters)
 
             resources_name = self._profile_type + '-activation-profiles'
             uri = '{}/{}{}'.format(self.cpc.uri, resources_name, query_parms)
@@ -205,10 +206,10 @@ class ActivationProfileManager(BaseManager):
                         name=props.get(self._name_prop, None),
                         properties=props)
 
-                    if matches_filters(resource_obj, client_filters):
+                    if matches_filters(resource_obj, client_filter):
                         resource_obj_list.append(resource_obj)
-                        if full_properties:
-                            resource_obj.pull_full_properties()
+                if full_properties:
+                    self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
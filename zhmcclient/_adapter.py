@@ -69,7 +69,7 @@ from ._resource import BaseResource
 from ._port import PortManager
 from ._logging import logged_api_call
 from ._utils import repr_dict, repr_manager, repr_timestamp, matches_filters, \
-    divide_filter_args, RC_ADAPTER
+    Filter, divide_filter_args, RC_ADAPTER
 
 __all__ = ['AdapterManager', 'Adapter']
 
@@ -179,6 +179,7 @@ class AdapterManager(BaseManager):
         else:
             query_parms, client_filters = divide_filter_args(
                 self._query_props, filter_args)
+            client_filter = Filter(client_filters)
 
             resources_name = 'adapters'
             uri = '{}/{}{}'.format(self.cpc.uri, resources_name, query_parms)
@@ -194,10 +195,10 @@ class AdapterManager(BaseManager):
                         name=props.get(self._name_prop, None),
                         properties=props)
 
-                    if matches_filters(resource_obj, client_filters):
+                    if matches_filters(resource_obj, client_filter):
                         resource_obj_list.append(resource_obj)
-                        if full_properties:
-                            resource_obj.pull_full_properties()
+                if full_properties:
+                    self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
@@ -657,6 +658,7 @@ class Adapter(BaseResource):
         query_props = ['name', 'status']
         query_parms, client_filters = divide_filter_args(
             query_props, filter_args)
+        client_filter = Filter(client_filters)
         uri = '{}/operations/get-partitions-assigned-to-adapter{}'.format(
             self.uri, query_parms)
 
@@ -673,9 +675,10 @@ class Adapter(BaseResource):
                 name=props.get(partition_mgr._name_prop, None),
                 properties=props)
 
-            if matches_filters(resource_obj, client_filters):
+            if matches_filters(resource_obj, client_filter):
                 resource_obj_list.append(resource_obj)
-                if full_properties:
-                    resource_obj.pull_full_properties()
+        if full_properties:
+            # pylint: disable=protected-access
+            partition_mgr._pull_full_properties(resource_obj_list)
 
         return resource_obj_list
@@ -0,0 +1,419 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+AsyncExecutorSession and AsyncExecutorClient classes: Executor adapters for
+using the HMC from :mod:`py:asyncio` coroutines.
+
+These classes are available on Python 3.5 and higher only.
+
+They provide awaitable variants of the methods of
+:class:`~zhmcclient.Session` and :class:`~zhmcclient.Client` and of the
+resource manager and resource methods that are most frequently used for reading
+resources, for example::
+
+    import asyncio
+    import zhmcclient
+
+    async def list_all_partitions(asession):
+        aclient = zhmcclient.AsyncExecutorClient(asession)
+        cpcs = await aclient.list(aclient.client.cpcs)
+        part_lists = await asyncio.gather(
+            *[aclient.list(cpc.partitions) for cpc in cpcs])
+        return [p for parts in part_lists for p in parts]
+
+    session = zhmcclient.Session(host, userid, password)
+    with zhmcclient.AsyncExecutorSession(session, max_workers=20) as asession:
+        loop = asyncio.new_event_loop()
+        try:
+            partitions = loop.run_until_complete(
+                list_all_partitions(asession))
+        finally:
+            loop.close()
+
+These classes do not perform non-blocking I/O. The HTTP interactions with the
+HMC are performed by the underlying (blocking) :class:`~zhmcclient.Session`
+object, and are offloaded to a bounded pool of worker threads owned by the
+:class:`~zhmcclient.AsyncExecutorSession` object. Each HMC request that is in
+progress therefore occupies one worker thread, and the number of concurrently
+outstanding HMC requests is limited by the size of that pool, independently of
+the number of coroutines awaiting results. The logon and re-logon behavior,
+the :class:`~zhmcclient.RetryTimeoutConfig` settings and the time statistics
+of the underlying session apply unchanged.
+
+The resource objects returned by these classes are the normal zhmcclient
+resource objects (e.g. :class:`~zhmcclient.Partition`), so their synchronous
+methods can be used as well.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from ._client import Client
+from ._logging import logged_api_call
+
+__all__ = ['AsyncExecutorSession', 'AsyncExecutorClient']
+
+
+class AsyncExecutorSession(object):
+    """
+    An executor adapter for using a :class:`~zhmcclient.Session` from
+    :mod:`py:asyncio` coroutines.
+
+    An object of this class wraps a :class:`~zhmcclient.Session` object and
+    provides awaitable variants of its HTTP methods, by running the blocking
+    methods of the session in a pool of worker threads. The methods of this
+    class return coroutines that need to be awaited (or run to completion on
+    an event loop) to obtain the result. The blocking method is submitted to
+    the worker thread pool when the coroutine starts running, so no event loop
+    is needed to create the coroutine.
+
+    The object owns a pool of worker threads in which the blocking HTTP
+    requests of the underlying session are performed. It should be closed
+    using :meth:`~zhmcclient.AsyncExecutorSession.close` when no longer
+    needed, or be used as a context manager.
+    """
+
+    def __init__(self, session, max_workers=None):
+        """
+        Parameters:
+
+          session (:class:`~zhmcclient.Session`):
+            The session with the HMC that is used to perform the HTTP
+            interactions. Must not be `None`.
+
+          max_workers (:term:`integer`):
+            Maximum number of HMC requests that are outstanding concurrently.
+            `None` means to use the default of
+            :class:`py:concurrent.futures.ThreadPoolExecutor`.
+
+            To actually reuse connections for all concurrent requests, this
+            value should not be larger than the size of the HTTP connection
+            pool of the session.
+        """
+        self._session = session
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def __repr__(self):
+        """
+        Return a string with the state of this executor session, for debug
+        purposes.
+        """
+        ret = (
+            "{classname} at 0x{id:08x} (\n"
+            "  _session={s._session!r},\n"
+            "  _max_workers={s._max_workers!r}\n"
+            ")".format(classname=self.__class__.__name__, id=id(self), s=self))
+        return ret
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def session(self):
+        """
+        :class:`~zhmcclient.Session`: The underlying (synchronous) session
+        with the HMC.
+        """
+        return self._session
+
+    @property
+    def max_workers(self):
+        """
+        :term:`integer`: Maximum number of HMC requests that are outstanding
+        concurrently, or `None` for the default of
+        :class:`py:concurrent.futures.ThreadPoolExecutor`.
+        """
+        return self._max_workers
+
+    @property
+    def retry_timeout_config(self):
+        """
+        :class:`~zhmcclient.RetryTimeoutConfig`: The effective retry/timeout
+        configuration of the underlying session.
+        """
+        return self._session.retry_timeout_config
+
+    @property
+    def time_stats_keeper(self):
+        """
+        The time statistics keeper of the underlying session (for a usage
+        example, see section :ref:`Time Statistics`).
+        """
+        return self._session.time_stats_keeper
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Run a blocking callable in the worker thread pool of this executor
+        session.
+
+        This can be used to perform any synchronous zhmcclient method
+        without blocking the event loop, for example::
+
+            await asession.run(partition.start, wait_for_completion=True)
+
+        Parameters:
+
+          func (:term:`callable`): The callable to be run.
+
+          \\*args: Positional arguments for the callable.
+
+          \\**kwargs: Keyword arguments for the callable.
+
+        Returns:
+
+          :term:`py:coroutine`: A coroutine returning the return value of the
+          callable. Awaiting it raises any exception raised by the callable.
+        """
+        future = self._executor.submit(func, *args, **kwargs)
+        # When awaited, the wrapped future is bound to the running event loop
+        result = await asyncio.wrap_future(future)
+        return result
+
+    @logged_api_call
+    def close(self):
+        """
+        Close this executor session.
+
+        This shuts down the worker thread pool after the already submitted
+        requests have completed. The underlying session remains logged on;
+        use :meth:`~zhmcclient.AsyncExecutorSession.logoff` before closing to
+        log it off.
+        """
+        self._executor.shutdown(wait=True)
+
+    @logged_api_call
+    def logon(self, verify=False):
+        """
+        Awaitable variant of :meth:`zhmcclient.Session.logon`.
+        """
+        return self.run(self._session.logon, verify=verify)
+
+    @logged_api_call
+    def logoff(self, verify=False):
+        """
+        Awaitable variant of :meth:`zhmcclient.Session.logoff`.
+        """
+        return self.run(self._session.logoff, verify=verify)
+
+    @logged_api_call
+    def is_logon(self, verify=False):
+        """
+        Awaitable variant of :meth:`zhmcclient.Session.is_logon`.
+        """
+        return self.run(self._session.is_logon, verify=verify)
+
+    @logged_api_call
+    def get(self, uri, logon_required=True):
+        """
+        Awaitable variant of :meth:`zhmcclient.Session.get`.
+
+        Returns:
+
+          :term:`py:coroutine`: A coroutine returning the :term:`json object`
+          with the operation result.
+        """
+        return self.run(self._session.get, uri, logon_required=logon_required)
+
+    @logged_api_call
+    def post(self, uri, body=None, logon_required=True,
+             wait_for_completion=False, operation_timeout=None):
+        """
+        Awaitable variant of :meth:`zhmcclient.Session.post`.
+
+        Returns:
+
+          :term:`py:coroutine`: A coroutine returning the return value of
+          :meth:`zhmcclient.Session.post`.
+        """
+        return self.run(self._session.post, uri, body=body,
+                        logon_required=logon_required,
+                        wait_for_completion=wait_for_completion,
+                        operation_timeout=operation_timeout)
+
+    @logged_api_call
+    def delete(self, uri, logon_required=True):
+        """
+        Awaitable variant of :meth:`zhmcclient.Session.delete`.
+        """
+        return self.run(self._session.delete, uri,
+                        logon_required=logon_required)
+
+
+class AsyncExecutorClient(object):
+    """
+    An executor adapter for using a :class:`~zhmcclient.Client` from
+    :mod:`py:asyncio` coroutines.
+
+    An object of this class provides awaitable variants of the methods of
+    :class:`~zhmcclient.Client`, and of the resource manager and resource
+    methods that are used for finding and reading resources.
+
+    The resource managers are accessed through the (synchronous)
+    :class:`~zhmcclient.Client` object available as
+    :attr:`~zhmcclient.AsyncExecutorClient.client`, and are passed to the
+    methods of this class, for example::
+
+        cpcs = await aclient.list(aclient.client.cpcs)
+        partition = await aclient.find(cpcs[0].partitions, name='PART1')
+        await aclient.pull_full_properties(partition)
+    """
+
+    def __init__(self, executor_session):
+        """
+        Parameters:
+
+          executor_session (:class:`~zhmcclient.AsyncExecutorSession`):
+            Executor session with the HMC.
+        """
+        self._executor_session = executor_session
+        self._client = Client(executor_session.session)
+
+    @property
+    def executor_session(self):
+        """
+        :class:`~zhmcclient.AsyncExecutorSession`: Executor session with the
+        HMC.
+        """
+        return self._executor_session
+
+    @property
+    def client(self):
+        """
+        :class:`~zhmcclient.Client`: The (synchronous) client for the session
+        underlying the executor session, providing access to the resource
+        managers.
+        """
+        return self._client
+
+    @logged_api_call
+    def query_api_version(self):
+        """
+        Awaitable variant of :meth:`zhmcclient.Client.query_api_version`.
+        """
+        return self._executor_session.run(self._client.query_api_version)
+
+    @logged_api_call
+    def version_info(self):
+        """
+        Awaitable variant of :meth:`zhmcclient.Client.version_info`.
+        """
+        return self._executor_session.run(self._client.version_info)
+
+    @logged_api_call
+    def list(self, manager, full_properties=False, filter_args=None):
+        """
+        Awaitable variant of the ``list()`` method of resource managers (e.g.
+        :meth:`zhmcclient.PartitionManager.list`).
+
+        Parameters:
+
+          manager (subclass of :class:`~zhmcclient.BaseManager`):
+            The resource manager whose resources are listed.
+
+          full_properties (bool):
+            Controls whether the full set of resource properties should be
+            retrieved.
+
+          filter_args (dict):
+            Filter arguments. For details, see :ref:`Filtering`.
+
+        Returns:
+
+          :term:`py:coroutine`: A coroutine returning the list of resource
+          objects.
+        """
+        return self._executor_session.run(
+            manager.list, full_properties=full_properties,
+            filter_args=filter_args)
+
+    @logged_api_call
+    def findall(self, manager, **filter_args):
+        """
+        Awaitable variant of :meth:`zhmcclient.BaseManager.findall`.
+
+        Parameters:
+
+          manager (subclass of :class:`~zhmcclient.BaseManager`):
+            The resource manager whose resources are searched.
+
+          \\**filter_args:
+            Filter arguments. For details, see :ref:`Filtering`.
+
+        Returns:
+
+          :term:`py:coroutine`: A coroutine returning the list of matching
+          resource objects.
+        """
+        return self._executor_session.run(manager.findall, **filter_args)
+
+    @logged_api_call
+    def find(self, manager, **filter_args):
+        """
+        Awaitable variant of :meth:`zhmcclient.BaseManager.find`.
+
+        Parameters:
+
+          manager (subclass of :class:`~zhmcclient.BaseManager`):
+            The resource manager whose resources are searched.
+
+          \\**filter_args:
+            Filter arguments. For details, see :ref:`Filtering`.
+
+        Returns:
+
+          :term:`py:coroutine`: A coroutine returning the matching resource
+          object. Awaiting it raises :exc:`~zhmcclient.NotFound` or
+          :exc:`~zhmcclient.NoUniqueMatch` as described for
+          :meth:`zhmcclient.BaseManager.find`.
+        """
+        return self._executor_session.run(manager.find, **filter_args)
+
+    @logged_api_call
+    def find_by_name(self, manager, name):
+        """
+        Awaitable variant of :meth:`zhmcclient.BaseManager.find_by_name`.
+        """
+        return self._executor_session.run(manager.find_by_name, name)
+
+    @logged_api_call
+    def pull_full_properties(self, resource):
+        """
+        Awaitable variant of
+        :meth:`zhmcclient.BaseResource.pull_full_properties`.
+
+        Parameters:
+
+          resource (subclass of :class:`~zhmcclient.BaseResource`):
+            The resource object whose properties are retrieved.
+
+        Returns:
+
+          :term:`py:coroutine`: A coroutine that completes when the
+          properties of the resource object have been updated.
+        """
+        return self._executor_session.run(resource.pull_full_properties)
+
+    @logged_api_call
+    def get_property(self, resource, name):
+        """
+        Awaitable variant of :meth:`zhmcclient.BaseResource.get_property`.
+        """
+        return self._executor_session.run(resource.get_property, name)
@@ -30,7 +30,8 @@ import copy
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._logging import logged_api_call
-from ._utils import matches_filters, divide_filter_args, RC_CAPACITY_GROUP
+from ._utils import matches_filters, Filter, divide_filter_args, \
+    RC_CAPACITY_GROUP
 
 __all__ = ['CapacityGroupManager', 'CapacityGroup']
 
@@ -120,6 +121,7 @@ class CapacityGroupManager(BaseManager):
         else:
             query_parms, client_filters = divide_filter_args(
                 self._query_props, filter_args)
+            client_filter = Filter(client_filters)
 
             resources_name = 'capacity-groups'
             uri = '{}/{}{}'.format(self.cpc.uri, resources_name, query_parms)
@@ -135,10 +137,10 @@ class CapacityGroupManager(BaseManager):
                         name=props.get(self._name_prop, None),
                         properties=props)
 
-                    if matches_filters(resource_obj, client_filters):
+                    if matches_filters(resource_obj, client_filter):
                         resource_obj_list.append(resource_obj)
-                        if full_properties:
-                            resource_obj.pull_full_properties()
+                if full_properties:
+                    self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
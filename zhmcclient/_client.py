@@ -29,11 +29,14 @@ import yamlloader
 from ._cpc import CpcManager
 from ._console import ConsoleManager
 from ._metrics import MetricsContextManager, MetricsResponse, CLASS_FROM_GROUP
-from ._logging import logged_api_call
+from ._logging import logged_api_call, get_logger
 from ._exceptions import Error, OperationTimeout
+from ._constants import HMC_LOGGER_NAME
 
 __all__ = ['Client']
 
+HMC_LOGGER = get_logger(HMC_LOGGER_NAME)
+
 
 class Client(object):
     """
@@ -54,6 +57,8 @@ class Client(object):
         self._consoles = ConsoleManager(self)
         self._metrics_contexts = MetricsContextManager(self)
         self._api_version = None
+        # Session-id of the HMC session for which _api_version was retrieved
+        self._api_version_session_id = None
 
     @property
     def session(self):
@@ -97,6 +102,11 @@ class Client(object):
 
         This operation does not require authentication.
 
+        If the session uses a :class:`~zhmcclient.SessionCache` and has
+        reused the HMC session of a previous process from it, the API version
+        information that was stored in the session cache for that HMC session
+        is used, without contacting the HMC.
+
         Returns:
 
           :term:`HMC API version`: The HMC API version supported by the HMC.
@@ -107,6 +117,14 @@ class Client(object):
           :exc:`~zhmcclient.ParseError`
           :exc:`~zhmcclient.ConnectionError`
         """
+        session_id = self._session.session_id
+        if self._api_version_session_id not in (None, session_id):
+            # The session has logged on again since the API version
+            # information was retrieved (e.g. after an HMC restart)
+            self._api_version = None
+        if self._api_version is None:
+            self._api_version = self._cached_api_version()
+            self._api_version_session_id = session_id
         if self._api_version is None:
             self.query_api_version()
         return self._api_version['api-major-version'],\
@@ -120,6 +138,11 @@ class Client(object):
 
         This operation does not require authentication.
 
+        This method always contacts the HMC. If the session uses a
+        :class:`~zhmcclient.SessionCache` and is logged on, the API version
+        information is stored in the session cache for use by
+        :meth:`version_info` in later processes that reuse the HMC session.
+
         Returns:
 
           :term:`json object`:
@@ -135,11 +158,41 @@ class Client(object):
           :exc:`~zhmcclient.ParseError`
           :exc:`~zhmcclient.ConnectionError`
         """
-        version_resp = self._session.get('/api/version',
-                                         logon_required=False)
+        session = self._session
+        cache = session.session_cache
+        version_resp = session.get('/api/version', logon_required=False)
         self._api_version = version_resp
+        self._api_version_session_id = session.session_id
+        if cache is not None and session.userid is not None and \
+                session.session_id is not None:
+            try:
+                cache.update_entry(
+                    session.host, session.port, session.userid,
+                    api_version=version_resp)
+            except (IOError, OSError) as exc:
+                HMC_LOGGER.warning(
+                    "Cannot update session cache file %s: %s",
+                    cache.filepath, exc)
         return self._api_version
 
+    def _cached_api_version(self):
+        """
+        Return the API version information from the session cache, if the
+        session uses a session cache and the cache entry is for the current
+        HMC session of the session. Otherwise, return `None`.
+        """
+        session = self._session
+        cache = session.session_cache
+        if cache is None or session.userid is None or \
+                session.session_id is None:
+            return None
+        cache_entry = cache.get_entry(
+            session.host, session.port, session.userid)
+        if not cache_entry or \
+                cache_entry.get('session-id') != session.session_id:
+            return None
+        return cache_entry.get('api-version', None)
+
     @logged_api_call
     def get_inventory(self, resources):
         """
@@ -189,6 +242,53 @@ class Client(object):
         result = self.session.post(uri, body=body)
         return result
 
+    @logged_api_call
+    def iter_inventory(self, resources):
+        """
+        Return an iterator over the requested resources and their properties,
+        that are managed by the HMC.
+
+        This method performs the 'Get Inventory' HMC operation, like
+        :meth:`get_inventory`. However, the response is read and parsed
+        incrementally while the returned iterator is consumed, so that the
+        resources can be processed with bounded memory even for very large
+        HMCs (see :meth:`zhmcclient.Session.iter_post`).
+
+        If resources cannot be fully inventoried, the iterator returns items
+        describing the errors. They can be identified by their 'class'
+        property having a value of 'inventory-error'.
+
+        Parameters:
+
+          resources (:term:`iterable` of :term:`string`):
+            Resource classes and/or resource classifiers specifying the types
+            of resources that should be included in the result. For details,
+            see :meth:`get_inventory`.
+
+            Must not be `None`.
+
+        Returns:
+
+          iterator of dict: Iterator over the resources for the requested
+          resource classes and resource classifiers. Each item is a
+          dictionary with the resource properties using the HMC property
+          names.
+
+        Example:
+
+            for resource in client.iter_inventory(['partition', 'adapter']):
+                print(resource['class'], resource['name'])
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError` (also while iterating)
+          :exc:`~zhmcclient.ConnectionError` (also while iterating)
+        """
+        uri = '/api/services/inventory'
+        body = {'resources': resources}
+        return self.session.iter_post(uri, body=body)
+
     @logged_api_call
     def wait_for_available(self, operation_timeout=None):
         """
@@ -27,7 +27,7 @@ from ._manager import BaseManager
 from ._resource import BaseResource
 from ._logging import logged_api_call
 from ._utils import timestamp_from_datetime, divide_filter_args, \
-    matches_filters, RC_CONSOLE
+    matches_filters, Filter, RC_CONSOLE
 from ._storage_group import StorageGroupManager
 from ._storage_group_template import StorageGroupTemplateManager
 from ._user import UserManager
@@ -529,6 +529,106 @@ class Console(BaseResource):
         result = self.manager.session.get(uri)
         return result
 
+    @logged_api_call
+    def iter_audit_log(self, begin_time=None, end_time=None):
+        """
+        Return an iterator over the console audit log entries, optionally
+        filtered by their creation time.
+
+        This method performs the 'Get Console Audit Log' HMC operation, like
+        :meth:`get_audit_log`. However, the response is read and parsed
+        incrementally while the returned iterator is consumed, so that the
+        log entries can be processed with bounded memory even for very large
+        logs (see :meth:`zhmcclient.Session.iter_get`).
+
+        Authorization requirements:
+
+        * Task permission to the "Audit and Log Management" task.
+
+        Parameters:
+
+          begin_time (:class:`~py:datetime.datetime`):
+            Begin time for filtering. Log entries with a creation time older
+            than the begin time will be omitted from the results.
+
+            If `None`, no such filtering is performed (and the oldest available
+            log entries will be included).
+
+          end_time (:class:`~py:datetime.datetime`):
+            End time for filtering. Log entries with a creation time newer
+            than the end time will be omitted from the results.
+
+            If `None`, no such filtering is performed (and the newest available
+            log entries will be included).
+
+        Returns:
+
+          iterator of :term:`json object`:
+            Iterator over the log entries, as described in section
+            'Response body contents' of operation 'Get Console Audit Log' in
+            the :term:`HMC API` book.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError` (also while iterating)
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError` (also while iterating)
+        """
+        query_parms = self._time_query_parms(begin_time, end_time)
+        uri = self.uri + '/operations/get-audit-log' + query_parms
+        return self.manager.session.iter_get(uri)
+
+    @logged_api_call
+    def iter_security_log(self, begin_time=None, end_time=None):
+        """
+        Return an iterator over the console security log entries, optionally
+        filtered by their creation time.
+
+        This method performs the 'Get Console Security Log' HMC operation, like
+        :meth:`get_security_log`. However, the response is read and parsed
+        incrementally while the returned iterator is consumed, so that the
+        log entries can be processed with bounded memory even for very large
+        logs (see :meth:`zhmcclient.Session.iter_get`).
+
+        Authorization requirements:
+
+        * Task permission to the "View Security Logs" task.
+
+        Parameters:
+
+          begin_time (:class:`~py:datetime.datetime`):
+            Begin time for filtering. Log entries with a creation time older
+            than the begin time will be omitted from the results.
+
+            If `None`, no such filtering is performed (and the oldest available
+            log entries will be included).
+
+          end_time (:class:`~py:datetime.datetime`):
+            End time for filtering. Log entries with a creation time newer
+            than the end time will be omitted from the results.
+
+            If `None`, no such filtering is performed (and the newest available
+            log entries will be included).
+
+        Returns:
+
+          iterator of :term:`json object`:
+            Iterator over the log entries, as described in section
+            'Response body contents' of operation 'Get Console Security Log' in
+            the :term:`HMC API` book.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError` (also while iterating)
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError` (also while iterating)
+        """
+        query_parms = self._time_query_parms(begin_time, end_time)
+        uri = self.uri + '/operations/get-security-log' + query_parms
+        return self.manager.session.iter_get(uri)
+
     @logged_api_call
     def list_unmanaged_cpcs(self, name=None):
         """
@@ -634,6 +734,7 @@ class Console(BaseResource):
         query_parms, client_filters = divide_filter_args(
             ['name', 'type', 'status', 'has-unacceptable-status', 'cpc-name'],
             filter_args)
+        client_filter = Filter(client_filters)
 
         # Perform the operation with the HMC, including any server-side
         # filtering.
@@ -678,10 +779,11 @@ class Console(BaseResource):
                 )
 
                 # Apply client-side filtering
-                if matches_filters(partition_obj, client_filters):
+                if matches_filters(partition_obj, client_filter):
                     partition_objs.append(partition_obj)
-                    if full_properties:
-                        partition_obj.pull_full_properties()
+            if full_properties:
+                # pylint: disable=protected-access
+                self.manager._pull_full_properties(partition_objs)
 
         return partition_objs
 
@@ -751,6 +853,7 @@ class Console(BaseResource):
         query_parms, client_filters = divide_filter_args(
             ['name', 'type', 'status', 'has-unacceptable-status', 'cpc-name'],
             filter_args)
+        client_filter = Filter(client_filters)
 
         # Perform the operation with the HMC, including any server-side
         # filtering.
@@ -796,10 +899,11 @@ class Console(BaseResource):
                 )
 
                 # Apply client-side filtering
-                if matches_filters(lpar_obj, client_filters):
+                if matches_filters(lpar_obj, client_filter):
                     lpar_objs.append(lpar_obj)
-                    if full_properties:
-                        lpar_obj.pull_full_properties()
+            if full_properties:
+                # pylint: disable=protected-access
+                self.manager._pull_full_properties(lpar_objs)
 
         return lpar_objs
 
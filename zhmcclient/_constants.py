@@ -33,6 +33,20 @@ __all__ = ['DEFAULT_CONNECT_TIMEOUT',
            'DEFAULT_OPERATION_TIMEOUT',
            'DEFAULT_STATUS_TIMEOUT',
            'DEFAULT_NAME_URI_CACHE_TIMETOLIVE',
+           'DEFAULT_NAME_URI_CACHE_MAXSIZE',
+           'DEFAULT_NAME_URI_CACHE_NEGATIVE_TTL',
+           'DEFAULT_MAX_WORKERS',
+           'DEFAULT_POLL_MIN_INTERVAL',
+           'DEFAULT_POLL_MAX_INTERVAL',
+           'DEFAULT_POOL_CONNECTIONS',
+           'DEFAULT_POOL_MAXSIZE',
+           'DEFAULT_POOL_BLOCK',
+           'DEFAULT_RATE_LIMIT',
+           'DEFAULT_RATE_LIMIT_BURST',
+           'DEFAULT_MAX_IN_FLIGHT',
+           'DEFAULT_BUSY_RETRIES',
+           'DEFAULT_BUSY_MIN_INTERVAL',
+           'DEFAULT_BUSY_MAX_INTERVAL',
            'HMC_LOGGER_NAME',
            'JMS_LOGGER_NAME',
            'API_LOGGER_NAME',
@@ -113,6 +127,109 @@ DEFAULT_STATUS_TIMEOUT = 900
 #: caching is disabled).
 DEFAULT_NAME_URI_CACHE_TIMETOLIVE = 300
 
+#: Default maximum number of entries of a session-wide Name-URI cache,
+#: if not specified in the ``maxsize`` init argument to
+#: :class:`~zhmcclient.NameUriCache`.
+DEFAULT_NAME_URI_CACHE_MAXSIZE = 10000
+
+#: Default time in seconds a resource name that was not found is remembered
+#: by a session-wide Name-URI cache,
+#: if not specified in the ``negative_ttl`` init argument to
+#: :class:`~zhmcclient.NameUriCache`.
+DEFAULT_NAME_URI_CACHE_NEGATIVE_TTL = 10
+
+#: Default maximum number of HMC requests that are issued concurrently by
+#: zhmcclient methods that perform multiple independent HMC requests (e.g.
+#: the ``list()`` methods of resource managers when retrieving the full set of
+#: properties),
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+#:
+#: The value 1 causes these HMC requests to be issued sequentially.
+DEFAULT_MAX_WORKERS = 1
+
+#: Default initial interval in seconds between polls when waiting for
+#: completion of an asynchronous HMC operation or for a resource status,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+#:
+#: The interval is doubled after each poll, up to
+#: :data:`~zhmcclient.DEFAULT_POLL_MAX_INTERVAL`.
+DEFAULT_POLL_MIN_INTERVAL = 1
+
+#: Default maximum interval in seconds between polls when waiting for
+#: completion of an asynchronous HMC operation or for a resource status,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+DEFAULT_POLL_MAX_INTERVAL = 10
+
+#: Default number of HTTP connection pools (one per host) cached by a
+#: :class:`~zhmcclient.Session`,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+DEFAULT_POOL_CONNECTIONS = 10
+
+#: Default maximum number of HTTP connections to the HMC that are kept in the
+#: connection pool of a :class:`~zhmcclient.Session` for reuse,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+#:
+#: This should be at least the maximum number of threads that concurrently
+#: issue HMC requests on the session (see also
+#: :data:`~zhmcclient.DEFAULT_MAX_WORKERS`).
+DEFAULT_POOL_MAXSIZE = 10
+
+#: Default for whether HMC requests wait for a free HTTP connection when all
+#: connections of the connection pool of a :class:`~zhmcclient.Session` are in
+#: use, if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+#:
+#: `False` causes an additional connection to be opened that is discarded
+#: after its use.
+DEFAULT_POOL_BLOCK = False
+
+#: Default maximum average number of HTTP requests per second that are sent to
+#: the HMC by a :class:`~zhmcclient.Session`,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+#:
+#: The special value 0 means that no rate limit is set.
+DEFAULT_RATE_LIMIT = 0
+
+#: Default maximum number of HTTP requests that can be sent at once when a
+#: rate limit is set,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+DEFAULT_RATE_LIMIT_BURST = 10
+
+#: Default maximum number of HTTP requests of a :class:`~zhmcclient.Session`
+#: that are in progress at the same time,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+#:
+#: The special value 0 means that no limit is set.
+DEFAULT_MAX_IN_FLIGHT = 0
+
+#: Default number of retries for HTTP requests that the HMC rejects with
+#: HTTP status 429 or 503,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+#:
+#: The special value 0 means that such requests are not retried.
+DEFAULT_BUSY_RETRIES = 0
+
+#: Default backoff interval in seconds for the first retry of an HTTP request
+#: that the HMC rejected with HTTP status 429 or 503,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+DEFAULT_BUSY_MIN_INTERVAL = 0.5
+
+#: Default maximum time in seconds to wait before retrying an HTTP request
+#: that the HMC rejected with HTTP status 429 or 503,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+DEFAULT_BUSY_MAX_INTERVAL = 30
+
 #: Name of the Python logger that logs HMC operations.
 HMC_LOGGER_NAME = 'zhmcclient.hmc'
 
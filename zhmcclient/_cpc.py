@@ -65,7 +65,7 @@ from ._virtual_switch import VirtualSwitchManager
 from ._capacity_group import CapacityGroupManager
 from ._logging import logged_api_call
 from ._exceptions import ParseError, ConsistencyError
-from ._utils import matches_filters, divide_filter_args, \
+from ._utils import matches_filters, Filter, divide_filter_args, \
     RC_CPC, RC_ADAPTER, RC_CAPACITY_GROUP, RC_HBA, RC_NIC, RC_PARTITION, \
     RC_NETWORK_PORT, RC_STORAGE_PORT, RC_STORAGE_TEMPLATE, RC_STORAGE_GROUP, \
     RC_STORAGE_TEMPLATE_VOLUME, RC_STORAGE_VOLUME, RC_VIRTUAL_FUNCTION, \
@@ -187,6 +187,7 @@ class CpcManager(BaseManager):
         else:
             query_parms, client_filters = divide_filter_args(
                 self._query_props, filter_args)
+            client_filter = Filter(client_filters)
 
             resources_name = 'cpcs'
             uri = '/api/{}{}'.format(resources_name, query_parms)
@@ -202,10 +203,10 @@ class CpcManager(BaseManager):
                         name=props.get(self._name_prop, None),
                         properties=props)
 
-                    if matches_filters(resource_obj, client_filters):
+                    if matches_filters(resource_obj, client_filter):
                         resource_obj_list.append(resource_obj)
-                        if full_properties:
-                            resource_obj.pull_full_properties()
+                if full_properties:
+                    self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
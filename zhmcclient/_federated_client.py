@@ -0,0 +1,365 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A federated client performs the same query on the clients for multiple HMCs
+concurrently, and merges the results with the originating HMC host.
+
+A timeout can be specified for the query on each HMC, so that a slow or
+unreachable HMC does not delay the overall result. The timeout also applies
+to the time a query waits for a worker thread. The HMCs for which the
+query failed or timed out are reported in the result, and do not cause
+the overall query to fail.
+
+Example::
+
+    clients = [zhmcclient.Client(zhmcclient.Session(host, userid, password))
+               for host in hosts]
+    fed_client = zhmcclient.FederatedClient(clients, timeout=60)
+
+    result = fed_client.list_cpcs()
+    for host, cpc in result.items():
+        print(host, cpc.name)
+    for host, exc in result.errors.items():
+        print("Error on HMC {}: {}".format(host, exc))
+"""
+
+from __future__ import absolute_import
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from ._exceptions import OperationTimeout
+from ._logging import logged_api_call
+from ._scheduler import with_request_lane
+
+__all__ = ['FederatedClient', 'FederatedResult']
+
+# Polling interval in seconds while a started query on an HMC has not
+# registered its start time yet
+_START_POLL_INTERVAL = 0.05
+
+
+class FederatedResult(object):
+    """
+    The result of a query performed by a :class:`~zhmcclient.FederatedClient`
+    on multiple HMCs.
+    """
+
+    def __init__(self, hosts, results, errors):
+        """
+        Parameters:
+
+          hosts (list of :term:`string`): The HMC hosts of the query, in the
+            order of the clients of the federated client.
+
+          results (dict): The return values of the query for the HMCs on which
+            it succeeded, by HMC host.
+
+          errors (dict): The exceptions for the HMCs on which the query failed
+            or timed out, by HMC host.
+        """
+        self._hosts = hosts
+        self._results = results
+        self._errors = errors
+
+    def __repr__(self):
+        return "{}(hosts={!r}, failed_hosts={!r})". \
+            format(self.__class__.__name__, self._hosts,
+                   [h for h in self._hosts if h in self._errors])
+
+    @property
+    def hosts(self):
+        """
+        list of :term:`string`: The HMC hosts of the query.
+        """
+        return self._hosts
+
+    @property
+    def results(self):
+        """
+        dict: The return values of the query for the HMCs on which it
+        succeeded, by HMC host.
+        """
+        return self._results
+
+    @property
+    def errors(self):
+        """
+        dict: The exceptions for the HMCs on which the query failed, by HMC
+        host. A query that timed out has a
+        :exc:`~zhmcclient.OperationTimeout` exception.
+        """
+        return self._errors
+
+    def items(self):
+        """
+        Return the merged items of list results, tagged with the HMC host they
+        originate from.
+
+        Returns:
+
+          list of tuple(host, item): The items of the results of the HMCs, in
+          the order of the HMCs.
+        """
+        return [(host, item)
+                for host in self._hosts if host in self._results
+                for item in self._results[host]]
+
+
+class FederatedClient(object):
+    """
+    A client for performing queries concurrently on multiple HMCs, each of
+    which is represented by a :class:`~zhmcclient.Client` object.
+
+    The query on each HMC is performed in its own worker thread. If a query
+    times out, its worker thread is not waited for, and continues until the
+    HMC request ends (e.g. due to the read timeout of its session). Note that
+    the Python interpreter waits for such worker threads to end before it
+    exits.
+    """
+
+    def __init__(self, clients, max_workers=None, timeout=None):
+        """
+        Parameters:
+
+          clients (iterable of :class:`~zhmcclient.Client`): The clients for
+            the HMCs. The HMC hosts of their sessions must be unique.
+
+          max_workers (:term:`integer`): Maximum number of HMCs that are
+            queried concurrently. `None` means all HMCs.
+
+          timeout (:term:`number`): Default timeout in seconds for the query
+            on each HMC, measured from when the query on that HMC is started.
+            A query that has not been started within the timeout after the
+            queries were submitted (because all worker threads were busy) is
+            cancelled and times out. `None` means no timeout.
+
+        Raises:
+
+          ValueError: Duplicate HMC hosts.
+        """
+        self._clients = list(clients)
+        hosts = [c.session.host for c in self._clients]
+        for host in hosts:
+            if hosts.count(host) > 1:
+                raise ValueError("Duplicate HMC host in federated client: {!r}".
+                                 format(host))
+        self._max_workers = max_workers
+        self._timeout = timeout
+
+    def __repr__(self):
+        return "{}(hosts={!r}, max_workers={!r}, timeout={!r})". \
+            format(self.__class__.__name__, self.hosts, self._max_workers,
+                   self._timeout)
+
+    @property
+    def clients(self):
+        """
+        list of :class:`~zhmcclient.Client`: The clients for the HMCs.
+        """
+        return self._clients
+
+    @property
+    def hosts(self):
+        """
+        list of :term:`string`: The HMC hosts, in the order of the clients.
+        """
+        return [c.session.host for c in self._clients]
+
+    @property
+    def timeout(self):
+        """
+        :term:`number`: Default timeout in seconds for the query on each HMC,
+        or `None` for no timeout.
+        """
+        return self._timeout
+
+    @logged_api_call
+    def map(self, func, timeout=None):
+        """
+        Perform a query on each HMC concurrently.
+
+        Parameters:
+
+          func (callable): The query. It is called with the
+            :class:`~zhmcclient.Client` object for the HMC as its only
+            argument.
+
+          timeout (:term:`number`): Timeout in seconds for the query on each
+            HMC. `None` means the default timeout of the federated client.
+
+        Returns:
+
+          :class:`~zhmcclient.FederatedResult`: The results and errors of the
+          query on the HMCs.
+        """
+        if timeout is None:
+            timeout = self._timeout
+        hosts = self.hosts
+        results = {}
+        errors = {}
+        if not self._clients:
+            return FederatedResult(hosts, results, errors)
+
+        start_times = {}
+        submit_time = time.time()
+
+        def query(client):
+            # pylint: disable=missing-docstring
+            start_times[client.session.host] = time.time()
+            return func(client)
+
+        query = with_request_lane(query)
+        max_workers = self._max_workers or len(self._clients)
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(self._clients)))
+        try:
+            pending = {executor.submit(query, c): c.session.host
+                       for c in self._clients}
+            while pending:
+                wait_time = None
+                if timeout is not None:
+                    now = time.time()
+                    for future, host in list(pending.items()):
+                        start_time = start_times.get(host)
+                        if start_time is not None:
+                            deadline = start_time + timeout
+                        elif future.running():
+                            # Started, but start time not registered yet
+                            deadline = now + _START_POLL_INTERVAL
+                        else:
+                            # Waiting for a worker thread
+                            deadline = submit_time + timeout
+                        remaining = deadline - now
+                        if remaining <= 0 and not future.done():
+                            # Cancels the query if it has not been started
+                            future.cancel()
+                            del pending[future]
+                            errors[host] = OperationTimeout(
+                                "Query on HMC {} timed out after {} s".
+                                format(host, timeout), timeout)
+                        elif wait_time is None or remaining < wait_time:
+                            wait_time = max(remaining, 0)
+                    if not pending:
+                        break
+                done, _ = wait(list(pending), timeout=wait_time,
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    host = pending.pop(future)
+                    exc = future.exception()
+                    if exc is None:
+                        results[host] = future.result()
+                    else:
+                        errors[host] = exc
+        finally:
+            # Do not wait for the worker threads of timed out queries
+            executor.shutdown(wait=False)
+        return FederatedResult(hosts, results, errors)
+
+    @logged_api_call
+    def list_cpcs(self, full_properties=False, filter_args=None,
+                  timeout=None):
+        """
+        List the CPCs managed by the HMCs.
+
+        For a description of the `full_properties` and `filter_args`
+        parameters, see :meth:`zhmcclient.CpcManager.list`.
+
+        Parameters:
+
+          timeout (:term:`number`): Timeout in seconds for the query on each
+            HMC. `None` means the default timeout of the federated client.
+
+        Returns:
+
+          :class:`~zhmcclient.FederatedResult`: The lists of
+          :class:`~zhmcclient.Cpc` objects of the HMCs.
+        """
+        return self.map(
+            lambda client: client.cpcs.list(
+                full_properties=full_properties, filter_args=filter_args),
+            timeout=timeout)
+
+    @logged_api_call
+    def list_permitted_partitions(self, full_properties=False,
+                                  filter_args=None, timeout=None):
+        """
+        List the permitted partitions of the CPCs in DPM mode managed by the
+        HMCs.
+
+        For a description of the `full_properties` and `filter_args`
+        parameters, see :meth:`zhmcclient.Console.list_permitted_partitions`.
+
+        Parameters:
+
+          timeout (:term:`number`): Timeout in seconds for the query on each
+            HMC. `None` means the default timeout of the federated client.
+
+        Returns:
+
+          :class:`~zhmcclient.FederatedResult`: The lists of
+          :class:`~zhmcclient.Partition` objects of the HMCs.
+        """
+        return self.map(
+            lambda client: client.consoles.console.list_permitted_partitions(
+                full_properties=full_properties, filter_args=filter_args),
+            timeout=timeout)
+
+    @logged_api_call
+    def list_permitted_lpars(self, full_properties=False, filter_args=None,
+                             timeout=None):
+        """
+        List the permitted LPARs of the CPCs in classic mode managed by the
+        HMCs.
+
+        For a description of the `full_properties` and `filter_args`
+        parameters, see :meth:`zhmcclient.Console.list_permitted_lpars`.
+
+        Parameters:
+
+          timeout (:term:`number`): Timeout in seconds for the query on each
+            HMC. `None` means the default timeout of the federated client.
+
+        Returns:
+
+          :class:`~zhmcclient.FederatedResult`: The lists of
+          :class:`~zhmcclient.Lpar` objects of the HMCs.
+        """
+        return self.map(
+            lambda client: client.consoles.console.list_permitted_lpars(
+                full_properties=full_properties, filter_args=filter_args),
+            timeout=timeout)
+
+    @logged_api_call
+    def get_inventory(self, resources, timeout=None):
+        """
+        Get the inventory of the HMCs, for the specified resource classes.
+
+        For a description of the `resources` parameter, see
+        :meth:`zhmcclient.Client.get_inventory`.
+
+        Parameters:
+
+          timeout (:term:`number`): Timeout in seconds for the query on each
+            HMC. `None` means the default timeout of the federated client.
+
+        Returns:
+
+          :class:`~zhmcclient.FederatedResult`: The lists of resource
+          property dictionaries of the HMCs.
+        """
+        return self.map(
+            lambda client: client.get_inventory(resources),
+            timeout=timeout)
@@ -34,7 +34,7 @@ import copy
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._logging import logged_api_call
-from ._utils import matches_filters, RC_HBA
+from ._utils import matches_filters, Filter, RC_HBA
 
 __all__ = ['HbaManager', 'Hba']
 
@@ -125,6 +125,7 @@ class HbaManager(BaseManager):
         resource_obj_list = []
         uris = self.partition.get_property('hba-uris')
         if uris:
+            client_filter = Filter(filter_args)
             for uri in uris:
 
                 resource_obj = self.resource_class(
@@ -133,10 +134,10 @@ class HbaManager(BaseManager):
                     name=None,
                     properties=None)
 
-                if matches_filters(resource_obj, filter_args):
+                if matches_filters(resource_obj, client_filter):
                     resource_obj_list.append(resource_obj)
-                    if full_properties:
-                        resource_obj.pull_full_properties()
+            if full_properties:
+                self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
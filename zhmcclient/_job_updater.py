@@ -0,0 +1,270 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Job updater for notification-driven waiting for completion of asynchronous
+HMC operations (see :meth:`zhmcclient.Session.subscribe_job_updates`).
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from ._logging import logged_api_call
+from ._constants import DEFAULT_STOMP_PORT, JMS_LOGGER_NAME
+
+__all__ = ['JobUpdater']
+
+JMS_LOGGER = logging.getLogger(JMS_LOGGER_NAME)
+
+# Maximum number of completed job URIs that are remembered for jobs that are
+# not (yet) being waited for.
+_MAX_COMPLETED_JOBS = 1000
+
+
+class JobUpdater(object):
+    """
+    A class that receives the job completion notifications of a session and
+    wakes up threads that wait for completion of the corresponding jobs.
+
+    **Experimental:** This class is considered experimental at this point, and
+    its API may change incompatibly as long as it is experimental.
+
+    Note: The user should not create any objects of this class nor invoke any
+    methods of this class, because the objects are created automatically
+    when a :class:`~zhmcclient.Session` object is subscribed for job
+    updates (via its :meth:`~zhmcclient.Session.subscribe_job_updates`
+    method).
+
+    Creating an object of this class establishes a JMS session with the HMC and
+    subscribes for the job notification topic of the session. This causes the
+    HMC to emit a job completion notification when an asynchronous operation
+    started by the session completes. :meth:`zhmcclient.Job.wait_for_completion`
+    uses these notifications to retrieve the job status as soon as the job has
+    completed, instead of waiting for its next poll interval.
+    """
+
+    def __init__(self, session):
+        """
+        Parameters:
+
+          session (:class:`~zhmcclient.Session`): Session for which the
+            job updater should do its work. This defines the HMC host,
+            credentials and job notification topic that are used to establish
+            the JMS session with the HMC.
+        """
+
+        # URIs of completed jobs, as: OrderedDict(key: uri, value: None)
+        self._completed_jobs = OrderedDict()
+        self._condition = threading.Condition()
+
+        # Subscription ID. We use some value that allows to identify on the
+        # HMC that this is the zhmcclient, but otherwise we are not using
+        # this value ourselves.
+        self._sub_id = 'zhmcclient.%s' % id(self)
+
+        self._job_topic = session.job_topic
+
+        # Lazy importing for stomp, because it is so slow (ca. 5 sec)
+        if 'Stomp_Connection' not in globals():
+            # pylint: disable=import-outside-toplevel
+            from stomp import Connection as Stomp_Connection
+
+        self._conn = Stomp_Connection(
+            [(session.host, DEFAULT_STOMP_PORT)], use_ssl="SSL")
+        listener = _JobListener(self, session)
+        self._conn.set_listener('', listener)
+        # pylint: disable=protected-access
+        self._conn.connect(session.userid, session._password, wait=True)
+
+        dest = "/topic/" + self._job_topic
+        self._conn.subscribe(destination=dest, id=self._sub_id, ack='auto')
+
+        JMS_LOGGER.info(
+            "JMS session for job notification topic '%s' has been "
+            "established", self._job_topic)
+
+    @logged_api_call
+    def close(self):
+        """
+        Disconnect and close the JMS session with the HMC.
+
+        This implicitly unsubscribes from the job notification topic this
+        updater was created for. Threads that are currently waiting for jobs
+        are woken up.
+        """
+        self._conn.disconnect()
+        with self._condition:
+            self._condition.notify_all()
+
+    def job_completed(self, job_uri):
+        """
+        Record that a job has completed and wake up the threads waiting for
+        it.
+
+        This method is called when a job completion notification has been
+        received.
+        """
+        with self._condition:
+            self._completed_jobs[job_uri] = None
+            while len(self._completed_jobs) > _MAX_COMPLETED_JOBS:
+                self._completed_jobs.popitem(last=False)
+            self._condition.notify_all()
+
+    def wait_for_job(self, job_uri, timeout):
+        """
+        Wait until a job completion notification for the specified job has
+        been received, or until the timeout expires.
+
+        A notification that has been received before this method is called
+        is taken into account.
+
+        Parameters:
+
+          job_uri (:term:`string`): Canonical URI of the job.
+
+          timeout (:term:`number`): Maximum time to wait, in seconds.
+
+        Returns:
+
+          bool: Indicates whether a job completion notification for the job
+          has been received.
+        """
+        return bool(self.wait_for_jobs([job_uri], timeout))
+
+    def wait_for_jobs(self, job_uris, timeout):
+        """
+        Wait until a job completion notification for at least one of the
+        specified jobs has been received, or until the timeout expires.
+
+        Notifications that have been received before this method is called
+        are taken into account.
+
+        Parameters:
+
+          job_uris (iterable of :term:`string`): Canonical URIs of the jobs.
+
+          timeout (:term:`number`): Maximum time to wait, in seconds.
+
+        Returns:
+
+          list of :term:`string`: Canonical URIs of the specified jobs for
+          which a job completion notification has been received. The list is
+          empty if the timeout expired.
+        """
+        job_uris = list(job_uris)
+        end_time = time.time() + timeout
+        with self._condition:
+            while True:
+                completed = [uri for uri in job_uris
+                             if uri in self._completed_jobs]
+                if completed:
+                    return completed
+                remaining = end_time - time.time()
+                if remaining <= 0:
+                    return []
+                self._condition.wait(remaining)
+
+    def forget_job(self, job_uri):
+        """
+        Remove a job from the completed jobs of this job updater, if it is
+        there.
+
+        This method is called when the job has been deleted on the HMC.
+        """
+        with self._condition:
+            self._completed_jobs.pop(job_uri, None)
+
+
+class _JobListener(object):
+    # pylint: disable=too-few-public-methods
+    """
+    A notification listener class for use by the Python `stomp` package.
+
+    This is an internal class that does not need to be accessed or created by
+    the user. An object of this class is automatically created by the
+    :class:`~zhmcclient.JobUpdater` class, for its notification topic.
+
+    Note: In the stomp examples, this class inherits from
+    stomp.ConnectionListener. However, since that class defines only empty
+    methods and since we want to import the stomp module in a lazy manner,
+    we are not using that class, and stomp does not require us to.
+    """
+
+    def __init__(self, updater, session):
+        self._updater = updater
+        self._session = session
+
+    def on_message(self, headers, message):
+        # pylint: disable=unused-argument
+        """
+        Event method that gets called when this listener has received a JMS
+        message (representing an HMC notification).
+
+        Parameters:
+
+          headers (dict): JMS message headers, see HMC API book.
+
+          message (string): JMS message body as a string, which contains a
+            serialized JSON object, see HMC API book.
+        """
+        noti_type = headers.get('notification-type', None)
+        if noti_type != 'job-completion':
+            JMS_LOGGER.warning(
+                "JMS message for notification of type %s for topic '%s' "
+                "is ignored", noti_type, self._session.job_topic)
+            return
+
+        try:
+            job_uri = headers['job-uri']
+        except KeyError:
+            JMS_LOGGER.error(
+                "JMS message for job notification topic '%s' "
+                "has no job-uri field in its headers (ignored): %r",
+                self._session.job_topic, headers)
+            return
+
+        JMS_LOGGER.debug(
+            "JMS message for job completion notification for topic '%s' "
+            "for job %s", self._session.job_topic, job_uri)
+        self._updater.job_completed(job_uri)
+
+    def on_error(self, headers, message):
+        # pylint: disable=unused-argument
+        """
+        Event method that gets called when this listener has received a JMS
+        error.
+
+        Parameters:
+
+          headers (dict): JMS message headers.
+
+          message (string): JMS message body as a string, which contains a
+            serialized JSON object.
+        """
+        JMS_LOGGER.error(
+            "JMS error message received for job notification topic '%s' "
+            "(ignored): %s",
+            self._session.job_topic, message)
+
+    def on_disconnected(self):
+        """
+        Event method that gets called when the JMS session has been
+        disconnected.
+        """
+        JMS_LOGGER.info(
+            "JMS session for job notification topic '%s' has been "
+            "disconnected",
+            self._session.job_topic)
@@ -0,0 +1,220 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+JSON codecs used by a :class:`~zhmcclient.Session` for encoding request
+bodies and decoding response bodies (including job results), and for
+blanking out sensitive data when logging them.
+
+By default, the JSON support of the Python standard library is used. Large
+responses such as the result of
+:meth:`~zhmcclient.Client.get_inventory` or of
+:meth:`~zhmcclient.Cpc.export_dpm_configuration` can be decoded considerably
+faster by one of the following optional packages, if installed:
+
+* `orjson <https://pypi.org/project/orjson/>`_ (codec name 'orjson')
+* `ujson <https://pypi.org/project/ujson/>`_ (codec name 'ujson')
+* `pysimdjson <https://pypi.org/project/pysimdjson/>`_ (codec name
+  'simdjson')
+
+These packages are not installed with the zhmcclient package. The codec is
+selected with the `json_codec` parameter of :class:`~zhmcclient.Session`.
+"""
+
+from __future__ import absolute_import
+
+import sys
+import json
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+import six
+
+__all__ = ['JsonCodec', 'get_json_codec']
+
+# Names of the codecs for optional JSON packages, in order of preference
+# for codec name 'auto'.
+_OPTIONAL_CODEC_NAMES = ('orjson', 'ujson', 'simdjson')
+
+
+class JsonCodec(object):
+    """
+    A JSON codec based on the :mod:`py:json` module of the Python standard
+    library. This is the default codec of a :class:`~zhmcclient.Session`.
+
+    JSON objects are decoded into :class:`py:collections.OrderedDict`
+    objects.
+
+    This class is also the base class for the codecs of the optional JSON
+    packages (see :func:`~zhmcclient.get_json_codec`). User-defined codecs
+    can be implemented by deriving from this class and overriding the
+    :meth:`loads` and :meth:`dumps` methods.
+    """
+
+    #: :term:`string`: Name of the codec.
+    name = 'json'
+
+    def __repr__(self):
+        return "{}(name={!r})".format(self.__class__.__name__, self.name)
+
+    def loads(self, data):
+        """
+        Decode a JSON document.
+
+        Parameters:
+
+          data (:term:`unicode string` or :term:`byte string`): The JSON
+            document. Byte strings must be UTF-8 encoded.
+
+        Returns:
+
+          The decoded JSON value (e.g. a dict for a JSON object).
+
+        Raises:
+
+          ValueError: The data is not a valid JSON document.
+        """
+        # In Python 3 up to 3.5, json.loads() requires unicode strings.
+        if sys.version_info[0] == 3 and sys.version_info[1] in (4, 5) and \
+                isinstance(data, six.binary_type):
+            data = data.decode('utf-8')
+        return json.loads(data, object_pairs_hook=OrderedDict)
+
+    def dumps(self, obj):
+        """
+        Encode a value into a JSON document.
+
+        Parameters:
+
+          obj: The value to be encoded (e.g. a dict).
+
+        Returns:
+
+          :term:`unicode string` (py3) or :term:`byte string` (py2): The JSON
+          document.
+
+        Raises:
+
+          TypeError: The value cannot be encoded into JSON.
+        """
+        return json.dumps(obj)
+
+
+class _OrjsonCodec(JsonCodec):
+    """
+    A JSON codec based on the 'orjson' package.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        # pylint: disable=import-outside-toplevel,import-error
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data):
+        # orjson.JSONDecodeError is a subclass of ValueError
+        return self._orjson.loads(data)
+
+    def dumps(self, obj):
+        # orjson.dumps() returns UTF-8 encoded bytes
+        return self._orjson.dumps(obj).decode('utf-8')
+
+
+class _UjsonCodec(JsonCodec):
+    """
+    A JSON codec based on the 'ujson' package.
+    """
+
+    name = 'ujson'
+
+    def __init__(self):
+        # pylint: disable=import-outside-toplevel,import-error
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, data):
+        # ujson.JSONDecodeError is a subclass of ValueError
+        return self._ujson.loads(data)
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj, escape_forward_slashes=False)
+
+
+class _SimdjsonCodec(JsonCodec):
+    """
+    A JSON codec based on the 'pysimdjson' package.
+
+    pysimdjson only accelerates decoding; encoding uses the Python standard
+    library.
+    """
+
+    name = 'simdjson'
+
+    def __init__(self):
+        # pylint: disable=import-outside-toplevel,import-error
+        import simdjson
+        self._simdjson = simdjson
+
+    def loads(self, data):
+        return self._simdjson.loads(data)
+
+
+_CODEC_CLASSES = {
+    'json': JsonCodec,
+    'orjson': _OrjsonCodec,
+    'ujson': _UjsonCodec,
+    'simdjson': _SimdjsonCodec,
+}
+
+
+def get_json_codec(name='json'):
+    """
+    Return a JSON codec object for a codec name.
+
+    Parameters:
+
+      name (:term:`string`): Name of the codec. Valid values are:
+
+        * 'json' - JSON support of the Python standard library.
+        * 'orjson' - The 'orjson' package.
+        * 'ujson' - The 'ujson' package.
+        * 'simdjson' - The 'pysimdjson' package.
+        * 'auto' - The first of 'orjson', 'ujson', 'simdjson' whose package is
+          installed, or 'json' if none of them is installed.
+
+    Returns:
+
+      :class:`~zhmcclient.JsonCodec`: The JSON codec object.
+
+    Raises:
+
+      ValueError: Invalid codec name.
+      ImportError: The package for the codec is not installed.
+    """
+    if name == 'auto':
+        for opt_name in _OPTIONAL_CODEC_NAMES:
+            try:
+                return _CODEC_CLASSES[opt_name]()
+            except ImportError:
+                pass
+        return JsonCodec()
+    try:
+        codec_class = _CODEC_CLASSES[name]
+    except KeyError:
+        raise ValueError(
+            "Invalid JSON codec name: {!r} (valid names are: {})".
+            format(name, ', '.join(sorted(_CODEC_CLASSES) + ['auto'])))
+    return codec_class()
@@ -34,7 +34,9 @@ from ._manager import BaseManager
 from ._resource import BaseResource
 from ._exceptions import StatusTimeout, HTTPError
 from ._logging import logged_api_call
-from ._utils import matches_filters, divide_filter_args, RC_LOGICAL_PARTITION
+from ._utils import matches_filters, Filter, divide_filter_args, \
+    RC_LOGICAL_PARTITION
+from ._waiter import run_bulk_operation
 
 __all__ = ['LparManager', 'Lpar']
 
@@ -77,7 +79,8 @@ class LparManager(BaseManager):
             oid_prop='object-id',
             uri_prop='object-uri',
             name_prop='name',
-            query_props=query_props)
+            query_props=query_props,
+            supports_additional_properties=True)
 
     @property
     def cpc(self):
@@ -88,7 +91,8 @@ class LparManager(BaseManager):
         return self._parent
 
     @logged_api_call
-    def list(self, full_properties=False, filter_args=None):
+    def list(self, full_properties=False, filter_args=None,
+             additional_properties=None):
         """
         List the LPARs in this CPC.
 
@@ -112,6 +116,24 @@ class LparManager(BaseManager):
             `None` causes no filtering to happen, i.e. all resources are
             returned.
 
+          additional_properties (list of :term:`string`):
+            List of property names that are to be returned in addition to the
+            default properties, for each resource. `None` means no additional
+            properties.
+
+            The properties used for client-side filtering (see
+            :ref:`Filtering`) are automatically added to the additional
+            properties.
+
+            If the HMC supports the 'additional-properties' query parameter
+            of the list operation (HMC API version 4.10 or higher), the
+            additional properties are returned by the list operation.
+            Otherwise, the properties of the listed resources that do not
+            have all of the additional properties are retrieved with a single
+            'Get Inventory' operation. If the HMC rejects that operation, only
+            the additional properties are retrieved for each of these
+            resources, concurrently.
+
         Returns:
 
           : A list of :class:`~zhmcclient.Lpar` objects.
@@ -131,6 +153,9 @@ class LparManager(BaseManager):
         else:
             query_parms, client_filters = divide_filter_args(
                 self._query_props, filter_args)
+            client_filter = Filter(client_filters)
+            query_parms, missing_props = self._additional_properties_query(
+                query_parms, additional_properties, client_filters)
 
             resources_name = 'logical-partitions'
             uri = '{}/{}{}'.format(self.cpc.uri, resources_name, query_parms)
@@ -145,6 +170,7 @@ class LparManager(BaseManager):
                     result = []
             if result:
                 props_list = result[resources_name]
+                listed_obj_list = []
                 for props in props_list:
 
                     resource_obj = self.resource_class(
@@ -152,15 +178,265 @@ class LparManager(BaseManager):
                         uri=props[self._uri_prop],
                         name=props.get(self._name_prop, None),
                         properties=props)
+                    listed_obj_list.append(resource_obj)
+
+                if missing_props:
+                    self._pull_missing_properties(
+                        listed_obj_list, missing_props)
 
-                    if matches_filters(resource_obj, client_filters):
+                for resource_obj in listed_obj_list:
+                    if matches_filters(resource_obj, client_filter):
                         resource_obj_list.append(resource_obj)
-                        if full_properties:
-                            resource_obj.pull_full_properties()
+                if full_properties:
+                    self._pull_full_properties(
+                        [obj for obj in resource_obj_list
+                         if not obj.full_properties])
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
 
+    @logged_api_call
+    def activate_many(self, lpars, max_parallel=None, operation_timeout=None,
+                      status_timeout=None, allow_status_exceptions=False,
+                      activation_profile_name=None, force=False):
+        """
+        Activate (start) multiple LPARs concurrently, using the HMC operation
+        "Activate Logical Partition", and wait for the LPARs to reach status
+        "not-operating" or "operating" (or in addition "exceptions", if
+        `allow_status_exceptions` was set).
+
+        The operations are started concurrently (up to `max_parallel`), the
+        resulting jobs and the LPAR status values are waited for by a
+        :class:`~zhmcclient.JobSet` and a :class:`~zhmcclient.StatusWaiter`,
+        and a new operation is started as soon as an operation in progress is
+        done.
+
+        Authorization requirements:
+
+        * Object-access permission to the LPARs.
+        * Before HMC API version 3.6 in an update to HMC 2.15.0: Object-access
+          permission to the CPC of the LPARs.
+        * Task permission for the "Activate" task.
+
+        Parameters:
+
+          lpars (iterable of :class:`~zhmcclient.Lpar`):
+            The LPARs.
+
+          max_parallel (:term:`integer`):
+            Maximum number of LPARs for which the operation is in progress at
+            the same time. `None` means that the operation is started on all
+            LPARs right away.
+
+          operation_timeout (:term:`number`):
+            Timeout in seconds, for waiting for completion of the asynchronous
+            job performing the operation on each LPAR. The special value 0
+            means that no timeout is set. `None` means that the default async
+            operation timeout of the session is used.
+
+          status_timeout (:term:`number`):
+            Timeout in seconds, for waiting that the status of each LPAR has
+            reached the desired status, after the HMC operation has completed.
+            The special value 0 means that no timeout is set. `None` means that
+            the default status timeout of the session is used.
+
+          allow_status_exceptions (bool):
+            Boolean controlling whether LPAR status "exceptions" is considered
+            an additional acceptable end status.
+
+          activation_profile_name (:term:`string`):
+            Name of the image :class:`ActivationProfile` to use for activation
+            of all LPARs.
+
+            `None` means that the activation profile specified in the
+            `next-activation-profile-name` property of each LPAR is used.
+
+          force (bool):
+            Boolean controlling whether this operation is permitted when an
+            LPAR is in the "operating" status.
+
+        Returns:
+
+          list: One item for each of the specified LPARs, in the order of the
+          LPARs. Each item is either the reached status of the LPAR (as a
+          :term:`string`), or the exception object for the failed operation on
+          the LPAR (e.g. :exc:`~zhmcclient.HTTPError`,
+          :exc:`~zhmcclient.OperationTimeout`, or
+          :exc:`~zhmcclient.StatusTimeout`). Exceptions for individual LPARs
+          are not raised.
+        """
+        statuses = ["not-operating", "operating"]
+        if allow_status_exceptions:
+            statuses.append("exceptions")
+        return run_bulk_operation(
+            self.session, lpars,
+            lambda lpar: lpar.activate(
+                wait_for_completion=False,
+                activation_profile_name=activation_profile_name, force=force),
+            statuses, max_parallel, operation_timeout, status_timeout)
+
+    @logged_api_call
+    def deactivate_many(self, lpars, max_parallel=None, operation_timeout=None,
+                        status_timeout=None, allow_status_exceptions=False,
+                        force=False):
+        """
+        De-activate (stop) multiple LPARs concurrently, using the HMC operation
+        "Deactivate Logical Partition", and wait for the LPARs to reach status
+        "not-activated" (or in addition "exceptions", if
+        `allow_status_exceptions` was set).
+
+        The operations are started concurrently (up to `max_parallel`), the
+        resulting jobs and the LPAR status values are waited for by a
+        :class:`~zhmcclient.JobSet` and a :class:`~zhmcclient.StatusWaiter`,
+        and a new operation is started as soon as an operation in progress is
+        done.
+
+        Authorization requirements:
+
+        * Object-access permission to the LPARs.
+        * Before HMC API version 3.6 in an update to HMC 2.15.0: Object-access
+          permission to the CPC of the LPARs.
+        * Task permission for the "Deactivate" task.
+
+        Parameters:
+
+          lpars (iterable of :class:`~zhmcclient.Lpar`):
+            The LPARs.
+
+          max_parallel (:term:`integer`):
+            Maximum number of LPARs for which the operation is in progress at
+            the same time. `None` means that the operation is started on all
+            LPARs right away.
+
+          operation_timeout (:term:`number`):
+            Timeout in seconds, for waiting for completion of the asynchronous
+            job performing the operation on each LPAR. The special value 0
+            means that no timeout is set. `None` means that the default async
+            operation timeout of the session is used.
+
+          status_timeout (:term:`number`):
+            Timeout in seconds, for waiting that the status of each LPAR has
+            reached the desired status, after the HMC operation has completed.
+            The special value 0 means that no timeout is set. `None` means that
+            the default status timeout of the session is used.
+
+          allow_status_exceptions (bool):
+            Boolean controlling whether LPAR status "exceptions" is considered
+            an additional acceptable end status.
+
+          force (bool):
+            Boolean controlling whether this operation is permitted when an
+            LPAR is in the "operating" status.
+
+        Returns:
+
+          list: One item for each of the specified LPARs, in the order of the
+          LPARs. Each item is either the reached status of the LPAR (as a
+          :term:`string`), or the exception object for the failed operation on
+          the LPAR (e.g. :exc:`~zhmcclient.HTTPError`,
+          :exc:`~zhmcclient.OperationTimeout`, or
+          :exc:`~zhmcclient.StatusTimeout`). Exceptions for individual LPARs
+          are not raised.
+        """
+        statuses = ["not-activated"]
+        if allow_status_exceptions:
+            statuses.append("exceptions")
+        return run_bulk_operation(
+            self.session, lpars,
+            lambda lpar: lpar.deactivate(
+                wait_for_completion=False, force=force),
+            statuses, max_parallel, operation_timeout, status_timeout)
+
+    @logged_api_call
+    def load_many(self, lpars, max_parallel=None, operation_timeout=None,
+                  status_timeout=None, allow_status_exceptions=False,
+                  load_address=None, load_parameter=None,
+                  clear_indicator=True, store_status_indicator=False,
+                  force=False):
+        """
+        Load (boot) multiple LPARs concurrently, using the HMC operation "Load
+        Logical Partition", and wait for the LPARs to reach status "operating"
+        (or in addition "exceptions", if `allow_status_exceptions` was set).
+
+        The operations are started concurrently (up to `max_parallel`), the
+        resulting jobs and the LPAR status values are waited for by a
+        :class:`~zhmcclient.JobSet` and a :class:`~zhmcclient.StatusWaiter`,
+        and a new operation is started as soon as an operation in progress is
+        done.
+
+        Authorization requirements:
+
+        * Object-access permission to the LPARs.
+        * Task permission for the "Load" task.
+
+        Parameters:
+
+          lpars (iterable of :class:`~zhmcclient.Lpar`):
+            The LPARs.
+
+          max_parallel (:term:`integer`):
+            Maximum number of LPARs for which the operation is in progress at
+            the same time. `None` means that the operation is started on all
+            LPARs right away.
+
+          operation_timeout (:term:`number`):
+            Timeout in seconds, for waiting for completion of the asynchronous
+            job performing the operation on each LPAR. The special value 0
+            means that no timeout is set. `None` means that the default async
+            operation timeout of the session is used.
+
+          status_timeout (:term:`number`):
+            Timeout in seconds, for waiting that the status of each LPAR has
+            reached the desired status, after the HMC operation has completed.
+            The special value 0 means that no timeout is set. `None` means that
+            the default status timeout of the session is used.
+
+          allow_status_exceptions (bool):
+            Boolean controlling whether LPAR status "exceptions" is considered
+            an additional acceptable end status.
+
+          load_address (:term:`string`): Device number of the boot device,
+            for all LPARs. `None` means that the load address of the last
+            load of each LPAR is used.
+
+          load_parameter (:term:`string`): Optional load control string,
+            for all LPARs. `None` means that the load parameter of the last
+            load of each LPAR is used.
+
+          clear_indicator (bool):
+            Optional boolean controlling whether the memory should be
+            cleared before performing the load or not cleared.
+
+          store_status_indicator (bool):
+            Optional boolean controlling whether the status should be stored
+            before performing the Load.
+
+          force (bool):
+            Boolean controlling whether this operation is permitted when an
+            LPAR is in the "operating" status.
+
+        Returns:
+
+          list: One item for each of the specified LPARs, in the order of the
+          LPARs. Each item is either the reached status of the LPAR (as a
+          :term:`string`), or the exception object for the failed operation on
+          the LPAR (e.g. :exc:`~zhmcclient.HTTPError`,
+          :exc:`~zhmcclient.OperationTimeout`, or
+          :exc:`~zhmcclient.StatusTimeout`). Exceptions for individual LPARs
+          are not raised.
+        """
+        statuses = ["operating"]
+        if allow_status_exceptions:
+            statuses.append("exceptions")
+        return run_bulk_operation(
+            self.session, lpars,
+            lambda lpar: lpar.load(
+                load_address=load_address, load_parameter=load_parameter,
+                clear_indicator=clear_indicator,
+                store_status_indicator=store_status_indicator, force=force,
+                wait_for_completion=False),
+            statuses, max_parallel, operation_timeout, status_timeout)
+
 
 class Lpar(BaseResource):
     """
@@ -1724,6 +2000,17 @@ class Lpar(BaseResource):
         """
         Wait until the status of this LPAR has a desired value.
 
+        The status is polled with an interval that starts at the
+        :attr:`~zhmcclient.RetryTimeoutConfig.poll_min_interval` attribute of
+        the retry/timeout configuration of the session and is doubled after
+        each poll, up to its
+        :attr:`~zhmcclient.RetryTimeoutConfig.poll_max_interval` attribute.
+        If the session is subscribed for
+        :ref:`auto-updating of resources <Auto-updating of resources>` (see
+        :meth:`~zhmcclient.Session.subscribe_auto_update`), a status
+        notification from the HMC that reports a desired status causes the
+        status to be polled right away.
+
         Parameters:
 
           status (:term:`string` or iterable of :term:`string`):
@@ -1759,32 +2046,52 @@ class Lpar(BaseResource):
           :exc:`~zhmcclient.StatusTimeout`: The timeout expired while
             waiting for the desired LPAR status.
         """
+        rt_config = self.manager.session.retry_timeout_config
         if status_timeout is None:
-            status_timeout = \
-                self.manager.session.retry_timeout_config.status_timeout
+            status_timeout = rt_config.status_timeout
         if status_timeout > 0:
             end_time = time.time() + status_timeout
         if isinstance(status, (list, tuple)):
             statuses = status
         else:
             statuses = [status]
-        while True:
-
-            # Fastest way to get actual status value:
-            lpars = self.manager.cpc.lpars.list(
-                filter_args={'name': self.name})
-            assert len(lpars) == 1
-            this_lpar = lpars[0]
-            actual_status = this_lpar.get_property('status')
-
-            if actual_status in statuses:
-                return
-
-            if status_timeout > 0 and time.time() > end_time:
-                raise StatusTimeout(
-                    "Waiting for LPAR {} to reach status(es) '{}' timed out "
-                    "after {} s - current status is '{}'".
-                    format(self.name, statuses, status_timeout, actual_status),
-                    actual_status, statuses, status_timeout)
-
-            time.sleep(1)  # Avoid hot spin loop
+        poll_interval = rt_config.poll_min_interval
+
+        # Watch for status notifications if the session is subscribed for
+        # auto-update. The polling below remains in place as a fallback.
+        updater = self.manager.session.resource_updater
+        if updater:
+            updater.watch_status(self.uri)
+        try:
+            while True:
+
+                # Fastest way to get actual status value:
+                lpars = self.manager.cpc.lpars.list(
+                    filter_args={'name': self.name})
+                assert len(lpars) == 1
+                this_lpar = lpars[0]
+                actual_status = this_lpar.get_property('status')
+
+                if actual_status in statuses:
+                    return
+
+                if status_timeout > 0 and time.time() > end_time:
+                    raise StatusTimeout(
+                        "Waiting for LPAR {} to reach status(es) '{}' timed "
+                        "out after {} s - current status is '{}'".
+                        format(self.name, statuses, status_timeout,
+                               actual_status),
+                        actual_status, statuses, status_timeout)
+
+                wait_time = poll_interval
+                if status_timeout > 0:
+                    wait_time = min(wait_time, max(end_time - time.time(), 0))
+                if updater:
+                    updater.wait_for_status(self.uri, statuses, wait_time)
+                else:
+                    time.sleep(wait_time)  # Avoid hot spin loop
+                poll_interval = min(poll_interval * 2,
+                                    rt_config.poll_max_interval)
+        finally:
+            if updater:
+                updater.unwatch_status(self.uri)
@@ -35,16 +35,25 @@ from nocasedict import NocaseDict
 
 from ._logging import logged_api_call
 from ._exceptions import NotFound, NoUniqueMatch, HTTPError
-from ._utils import repr_list
+from ._utils import repr_list, run_concurrently, append_query_parms
 
 __all__ = ['BaseManager']
 
+# Minimum HMC API version that supports the 'additional-properties' query
+# parameter on the list operations of the resource types that support it
+# (HMC 2.16.0).
+_ADDITIONAL_PROPERTIES_API_VERSION = (4, 10)
+
 
 class _NameUriCache(object):
     """
     A Name-URI cache, that caches the mapping between resource names and
     resource URIs. It supports looking up resource URIs by resource names.
 
+    If the session of the manager has a session-wide Name-URI cache (see
+    :class:`~zhmcclient.NameUriCache`), the mappings are stored in that cache
+    and the time to live of this cache is not used.
+
     This class is used by the implementation of manager classes, and is not
     part of the external API.
     """
@@ -76,6 +85,13 @@ class _NameUriCache(object):
         # Point in time when the cache was last invalidated
         self._invalidated = datetime.now()
 
+        # Session-wide Name-URI cache, and the scope of the resources of the
+        # manager in that cache
+        self._shared = manager.session.name_uri_cache
+        parent = manager.parent
+        self._scope = (parent.uri if parent is not None else None,
+                       manager.class_name, case_insensitive_names)
+
     def get(self, name):
         """
         Get the resource URI for a specified resource name.
@@ -87,13 +103,15 @@ class _NameUriCache(object):
         If an entry for the specified resource name still does not exist after
         that, ``NotFound`` is raised.
         """
+        if self._shared is not None:
+            return self._get_shared(name)
         self.auto_invalidate()
         try:
             return self._uris[name]
         except KeyError:
-            self.refresh()
+            uris = self.refresh()
             try:
-                return self._uris[name]
+                return uris[name]
             except KeyError:
                 # pylint: disable=protected-access
                 new_exc = NotFound(
@@ -101,6 +119,79 @@ class _NameUriCache(object):
                 new_exc.__cause__ = None
                 raise new_exc  # zhmcclient.NotFound
 
+    def _get_shared(self, name):
+        """
+        Get the resource URI for a specified resource name from the
+        session-wide Name-URI cache.
+
+        Names that do not exist in the resource list used for refreshing the
+        cache are remembered as not existing, so that subsequent lookups of
+        these names do not refresh the cache again.
+        """
+        found, uri = self._shared.lookup(self._scope, name)
+        if not found:
+            # The URI is taken from the resource list, because the entry in
+            # the session-wide cache may already have been removed again
+            # (e.g. by its LRU limit)
+            uri = self.refresh().get(name, None)
+            if uri is None:
+                self._shared.put(self._scope, name, None)
+        if uri is None:
+            # pylint: disable=protected-access
+            raise NotFound({self._manager._name_prop: name}, self._manager)
+        return uri
+
+    def get_many(self, names):
+        """
+        Get the resource URIs for the specified resource names.
+
+        If entries for some of the resource names do not exist in the
+        Name-URI cache, the cache is refreshed from the HMC once, with all
+        resources of the manager holding this cache.
+
+        Returns a tuple of a dictionary with the resource URIs by resource
+        name, and a set of the resource names that do not exist.
+        """
+        uris = {}
+        not_found = set()
+        missing = []
+        if self._shared is None:
+            self.auto_invalidate()
+        for name in names:
+            found, uri = self._lookup(name)
+            if not found:
+                missing.append(name)
+            elif uri is None:
+                not_found.add(name)
+            else:
+                uris[name] = uri
+        if missing:
+            refreshed_uris = self.refresh()
+            for name in missing:
+                uri = refreshed_uris.get(name, None)
+                if uri is not None:
+                    uris[name] = uri
+                else:
+                    not_found.add(name)
+                    if self._shared is not None:
+                        self._shared.put(self._scope, name, None)
+        return uris, not_found
+
+    def _lookup(self, name):
+        """
+        Look up the resource URI for a specified resource name, without
+        refreshing the cache.
+
+        Returns a tuple of whether the name was found, and the resource URI
+        (`None` for a name that is remembered as not existing).
+        """
+        if self._shared is not None:
+            return self._shared.lookup(self._scope, name)
+        try:
+            return True, self._uris[name]
+        except KeyError:
+            return False, None
+
     def auto_invalidate(self):
         """
         Invalidate the cache if the current time is past the time to live.
@@ -118,19 +209,39 @@ class _NameUriCache(object):
         """
         self._uris = self._dict_type()
         self._invalidated = datetime.now()
+        if self._shared is not None:
+            self._shared.invalidate_scope(self._scope)
 
     def refresh(self):
         """
         Refresh the Name-URI cache from the HMC.
 
-        This is done by invalidating the cache, listing the resources of this
-        manager from the HMC, and populating the cache with that information.
+        This is done by listing the resources of this manager from the HMC,
+        and populating the cache with that information. The cache is
+        invalidated before, except for a session-wide Name-URI cache, where
+        the entries of the listed resources are replaced, and the entries of
+        resources that no longer exist are removed.
+
+        Returns a dictionary with the resource URIs by resource name, from
+        the resource list.
         """
         # pylint: disable=protected-access
-        self.invalidate()
+        if self._shared is None:
+            self.invalidate()
         full = not self._manager._list_has_name
         res_list = self._manager.list(full_properties=full)
-        self.update_from(res_list)
+        uris = self._dict_type()
+        for res in res_list:
+            # We access the properties dictionary, in order to make sure
+            # we don't drive additional HMC interactions.
+            name = res.properties.get(self._manager._name_prop, None)
+            if name:
+                uris[name] = res.properties.get(self._manager._uri_prop, None)
+        if self._shared is not None:
+            self._shared.update_scope(self._scope, uris)
+        else:
+            self._uris.update(uris)
+        return uris
 
     def update_from(self, res_list):
         """
@@ -155,7 +266,9 @@ class _NameUriCache(object):
 
         If the specified name is `None` or the empty string, do nothing.
         """
-        if name:
+        if self._shared is not None:
+            self._shared.put(self._scope, name, uri)
+        elif name:
             self._uris[name] = uri
 
     def delete(self, name):
@@ -166,7 +279,9 @@ class _NameUriCache(object):
         If the specified name is `None` or the empty string, or if an entry for
         the specified name does not exist, do nothing.
         """
-        if name:
+        if self._shared is not None:
+            self._shared.delete(self._scope, name)
+        elif name:
             try:
                 del self._uris[name]
             except KeyError:
@@ -192,7 +307,8 @@ class BaseManager(object):
 
     def __init__(self, resource_class, class_name, session, parent, base_uri,
                  oid_prop, uri_prop, name_prop, query_props,
-                 list_has_name=True, case_insensitive_names=False):
+                 list_has_name=True, case_insensitive_names=False,
+                 supports_additional_properties=False):
         # This method intentionally has no docstring, because it is internal.
         #
         # Parameters:
@@ -243,6 +359,10 @@ class BaseManager(object):
         #   case_insensitive_names (bool):
         #     Indicates whether the name of the resource is treated case
         #     insensitively.
+        #   supports_additional_properties (bool):
+        #     Indicates whether the HMC list operation for the resource
+        #     supports the 'additional-properties' query parameter (starting
+        #     with HMC API version 4.10).
 
         # We want to surface precondition violations as early as possible,
         # so we test those that are not surfaced through the init code:
@@ -265,6 +385,7 @@ class BaseManager(object):
         self._query_props = query_props
         self._list_has_name = list_has_name
         self._case_insensitive_names = case_insensitive_names
+        self._supports_additional_properties = supports_additional_properties
 
         self._name_uri_cache = _NameUriCache(
             self, session.retry_timeout_config.name_uri_cache_timetolive,
@@ -338,6 +459,10 @@ class BaseManager(object):
         can be configured using the
         :attr:`~zhmcclient.RetryTimeoutConfig.name_uri_cache_timetolive`
         attribute of the :class:`~zhmcclient.RetryTimeoutConfig` class.
+
+        If the session has a session-wide Name-URI cache (see
+        :class:`~zhmcclient.NameUriCache`), the entries of the resources of
+        this manager are invalidated in that cache.
         """
         self._name_uri_cache.invalidate()
 
@@ -395,6 +520,29 @@ class BaseManager(object):
 
         return resource_obj
 
+    def _pull_full_properties(self, resource_obj_list):
+        """
+        Retrieve the full set of resource properties for each of the specified
+        resource objects and cache them in the resource objects.
+
+        The retrievals are performed concurrently, using up to the number of
+        concurrent HMC requests specified in the
+        :attr:`~zhmcclient.RetryTimeoutConfig.max_workers` attribute of the
+        retry/timeout configuration of the session. If a retrieval fails, the
+        exception for the first failing resource object (in the order of the
+        list) is raised.
+
+        Parameters:
+
+          resource_obj_list (list of resource objects):
+            The resource objects. They do not need to be resources of this
+            manager, but they must use the same session.
+        """
+        max_workers = self.session.retry_timeout_config.max_workers
+        run_concurrently(
+            lambda resource_obj: resource_obj.pull_full_properties(),
+            resource_obj_list, max_workers)
+
     @property
     def resource_class(self):
         """
@@ -497,7 +645,154 @@ class BaseManager(object):
                 pass
         return self.resource_class(self, uri, name, res_props)
 
-    @logged_api_call
+    def _additional_properties_query(self, query_parms, additional_properties,
+                                     client_filters):
+        """
+        Add the 'additional-properties' query parameter to the query
+        parameters for a list operation, if the list operation and the HMC
+        support it.
+
+        The additional properties are the specified additional properties and
+        the properties used in the client-side filters. Requesting the latter
+        from the list operation avoids retrieving the properties of each
+        listed resource separately for client-side filtering.
+
+        Parameters:
+
+          query_parms (:term:`string`):
+            Query parameter string for the list operation, as returned by
+            :func:`~zhmcclient._utils.divide_filter_args`.
+
+          additional_properties (list of :term:`string`):
+            Names of additional resource properties to be returned by the
+            list operation. `None` means no additional properties.
+
+          client_filters (dict):
+            Client-side filter arguments. `None` means no client-side
+            filtering.
+
+        Returns:
+
+          tuple(query_parms, missing_props), with:
+
+          - query_parms (:term:`string`): The query parameter string to be
+            used for the list operation.
+
+          - missing_props (list of :term:`string`): Names of the properties
+            that need to be retrieved separately after the list operation,
+            because the HMC does not support the 'additional-properties'
+            query parameter for this list operation.
+        """
+        names = list(additional_properties or [])
+        for name in client_filters or []:
+            if name not in names:
+                names.append(name)
+        if not names:
+            return query_parms, []
+
+        if not self._supports_additional_properties or \
+                self._client().version_info() < \
+                _ADDITIONAL_PROPERTIES_API_VERSION:
+            return query_parms, names
+
+        qp_list = []
+        append_query_parms(qp_list, 'additional-properties', ','.join(names))
+        sep = '&' if query_parms else '?'
+        query_parms = '{}{}{}'.format(query_parms, sep, qp_list[0])
+        return query_parms, []
+
+    def _pull_missing_properties(self, resource_obj_list, names):
+        """
+        Retrieve the resource properties for those of the specified resource
+        objects that do not have all of the specified properties, and cache
+        them in the resource objects.
+
+        This is used after list operations that do not support the
+        'additional-properties' query parameter, in order to make the
+        additional properties and the properties used for client-side
+        filtering available, instead of one sequential retrieval per resource
+        during client-side filtering.
+
+        If more than one resource object lacks properties, their properties
+        are retrieved with a single 'Get Inventory' operation (see
+        :meth:`_pull_inventory_properties`). The specified properties of any
+        resource objects that could not be retrieved that way (e.g. because
+        the HMC rejects the 'Get Inventory' operation) are retrieved
+        concurrently using :meth:`~zhmcclient.BaseResource.pull_properties`,
+        using up to the number of concurrent HMC requests specified in the
+        :attr:`~zhmcclient.RetryTimeoutConfig.max_workers` attribute of the
+        retry/timeout configuration of the session.
+
+        Parameters:
+
+          resource_obj_list (list of resource objects):
+            The resource objects of this manager.
+
+          names (list of :term:`string`):
+            Names of the resource properties that are needed.
+        """
+        missing_list = []
+        for resource_obj in resource_obj_list:
+            if resource_obj.full_properties:
+                continue
+            if any(name not in resource_obj.properties for name in names):
+                missing_list.append(resource_obj)
+        if len(missing_list) > 1:
+            missing_list = self._pull_inventory_properties(missing_list)
+        if missing_list:
+            max_workers = self.session.retry_timeout_config.max_workers
+            run_concurrently(
+                lambda resource_obj: resource_obj.pull_properties(names),
+                missing_list, max_workers)
+
+    def _pull_inventory_properties(self, resource_obj_list):
+        """
+        Retrieve the resource properties of the specified resource objects
+        with a single 'Get Inventory' operation for the resource class of this
+        manager, and cache them in the resource objects.
+
+        The inventory is processed while it is received (see
+        :meth:`~zhmcclient.Client.iter_inventory`), so that only the
+        properties of the specified resource objects are kept in memory.
+
+        If the HMC rejects the 'Get Inventory' operation with an HTTP error,
+        no properties are updated.
+
+        Parameters:
+
+          resource_obj_list (list of resource objects):
+            The resource objects of this manager.
+
+        Returns:
+
+          list of resource objects: The specified resource objects whose
+          properties have not been retrieved, in their original order.
+        """
+        obj_by_uri = {}
+        for resource_obj in resource_obj_list:
+            obj_by_uri[resource_obj.uri] = resource_obj
+        try:
+            for props in self._client().iter_inventory([self.class_name]):
+                # The inventory includes element resources and error items
+                if props.get('class') != self.class_name:
+                    continue
+                resource_obj = obj_by_uri.pop(props.get(self._uri_prop), None)
+                if resource_obj is not None:
+                    resource_obj.update_properties_local(props)
+        except HTTPError:
+            return resource_obj_list
+        return [obj for obj in resource_obj_list if obj.uri in obj_by_uri]
+
+    def _client(self):
+        """
+        Return the :class:`~zhmcclient.Client` object of this manager, by
+        navigating up the parent resources to the top-level manager.
+        """
+        manager = self
+        while manager.parent is not None:
+            manager = manager.parent.manager
+        return manager.client
+
     def findall(self, **filter_args):
         """
         Find zero or more resources in scope of this manager, by matching
@@ -769,6 +1064,56 @@ class BaseManager(object):
             properties=None)
         return obj
 
+    @logged_api_call
+    def find_many_by_name(self, names):
+        """
+        Find multiple resources by name (i.e. value of their 'name' resource
+        property) and return their Python resource objects.
+
+        Like :meth:`find_by_name`, this method performs an optimized lookup
+        that uses the Name-URI cache. Regardless of the number of names, at
+        most one ``list()`` operation is performed to refresh the Name-URI
+        cache, which populates the cache for all resources of this manager.
+
+        Authorization requirements:
+
+        * see the `list()` method in the derived classes.
+
+        Parameters:
+
+          names (iterable of string):
+            Names of the resources (values of their 'name' resource property).
+            Regular expression matching is not supported for the names.
+
+        Returns:
+
+          tuple(dict, set): A dictionary with the resource objects in scope of
+          this manager object by resource name, for the resources that were
+          found, and a set of the resource names that were not found. The
+          resource objects have a minimal set of properties.
+
+        Raises:
+
+          : Exceptions raised by the `list()` methods in derived resource
+            manager classes (see :ref:`Resources`).
+
+        Examples:
+
+        * The following example finds partitions by their names::
+
+              partitions, not_found = cpc.partitions.find_many_by_name(
+                  ['PART1', 'PART2'])
+        """
+        uris, not_found = self._name_uri_cache.get_many(list(names))
+        resources = {}
+        for name, uri in uris.items():
+            resources[name] = self.resource_class(
+                manager=self,
+                uri=uri,
+                name=name,
+                properties=None)
+        return resources, not_found
+
     @logged_api_call
     def find_local(self, name, uri, properties=None):
         """
@@ -74,9 +74,14 @@ try:
 except ImportError:
     from ordereddict import OrderedDict
 import re
+from array import array
 from datetime import datetime
 import pytz
 import six
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from ._manager import BaseManager
 from ._resource import BaseResource
@@ -91,7 +96,8 @@ from ._utils import datetime_from_timestamp, repr_list, datetime_to_isoformat
 
 __all__ = ['MetricsContextManager', 'MetricsContext', 'MetricGroupDefinition',
            'MetricDefinition', 'MetricsResponse', 'MetricGroupValues',
-           'MetricObjectValues']
+           'MetricObjectValues', 'ColumnarMetricsResponse',
+           'MetricGroupColumns']
 
 
 class MetricsContextManager(BaseManager):
@@ -604,11 +610,36 @@ CLASS_FROM_GROUP = {
 }
 
 
+def _metric_timestamp(timestamp_str):
+    """
+    Return a timezone-aware datetime object from a timestamp string in a
+    metrics response string.
+    """
+    assert timestamp_str != ''
+    try:
+        return datetime_from_timestamp(int(timestamp_str))
+    except ValueError:
+        # Sometimes, the returned epoch timestamp values are way
+        # too large, e.g. 3651584404810066 (which would translate
+        # to the year 115791 A.D.). Python datetime supports
+        # up to the year 9999. We circumvent this issue by
+        # simply using the current date&time.
+        # TODO: Remove the circumvention for too large timestamps.
+        return datetime.now(pytz.utc)
+
+
 class MetricsResponse(object):
     """
     Represents the metric values returned by one call to the
     :meth:`~zhmcclient.MetricsContext.get_metrics` method, and provides
     structured access to the data.
+
+    The metrics response string is parsed lazily: A metric group is parsed
+    when its metric values are accessed for the first time, and
+    :meth:`iter_rows` provides the metric values without creating objects
+    for each resource and point in time. Therefore, invalid metric values in
+    a metric group raise :exc:`py:ValueError` only when the metric group is
+    accessed.
     """
 
     def __init__(self, metrics_context, metrics_response_str):
@@ -623,17 +654,29 @@ class MetricsResponse(object):
           metrics_response_str (:term:`string`):
             The metrics response string, as returned by the
             :meth:`~zhmcclient.MetricsContext.get_metrics` method.
+
+        Raises:
+
+          KeyError: The metrics response string has a metric group that is
+            not defined in the metrics context.
         """
         self._metrics_context = metrics_context
         self._metrics_response_str = metrics_response_str
         self._client = self._metrics_context.manager.client
 
-        self._metric_group_values = self._setup_metric_group_values()
+        # The metric groups are parsed lazily. On construction, only the
+        # line ranges of the metric groups are determined.
+        self._lines = metrics_response_str.splitlines()
+        self._metric_group_ranges = self._index_metric_groups()
+
+        # Parsed MetricGroupValues objects, by metric group name
+        self._metric_group_values_by_name = {}
 
-    def _setup_metric_group_values(self):
+    def _index_metric_groups(self):
         """
-        Return the list of MetricGroupValues objects for this metrics response,
-        by processing its metrics response string.
+        Return the line ranges of the metric groups in the metrics response
+        string, as a dictionary with tuple(start, end) by metric group name,
+        in the order of the metric groups.
 
         The lines in the metrics response string are::
 
@@ -648,78 +691,88 @@ class MetricsResponse(object):
                              Timestamp
                              ValueRow{1,*}
                              <emptyline>      a first empty line after this blk
-        """
 
-        mg_defs = self._metrics_context.metric_group_definitions
+        The range of a metric group starts at its first ObjectValues line and
+        ends at its second empty line.
 
-        metric_group_name = None
-        resource_uri = None
-        dt_timestamp = None
-
-        object_values = None
-        metric_group_values = []
-        state = 0
-        for mr_line in self._metrics_response_str.splitlines():
-            if state == 0:
-                if object_values is not None:
-                    # Store the result from the previous metric group
-                    mgv = MetricGroupValues(metric_group_name, object_values)
-                    metric_group_values.append(mgv)
-                    object_values = None
-                if mr_line == '':
-                    # Skip initial (or trailing) empty lines
-                    pass
-                else:
-                    # Process the next metrics group
-                    metric_group_name = mr_line.strip('"')  # No " or \ inside
-                    assert metric_group_name in mg_defs
-                    m_defs = mg_defs[metric_group_name].metric_definitions
-                    object_values = []
-                    state = 1
-            elif state == 1:
-                if mr_line == '':
-                    # There are no (or no more) ObjectValues items in this
-                    # metrics group
-                    state = 0
-                else:
-                    # There are ObjectValues items
-                    resource_uri = mr_line.strip('"')  # No " or \ inside
-                    state = 2
-            elif state == 2:
-                # Process the timestamp
-                assert mr_line != ''
+        Raises KeyError for a metric group that is not defined in the metrics
+        context.
+        """
+        mg_defs = self._metrics_context.metric_group_definitions
+        lines = self._lines
+        num_lines = len(lines)
+        ranges = OrderedDict()
+        i = 0
+        while i < num_lines:
+            if lines[i] == '':
+                # Skip initial (or trailing) empty lines
+                i += 1
+                continue
+            metric_group_name = lines[i].strip('"')  # No " or \ inside
+            if metric_group_name not in mg_defs:
+                raise KeyError(metric_group_name)
+            start = i + 1
+            j = start
+            while j < num_lines and lines[j] != '':
+                # Skip the ObjectValues item, whose ValueRow lines are not
+                # empty. The empty line search is done by list.index() since
+                # that is much faster than a Python loop.
                 try:
-                    dt_timestamp = datetime_from_timestamp(int(mr_line))
+                    j = lines.index('', j + 2) + 1
                 except ValueError:
-                    # Sometimes, the returned epoch timestamp values are way
-                    # too large, e.g. 3651584404810066 (which would translate
-                    # to the year 115791 A.D.). Python datetime supports
-                    # up to the year 9999. We circumvent this issue by
-                    # simply using the current date&time.
-                    # TODO: Remove the circumvention for too large timestamps.
-                    dt_timestamp = datetime.now(pytz.utc)
-                state = 3
-            elif state == 3:
-                if mr_line != '':
-                    # Process the metric values in the ValueRow line
-                    str_values = mr_line.split(',')
-                    metrics = {}
-                    for m_name in m_defs:
-                        m_def = m_defs[m_name]
-                        m_type = m_def.type
-                        m_value_str = str_values[m_def.index]
-                        m_value = _metric_value(m_value_str, m_type)
-                        metrics[m_name] = m_value
-                    ov = MetricObjectValues(
-                        self._client, mg_defs[metric_group_name], resource_uri,
-                        dt_timestamp, metrics)
-                    object_values.append(ov)
-                    # stay in this state, for more ValueRow lines
-                else:
-                    # On the empty line after the last ValueRow line
-                    state = 1
-
-        return metric_group_values
+                    j = num_lines
+            ranges[metric_group_name] = (start, j)
+            i = j + 1
+        return ranges
+
+    def _iter_metric_group_rows(self, metric_group_name):
+        """
+        Generator that parses the ValueRow lines of a metric group in the
+        metrics response string, and yields a tuple(resource_uri, timestamp,
+        metrics) for each of them.
+        """
+        m_defs = self._metrics_context.metric_group_definitions[
+            metric_group_name].metric_definitions
+        m_items = [(m_name, m_def.index, m_def.type)
+                   for m_name, m_def in m_defs.items()]
+        start, end = self._metric_group_ranges[metric_group_name]
+        lines = self._lines
+        i = start
+        while i < end and lines[i] != '':
+            resource_uri = lines[i].strip('"')  # No " or \ inside
+            dt_timestamp = _metric_timestamp(lines[i + 1])
+            i += 2
+            while i < end and lines[i] != '':
+                # Process the metric values in the ValueRow line
+                str_values = lines[i].split(',')
+                metrics = {}
+                for m_name, m_index, m_type in m_items:
+                    metrics[m_name] = _metric_value(str_values[m_index],
+                                                    m_type)
+                yield resource_uri, dt_timestamp, metrics
+                i += 1
+            # On the empty line after the last ValueRow line
+            i += 1
+
+    def _parse_metric_group(self, metric_group_name):
+        """
+        Return the MetricGroupValues object for a metric group, parsing the
+        metric group if it has not been parsed yet.
+        """
+        try:
+            return self._metric_group_values_by_name[metric_group_name]
+        except KeyError:
+            pass
+        mg_def = self._metrics_context.metric_group_definitions[
+            metric_group_name]
+        object_values = [
+            MetricObjectValues(self._client, mg_def, resource_uri,
+                               dt_timestamp, metrics)
+            for resource_uri, dt_timestamp, metrics
+            in self._iter_metric_group_rows(metric_group_name)]
+        mgv = MetricGroupValues(metric_group_name, object_values)
+        self._metric_group_values_by_name[metric_group_name] = mgv
+        return mgv
 
     @property
     def metrics_context(self):
@@ -729,6 +782,16 @@ class MetricsResponse(object):
         """
         return self._metrics_context
 
+    @property
+    def metric_group_names(self):
+        """
+        :class:`py:list`: The names of the metric groups in this metric
+          response, in the order of the metrics response string.
+
+          Accessing this property does not parse the metric groups.
+        """
+        return list(self._metric_group_ranges)
+
     @property
     def metric_group_values(self):
         """
@@ -739,8 +802,71 @@ class MetricsResponse(object):
           :class:`~zhmcclient.MetricObjectValues` objects representing the
           metric values in this group (each for a single resource and point in
           time).
+
+          Accessing this property parses all metric groups that have not been
+          parsed yet.
+        """
+        return [self._parse_metric_group(name)
+                for name in self._metric_group_ranges]
+
+    def get_metric_group_values(self, metric_group_name):
+        """
+        Return the :class:`~zhmcclient.MetricGroupValues` object for a metric
+        group in this metric response.
+
+        Only this metric group is parsed, if it has not been parsed yet.
+
+        Parameters:
+
+          metric_group_name (:term:`string`): Name of the metric group.
+
+        Returns:
+
+          :class:`~zhmcclient.MetricGroupValues`: The metric values of the
+          metric group.
+
+        Raises:
+
+          KeyError: The metric group is not in this metric response.
+        """
+        if metric_group_name not in self._metric_group_ranges:
+            raise KeyError("Metric group {!r} is not in the metrics response".
+                           format(metric_group_name))
+        return self._parse_metric_group(metric_group_name)
+
+    def iter_rows(self, metric_group_names=None):
         """
-        return self._metric_group_values
+        Generator that parses the metrics response string and yields the
+        metric values of each value row, without creating
+        :class:`~zhmcclient.MetricGroupValues` and
+        :class:`~zhmcclient.MetricObjectValues` objects.
+
+        The metric values are parsed again each time this method is used.
+
+        Parameters:
+
+          metric_group_names (iterable of :term:`string`): Names of the metric
+            groups whose value rows are yielded. `None` means all metric
+            groups in this metric response. Metric groups that are not in
+            this metric response are ignored.
+
+        Returns:
+
+          iterator of tuple(metric_group_name, resource_uri, timestamp,
+          metrics): For each value row, the metric group name, the resource
+          URI, the point in time when the HMC captured the metric values (as
+          a timezone-aware :class:`py:datetime.datetime` object), and the
+          metric values as a dictionary of the (Python typed) metric values,
+          by metric name.
+        """
+        if metric_group_names is None:
+            metric_group_names = list(self._metric_group_ranges)
+        for metric_group_name in metric_group_names:
+            if metric_group_name not in self._metric_group_ranges:
+                continue
+            for resource_uri, dt_timestamp, metrics in \
+                    self._iter_metric_group_rows(metric_group_name):
+                yield metric_group_name, resource_uri, dt_timestamp, metrics
 
 
 class MetricGroupValues(object):
@@ -999,3 +1125,300 @@ class MetricObjectValues(object):
         obj_dict['timestamp'] = datetime_to_isoformat(self.timestamp)
         obj_dict['metrics'] = self.metrics
         return obj_dict
+
+
+def _int_typecode():
+    """
+    Return the typecode of the array module for 64-bit signed integers.
+    """
+    try:
+        array('q')
+        return 'q'
+    except ValueError:  # Python 2
+        return 'l'
+
+
+_INT_TYPECODE = _int_typecode()
+
+_BOOLEAN_VALUES = {'true': True, 'false': False}
+
+
+def _metric_column(value_strs, metric_type, use_numpy):
+    """
+    Return a column of Python-typed metric values from a sequence of metric
+    value strings.
+
+    Integer, float and boolean metric values are returned as a NumPy array if
+    `use_numpy` is True, or otherwise as an array of the array module. String
+    metric values are returned as a list.
+    """
+    if metric_type is six.text_type:
+        return [_metric_value(v, metric_type) for v in value_strs]
+    try:
+        if metric_type is bool:
+            values = [_BOOLEAN_VALUES[v.lower()] for v in value_strs]
+        else:
+            values = [metric_type(v) for v in value_strs]
+    except (KeyError, ValueError):
+        # Raise the same exception as for the row-wise parsing
+        for value_str in value_strs:
+            _metric_value(value_str, metric_type)
+        raise
+    if use_numpy:
+        dtype = {int: numpy.int64, float: numpy.float64, bool: numpy.bool_}
+        return numpy.array(values, dtype=dtype[metric_type])
+    typecode = {int: _INT_TYPECODE, float: 'd', bool: 'B'}
+    return array(typecode[metric_type], values)
+
+
+class ColumnarMetricsResponse(object):
+    """
+    Represents the metric values returned by one call to the
+    :meth:`~zhmcclient.MetricsContext.get_metrics` method in a columnar form,
+    as an alternative to :class:`~zhmcclient.MetricsResponse`.
+
+    For each metric group, the metric values are provided as one column per
+    metric, with one row for each value row in the metrics response string,
+    together with the resource URI and the epoch timestamp of each row (see
+    :class:`~zhmcclient.MetricGroupColumns`). This avoids creating Python
+    objects for each resource and point in time, and is considerably faster
+    for metrics responses with many resources.
+
+    The columns of integer, float and boolean metrics are NumPy arrays if the
+    NumPy package is used, or otherwise arrays of the :mod:`py:array` module.
+    The columns of string metrics are lists.
+    """
+
+    def __init__(self, metrics_context, metrics_response_str, use_numpy=None):
+        """
+        Parameters:
+
+          metrics_context (:class:`~zhmcclient.MetricsContext`):
+            The :class:`~zhmcclient.MetricsContext` object that was used to
+            retrieve the metrics response string. It defines the structure of
+            the metric values in the metrics response string.
+
+          metrics_response_str (:term:`string`):
+            The metrics response string, as returned by the
+            :meth:`~zhmcclient.MetricsContext.get_metrics` method.
+
+          use_numpy (bool):
+            Controls whether the columns are NumPy arrays. `None` means that
+            NumPy is used if the NumPy package is installed.
+
+        Raises:
+
+          ImportError: `use_numpy` is True and the NumPy package is not
+            installed.
+        """
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ImportError("The NumPy package is required for "
+                              "use_numpy=True but is not installed")
+        self._metrics_context = metrics_context
+        self._use_numpy = use_numpy
+        self._metric_group_columns = self._setup_metric_group_columns(
+            metrics_response_str)
+
+    def _setup_metric_group_columns(self, metrics_response_str):
+        """
+        Return the list of MetricGroupColumns objects for this metrics
+        response, by processing the metrics response string.
+
+        For the structure of the metrics response string, see
+        :meth:`zhmcclient.MetricsResponse._index_metric_groups`.
+        """
+        mg_defs = self._metrics_context.metric_group_definitions
+        lines = metrics_response_str.splitlines()
+        num_lines = len(lines)
+        metric_group_columns = []
+        i = 0
+        while i < num_lines:
+            if lines[i] == '':
+                # Skip initial (or trailing) empty lines
+                i += 1
+                continue
+            metric_group_name = lines[i].strip('"')  # No " or \ inside
+            mg_def = mg_defs[metric_group_name]
+            i += 1
+            resource_uris = []
+            uri_indexes = {}
+            row_uri_indexes = []
+            timestamps = []
+            rows = []
+            # ObjectValues items, up to the empty line ending the group
+            while i < num_lines and lines[i] != '':
+                resource_uri = lines[i].strip('"')  # No " or \ inside
+                timestamp = int(lines[i + 1])
+                i += 2
+                uri_index = uri_indexes.get(resource_uri)
+                if uri_index is None:
+                    uri_index = len(resource_uris)
+                    uri_indexes[resource_uri] = uri_index
+                    resource_uris.append(resource_uri)
+                # ValueRow lines, up to the empty line ending the item
+                while i < num_lines and lines[i] != '':
+                    rows.append(lines[i].split(','))
+                    row_uri_indexes.append(uri_index)
+                    timestamps.append(timestamp)
+                    i += 1
+                i += 1
+            i += 1
+
+            str_columns = list(zip(*rows))
+            columns = OrderedDict()
+            for m_name, m_def in mg_def.metric_definitions.items():
+                value_strs = str_columns[m_def.index] if rows else ()
+                columns[m_name] = _metric_column(
+                    value_strs, m_def.type, self._use_numpy)
+            if self._use_numpy:
+                row_uri_indexes = numpy.array(row_uri_indexes,
+                                              dtype=numpy.int64)
+                timestamps = numpy.array(timestamps, dtype=numpy.int64)
+            else:
+                row_uri_indexes = array(_INT_TYPECODE, row_uri_indexes)
+                timestamps = array(_INT_TYPECODE, timestamps)
+            metric_group_columns.append(MetricGroupColumns(
+                mg_def, resource_uris, row_uri_indexes, timestamps, columns))
+        return metric_group_columns
+
+    @property
+    def metrics_context(self):
+        """
+        :class:`~zhmcclient.MetricsContext` object for this metric response.
+        This can be used to access the metric definitions for this response.
+        """
+        return self._metrics_context
+
+    @property
+    def use_numpy(self):
+        """
+        bool: Indicates whether the columns are NumPy arrays.
+        """
+        return self._use_numpy
+
+    @property
+    def metric_group_columns(self):
+        """
+        :class:`py:list`: The list of :class:`~zhmcclient.MetricGroupColumns`
+          objects representing the metric groups in this metric response.
+        """
+        return self._metric_group_columns
+
+
+class MetricGroupColumns(object):
+    """
+    Represents the metric values for a metric group in a metrics response
+    string, in a columnar form (see
+    :class:`~zhmcclient.ColumnarMetricsResponse`).
+
+    Row `i` of the metric group has the metric values ``columns[name][i]``,
+    the resource URI ``resource_uris[row_uri_indexes[i]]`` and the epoch
+    timestamp ``timestamps[i]``.
+    """
+
+    def __init__(self, metric_group_definition, resource_uris,
+                 row_uri_indexes, timestamps, columns):
+        """
+        Parameters:
+
+          metric_group_definition (:class:`~zhmcclient.MetricGroupDefinition`):
+            Metric group definition for the metric values.
+
+          resource_uris (:class:`py:list`):
+            The distinct resource URIs in the metric group, in the order of
+            their first occurrence.
+
+          row_uri_indexes (array of :term:`integer`):
+            For each row, the index of its resource URI in `resource_uris`.
+
+          timestamps (array of :term:`integer`):
+            For each row, the point in time when the HMC captured the metric
+            values, as returned by the HMC in milliseconds since the epoch.
+
+          columns (dict):
+            The metric values, as a dictionary of columns by metric name.
+        """
+        self._metric_group_definition = metric_group_definition
+        self._resource_uris = resource_uris
+        self._row_uri_indexes = row_uri_indexes
+        self._timestamps = timestamps
+        self._columns = columns
+
+    def __repr__(self):
+        return "{}(name={!r}, rows={}, resources={})". \
+            format(self.__class__.__name__, self.name, len(self),
+                   len(self._resource_uris))
+
+    def __len__(self):
+        return len(self._timestamps)
+
+    @property
+    def name(self):
+        """
+        string: The metric group name.
+        """
+        return self._metric_group_definition.name
+
+    @property
+    def metric_group_definition(self):
+        """
+        :class:`~zhmcclient.MetricGroupDefinition`: Metric group definition for
+        the metric values.
+        """
+        return self._metric_group_definition
+
+    @property
+    def resource_uris(self):
+        """
+        :class:`py:list`: The distinct resource URIs in the metric group, in
+          the order of their first occurrence.
+        """
+        return self._resource_uris
+
+    @property
+    def row_uri_indexes(self):
+        """
+        array of :term:`integer`: For each row, the index of its resource URI
+          in :attr:`resource_uris`.
+        """
+        return self._row_uri_indexes
+
+    @property
+    def timestamps(self):
+        """
+        array of :term:`integer`: For each row, the point in time when the HMC
+          captured the metric values, in milliseconds since the epoch.
+
+          These values can be converted to datetime objects using
+          :func:`~zhmcclient.datetime_from_timestamp`.
+        """
+        return self._timestamps
+
+    @property
+    def columns(self):
+        """
+        dict: The metric values, as a dictionary of columns by metric name.
+        """
+        return self._columns
+
+    def rows(self, resource_uri):
+        """
+        Return the indexes of the rows for a resource.
+
+        Parameters:
+
+          resource_uri (:term:`string`): The resource URI.
+
+        Returns:
+
+          :class:`py:list` of :term:`integer`: The row indexes, in ascending
+          order. The list is empty if the resource has no rows.
+        """
+        try:
+            uri_index = self._resource_uris.index(resource_uri)
+        except ValueError:
+            return []
+        return [i for i, index in enumerate(self._row_uri_indexes)
+                if index == uri_index]
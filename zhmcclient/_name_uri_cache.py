@@ -0,0 +1,329 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A session-wide Name-URI cache caches the mappings between resource names and
+resource URIs for all resource managers of a :class:`~zhmcclient.Session`,
+replacing the Name-URI caches that are otherwise maintained in each manager
+object (see :meth:`~zhmcclient.BaseManager.invalidate_cache`).
+
+Compared to the Name-URI caches of the manager objects, a session-wide
+Name-URI cache:
+
+* is shared by all manager objects of the session, so that e.g. manager
+  objects of resource objects that are created again and again reuse the
+  cached mappings,
+* has a maximum number of entries, and removes the least recently used
+  entries when that number would be exceeded,
+* has a time to live per resource class, that applies to each entry
+  separately instead of invalidating the whole cache at once,
+* remembers resource names that were not found for some time, so that
+  repeated lookups of a missing name do not list the resources each time,
+* is updated incrementally when the session receives inventory change and
+  property change notifications for resource creation, deletion and renaming.
+  These notifications are received only while the session is subscribed for
+  auto-updating (see :meth:`~zhmcclient.Session.subscribe_auto_update`).
+
+Example::
+
+    cache = zhmcclient.NameUriCache(ttls={'partition': 60, 'cpc': 3600})
+    session = zhmcclient.Session(host, userid, password,
+                                 name_uri_cache=cache)
+"""
+
+from __future__ import absolute_import
+
+import time
+import threading
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+from ._constants import DEFAULT_NAME_URI_CACHE_TIMETOLIVE, \
+    DEFAULT_NAME_URI_CACHE_MAXSIZE, DEFAULT_NAME_URI_CACHE_NEGATIVE_TTL
+
+__all__ = ['NameUriCache']
+
+
+def _name_key(scope, name):
+    """
+    Return the key of a resource name in the cache.
+    """
+    _, _, case_insensitive = scope
+    return (scope, name.lower() if case_insensitive else name)
+
+
+class NameUriCache(object):
+    """
+    A bounded LRU cache for the mappings between resource names and resource
+    URIs, shared by all resource managers of a :class:`~zhmcclient.Session`.
+
+    A session-wide Name-URI cache is used by passing it in the
+    `name_uri_cache` parameter of :class:`~zhmcclient.Session`. It is
+    thread-safe.
+
+    The resources of a manager object are identified in this cache by a
+    scope, which is a tuple(parent URI, resource class, case-insensitive
+    names). The methods that have a `scope` parameter are used by the
+    resource managers, and do not normally need to be used directly.
+    """
+
+    def __init__(self, ttls=None,
+                 default_ttl=DEFAULT_NAME_URI_CACHE_TIMETOLIVE,
+                 negative_ttl=DEFAULT_NAME_URI_CACHE_NEGATIVE_TTL,
+                 maxsize=DEFAULT_NAME_URI_CACHE_MAXSIZE):
+        """
+        Parameters:
+
+          ttls (dict):
+            Time to live in seconds for the entries of resources, by resource
+            class (e.g. 'partition'). `None` as a time to live means that the
+            entries do not expire. `None` means no resource classes.
+
+          default_ttl (:term:`number`):
+            Time to live in seconds for the entries of resource classes that
+            are not in `ttls`, with the same special value as in `ttls`.
+
+          negative_ttl (:term:`number`):
+            Time in seconds a resource name that was not found is remembered
+            as not existing. 0 means that names that were not found are not
+            remembered.
+
+          maxsize (:term:`integer`):
+            Maximum number of entries. When this number would be exceeded,
+            the least recently used entry is removed from the cache.
+        """
+        self._ttls = dict(ttls or {})
+        self._default_ttl = default_ttl
+        self._negative_ttl = negative_ttl
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        # Cache entries, by tuple(scope, name key), in LRU order.
+        # Value: tuple(uri, expires), with uri `None` for names that were not
+        # found.
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self):
+        return "{}(size={}, maxsize={}, hits={}, misses={})". \
+            format(self.__class__.__name__, len(self), self._maxsize,
+                   self._hits, self._misses)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def hits(self):
+        """
+        :term:`integer`: Number of lookups that were answered from the cache,
+        including lookups of names that are remembered as not existing.
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        :term:`integer`: Number of lookups that were not answered from the
+        cache.
+        """
+        return self._misses
+
+    def ttl(self, class_name):
+        """
+        Return the time to live for the entries of a resource class.
+
+        Parameters:
+
+          class_name (:term:`string`): Resource class (e.g. 'partition').
+
+        Returns:
+
+          :term:`number`: Time to live in seconds, or `None` for no expiration.
+        """
+        return self._ttls.get(class_name, self._default_ttl)
+
+    def lookup(self, scope, name):
+        """
+        Look up the URI of a resource by name.
+
+        Parameters:
+
+          scope (tuple): Scope of the resource.
+
+          name (:term:`string`): Name of the resource.
+
+        Returns:
+
+          tuple(found, uri): `found` indicates whether the name was found in
+          the cache, and `uri` is the URI of the resource, or `None` if the
+          resource is remembered as not existing or was not found in the cache.
+        """
+        key = _name_key(scope, name)
+        with self._lock:
+            try:
+                entry = self._entries.pop(key)
+            except KeyError:
+                self._misses += 1
+                return False, None
+            uri, expires = entry
+            if expires is not None and expires <= time.time():
+                self._misses += 1
+                return False, None
+            self._entries[key] = entry  # most recently used
+            self._hits += 1
+        return True, uri
+
+    def put(self, scope, name, uri):
+        """
+        Create or update the entry for a resource name.
+
+        If the specified name is `None` or the empty string, do nothing.
+
+        Parameters:
+
+          scope (tuple): Scope of the resource.
+
+          name (:term:`string`): Name of the resource.
+
+          uri (:term:`string`): URI of the resource, or `None` for remembering
+            that the resource does not exist.
+        """
+        if not name:
+            return
+        if uri is None:
+            if not self._negative_ttl:
+                return
+            expires = time.time() + self._negative_ttl
+        else:
+            ttl = self.ttl(scope[1])
+            expires = None if ttl is None else time.time() + ttl
+        key = _name_key(scope, name)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (uri, expires)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, scope, name):
+        """
+        Delete the entry for a resource name, if it exists.
+
+        Parameters:
+
+          scope (tuple): Scope of the resource.
+
+          name (:term:`string`): Name of the resource.
+        """
+        if not name:
+            return
+        with self._lock:
+            self._entries.pop(_name_key(scope, name), None)
+
+    def invalidate_scope(self, scope):
+        """
+        Delete the entries for all resources of a scope.
+
+        Parameters:
+
+          scope (tuple): Scope of the resources.
+        """
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == scope]:
+                del self._entries[key]
+
+    def update_scope(self, scope, uris):
+        """
+        Update the entries for all resources of a scope from a complete list
+        of its resources.
+
+        The entries of the listed resources are created or updated, and the
+        entries of resources of the scope that are not listed are removed.
+        Names that are remembered as not existing remain, unless they are
+        listed.
+
+        Parameters:
+
+          scope (tuple): Scope of the resources.
+
+          uris (dict): URIs of all resources of the scope, by resource name.
+        """
+        keys = set(_name_key(scope, name) for name in uris)
+        with self._lock:
+            scope_keys = [k for k, e in self._entries.items()
+                          if k[0] == scope and e[0] is not None]
+            for key in scope_keys:
+                if key not in keys:
+                    del self._entries[key]
+        for name, uri in uris.items():
+            self.put(scope, name, uri)
+
+    def clear(self):
+        """
+        Delete all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def resource_removed(self, uri):
+        """
+        Update the cache for a resource that has been deleted.
+
+        Parameters:
+
+          uri (:term:`string`): URI of the resource.
+        """
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if e[0] == uri]:
+                del self._entries[key]
+
+    def resource_added(self, class_name, name=None):
+        """
+        Update the cache for a resource that has been created, by deleting the
+        entries that remember its name as not existing.
+
+        Parameters:
+
+          class_name (:term:`string`): Resource class of the resource.
+
+          name (:term:`string`): Name of the resource, or `None` if not known,
+            in which case all names of the resource class that are remembered
+            as not existing are deleted.
+        """
+        with self._lock:
+            for key in [k for k, e in self._entries.items()
+                        if e[0] is None and k[0][1] == class_name]:
+                if name is None or key == _name_key(key[0], name):
+                    del self._entries[key]
+
+    def resource_renamed(self, uri, name):
+        """
+        Update the cache for a resource whose name has changed.
+
+        Parameters:
+
+          uri (:term:`string`): URI of the resource.
+
+          name (:term:`string`): New name of the resource.
+        """
+        with self._lock:
+            renamed = [(k, e) for k, e in self._entries.items()
+                       if e[0] == uri]
+            for key, entry in renamed:
+                del self._entries[key]
+                new_key = _name_key(key[0], name)
+                self._entries.pop(new_key, None)
+                self._entries[new_key] = entry
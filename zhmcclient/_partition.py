@@ -42,7 +42,8 @@ from ._nic import NicManager
 from ._hba import HbaManager
 from ._virtual_function import VirtualFunctionManager
 from ._logging import logged_api_call
-from ._utils import matches_filters, divide_filter_args, RC_PARTITION
+from ._utils import matches_filters, Filter, divide_filter_args, RC_PARTITION
+from ._waiter import run_bulk_operation
 
 __all__ = ['PartitionManager', 'Partition']
 
@@ -86,7 +87,8 @@ class PartitionManager(BaseManager):
             oid_prop='object-id',
             uri_prop='object-uri',
             name_prop='name',
-            query_props=query_props)
+            query_props=query_props,
+            supports_additional_properties=True)
 
     @property
     def cpc(self):
@@ -97,7 +99,8 @@ class PartitionManager(BaseManager):
         return self._parent
 
     @logged_api_call
-    def list(self, full_properties=False, filter_args=None):
+    def list(self, full_properties=False, filter_args=None,
+             additional_properties=None):
         """
         List the Partitions in this CPC.
 
@@ -122,6 +125,24 @@ class PartitionManager(BaseManager):
             `None` causes no filtering to happen, i.e. all resources are
             returned.
 
+          additional_properties (list of :term:`string`):
+            List of property names that are to be returned in addition to the
+            default properties, for each resource. `None` means no additional
+            properties.
+
+            The properties used for client-side filtering (see
+            :ref:`Filtering`) are automatically added to the additional
+            properties.
+
+            If the HMC supports the 'additional-properties' query parameter
+            of the list operation (HMC API version 4.10 or higher), the
+            additional properties are returned by the list operation.
+            Otherwise, the properties of the listed resources that do not
+            have all of the additional properties are retrieved with a single
+            'Get Inventory' operation. If the HMC rejects that operation, only
+            the additional properties are retrieved for each of these
+            resources, concurrently.
+
         Returns:
 
           : A list of :class:`~zhmcclient.Partition` objects.
@@ -143,6 +164,9 @@ class PartitionManager(BaseManager):
         else:
             query_parms, client_filters = divide_filter_args(
                 self._query_props, filter_args)
+            client_filter = Filter(client_filters)
+            query_parms, missing_props = self._additional_properties_query(
+                query_parms, additional_properties, client_filters)
 
             resources_name = 'partitions'
             uri = '{}/{}{}'.format(self.cpc.uri, resources_name, query_parms)
@@ -150,6 +174,7 @@ class PartitionManager(BaseManager):
             result = self.session.get(uri)
             if result:
                 props_list = result[resources_name]
+                listed_obj_list = []
                 for props in props_list:
 
                     resource_obj = self.resource_class(
@@ -157,11 +182,19 @@ class PartitionManager(BaseManager):
                         uri=props[self._uri_prop],
                         name=props.get(self._name_prop, None),
                         properties=props)
+                    listed_obj_list.append(resource_obj)
+
+                if missing_props:
+                    self._pull_missing_properties(
+                        listed_obj_list, missing_props)
 
-                    if matches_filters(resource_obj, client_filters):
+                for resource_obj in listed_obj_list:
+                    if matches_filters(resource_obj, client_filter):
                         resource_obj_list.append(resource_obj)
-                        if full_properties:
-                            resource_obj.pull_full_properties()
+                if full_properties:
+                    self._pull_full_properties(
+                        [obj for obj in resource_obj_list
+                         if not obj.full_properties])
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
@@ -208,6 +241,123 @@ class PartitionManager(BaseManager):
         self._name_uri_cache.update(name, uri)
         return part
 
+    @logged_api_call
+    def start_many(self, partitions, max_parallel=None,
+                   operation_timeout=None, status_timeout=None):
+        """
+        Start (activate) multiple Partitions concurrently, using the HMC
+        operation "Start Partition", and wait for the partitions to reach
+        status "active" or "degraded".
+
+        The operations are started concurrently (up to `max_parallel`), the
+        resulting jobs and the partition status values are waited for by a
+        :class:`~zhmcclient.JobSet` and a :class:`~zhmcclient.StatusWaiter`,
+        and a new operation is started as soon as an operation in progress is
+        done.
+
+        Authorization requirements:
+
+        * Object-access permission to the Partitions.
+        * Task permission to the "Start Partition" task.
+
+        Parameters:
+
+          partitions (iterable of :class:`~zhmcclient.Partition`):
+            The partitions.
+
+          max_parallel (:term:`integer`):
+            Maximum number of partitions for which the operation is in
+            progress at the same time. `None` means that the operation is
+            started on all partitions right away.
+
+          operation_timeout (:term:`number`):
+            Timeout in seconds, for waiting for completion of the asynchronous
+            job performing the operation on each partition. The special value
+            0 means that no timeout is set. `None` means that the default
+            async operation timeout of the session is used.
+
+          status_timeout (:term:`number`):
+            Timeout in seconds, for waiting that the status of each partition
+            has reached the desired status, after the HMC operation has
+            completed. The special value 0 means that no timeout is set.
+            `None` means that the default status timeout of the session is
+            used.
+
+        Returns:
+
+          list: One item for each of the specified partitions, in the order
+          of the partitions. Each item is either the reached status of the
+          partition (as a :term:`string`), or the exception object for the
+          failed operation on the partition (e.g.
+          :exc:`~zhmcclient.HTTPError`,
+          :exc:`~zhmcclient.OperationTimeout`, or
+          :exc:`~zhmcclient.StatusTimeout`). Exceptions for individual
+          partitions are not raised.
+        """
+        return run_bulk_operation(
+            self.session, partitions,
+            lambda partition: partition.start(wait_for_completion=False),
+            ["active", "degraded"], max_parallel, operation_timeout,
+            status_timeout)
+
+    @logged_api_call
+    def stop_many(self, partitions, max_parallel=None,
+                  operation_timeout=None, status_timeout=None):
+        """
+        Stop (deactivate) multiple Partitions concurrently, using the HMC
+        operation "Stop Partition", and wait for the partitions to reach
+        status "stopped".
+
+        The operations are started concurrently (up to `max_parallel`), the
+        resulting jobs and the partition status values are waited for by a
+        :class:`~zhmcclient.JobSet` and a :class:`~zhmcclient.StatusWaiter`,
+        and a new operation is started as soon as an operation in progress is
+        done.
+
+        Authorization requirements:
+
+        * Object-access permission to the Partitions.
+        * Task permission to the "Stop Partition" task.
+
+        Parameters:
+
+          partitions (iterable of :class:`~zhmcclient.Partition`):
+            The partitions.
+
+          max_parallel (:term:`integer`):
+            Maximum number of partitions for which the operation is in
+            progress at the same time. `None` means that the operation is
+            started on all partitions right away.
+
+          operation_timeout (:term:`number`):
+            Timeout in seconds, for waiting for completion of the asynchronous
+            job performing the operation on each partition. The special value
+            0 means that no timeout is set. `None` means that the default
+            async operation timeout of the session is used.
+
+          status_timeout (:term:`number`):
+            Timeout in seconds, for waiting that the status of each partition
+            has reached the desired status, after the HMC operation has
+            completed. The special value 0 means that no timeout is set.
+            `None` means that the default status timeout of the session is
+            used.
+
+        Returns:
+
+          list: One item for each of the specified partitions, in the order
+          of the partitions. Each item is either the reached status of the
+          partition (as a :term:`string`), or the exception object for the
+          failed operation on the partition (e.g.
+          :exc:`~zhmcclient.HTTPError`,
+          :exc:`~zhmcclient.OperationTimeout`, or
+          :exc:`~zhmcclient.StatusTimeout`). Exceptions for individual
+          partitions are not raised.
+        """
+        return run_bulk_operation(
+            self.session, partitions,
+            lambda partition: partition.stop(wait_for_completion=False),
+            ["stopped"], max_parallel, operation_timeout, status_timeout)
+
 
 class Partition(BaseResource):
     """
@@ -939,6 +1089,17 @@ class Partition(BaseResource):
         """
         Wait until the status of this partition has a desired value.
 
+        The status is polled with an interval that starts at the
+        :attr:`~zhmcclient.RetryTimeoutConfig.poll_min_interval` attribute of
+        the retry/timeout configuration of the session and is doubled after
+        each poll, up to its
+        :attr:`~zhmcclient.RetryTimeoutConfig.poll_max_interval` attribute.
+        If the session is subscribed for
+        :ref:`auto-updating of resources <Auto-updating of resources>` (see
+        :meth:`~zhmcclient.Session.subscribe_auto_update`), a status
+        notification from the HMC that reports a desired status causes the
+        status to be polled right away.
+
         Parameters:
 
           status (:term:`string` or iterable of :term:`string`):
@@ -963,35 +1124,55 @@ class Partition(BaseResource):
           :exc:`~zhmcclient.StatusTimeout`: The status timeout expired while
             waiting for the desired partition status.
         """
+        rt_config = self.manager.session.retry_timeout_config
         if status_timeout is None:
-            status_timeout = \
-                self.manager.session.retry_timeout_config.status_timeout
+            status_timeout = rt_config.status_timeout
         if status_timeout > 0:
             end_time = time.time() + status_timeout
         if isinstance(status, (list, tuple)):
             statuses = status
         else:
             statuses = [status]
-        while True:
-
-            # Fastest way to get actual status value:
-            parts = self.manager.cpc.partitions.list(
-                filter_args={'name': self.name})
-            assert len(parts) == 1
-            this_part = parts[0]
-            actual_status = this_part.get_property('status')
-
-            if actual_status in statuses:
-                return
-
-            if status_timeout > 0 and time.time() > end_time:
-                raise StatusTimeout(
-                    "Waiting for partition {} to reach status(es) '{}' timed "
-                    "out after {} s - current status is '{}'".
-                    format(self.name, statuses, status_timeout, actual_status),
-                    actual_status, statuses, status_timeout)
-
-            time.sleep(1)  # Avoid hot spin loop
+        poll_interval = rt_config.poll_min_interval
+
+        # Watch for status notifications if the session is subscribed for
+        # auto-update. The polling below remains in place as a fallback.
+        updater = self.manager.session.resource_updater
+        if updater:
+            updater.watch_status(self.uri)
+        try:
+            while True:
+
+                # Fastest way to get actual status value:
+                parts = self.manager.cpc.partitions.list(
+                    filter_args={'name': self.name})
+                assert len(parts) == 1
+                this_part = parts[0]
+                actual_status = this_part.get_property('status')
+
+                if actual_status in statuses:
+                    return
+
+                if status_timeout > 0 and time.time() > end_time:
+                    raise StatusTimeout(
+                        "Waiting for partition {} to reach status(es) '{}' "
+                        "timed out after {} s - current status is '{}'".
+                        format(self.name, statuses, status_timeout,
+                               actual_status),
+                        actual_status, statuses, status_timeout)
+
+                wait_time = poll_interval
+                if status_timeout > 0:
+                    wait_time = min(wait_time, max(end_time - time.time(), 0))
+                if updater:
+                    updater.wait_for_status(self.uri, statuses, wait_time)
+                else:
+                    time.sleep(wait_time)  # Avoid hot spin loop
+                poll_interval = min(poll_interval * 2,
+                                    rt_config.poll_max_interval)
+        finally:
+            if updater:
+                updater.unwatch_status(self.uri)
 
     @logged_api_call
     def increase_crypto_config(self, crypto_adapters,
@@ -1312,8 +1493,9 @@ class Partition(BaseResource):
             for sg_uri in sg_uris:
                 sg = console.storage_groups.resource_object(sg_uri)
                 sg_list.append(sg)
-                if full_properties:
-                    sg.pull_full_properties()
+            if full_properties:
+                # pylint: disable=protected-access
+                console.storage_groups._pull_full_properties(sg_list)
         return sg_list
 
     def dump(self):
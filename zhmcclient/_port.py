@@ -31,7 +31,8 @@ except ImportError:
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._logging import logged_api_call
-from ._utils import matches_filters, RC_NETWORK_PORT, RC_STORAGE_PORT
+from ._utils import matches_filters, Filter, RC_NETWORK_PORT, \
+    RC_STORAGE_PORT
 
 __all__ = ['PortManager', 'Port']
 
@@ -158,6 +159,8 @@ class PortManager(BaseManager):
         # causes duplicate URIs to show up in this property:
         uris = list(set(uris))
 
+        client_filter = Filter(filter_args)
+
         resource_obj_list = []
         for uri in uris:
 
@@ -167,10 +170,10 @@ class PortManager(BaseManager):
                 name=None,
                 properties=None)
 
-            if matches_filters(resource_obj, filter_args):
+            if matches_filters(resource_obj, client_filter):
                 resource_obj_list.append(resource_obj)
-                if full_properties:
-                    resource_obj.pull_full_properties()
+        if full_properties:
+            self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
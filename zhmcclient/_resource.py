@@ -264,12 +264,64 @@ class BaseResource(object):
             self._full_properties = True
 
     @logged_api_call
-    def get_property(self, name):
+    def pull_properties(self, names):
+        """
+        Retrieve the specified resource properties and update them in the
+        properties cached in this object.
+
+        Only the specified properties are requested from the HMC, using the
+        'properties' query parameter of the 'Get <resource> Properties'
+        operation. This reduces the amount of data transferred from the HMC
+        compared to :meth:`pull_full_properties`, if only a few properties
+        are needed.
+
+        The retrieved properties are merged into the properties cached in this
+        object. This does not change whether the cached properties are
+        considered to be the full set of properties (see
+        :attr:`full_properties`).
+
+        If the HMC returns more properties than the specified ones (e.g. if it
+        does not support the 'properties' query parameter), all returned
+        properties are merged into the cache.
+
+        This method serializes with other methods that access or change
+        properties on the same Python object.
+
+        Authorization requirements:
+
+        * Object-access permission to this resource.
+
+        Parameters:
+
+          names (iterable of :term:`string`):
+            Names of the resource properties, using the names defined in the
+            respective 'Data model' sections in the :term:`HMC API` book.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          :exc:`~zhmcclient.CeasedExistence`
+        """
+        with self._property_lock:
+            if self._ceased_existence:
+                raise CeasedExistence(self._uri)
+        uri = '{}?properties={}'.format(self._uri, ','.join(names))
+        properties = self.manager.session.get(uri)
+        with self._property_lock:
+            self._properties.update(properties)
+            self._properties_timestamp = int(time.time())
+
+    @logged_api_call
+    def get_property(self, name, partial=False):
         """
         Return the value of a resource property.
 
         If the resource property is not cached in this object yet, the full set
-        of resource properties is retrieved and cached in this object, and the
+        of resource properties is retrieved and cached in this object (or only
+        the specified resource property, if `partial` is `True`), and the
         resource property is again attempted to be returned.
 
         This method serializes with other methods that access or change
@@ -285,6 +337,13 @@ class BaseResource(object):
             Name of the resource property, using the names defined in the
             respective 'Data model' sections in the :term:`HMC API` book.
 
+          partial (bool):
+            Controls what is retrieved from the HMC if the resource property
+            is not cached in this object yet: If `True`, only the specified
+            resource property is retrieved (see :meth:`pull_properties`). If
+            `False`, the full set of resource properties is retrieved (see
+            :meth:`pull_full_properties`).
+
         Returns:
 
           The value of the resource property.
@@ -292,7 +351,7 @@ class BaseResource(object):
         Raises:
 
           KeyError: The resource property could not be found (also not in the
-            full set of resource properties).
+            properties retrieved from the HMC).
           :exc:`~zhmcclient.HTTPError`
           :exc:`~zhmcclient.ParseError`
           :exc:`~zhmcclient.AuthError`
@@ -307,7 +366,10 @@ class BaseResource(object):
         except KeyError:
             if self._full_properties:
                 raise
-            self.pull_full_properties()
+            if partial:
+                self.pull_properties([name])
+            else:
+                self.pull_full_properties()
             with self._property_lock:
                 return self._properties[name]
 
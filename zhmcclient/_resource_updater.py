@@ -20,6 +20,8 @@ Resource updater for
 
 import logging
 import json
+import threading
+import time
 try:
     from json import JSONDecodeError as _JSONDecodeError
 except ImportError:
@@ -57,6 +59,11 @@ class ResourceUpdater(object):
 
     Zhmcclient resource objects that are not enabled for auto-updating remain
     unchanged.
+
+    In addition, the status notifications are used to wake up threads that
+    wait for a resource to reach a desired status (e.g. in
+    :meth:`zhmcclient.Partition.wait_for_status`), for resources whose status
+    is being watched (via :meth:`~zhmcclient.ResourceUpdater.watch_status`).
     """
 
     def __init__(self, session):
@@ -73,6 +80,11 @@ class ResourceUpdater(object):
         #   dict(key: uri, value: dict(key: id, value: object))
         self._registered_objects = {}
 
+        # Resources whose status is watched, as:
+        #   dict(key: uri, value: list(watch count, latest notified status))
+        self._status_watches = {}
+        self._status_condition = threading.Condition()
+
         # Subscription ID. We use some value that allows to identify on the
         # HMC that this is the zhmcclient, but otherwise we are not using
         # this value ourselves.
@@ -106,6 +118,8 @@ class ResourceUpdater(object):
         updater was created for.
         """
         self._conn.disconnect()
+        with self._status_condition:
+            self._status_condition.notify_all()
 
     def register_object(self, resource_obj):
         """
@@ -153,6 +167,111 @@ class ResourceUpdater(object):
         """
         return bool(self._registered_objects)
 
+    def watch_status(self, resource_uri):
+        """
+        Start watching the status of a resource, so that status notifications
+        for the resource are recorded for
+        :meth:`~zhmcclient.ResourceUpdater.wait_for_status`.
+
+        Watches are counted, i.e. each call to this method must be paired with
+        a call to :meth:`~zhmcclient.ResourceUpdater.unwatch_status`.
+        """
+        with self._status_condition:
+            if resource_uri in self._status_watches:
+                self._status_watches[resource_uri][0] += 1
+            else:
+                self._status_watches[resource_uri] = [1, None]
+
+    def unwatch_status(self, resource_uri):
+        """
+        Stop watching the status of a resource.
+        """
+        with self._status_condition:
+            watch = self._status_watches.get(resource_uri, None)
+            if watch:
+                watch[0] -= 1
+                if watch[0] <= 0:
+                    del self._status_watches[resource_uri]
+
+    def status_changed(self, resource_uri, status):
+        """
+        Record the new status of a resource whose status is watched, and wake
+        up the threads waiting for it.
+
+        This method is called when a status notification has been received.
+        """
+        with self._status_condition:
+            watch = self._status_watches.get(resource_uri, None)
+            if watch:
+                watch[1] = status
+                self._status_condition.notify_all()
+
+    def wait_for_status(self, resource_uri, statuses, timeout):
+        """
+        Wait until a status notification for a watched resource has reported
+        one of the desired status values, or until the timeout expires.
+
+        A notification that has been received since the status of the
+        resource is being watched is taken into account. A reported desired
+        status is consumed by returning it.
+
+        Parameters:
+
+          resource_uri (:term:`string`): Canonical URI of the resource.
+
+          statuses (list of :term:`string`): Desired status values.
+
+          timeout (:term:`number`): Maximum time to wait, in seconds.
+
+        Returns:
+
+          :term:`string`: The desired status value that was reported, or
+          `None` if none was reported within the timeout.
+        """
+        reached = self.wait_for_statuses({resource_uri: statuses}, timeout)
+        return reached.get(resource_uri, None)
+
+    def wait_for_statuses(self, targets, timeout):
+        """
+        Wait until status notifications for at least one of a set of watched
+        resources have reported one of its desired status values, or until
+        the timeout expires.
+
+        Notifications that have been received since the status of a
+        resource is being watched are taken into account. Reported desired
+        status values are consumed by returning them.
+
+        Parameters:
+
+          targets (dict): The desired status values of the resources, with:
+
+            - key (:term:`string`): Canonical URI of the resource.
+            - value (list of :term:`string`): Desired status values.
+
+          timeout (:term:`number`): Maximum time to wait, in seconds.
+
+        Returns:
+
+          dict: The desired status values that were reported, with the
+          canonical resource URIs as keys. The dict is empty if the timeout
+          expired.
+        """
+        end_time = time.time() + timeout
+        with self._status_condition:
+            while True:
+                reached = {}
+                for uri, statuses in targets.items():
+                    watch = self._status_watches.get(uri, None)
+                    if watch and watch[1] in statuses:
+                        reached[uri] = watch[1]
+                        watch[1] = None
+                if reached:
+                    return reached
+                remaining = end_time - time.time()
+                if remaining <= 0:
+                    return reached
+                self._status_condition.wait(remaining)
+
 
 class _UpdateListener(object):
     # pylint: disable=too-few-public-methods
@@ -220,6 +339,9 @@ class _UpdateListener(object):
             for obj in self._updater.registered_objects(uri):
                 if obj.auto_update_enabled():
                     obj.update_properties_local(new_props)
+            name_uri_cache = self._session.name_uri_cache
+            if name_uri_cache is not None and new_props.get('name'):
+                name_uri_cache.resource_renamed(uri, new_props['name'])
         elif noti_type == 'status-change':
             try:
                 msg_obj = json.loads(message)
@@ -247,6 +369,8 @@ class _UpdateListener(object):
             for obj in self._updater.registered_objects(uri):
                 if obj.auto_update_enabled():
                     obj.update_properties_local(new_props)
+            if 'status' in new_props:
+                self._updater.status_changed(uri, new_props['status'])
         elif noti_type == 'inventory-change':
             action = headers['action']
             JMS_LOGGER.debug(
@@ -257,6 +381,13 @@ class _UpdateListener(object):
                 for obj in self._updater.registered_objects(uri):
                     if obj.auto_update_enabled():
                         obj.cease_existence_local()
+            name_uri_cache = self._session.name_uri_cache
+            if name_uri_cache is not None:
+                if action == 'remove':
+                    name_uri_cache.resource_removed(uri)
+                elif action == 'add':
+                    name_uri_cache.resource_added(
+                        headers.get('class'), headers.get('name'))
         else:
             JMS_LOGGER.warning(
                 "JMS message for notification of type %s for topic '%s' "
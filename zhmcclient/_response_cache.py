@@ -0,0 +1,353 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A response cache caches the results of HTTP GET requests issued by a
+:class:`~zhmcclient.Session`, so that repeated retrievals of the same
+resources (e.g. by ``list()`` or
+:meth:`~zhmcclient.BaseResource.get_property` methods) within a configurable
+time to live do not cause HMC requests.
+
+The time to live is configured per URI pattern. Cached results are
+automatically invalidated when the session performs a POST or DELETE request
+(or completes an asynchronous operation) that targets the same resource, one
+of its parent resources or child resources, or a resource in a collection of
+the same name. The result of a GET request that was in progress while such
+an invalidation happened is not cached, because it may be outdated.
+
+Because resource properties may also be changed by other HMC clients or by
+the HMC itself, a response cache should be used only where the configured
+time to live is acceptable as a delay for noticing such changes. The URIs
+of volatile data are never cached: Job status, session related URIs (e.g.
+the notification topics), the metrics service (e.g. metric samples
+retrieved by :meth:`~zhmcclient.MetricsContext.get_metrics`) and the audit
+and security logs of the console.
+
+Cached results are returned for GET requests that require a logged-on
+session only while the session is logged on.
+"""
+
+from __future__ import absolute_import
+
+import re
+import time
+import threading
+from copy import deepcopy
+from collections import deque
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+__all__ = ['ResponseCache']
+
+# Number of recent invalidations that are remembered for checking whether
+# the result of a GET request was invalidated while the request was in
+# progress
+_INVALIDATION_HISTORY = 100
+
+# URI paths whose responses are never cached, because they are volatile
+_NEVER_CACHED_PATTERN = re.compile(
+    r'/api/(jobs|sessions|services/metrics)(/|$)|'
+    r'/api/console/operations/get-(audit|security)-log$')
+
+
+def _uri_path(uri):
+    """
+    Return the path of a URI, without query parameters.
+    """
+    return uri.split('?', 1)[0]
+
+
+def _target_resource(path):
+    """
+    Return the URI path of the resource targeted by a POST or DELETE request
+    path, removing any operation name (e.g. "/operations/start").
+    """
+    return path.split('/operations/', 1)[0]
+
+
+class _Invalidation(object):
+    # pylint: disable=too-few-public-methods
+    """
+    The set of URI paths affected by a POST or DELETE request, as described
+    in :meth:`ResponseCache.invalidate`.
+    """
+
+    def __init__(self, uri):
+        resource = _target_resource(_uri_path(uri)).rstrip('/')
+        ancestors = set()
+        parent = resource
+        while '/' in parent:
+            parent = parent.rsplit('/', 1)[0]
+            if parent:
+                ancestors.add(parent)
+        collection_suffix = None
+        if '/' in resource:
+            collection = resource.rsplit('/', 1)[0]
+            if collection:
+                collection_suffix = '/' + collection.rsplit('/', 1)[-1]
+        self._resource = resource
+        self._ancestors = ancestors
+        self._collection_suffix = collection_suffix
+
+    def affects(self, uri):
+        """
+        Return whether the result of a GET request is affected.
+        """
+        path = _uri_path(uri)
+        if path == self._resource or \
+                path.startswith(self._resource + '/') or \
+                path in self._ancestors:
+            return True
+        return bool(self._collection_suffix) and \
+            path.endswith(self._collection_suffix)
+
+
+class ResponseCache(object):
+    """
+    A bounded LRU cache for the results of HTTP GET requests of a
+    :class:`~zhmcclient.Session`, with a time to live per URI pattern.
+
+    A response cache is used by passing it in the `response_cache` parameter
+    of :class:`~zhmcclient.Session`. It is thread-safe, and can be shared by
+    multiple sessions for the same HMC and userid.
+
+    Example for caching the API version forever, adapter lists for 60 seconds,
+    and nothing else::
+
+        cache = zhmcclient.ResponseCache(ttls=[
+            ('/api/version', None),
+            ('/api/cpcs/[^/]+/adapters', 60),
+        ])
+        session = zhmcclient.Session(host, userid, password,
+                                     response_cache=cache)
+    """
+
+    def __init__(self, ttls=None, default_ttl=0, maxsize=1000):
+        """
+        Parameters:
+
+          ttls (iterable of tuple(pattern, ttl)):
+            Time to live for the results of GET requests, by URI pattern.
+            `pattern` is a regular expression :term:`string` that needs to
+            match the complete URI path (without query parameters) of the GET
+            request. The first matching pattern determines the time to live.
+            `ttl` is the time to live in seconds, where `None` means that the
+            result does not expire, and 0 means that the result is not cached.
+            `None` means no URI patterns.
+
+          default_ttl (:term:`number`):
+            Time to live in seconds for URIs that do not match any of the URI
+            patterns, with the same special values as `ttl`.
+
+          maxsize (:term:`integer`):
+            Maximum number of cached results. When this number would be
+            exceeded, the least recently used result is removed from the
+            cache.
+        """
+        self._ttls = [(re.compile(pattern + r'\Z'), ttl)
+                      for pattern, ttl in (ttls or [])]
+        self._default_ttl = default_ttl
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        # Cached results, by URI, in LRU order. Value: tuple(expires, result)
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        # Number of invalidations so far, and the most recent invalidations,
+        # as tuple(generation, _Invalidation)
+        self._generation = 0
+        self._invalidations = deque(maxlen=_INVALIDATION_HISTORY)
+
+    def __repr__(self):
+        return "{}(size={}, maxsize={}, hits={}, misses={})". \
+            format(self.__class__.__name__, len(self), self._maxsize,
+                   self._hits, self._misses)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def hits(self):
+        """
+        :term:`integer`: Number of GET requests that were served from the
+        cache.
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        :term:`integer`: Number of cacheable GET requests that were not
+        served from the cache.
+        """
+        return self._misses
+
+    @property
+    def generation(self):
+        """
+        :term:`integer`: The invalidation generation of the cache, which is
+        increased by each invalidation.
+
+        This is retrieved before a GET request is issued, and is passed to
+        :meth:`put` for its result (see there).
+        """
+        return self._generation
+
+    def ttl(self, uri):
+        """
+        Return the time to live for the result of a GET request.
+
+        Parameters:
+
+          uri (:term:`string`): URI of the GET request.
+
+        Returns:
+
+          :term:`number`: Time to live in seconds, `None` for no expiration,
+          or 0 if the result is not cached.
+        """
+        path = _uri_path(uri)
+        if _NEVER_CACHED_PATTERN.match(path):
+            return 0
+        for pattern, ttl in self._ttls:
+            if pattern.match(path):
+                return ttl
+        return self._default_ttl
+
+    def get(self, uri):
+        """
+        Return the cached result of a GET request, if cached and not expired.
+
+        Parameters:
+
+          uri (:term:`string`): URI of the GET request.
+
+        Returns:
+
+          tuple(found, result): `found` indicates whether the result was
+          found in the cache, and `result` is a copy of the cached result
+          (or `None` if not found).
+        """
+        if self.ttl(uri) == 0:
+            return False, None
+        with self._lock:
+            try:
+                expires, result = self._entries.pop(uri)
+            except KeyError:
+                self._misses += 1
+                return False, None
+            if expires is not None and expires <= time.time():
+                self._misses += 1
+                return False, None
+            self._entries[uri] = (expires, result)  # most recently used
+            self._hits += 1
+        return True, deepcopy(result)
+
+    def put(self, uri, result, generation=None):
+        """
+        Store the result of a GET request in the cache, if its URI is
+        cacheable.
+
+        If the invalidation generation at the time the GET request was issued
+        is specified, the result is not stored if an invalidation that
+        affects the URI happened while the GET request was in progress,
+        because the result may be outdated. If that cannot be determined
+        because the invalidation happened too long ago, the result is not
+        stored either.
+
+        Parameters:
+
+          uri (:term:`string`): URI of the GET request.
+
+          result (:term:`json object`): Result of the GET request. A copy
+            of it is stored.
+
+          generation (:term:`integer`): The value of the
+            :attr:`generation` property before the GET request was issued,
+            or `None` for storing the result unconditionally.
+        """
+        ttl = self.ttl(uri)
+        if ttl == 0:
+            return
+        expires = None if ttl is None else time.time() + ttl
+        result = deepcopy(result)
+        with self._lock:
+            if generation is not None and \
+                    self._invalidated_since(uri, generation):
+                return
+            self._entries.pop(uri, None)
+            self._entries[uri] = (expires, result)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, uri):
+        """
+        Invalidate the cached results that may be affected by a POST or
+        DELETE request.
+
+        The following cached results are invalidated, where the target
+        resource is the URI path of the request without any operation name
+        (e.g. "/api/partitions/{id}" for
+        "/api/partitions/{id}/operations/start"):
+
+        * the target resource and its child resources,
+        * the parent resources of the target resource,
+        * all collections with the same name as the collection of the target
+          resource (e.g. the partitions of all CPCs for a partition).
+
+        Results for different query parameters of these URIs are
+        invalidated as well.
+
+        The invalidation is also remembered, so that the results of GET
+        requests for these URIs that are in progress are not stored (see
+        :meth:`put`).
+
+        Parameters:
+
+          uri (:term:`string`): URI of the POST or DELETE request.
+        """
+        invalidation = _Invalidation(uri)
+        with self._lock:
+            self._generation += 1
+            self._invalidations.append((self._generation, invalidation))
+            for cached_uri in list(self._entries):
+                if invalidation.affects(cached_uri):
+                    del self._entries[cached_uri]
+
+    def _invalidated_since(self, uri, generation):
+        """
+        Return whether an invalidation after the specified invalidation
+        generation affected a URI, or may have affected it. Must be called
+        while holding the lock.
+        """
+        if generation == self._generation:
+            return False
+        if not self._invalidations or \
+                self._invalidations[0][0] > generation + 1:
+            # Not all invalidations since then are remembered
+            return True
+        for inv_generation, invalidation in self._invalidations:
+            if inv_generation > generation and invalidation.affects(uri):
+                return True
+        return False
+
+    def clear(self):
+        """
+        Remove all cached results.
+        """
+        with self._lock:
+            self._entries.clear()
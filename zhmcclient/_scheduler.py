@@ -0,0 +1,347 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A request scheduler prioritizes the HTTP requests of a
+:class:`~zhmcclient.Session` that is used concurrently by multiple threads,
+e.g. for interactive requests and for long-running batch work at the same
+time.
+
+The requests are assigned to named lanes. Each lane has a priority and
+optionally a maximum number of concurrent requests, and the scheduler has an
+overall maximum number of concurrent requests. When a request can be sent,
+it is taken from the lane with the highest priority that has waiting
+requests and has not reached its own maximum, so interactive requests do not
+queue behind batch requests.
+
+The lane of a request is selected for the current thread with
+:func:`~zhmcclient.request_lane`. The zhmcclient methods that issue HMC
+requests in worker threads (e.g. ``list()`` with ``max_workers``) use the
+lane of the calling thread.
+
+Example::
+
+    scheduler = zhmcclient.RequestScheduler(
+        lanes=[
+            zhmcclient.RequestLane('interactive', priority=10),
+            zhmcclient.RequestLane('batch', priority=0, max_concurrency=2),
+        ],
+        max_concurrency=4, default_lane='interactive')
+    session = zhmcclient.Session(host, userid, password,
+                                 request_scheduler=scheduler)
+    client = zhmcclient.Client(session)
+
+    # In a batch thread:
+    with zhmcclient.request_lane('batch'):
+        inventory = client.get_inventory(['partition'])
+"""
+
+from __future__ import absolute_import
+
+import threading
+import functools
+from collections import deque
+from contextlib import contextmanager
+
+__all__ = ['RequestScheduler', 'RequestLane', 'request_lane']
+
+# Lane of the current thread, in attribute 'name'
+_THREAD_LANE = threading.local()
+
+
+@contextmanager
+def request_lane(name):
+    """
+    Context manager that selects the request lane for the HMC requests
+    issued by the current thread within its context, for sessions that use a
+    :class:`~zhmcclient.RequestScheduler`.
+
+    The context managers can be nested; the innermost lane is used.
+
+    Parameters:
+
+      name (:term:`string`): Name of the lane. `None` selects the default
+        lane of the scheduler.
+    """
+    saved_name = getattr(_THREAD_LANE, 'name', None)
+    _THREAD_LANE.name = name
+    try:
+        yield
+    finally:
+        _THREAD_LANE.name = saved_name
+
+
+def current_request_lane():
+    """
+    Return the name of the request lane selected for the current thread, or
+    `None` if no lane is selected.
+    """
+    return getattr(_THREAD_LANE, 'name', None)
+
+
+def with_request_lane(func):
+    """
+    Return a function that calls the specified function in the request lane
+    of the current thread. This is used for passing the request lane to
+    worker threads.
+    """
+    name = current_request_lane()
+    if name is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # pylint: disable=missing-docstring
+        with request_lane(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class RequestLane(object):
+    # pylint: disable=too-few-public-methods
+    """
+    A lane of a :class:`~zhmcclient.RequestScheduler`.
+    """
+
+    def __init__(self, name, priority=0, max_concurrency=None):
+        """
+        Parameters:
+
+          name (:term:`string`): Name of the lane.
+
+          priority (:term:`integer`): Priority of the lane. When a request can
+            be sent, the lanes with a higher priority are served first.
+
+          max_concurrency (:term:`integer`): Maximum number of requests of
+            the lane that are in progress at the same time. `None` means that
+            only the maximum of the scheduler applies.
+        """
+        self.name = name
+        self.priority = priority
+        self.max_concurrency = max_concurrency
+
+    def __repr__(self):
+        return "{}(name={!r}, priority={!r}, max_concurrency={!r})". \
+            format(self.__class__.__name__, self.name, self.priority,
+                   self.max_concurrency)
+
+
+class _LaneState(object):
+    # pylint: disable=too-few-public-methods
+    """
+    State of a lane within a request scheduler.
+    """
+
+    def __init__(self, lane):
+        self.lane = lane
+        self.active = 0
+        self.waiting = deque()  # Tickets of the waiting requests, in order
+
+    def has_capacity(self):
+        """Return whether the lane can start another request."""
+        return self.lane.max_concurrency is None or \
+            self.active < self.lane.max_concurrency
+
+
+class RequestScheduler(object):
+    """
+    A scheduler for the HTTP requests of a :class:`~zhmcclient.Session`, with
+    named priority lanes and limits for the number of concurrent requests.
+
+    A request scheduler is used by passing it in the `request_scheduler`
+    parameter of :class:`~zhmcclient.Session`. It is thread-safe and can be
+    shared by multiple sessions, in which case its limits apply to the
+    requests of all of these sessions.
+
+    The scheduler limits the requests while they are sent and their
+    responses are received. Waiting for the completion of asynchronous HMC
+    operations or for retries is not subject to the scheduler.
+    """
+
+    def __init__(self, lanes, max_concurrency=None, default_lane=None):
+        """
+        Parameters:
+
+          lanes (iterable of :class:`~zhmcclient.RequestLane`): The lanes of
+            the scheduler. Must not be empty, and the lane names must be
+            unique.
+
+          max_concurrency (:term:`integer`): Maximum number of requests that
+            are in progress at the same time, across all lanes. `None` means
+            that only the maximums of the lanes apply.
+
+          default_lane (:term:`string`): Name of the lane for requests of
+            threads that have not selected a lane. `None` means the first
+            lane.
+
+        Raises:
+
+          ValueError: Invalid lanes or default lane.
+        """
+        lanes = list(lanes)
+        if not lanes:
+            raise ValueError("A request scheduler requires at least one lane")
+        self._lanes = {}
+        for lane in lanes:
+            if lane.name in self._lanes:
+                raise ValueError("Duplicate request lane name: {!r}".
+                                 format(lane.name))
+            self._lanes[lane.name] = _LaneState(lane)
+        if default_lane is None:
+            default_lane = lanes[0].name
+        elif default_lane not in self._lanes:
+            raise ValueError("Default request lane {!r} is not a lane of the "
+                             "scheduler".format(default_lane))
+        self._default_lane = default_lane
+        self._max_concurrency = max_concurrency
+        # Lane states ordered by decreasing priority
+        self._lanes_by_priority = sorted(
+            self._lanes.values(), key=lambda ls: -ls.lane.priority)
+        self._active = 0
+        self._condition = threading.Condition()
+
+    def __repr__(self):
+        return "{}(lanes={!r}, max_concurrency={!r}, default_lane={!r})". \
+            format(self.__class__.__name__,
+                   [ls.lane for ls in self._lanes_by_priority],
+                   self._max_concurrency, self._default_lane)
+
+    @property
+    def default_lane(self):
+        """
+        :term:`string`: Name of the lane for requests of threads that have
+        not selected a lane.
+        """
+        return self._default_lane
+
+    def lane_name(self, name=None):
+        """
+        Return the name of the lane that is used for a request.
+
+        Parameters:
+
+          name (:term:`string`): Name of the lane selected for the request,
+            or `None` for the lane selected for the current thread, or the
+            default lane if none is selected.
+
+        Returns:
+
+          :term:`string`: Name of the lane.
+
+        Raises:
+
+          ValueError: The lane does not exist in this scheduler.
+        """
+        if name is None:
+            name = current_request_lane()
+        if name is None:
+            return self._default_lane
+        if name not in self._lanes:
+            raise ValueError("Request lane {!r} is not a lane of the "
+                             "scheduler".format(name))
+        return name
+
+    def active_count(self, name):
+        """
+        Return the number of requests of a lane that are in progress.
+        """
+        return self._lanes[name].active
+
+    def waiting_count(self, name):
+        """
+        Return the number of requests of a lane that are waiting.
+        """
+        return len(self._lanes[name].waiting)
+
+    def _next_ticket(self):
+        """
+        Return the ticket of the next request that may be started, or `None`.
+        Must be called with the condition acquired.
+        """
+        if self._max_concurrency is not None and \
+                self._active >= self._max_concurrency:
+            return None
+        for lane_state in self._lanes_by_priority:
+            if lane_state.waiting and lane_state.has_capacity():
+                return lane_state.waiting[0]
+        return None
+
+    def acquire(self, name=None):
+        """
+        Wait until a request of a lane may be started, and account for it
+        as being in progress.
+
+        Parameters:
+
+          name (:term:`string`): Name of the lane, or `None` for the lane
+            selected for the current thread (see :meth:`lane_name`).
+
+        Returns:
+
+          :term:`string`: Name of the lane, to be passed to :meth:`release`.
+
+        Raises:
+
+          ValueError: The lane does not exist in this scheduler.
+        """
+        name = self.lane_name(name)
+        lane_state = self._lanes[name]
+        ticket = object()
+        with self._condition:
+            lane_state.waiting.append(ticket)
+            try:
+                while self._next_ticket() is not ticket:
+                    self._condition.wait()
+            except BaseException:
+                lane_state.waiting.remove(ticket)
+                self._condition.notify_all()
+                raise
+            lane_state.waiting.popleft()
+            lane_state.active += 1
+            self._active += 1
+            # Another request may be startable as well
+            self._condition.notify_all()
+        return name
+
+    def release(self, name):
+        """
+        Account for the completion of a request of a lane.
+
+        Parameters:
+
+          name (:term:`string`): Name of the lane, as returned by
+            :meth:`acquire`.
+        """
+        with self._condition:
+            self._lanes[name].active -= 1
+            self._active -= 1
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self, name=None):
+        """
+        Context manager that waits until a request of a lane may be started
+        and accounts for it as being in progress within its context.
+
+        Parameters:
+
+          name (:term:`string`): Name of the lane, or `None` for the lane
+            selected for the current thread (see :meth:`lane_name`).
+        """
+        name = self.acquire(name)
+        try:
+            yield
+        finally:
+            self.release(name)
@@ -18,15 +18,12 @@ Session class: A session to the HMC, optionally in context of an HMC user.
 
 from __future__ import absolute_import
 
-import sys
-import json
 import time
 import re
-from copy import copy
-try:
-    from collections import OrderedDict
-except ImportError:
-    from ordereddict import OrderedDict
+import threading
+import functools
+import codecs
+from copy import copy, deepcopy
 try:
     from collections.abc import Iterable
 except ImportError:
@@ -43,19 +40,28 @@ from ._exceptions import ConnectionError  # pylint: disable=redefined-builtin
 
 from ._timestats import TimeStatsKeeper
 from ._resource_updater import ResourceUpdater
+from ._job_updater import JobUpdater
+from ._json_codec import JsonCodec, get_json_codec
+from ._throttle import Throttle, BUSY_STATUSES, busy_retry_delay
 from ._logging import get_logger, logged_api_call
+from ._utils import run_concurrently
 from ._constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_CONNECT_RETRIES, \
     DEFAULT_READ_TIMEOUT, DEFAULT_READ_RETRIES, DEFAULT_MAX_REDIRECTS, \
     DEFAULT_OPERATION_TIMEOUT, DEFAULT_STATUS_TIMEOUT, \
-    DEFAULT_NAME_URI_CACHE_TIMETOLIVE, HMC_LOGGER_NAME, \
+    DEFAULT_NAME_URI_CACHE_TIMETOLIVE, DEFAULT_MAX_WORKERS, HMC_LOGGER_NAME, \
     HTML_REASON_WEB_SERVICES_DISABLED, HTML_REASON_OTHER, \
-    DEFAULT_HMC_PORT
+    DEFAULT_HMC_PORT, DEFAULT_POLL_MIN_INTERVAL, DEFAULT_POLL_MAX_INTERVAL, \
+    DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, DEFAULT_POOL_BLOCK, \
+    DEFAULT_RATE_LIMIT, DEFAULT_RATE_LIMIT_BURST, DEFAULT_MAX_IN_FLIGHT, \
+    DEFAULT_BUSY_RETRIES, DEFAULT_BUSY_MIN_INTERVAL, DEFAULT_BUSY_MAX_INTERVAL
 from ._version import __version__
 
 __all__ = ['Session', 'Job', 'RetryTimeoutConfig', 'get_password_interface']
 
 HMC_LOGGER = get_logger(HMC_LOGGER_NAME)
 
+_DEFAULT_JSON_CODEC = JsonCodec()
+
 _HMC_SCHEME = "https"
 _STD_HEADERS = {
     'User-Agent': 'python-zhmcclient/{}'.format(__version__),
@@ -63,6 +69,11 @@ _STD_HEADERS = {
     'Accept': '*/*'
 }
 
+_LOGON_URI = '/api/sessions'
+
+# URI of the "Get Notification Topics" operation used for the keepalive
+_KEEPALIVE_URI = '/api/sessions/operations/get-notification-topics'
+
 BLANKED_OUT = '********'  # Replacement for blanked out sensitive values
 
 
@@ -145,7 +156,12 @@ class RetryTimeoutConfig(object):
     def __init__(self, connect_timeout=None, connect_retries=None,
                  read_timeout=None, read_retries=None, max_redirects=None,
                  operation_timeout=None, status_timeout=None,
-                 name_uri_cache_timetolive=None):
+                 name_uri_cache_timetolive=None, max_workers=None,
+                 poll_min_interval=None, poll_max_interval=None,
+                 pool_connections=None, pool_maxsize=None, pool_block=None,
+                 rate_limit=None, rate_limit_burst=None, max_in_flight=None,
+                 busy_retries=None, busy_min_interval=None,
+                 busy_max_interval=None):
         """
         For all parameters, `None` means that this object does not specify a
         value for the parameter, and that a default value should be used
@@ -195,6 +211,73 @@ class RetryTimeoutConfig(object):
             seconds since the last invalidation. The special value 0 means
             that no Name-URI cache is maintained (i.e. the caching is
             disabled).
+
+          max_workers (:term:`integer`): Maximum number of HMC requests that
+            are issued concurrently by zhmcclient methods that perform multiple
+            independent HMC requests, for example the ``list()`` methods of
+            resource managers when retrieving the full set of properties of the
+            listed resources. The value 1 causes these HMC requests to be
+            issued sequentially.
+
+            In order to reuse pooled connections for all concurrent requests,
+            this value should not exceed the size of the HTTP connection pool
+            (see `pool_maxsize`).
+
+          poll_min_interval (:term:`number`): Initial interval in seconds
+            between polls when waiting for the completion of asynchronous HMC
+            operations or for a resource to reach a desired status. The
+            interval is doubled after each poll, up to `poll_max_interval`.
+
+          poll_max_interval (:term:`number`): Maximum interval in seconds
+            between polls when waiting for the completion of asynchronous HMC
+            operations or for a resource to reach a desired status.
+
+          pool_connections (:term:`integer`): Number of HTTP connection pools
+            (one per host) that are cached by the session.
+
+          pool_maxsize (:term:`integer`): Maximum number of HTTP connections to
+            the HMC that are kept in the connection pool for reuse. When the
+            session is used concurrently, e.g. by multiple threads or with
+            `max_workers` greater than 1, this should be at least the number
+            of concurrent requests, in order to avoid repeated SSL/TLS
+            handshakes for new connections.
+
+          pool_block (bool): Controls the behavior when all connections of the
+            connection pool are in use: `True` causes a request to wait until
+            a connection becomes available, limiting the number of
+            connections to the HMC to `pool_maxsize`. `False` causes an
+            additional connection to be opened that is discarded after its
+            use.
+
+          rate_limit (:term:`number`): Maximum average number of HTTP requests
+            per second that are sent to the HMC by the session. Requests
+            exceeding the rate limit wait until they may be sent. The special
+            value 0 means that no rate limit is set.
+
+          rate_limit_burst (:term:`integer`): Maximum number of HTTP requests
+            that can be sent at once when the rate limit is set, after a time
+            without requests.
+
+          max_in_flight (:term:`integer`): Maximum number of HTTP requests of
+            the session that are in progress at the same time (e.g. when the
+            session is used by multiple threads). Requests exceeding that
+            number wait until a request completes. The special value 0 means
+            that no limit is set.
+
+          busy_retries (:term:`integer`): Number of retries (after the initial
+            attempt) for HTTP requests that the HMC rejects with HTTP status
+            429 (Too Many Requests) or 503 (Service Unavailable). The special
+            value 0 means that such requests are not retried.
+
+          busy_min_interval (:term:`number`): Backoff interval in seconds for
+            the first retry of a request rejected by the HMC as busy. The
+            interval is doubled for each further retry, up to
+            `busy_max_interval`, and the actual wait time is a random time
+            between 0 and the interval. If the HMC response has a Retry-After
+            header, the time specified there is used instead.
+
+          busy_max_interval (:term:`number`): Maximum time in seconds to wait
+            before retrying a request rejected by the HMC as busy.
         """
         self.connect_timeout = connect_timeout
         self.connect_retries = connect_retries
@@ -204,6 +287,18 @@ class RetryTimeoutConfig(object):
         self.operation_timeout = operation_timeout
         self.status_timeout = status_timeout
         self.name_uri_cache_timetolive = name_uri_cache_timetolive
+        self.max_workers = max_workers
+        self.poll_min_interval = poll_min_interval
+        self.poll_max_interval = poll_max_interval
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.max_in_flight = max_in_flight
+        self.busy_retries = busy_retries
+        self.busy_min_interval = busy_min_interval
+        self.busy_max_interval = busy_max_interval
 
         # Read retries only for these HTTP methods:
         self.method_whitelist = {'GET'}
@@ -211,6 +306,10 @@ class RetryTimeoutConfig(object):
     _attrs = ('connect_timeout', 'connect_retries', 'read_timeout',
               'read_retries', 'max_redirects', 'operation_timeout',
               'status_timeout', 'name_uri_cache_timetolive',
+              'max_workers', 'poll_min_interval', 'poll_max_interval',
+              'pool_connections', 'pool_maxsize', 'pool_block',
+              'rate_limit', 'rate_limit_burst', 'max_in_flight',
+              'busy_retries', 'busy_min_interval', 'busy_max_interval',
               'method_whitelist')
 
     def override_with(self, override_config):
@@ -280,6 +379,15 @@ class Session(object):
     requests against the HMC API. Instance variable
     :attr:`~zhmcclient.Session.time_stats_keeper` is used to enable/disable the
     measurements, and to print the statistics.
+
+    A session object can be used concurrently by multiple threads, e.g. for
+    issuing HMC operations on different resources in parallel. The threads
+    share the HMC session-id and the HTTP connection pool of the session (see
+    the `pool_maxsize` and `pool_block` attributes of
+    :class:`~zhmcclient.RetryTimeoutConfig` for sizing the pool). Logon and
+    re-logon are serialized: When multiple threads need to log on, or find
+    that the HMC session token has expired, only one of them logs on to the
+    HMC and the others use the resulting session-id.
     """
 
     default_rt_config = RetryTimeoutConfig(
@@ -291,11 +399,27 @@ class Session(object):
         operation_timeout=DEFAULT_OPERATION_TIMEOUT,
         status_timeout=DEFAULT_STATUS_TIMEOUT,
         name_uri_cache_timetolive=DEFAULT_NAME_URI_CACHE_TIMETOLIVE,
+        max_workers=DEFAULT_MAX_WORKERS,
+        poll_min_interval=DEFAULT_POLL_MIN_INTERVAL,
+        poll_max_interval=DEFAULT_POLL_MAX_INTERVAL,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        pool_block=DEFAULT_POOL_BLOCK,
+        rate_limit=DEFAULT_RATE_LIMIT,
+        rate_limit_burst=DEFAULT_RATE_LIMIT_BURST,
+        max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+        busy_retries=DEFAULT_BUSY_RETRIES,
+        busy_min_interval=DEFAULT_BUSY_MIN_INTERVAL,
+        busy_max_interval=DEFAULT_BUSY_MAX_INTERVAL,
     )
 
     def __init__(self, host, userid=None, password=None, session_id=None,
                  get_password=None, retry_timeout_config=None,
-                 port=DEFAULT_HMC_PORT, verify_cert=True):
+                 port=DEFAULT_HMC_PORT, verify_cert=True, json_codec=None,
+                 keepalive_interval=None, session_cache=None,
+                 coalesce_gets=False, response_cache=None,
+                 request_scheduler=None, name_uri_cache=None,
+                 keepalive_relogon=True):
         # pylint: disable=line-too-long
         """
         Creating a session object will not immediately cause a logon to be
@@ -331,6 +455,10 @@ class Session(object):
         * Neither `userid`/`password` nor `session_id`: Only operations that do
           not require logon, are possible.
 
+        If a `session_cache` is specified and `session_id` is not specified,
+        a session-id for the HMC and userid is looked up in the session cache.
+        If found, it is used like a specified `session_id`.
+
         Parameters:
 
           host (:term:`string`):
@@ -401,6 +529,88 @@ class Session(object):
             For details, see the :ref:`HMC certificate` section.
 
             *Added in version 0.31*
+
+          json_codec (:class:`~zhmcclient.JsonCodec` or :term:`string`):
+            JSON codec to be used for encoding request bodies and decoding
+            response bodies (including job results), and for blanking out
+            sensitive data when logging them. May be a codec object or a
+            codec name as accepted by :func:`~zhmcclient.get_json_codec`
+            (e.g. 'orjson' or 'auto').
+            `None` uses the JSON support of the Python standard library.
+
+          keepalive_interval (:term:`number`):
+            Enables a keepalive for the HMC session, by specifying the idle
+            time in seconds after which the keepalive issues an HMC request
+            ("Get Notification Topics") on behalf of this session.
+            `None` disables the keepalive.
+
+            While the session is logged on, a background thread issues the
+            keepalive request whenever no other request has been issued for
+            the specified time. This prevents the HMC session from expiring
+            due to inactivity. If the HMC session has expired nevertheless
+            (e.g. because its maximum lifetime was reached or the HMC was
+            restarted), the keepalive re-logs on, as controlled by the
+            `keepalive_relogon` parameter. The keepalive never performs the
+            initial logon. The keepalive thread is stopped when the session
+            is logged off, and the logoff waits for a keepalive request that
+            is in progress.
+
+            The value should be smaller than the session inactivity timeout
+            of the HMC.
+
+          session_cache (:class:`~zhmcclient.SessionCache`):
+            Session cache for reusing the HMC session-id of a previous
+            process, or `None` for not using a session cache.
+
+            If specified, the session-id resulting from a logon of this
+            session is stored in the session cache and is removed from it
+            again upon logoff, and a session-id for the HMC and userid is
+            taken from the session cache upon creation of this session (see
+            above). The session-id from the session cache is not verified
+            upfront; if the HMC rejects it as expired, a re-logon is
+            performed, which requires `userid` and `password`.
+
+          coalesce_gets (bool):
+            Enables coalescing of concurrent identical GET requests in
+            :meth:`get`: While a GET request for a URI is in progress, further
+            calls of :meth:`get` for the same URI (e.g. from other threads)
+            do not issue their own HTTP request but wait for the request in
+            progress, and return a copy of its result or raise its exception.
+            This reduces the load on the HMC when many threads retrieve the
+            same resources at the same time.
+
+          response_cache (:class:`~zhmcclient.ResponseCache`):
+            Response cache for the results of :meth:`get`, or `None` for not
+            caching them. If specified, :meth:`get` returns a copy of a cached
+            result if it is cached and has not expired, and caches the results
+            it retrieves from the HMC. The cached results that may be affected
+            by :meth:`post` and :meth:`delete` requests and by the completion
+            of asynchronous operations are invalidated.
+
+          request_scheduler (:class:`~zhmcclient.RequestScheduler`):
+            Request scheduler that prioritizes the HTTP requests of this
+            session by request lane (see :func:`~zhmcclient.request_lane`),
+            or `None` for sending the HTTP requests without prioritization.
+
+          name_uri_cache (:class:`~zhmcclient.NameUriCache`):
+            Session-wide Name-URI cache that is used by all resource managers
+            of this session, or `None` for using a separate Name-URI cache in
+            each manager object. If the session is subscribed for
+            auto-updating (see :meth:`subscribe_auto_update`), the cache is
+            updated from the inventory change and property change
+            notifications received by the session.
+
+          keepalive_relogon (bool):
+            Controls whether the keepalive (see `keepalive_interval`) re-logs
+            on when the HMC rejects its request because the HMC session token
+            has expired, so that the HMC session is re-established before the
+            next request of the user. If `False`, the next request of the
+            user performs the re-logon.
+
+            The re-logon of the keepalive requires that the password is
+            provided or can be retrieved with `get_password`. Failures of the
+            re-logon are logged, and cause the next request of the user to
+            retry the re-logon.
         """  # noqa: E501
         # pylint: enable=line-too-long
 
@@ -410,18 +620,48 @@ class Session(object):
         self._password = password
         self._verify_cert = verify_cert
         self._get_password = get_password
+        if json_codec is None:
+            json_codec = JsonCodec()
+        elif isinstance(json_codec, six.string_types):
+            json_codec = get_json_codec(json_codec)
+        self._json_codec = json_codec
         self._retry_timeout_config = self.default_rt_config.override_with(
             retry_timeout_config)
+        self._throttle = Throttle(
+            self._retry_timeout_config.rate_limit,
+            self._retry_timeout_config.rate_limit_burst,
+            self._retry_timeout_config.max_in_flight)
+        self._keepalive_interval = keepalive_interval
+        self._keepalive_relogon = keepalive_relogon
+        self._session_cache = session_cache
+        self._coalesce_gets = coalesce_gets
+        self._response_cache = response_cache
+        self._request_scheduler = request_scheduler
+        self._name_uri_cache = name_uri_cache
+        # In-progress coalesced GET requests, by URI and logon_required
+        self._inflight_gets = {}
+        self._inflight_lock = threading.Lock()
+        self._keepalive_thread = None
+        self._last_request_time = time.time()
         self._base_url = "{scheme}://{host}:{port}".format(
             scheme=_HMC_SCHEME,
             host=self._host,
             port=self._port)
         self._headers = copy(_STD_HEADERS)  # dict with standard HTTP headers
+        # Serializes logon, re-logon and logoff across threads
+        self._logon_lock = threading.RLock()
+        cache_entry = None
+        if session_id is None and session_cache is not None and \
+                userid is not None:
+            cache_entry = session_cache.get_entry(host, port, userid)
+            if cache_entry:
+                session_id = cache_entry.get('session-id', None)
         if session_id is not None:
             # Create a logged-on state (same state as in _do_logon())
             self._session_id = session_id
             self._session = self._new_session(self.retry_timeout_config)
             self._headers['X-API-Session'] = session_id
+            self._start_keepalive()
         else:
             # Create a logged-off state (same state as in _do_logoff())
             self._session_id = None
@@ -429,7 +669,11 @@ class Session(object):
         self._time_stats_keeper = TimeStatsKeeper()
         self._object_topic = None
         self._job_topic = None
+        if cache_entry and session_id == cache_entry.get('session-id', None):
+            self._object_topic = cache_entry.get('notification-topic', None)
+            self._job_topic = cache_entry.get('job-notification-topic', None)
         self._resource_updater = None
+        self._job_updater = None
 
     def __repr__(self):
         """
@@ -444,6 +688,14 @@ class Session(object):
             "  _verify_cert={s._verify_cert!r},\n"
             "  _get_password={s._get_password!r},\n"
             "  _retry_timeout_config={s._retry_timeout_config!r},\n"
+            "  _json_codec={s._json_codec!r},\n"
+            "  _keepalive_interval={s._keepalive_interval!r},\n"
+            "  _keepalive_relogon={s._keepalive_relogon!r},\n"
+            "  _session_cache={s._session_cache!r},\n"
+            "  _coalesce_gets={s._coalesce_gets!r},\n"
+            "  _response_cache={s._response_cache!r},\n"
+            "  _request_scheduler={s._request_scheduler!r},\n"
+            "  _name_uri_cache={s._name_uri_cache!r},\n"
             "  _base_url={s._base_url!r},\n"
             "  _headers={headers!r},\n"
             "  _session_id={blanked_out!r},\n"
@@ -451,6 +703,7 @@ class Session(object):
             "  _object_topic={s._object_topic!r}\n"
             "  _job_topic={s._job_topic!r}\n"
             "  _resource_updater={s._resource_updater!r}\n"
+            "  _job_updater={s._job_updater!r}\n"
             ")".
             format(classname=self.__class__.__name__, id=id(self), s=self,
                    headers=headers, blanked_out=BLANKED_OUT))
@@ -507,6 +760,86 @@ class Session(object):
         """
         return self._get_password
 
+    @property
+    def json_codec(self):
+        """
+        :class:`~zhmcclient.JsonCodec`: The JSON codec used by this session.
+
+        For details, see the same-named init parameter.
+        """
+        return self._json_codec
+
+    @property
+    def keepalive_interval(self):
+        """
+        :term:`number`: Idle time in seconds after which the keepalive of this
+        session issues an HMC request, or `None` if the keepalive is disabled.
+
+        For details, see the same-named init parameter.
+        """
+        return self._keepalive_interval
+
+    @property
+    def keepalive_relogon(self):
+        """
+        bool: Indicates whether the keepalive of this session re-logs on when
+        the HMC session token has expired.
+
+        For details, see the same-named init parameter.
+        """
+        return self._keepalive_relogon
+
+    @property
+    def session_cache(self):
+        """
+        :class:`~zhmcclient.SessionCache`: The session cache used by this
+        session, or `None` if no session cache is used.
+
+        For details, see the same-named init parameter.
+        """
+        return self._session_cache
+
+    @property
+    def coalesce_gets(self):
+        """
+        bool: Indicates whether concurrent identical GET requests are
+        coalesced.
+
+        For details, see the same-named init parameter.
+        """
+        return self._coalesce_gets
+
+    @property
+    def response_cache(self):
+        """
+        :class:`~zhmcclient.ResponseCache`: The response cache used by this
+        session, or `None` if GET results are not cached.
+
+        For details, see the same-named init parameter.
+        """
+        return self._response_cache
+
+    @property
+    def request_scheduler(self):
+        """
+        :class:`~zhmcclient.RequestScheduler`: The request scheduler used by
+        this session, or `None` if HTTP requests are not prioritized.
+
+        For details, see the same-named init parameter.
+        """
+        return self._request_scheduler
+
+    @property
+    def name_uri_cache(self):
+        """
+        :class:`~zhmcclient.NameUriCache`: The session-wide Name-URI cache used
+        by this session, or `None` if each manager object uses its own
+        Name-URI cache.
+
+        For details, see the same-named init parameter.
+        """
+        return self._name_uri_cache
+
     @property
     def retry_timeout_config(self):
         """
@@ -604,6 +937,15 @@ class Session(object):
         """
         return self._resource_updater
 
+    @property
+    def job_updater(self):
+        """
+        :class:`~zhmcclient.JobUpdater`: Job updater for notification-driven
+        waiting for job completion, or `None` if this session is not
+        subscribed for job updates.
+        """
+        return self._job_updater
+
     @logged_api_call
     def logon(self, verify=False):
         """
@@ -635,7 +977,10 @@ class Session(object):
           :exc:`~zhmcclient.ConnectionError`
         """
         if not self.is_logon(verify):
-            self._do_logon()
+            with self._logon_lock:
+                # Another thread may have logged on in the meantime
+                if not self.is_logon():
+                    self._do_logon()
 
     @logged_api_call
     def logoff(self, verify=False):
@@ -657,7 +1002,9 @@ class Session(object):
           :exc:`~zhmcclient.ConnectionError`
         """
         if self.is_logon(verify):
-            self._do_logoff()
+            with self._logon_lock:
+                if self.is_logon():
+                    self._do_logoff()
 
     @logged_api_call
     def is_logon(self, verify=False):
@@ -699,23 +1046,56 @@ class Session(object):
         """
         if self._userid is None:
             raise ClientAuthError("Userid is not provided.")
-        if self._password is None:
-            if self._get_password:
-                self._password = self._get_password(self._host, self._userid)
-            else:
-                raise ClientAuthError("Password is not provided.")
-        logon_uri = '/api/sessions'
-        logon_body = {
-            'userid': self._userid,
-            'password': self._password
-        }
-        self._headers.pop('X-API-Session', None)  # Just in case
-        self._session = self._new_session(self.retry_timeout_config)
-        logon_res = self.post(logon_uri, logon_body, logon_required=False)
-        self._session_id = logon_res['api-session']
-        self._headers['X-API-Session'] = self._session_id
-        self._object_topic = logon_res['notification-topic']
-        self._job_topic = logon_res['job-notification-topic']
+        with self._logon_lock:
+            if self._password is None:
+                if self._get_password:
+                    self._password = self._get_password(
+                        self._host, self._userid)
+                else:
+                    raise ClientAuthError("Password is not provided.")
+            logon_body = {
+                'userid': self._userid,
+                'password': self._password
+            }
+            # The session-id header is kept until it is replaced with the new
+            # session-id, so that concurrent requests of other threads remain
+            # valid requests. The Logon operation itself is sent without it
+            # (see post()).
+            self._session = self._new_session(self.retry_timeout_config)
+            logon_res = self.post(_LOGON_URI, logon_body,
+                                  logon_required=False)
+            self._session_id = logon_res['api-session']
+            self._headers['X-API-Session'] = self._session_id
+            self._object_topic = logon_res['notification-topic']
+            self._job_topic = logon_res['job-notification-topic']
+            self._update_session_cache()
+            self._start_keepalive()
+
+    def _relogon(self, expired_session_id):
+        """
+        Re-logon after the HMC rejected a request because its session token
+        expired.
+
+        If multiple threads find the same session token to be expired, only
+        the first one logs on again, and the others use its new session-id.
+
+        Parameters:
+
+          expired_session_id (:term:`string`): The session-id that was used
+            for the rejected request, or `None`.
+
+        Raises:
+
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.HTTPError`
+        """
+        with self._logon_lock:
+            if self._session_id is None or \
+                    self._session_id == expired_session_id:
+                self._do_logon()
 
     @staticmethod
     def _new_session(retry_timeout_config):
@@ -729,10 +1109,13 @@ class Session(object):
             method_whitelist=retry_timeout_config.method_whitelist,
             redirect=retry_timeout_config.max_redirects)
         session = requests.Session()
-        session.mount('https://',
-                      requests.adapters.HTTPAdapter(max_retries=retry))
-        session.mount('http://',
-                      requests.adapters.HTTPAdapter(max_retries=retry))
+        for prefix in ('https://', 'http://'):
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=retry_timeout_config.pool_connections,
+                pool_maxsize=retry_timeout_config.pool_maxsize,
+                pool_block=retry_timeout_config.pool_block,
+                max_retries=retry)
+            session.mount(prefix, adapter)
         return session
 
     def _do_logoff(self):
@@ -747,15 +1130,131 @@ class Session(object):
           :exc:`~zhmcclient.HTTPError`
         """
         session_uri = '/api/sessions/this-session'
-        self.delete(session_uri, logon_required=False)
-        self._session_id = None
-        self._session = None
-        self._headers.pop('X-API-Session', None)
-        self._object_topic = None
-        self._job_topic = None
+        with self._logon_lock:
+            self._stop_keepalive()
+            self.delete(session_uri, logon_required=False)
+            self._session_id = None
+            self._session = None
+            self._headers.pop('X-API-Session', None)
+            self._object_topic = None
+            self._job_topic = None
+            self._update_session_cache()
 
-    @staticmethod
-    def _log_http_request(method, url, headers=None, content=None,
+    def _update_session_cache(self):
+        """
+        Update the session cache entry for the HMC and userid of this session
+        with the current session-id and notification topics, if a session
+        cache is used. The API version information in the cache entry is
+        removed, because it was retrieved for a different HMC session.
+
+        Failures to write the session cache are logged and otherwise ignored.
+        """
+        if self._session_cache is None or self._userid is None:
+            return
+        try:
+            self._session_cache.update_entry(
+                self._host, self._port, self._userid,
+                session_id=self._session_id,
+                notification_topic=self._object_topic,
+                job_notification_topic=self._job_topic,
+                api_version=None)
+        except (IOError, OSError) as exc:
+            HMC_LOGGER.warning("Cannot update session cache file %s: %s",
+                               self._session_cache.filepath, exc)
+
+    def _send_request(self, req_func, method, uri, url, retry_busy=True,
+                      **kwargs):
+        """
+        Send an HTTP request, subject to the request scheduler and the
+        throttling of the session, and retry it with backoff if the HMC rejects
+        it as busy.
+
+        Parameters:
+
+          req_func (callable): The method of the `requests` session (or
+            module) that sends the request, e.g. `get`. It is invoked with
+            the URL as a positional argument and with `kwargs`.
+
+          method (:term:`string`): HTTP method name in upper case, e.g. 'GET'.
+
+          uri (:term:`string`): Relative URI path of the request, for the
+            time statistics.
+
+          url (:term:`string`): URL of the request.
+
+          retry_busy (bool): Allows retrying the request if the HMC rejects
+            it as busy.
+
+        Returns:
+
+          requests.Response: The HTTP response. This may be a response with
+          a busy status if the retries have been exhausted.
+
+        Raises:
+
+          Exceptions raised by the `requests` method.
+        """
+        rt_config = self.retry_timeout_config
+        scheduler = self._request_scheduler
+        retry = 0
+        while True:
+            if scheduler is not None:
+                lane_name = scheduler.lane_name()
+                stats = self.time_stats_keeper.get_stats(
+                    'scheduler-wait ' + lane_name)
+                stats.begin()
+                scheduler.acquire(lane_name)
+                stats.end()
+            try:
+                if self._throttle.enabled:
+                    stats = self.time_stats_keeper.get_stats('throttle-wait')
+                    stats.begin()
+                    with self._throttle:
+                        stats.end()
+                        result = req_func(url, **kwargs)
+                else:
+                    result = req_func(url, **kwargs)
+            finally:
+                if scheduler is not None:
+                    scheduler.release(lane_name)
+            if result.status_code not in BUSY_STATUSES or not retry_busy \
+                    or retry >= rt_config.busy_retries:
+                return result
+            delay = busy_retry_delay(
+                result, retry, rt_config.busy_min_interval,
+                rt_config.busy_max_interval)
+            HMC_LOGGER.debug("Request: %s %s rejected with HTTP status %s, "
+                             "retrying in %.3f s", method, url,
+                             result.status_code, delay)
+            result.close()
+            retry += 1
+            stats = self.time_stats_keeper.get_stats(
+                'busy-retry {} {}'.format(method.lower(), uri))
+            stats.begin()
+            time.sleep(delay)
+            stats.end()
+
+    def _start_keepalive(self):
+        """
+        Start the keepalive thread, if the keepalive is enabled and the thread
+        is not running.
+        """
+        if self._keepalive_interval is not None and \
+                self._keepalive_thread is None:
+            self._keepalive_thread = _KeepaliveThread(
+                self, self._keepalive_interval)
+            self._keepalive_thread.start()
+
+    def _stop_keepalive(self):
+        """
+        Stop the keepalive thread, if it is running, and wait for it to end.
+        Must be called while holding the logon lock.
+        """
+        if self._keepalive_thread is not None:
+            self._keepalive_thread.stop()
+            self._keepalive_thread = None
+
+    def _log_http_request(self, method, url, headers=None, content=None,
                           content_len=None):
         """
         Log the HTTP request of an HMC REST API call, at the debug level.
@@ -783,7 +1282,7 @@ class Session(object):
             if content_len is None:
                 content_len = len(content)  # may change after JSON conversion
             try:
-                content_dict = json2dict(content)
+                content_dict = json2dict(content, self._json_codec)
             except ValueError:
                 # If the content is not JSON, we assume it does not contain
                 # structured data such as a password or session IDs.
@@ -791,7 +1290,7 @@ class Session(object):
             else:
                 if 'password' in content_dict:
                     content_dict['password'] = BLANKED_OUT
-                content = dict2json(content_dict)
+                content = dict2json(content_dict, self._json_codec)
             trunc = 30000
             if content_len > trunc:
                 content_label = 'content(first {} B of {} B)'. \
@@ -808,8 +1307,8 @@ class Session(object):
                          method, url, _headers_for_logging(headers),
                          content_label, content_msg)
 
-    @staticmethod
-    def _log_http_response(method, url, status, headers=None, content=None):
+    def _log_http_response(self, method, url, status, headers=None,
+                           content=None):
         """
         Log the HTTP response of an HMC REST API call, at the debug level.
 
@@ -833,7 +1332,7 @@ class Session(object):
             assert isinstance(content, six.text_type)
             content_len = len(content)  # may change after JSON conversion
             try:
-                content_dict = json2dict(content)
+                content_dict = json2dict(content, self._json_codec)
             except ValueError:
                 # If the content is not JSON (e.g. response from metrics
                 # context retrieval), we assume it does not contain structured
@@ -848,7 +1347,7 @@ class Session(object):
                     content_dict['api-session'] = BLANKED_OUT
                 if 'session-credential' in content_dict:
                     content_dict['session-credential'] = BLANKED_OUT
-                content = dict2json(content_dict)
+                content = dict2json(content_dict, self._json_codec)
             if status >= 400:
                 content_label = 'content'
                 content_msg = content
@@ -879,6 +1378,16 @@ class Session(object):
         If the HMC session token is expired, this method re-logs on and retries
         the operation.
 
+        If the session has a response cache (see the `response_cache` init
+        parameter) that has a valid result for the URI, a copy of that result
+        is returned without performing an HTTP request. If `logon_required`
+        is True, this happens only while the session is logged on; otherwise
+        the session logs on and performs the HTTP request.
+
+        If the session coalesces GET requests (see the `coalesce_gets` init
+        parameter) and a GET request for the same URI is already in progress,
+        this method waits for that request and returns a copy of its result.
+
         Parameters:
 
           uri (:term:`string`):
@@ -904,38 +1413,298 @@ class Session(object):
           :exc:`~zhmcclient.ServerAuthError`
           :exc:`~zhmcclient.ConnectionError`
         """
+        response_cache = self._response_cache
+        if response_cache is not None and \
+                (not logon_required or self.is_logon()):
+            found, result = response_cache.get(uri)
+            if found:
+                return result
+
+        if self._coalesce_gets:
+            return self._coalesced_get(uri, logon_required)
+        return self._cached_get(uri, logon_required)
+
+    def _cached_get(self, uri, logon_required):
+        """
+        Perform the HTTP GET method against the resource identified by a URI,
+        without coalescing, and store the result in the response cache of
+        the session, if any.
+
+        The result is not stored if a POST or DELETE request of this session
+        invalidated the URI in the response cache while the GET request was
+        in progress.
+
+        For a description of the parameters, return value and exceptions, see
+        :meth:`get`.
+        """
+        response_cache = self._response_cache
+        if response_cache is None:
+            return self._do_get(uri, logon_required)
+        generation = response_cache.generation
+        result = self._do_get(uri, logon_required)
+        response_cache.put(uri, result, generation)
+        return result
+
+    def _coalesced_get(self, uri, logon_required):
+        """
+        Perform the HTTP GET method against the resource identified by a URI,
+        waiting for an identical GET request that is already in progress
+        instead of issuing a new one.
+
+        For a description of the parameters, return value and exceptions, see
+        :meth:`get`.
+        """
+        key = (uri, logon_required)
+        with self._inflight_lock:
+            inflight = self._inflight_gets.get(key, None)
+            is_leader = inflight is None
+            if is_leader:
+                inflight = _InflightGet()
+                self._inflight_gets[key] = inflight
+            else:
+                inflight.has_followers = True
+
+        if not is_leader:
+            inflight.done.wait()
+            if inflight.exc is not None:
+                # Each follower raises its own exception object
+                raise _copy_exception(inflight.exc)
+            return deepcopy(inflight.result)
+
+        result = None
+        try:
+            result = self._cached_get(uri, logon_required)
+        except Exception as exc:  # pylint: disable=broad-except
+            inflight.exc = exc
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight_gets[key]
+            # No more followers can join now. The followers copy the result
+            # from a private copy, because the caller of the leader may
+            # change the returned result while they copy it.
+            if inflight.has_followers and inflight.exc is None:
+                inflight.result = deepcopy(result)
+            inflight.done.set()
+        return result
+
+    def _do_get(self, uri, logon_required, relogon=True):
+        """
+        Perform the HTTP GET method against the resource identified by a URI,
+        without coalescing.
+
+        For a description of the parameters, return value and exceptions, see
+        :meth:`get`. If `relogon` is False, an expired HMC session token
+        raises :exc:`~zhmcclient.ServerAuthError` instead of causing a
+        re-logon.
+        """
         if logon_required:
             self.logon()
         url = self.base_url + uri
-        self._log_http_request('GET', url, headers=self.headers)
+        headers = self.headers.copy()  # Standard headers
+        self._log_http_request('GET', url, headers=headers)
         stats = self.time_stats_keeper.get_stats('get ' + uri)
         stats.begin()
         req = self._session or requests
         req_timeout = (self.retry_timeout_config.connect_timeout,
                        self.retry_timeout_config.read_timeout)
         try:
-            result = req.get(url, headers=self.headers, verify=self.verify_cert,
-                             timeout=req_timeout)
+            result = self._send_request(
+                req.get, 'GET', uri, url, headers=headers,
+                verify=self.verify_cert, timeout=req_timeout)
         # Note: The requests method may raise OSError/IOError in case of
         # HMC certificate validation issues (e.g. incorrect cert path)
         except (requests.exceptions.RequestException, IOError, OSError) as exc:
             _handle_request_exc(exc, self.retry_timeout_config)
         finally:
             stats.end()
+        self._last_request_time = time.time()
         self._log_http_response('GET', url,
                                 status=result.status_code,
                                 headers=result.headers,
                                 content=result.content)
 
         if result.status_code == 200:
-            return _result_object(result)
+            return _result_object(result, self._json_codec)
+        if result.status_code == 403:
+            result_object = _result_object(result, self._json_codec)
+            reason = result_object.get('reason', None)
+            if reason == 5 and relogon:
+                # API session token expired: re-logon and retry
+                self._relogon(headers.get('X-API-Session'))
+                return self._do_get(uri, logon_required)
+            if reason == 1:
+                # Login user's authentication is fine; this is an authorization
+                # issue, so we don't raise ServerAuthError.
+                raise HTTPError(result_object)
+            msg = result_object.get('message', None)
+            raise ServerAuthError("HTTP authentication failed: {}".
+                                  format(msg), HTTPError(result_object))
+        result_object = _result_object(result, self._json_codec)
+        raise HTTPError(result_object)
+
+    @logged_api_call
+    def iter_get(self, uri, logon_required=True):
+        """
+        Perform the HTTP GET method against the resource identified by a URI,
+        for an operation whose response body is a JSON array, and return an
+        iterator over the array items that reads and parses the response body
+        incrementally.
+
+        In contrast to :meth:`get`, the response body is not held in memory
+        as a whole, so that very large results can be processed with bounded
+        memory. The response body is not logged.
+
+        The HTTP request is performed and its status is checked when this
+        method is called. The response body is read while the returned
+        iterator is consumed, and the connection is kept open until the
+        iterator is exhausted or closed.
+
+        If the HMC session token is expired, this method re-logs on and retries
+        the operation.
+
+        Parameters:
+
+          uri (:term:`string`):
+            Relative URI path of the resource, e.g.
+            "/api/console/operations/get-audit-log".
+            This URI is relative to the base URL of the session (see
+            the :attr:`~zhmcclient.Session.base_url` property).
+            Must not be `None`.
+
+          logon_required (bool):
+            Boolean indicating whether the operation requires that the session
+            is logged on to the HMC.
+
+        Returns:
+
+          iterator of :term:`json object`: Iterator over the items of the JSON
+          array in the response body.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError` (also while iterating)
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError` (also while iterating)
+        """
+        result = self._stream_request('GET', uri, None, logon_required)
+        return _iter_result_items(result, self._json_codec,
+                                  self.retry_timeout_config)
+
+    @logged_api_call
+    def iter_post(self, uri, body=None, logon_required=True):
+        """
+        Perform the HTTP POST method against the resource identified by a URI,
+        for a synchronous operation whose response body is a JSON array, and
+        return an iterator over the array items that reads and parses the
+        response body incrementally.
+
+        This is the POST counterpart of :meth:`iter_get`, for operations
+        such as 'Get Inventory'. See :meth:`iter_get` for details about the
+        incremental processing.
+
+        If the HMC session token is expired, this method re-logs on and retries
+        the operation.
+
+        Parameters:
+
+          uri (:term:`string`):
+            Relative URI path of the resource, e.g. "/api/services/inventory".
+            This URI is relative to the base URL of the session (see
+            the :attr:`~zhmcclient.Session.base_url` property).
+            Must not be `None`.
+
+          body (:term:`json object`):
+            JSON object to be used as the HTTP request body (payload).
+            `None` means the same as an empty dictionary, namely that no HTTP
+            body is included in the request.
+
+          logon_required (bool):
+            Boolean indicating whether the operation requires that the session
+            is logged on to the HMC.
+
+        Returns:
+
+          iterator of :term:`json object`: Iterator over the items of the JSON
+          array in the response body. For operations that succeed without
+          response body (HTTP status 204), the iterator is empty.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError` (also while iterating)
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError` (also while iterating)
+        """
+        result = self._stream_request('POST', uri, body, logon_required)
+        return _iter_result_items(result, self._json_codec,
+                                  self.retry_timeout_config)
+
+    def _stream_request(self, method, uri, body, logon_required):
+        """
+        Perform an HTTP request whose response body is read incrementally, and
+        handle the error statuses in the same way as :meth:`get` and
+        :meth:`post`.
+
+        Returns:
+
+          requests.Response: The response with status 200, whose body has not
+          been read yet, or `None` for status 204.
+        """
+        if logon_required:
+            self.logon()
+        url = self.base_url + uri
+        headers = self.headers.copy()  # Standard headers
+        if body is None:
+            data = None
+        else:
+            data = self._json_codec.dumps(body)
+            if isinstance(data, six.text_type):
+                data = data.encode('utf-8')
+        self._log_http_request(method, url, headers=headers, content=data)
+        stats = self.time_stats_keeper.get_stats(method.lower() + ' ' + uri)
+        stats.begin()
+        req = self._session or requests
+        req_timeout = (self.retry_timeout_config.connect_timeout,
+                       self.retry_timeout_config.read_timeout)
+        try:
+            result = self._send_request(
+                functools.partial(req.request, method), method, uri, url,
+                data=data, headers=headers, verify=self.verify_cert,
+                timeout=req_timeout, stream=True)
+        # Note: The requests method may raise OSError/IOError in case of
+        # HMC certificate validation issues (e.g. incorrect cert path)
+        except (requests.exceptions.RequestException, IOError, OSError) as exc:
+            _handle_request_exc(exc, self.retry_timeout_config)
+        finally:
+            stats.end()
+        self._last_request_time = time.time()
+
+        if result.status_code == 200:
+            # The response body is not logged, because it is read later
+            self._log_http_response(method, url,
+                                    status=result.status_code,
+                                    headers=result.headers)
+            return result
+
+        # Error responses are small, so they are read as a whole
+        self._log_http_response(method, url,
+                                status=result.status_code,
+                                headers=result.headers,
+                                content=result.content)
+        if result.status_code == 204:
+            # No content
+            return None
+        result_object = _result_object(result, self._json_codec)
         if result.status_code == 403:
-            result_object = _result_object(result)
             reason = result_object.get('reason', None)
             if reason == 5:
                 # API session token expired: re-logon and retry
-                self._do_logon()
-                return self.get(uri, logon_required)
+                self._relogon(headers.get('X-API-Session'))
+                return self._stream_request(method, uri, body, logon_required)
             if reason == 1:
                 # Login user's authentication is fine; this is an authorization
                 # issue, so we don't raise ServerAuthError.
@@ -943,9 +1712,70 @@ class Session(object):
             msg = result_object.get('message', None)
             raise ServerAuthError("HTTP authentication failed: {}".
                                   format(msg), HTTPError(result_object))
-        result_object = _result_object(result)
         raise HTTPError(result_object)
 
+    @logged_api_call
+    def get_many(self, uris, logon_required=True, max_workers=None):
+        """
+        Perform the HTTP GET method against each of the resources identified
+        by a list of URIs, issuing up to a maximum number of the GET requests
+        concurrently.
+
+        Each GET request is performed using :meth:`~zhmcclient.Session.get`,
+        so the re-logon and retry behavior, the timeouts and the time
+        statistics (by URI) apply to each request in the same way as for that
+        method. The concurrent requests share the HTTP connection pool of the
+        session.
+
+        If logon is required and the session is not logged on, the logon is
+        performed once before any GET request is issued.
+
+        Parameters:
+
+          uris (iterable of :term:`string`):
+            Relative URI paths of the resources, e.g.
+            "/api/partitions/{partition-id}/nics/{nic-id}".
+            These URIs are relative to the base URL of the session (see
+            the :attr:`~zhmcclient.Session.base_url` property).
+
+          logon_required (bool):
+            Boolean indicating whether the operations require that the session
+            is logged on to the HMC.
+
+          max_workers (:term:`integer`):
+            Maximum number of GET requests that are issued concurrently.
+            `None` means to use the
+            :attr:`~zhmcclient.RetryTimeoutConfig.max_workers` attribute of
+            the retry/timeout configuration of the session. The value 1 causes
+            the GET requests to be issued sequentially.
+
+        Returns:
+
+          list: A list with one item for each of the specified URIs, in the
+          order of the URIs. Each item is either the :term:`json object` with
+          the operation result, or the exception object for the failed
+          operation (one of the exceptions listed for
+          :meth:`~zhmcclient.Session.get`). Exceptions for individual URIs are
+          not raised.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+            These exceptions are raised only for the initial logon.
+        """
+        uris = list(uris)
+        if max_workers is None:
+            max_workers = self.retry_timeout_config.max_workers
+        if logon_required and uris:
+            self.logon()
+        return run_concurrently(
+            lambda uri: self.get(uri, logon_required=logon_required),
+            uris, max_workers, return_exceptions=True)
+
     @logged_api_call
     def post(self, uri, body=None, logon_required=True,
              wait_for_completion=False, operation_timeout=None):
@@ -1071,13 +1901,15 @@ class Session(object):
             self.logon()
         url = self.base_url + uri
         headers = self.headers.copy()  # Standard headers
+        if uri == _LOGON_URI:
+            headers.pop('X-API-Session', None)
 
         log_len = None
         if body is None:
             data = None
             log_data = None
         elif isinstance(body, dict):
-            data = json.dumps(body)
+            data = self._json_codec.dumps(body)
             # Produces unicode string on py3, and unicode or byte string on py2.
             # Content-type is already set to 'application/json' in standard
             # headers.
@@ -1122,13 +1954,16 @@ class Session(object):
             stats.begin()
             try:
                 if data is None:
-                    result = req.post(url, headers=headers,
-                                      verify=self.verify_cert,
-                                      timeout=req_timeout)
+                    result = self._send_request(
+                        req.post, 'POST', uri, url, headers=headers,
+                        verify=self.verify_cert, timeout=req_timeout)
                 else:
-                    result = req.post(url, data=data, headers=headers,
-                                      verify=self.verify_cert,
-                                      timeout=req_timeout)
+                    # File-like objects cannot be sent again
+                    result = self._send_request(
+                        req.post, 'POST', uri, url,
+                        retry_busy=isinstance(data, six.binary_type),
+                        data=data, headers=headers, verify=self.verify_cert,
+                        timeout=req_timeout)
             # Note: The requests method may raise OSError/IOError in case of
             # HMC certificate validation issues (e.g. incorrect cert path)
             except (requests.exceptions.RequestException, IOError, OSError) \
@@ -1136,13 +1971,16 @@ class Session(object):
                 _handle_request_exc(exc, self.retry_timeout_config)
             finally:
                 stats.end()
+            self._last_request_time = time.time()
+            if self._response_cache is not None:
+                self._response_cache.invalidate(uri)
             self._log_http_response('POST', url,
                                     status=result.status_code,
                                     headers=result.headers,
                                     content=result.content)
 
             if result.status_code in (200, 201):
-                return _result_object(result)
+                return _result_object(result, self._json_codec)
 
             if result.status_code == 204:
                 # No content
@@ -1157,7 +1995,7 @@ class Session(object):
 
                 # This is the most common case to return 202: An
                 # asynchronous job has been started.
-                result_object = _result_object(result)
+                result_object = _result_object(result, self._json_codec)
                 job_uri = result_object['job-uri']
                 job = Job(self, job_uri, 'POST', uri)
                 if wait_for_completion:
@@ -1165,11 +2003,11 @@ class Session(object):
                 return job
 
             if result.status_code == 403:
-                result_object = _result_object(result)
+                result_object = _result_object(result, self._json_codec)
                 reason = result_object.get('reason', None)
                 if reason == 5:
                     # API session token expired: re-logon and retry
-                    self._do_logon()
+                    self._relogon(headers.get('X-API-Session'))
                     return self.post(uri, body, logon_required)
 
                 if reason == 1:
@@ -1182,7 +2020,7 @@ class Session(object):
                                       format(msg),
                                       HTTPError(result_object))
 
-            result_object = _result_object(result)
+            result_object = _result_object(result, self._json_codec)
             raise HTTPError(result_object)
 
         finally:
@@ -1225,21 +2063,26 @@ class Session(object):
         if logon_required:
             self.logon()
         url = self.base_url + uri
-        self._log_http_request('DELETE', url, headers=self.headers)
+        headers = self.headers.copy()  # Standard headers
+        self._log_http_request('DELETE', url, headers=headers)
         stats = self.time_stats_keeper.get_stats('delete ' + uri)
         stats.begin()
         req = self._session or requests
         req_timeout = (self.retry_timeout_config.connect_timeout,
                        self.retry_timeout_config.read_timeout)
         try:
-            result = req.delete(url, headers=self.headers,
-                                verify=self.verify_cert, timeout=req_timeout)
+            result = self._send_request(
+                req.delete, 'DELETE', uri, url, headers=headers,
+                verify=self.verify_cert, timeout=req_timeout)
         # Note: The requests method may raise OSError/IOError in case of
         # HMC certificate validation issues (e.g. incorrect cert path)
         except (requests.exceptions.RequestException, IOError, OSError) as exc:
             _handle_request_exc(exc, self.retry_timeout_config)
         finally:
             stats.end()
+        self._last_request_time = time.time()
+        if self._response_cache is not None:
+            self._response_cache.invalidate(uri)
         self._log_http_response('DELETE', url,
                                 status=result.status_code,
                                 headers=result.headers,
@@ -1249,11 +2092,11 @@ class Session(object):
             return
 
         if result.status_code == 403:
-            result_object = _result_object(result)
+            result_object = _result_object(result, self._json_codec)
             reason = result_object.get('reason', None)
             if reason == 5:
                 # API session token expired: re-logon and retry
-                self._do_logon()
+                self._relogon(headers.get('X-API-Session'))
                 self.delete(uri, logon_required)
                 return
 
@@ -1266,7 +2109,7 @@ class Session(object):
             raise ServerAuthError("HTTP authentication failed: {}".
                                   format(msg), HTTPError(result_object))
 
-        result_object = _result_object(result)
+        result_object = _result_object(result, self._json_codec)
         raise HTTPError(result_object)
 
     @logged_api_call
@@ -1343,6 +2186,165 @@ class Session(object):
             self._resource_updater.close()
             self._resource_updater = None
 
+    def job_updates_subscribed(self):
+        """
+        Return whether this session is currently subscribed for job updates.
+
+        Return:
+          bool: Indicates whether session is subscribed.
+        """
+        return bool(self._job_updater)
+
+    @logged_api_call
+    def subscribe_job_updates(self):
+        """
+        Subscribe this session for job updates, if not currently subscribed.
+
+        When subscribed, job completion notifications will be sent by the HMC
+        for the asynchronous operations started by this session, on the job
+        notification topic of the session (see
+        :attr:`~zhmcclient.Session.job_topic`). These notifications cause
+        :meth:`zhmcclient.Job.wait_for_completion` to retrieve the job status
+        as soon as the job has completed, instead of at its next poll. The
+        polling remains in effect as a fallback, e.g. for lost notifications.
+
+        This requires that the session is logged on, so the session is logged
+        on if needed.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        if not self._job_updater:
+            self.logon()
+            self._job_updater = JobUpdater(self)
+
+    @logged_api_call
+    def unsubscribe_job_updates(self):
+        """
+        Unsubscribe this session from job updates, if currently subscribed.
+
+        When unsubscribed, :meth:`zhmcclient.Job.wait_for_completion` relies
+        on polling only.
+        """
+        if self._job_updater:
+            self._job_updater.close()
+            self._job_updater = None
+
+
+class _InflightGet(object):
+    # pylint: disable=too-few-public-methods
+    """
+    A GET request in progress that concurrent identical GET requests wait
+    for, when the session coalesces GET requests.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.has_followers = False
+        # Private copy of the result for the followers
+        self.result = None
+        self.exc = None
+
+
+def _copy_exception(exc):
+    """
+    Return a shallow copy of an exception object, so that the same exception
+    can be raised in multiple threads without sharing the exception object
+    (and its traceback).
+
+    The copy is created without invoking the __init__() method, because the
+    init parameters of the exception classes differ from their `args`.
+    """
+    new_exc = exc.__class__.__new__(exc.__class__)
+    new_exc.args = exc.args
+    new_exc.__dict__.update(exc.__dict__)
+    new_exc.__cause__ = getattr(exc, '__cause__', None)
+    return new_exc
+
+
+class _KeepaliveThread(threading.Thread):
+    """
+    Background thread that keeps a logged-on HMC session alive, by issuing
+    the "Get Notification Topics" operation when the session has been idle for
+    the keepalive interval.
+
+    If the HMC session token has expired nevertheless, the keepalive re-logs
+    on if enabled for the session, so that the next request of the user does
+    not need to. The keepalive never performs the initial logon of the
+    session.
+    """
+
+    def __init__(self, session, interval):
+        super(_KeepaliveThread, self).__init__(name='zhmcclient-keepalive')
+        self.daemon = True
+        self._session = session
+        self._interval = interval
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        """
+        Stop the thread and wait for it to end.
+
+        This must be called while holding the logon lock of the session, so
+        that no keepalive request is in progress.
+        """
+        self._stop_event.set()
+        self.join()
+
+    def run(self):
+        # pylint: disable=protected-access
+        session = self._session
+        wait_time = self._interval
+        while not self._stop_event.wait(wait_time):
+            idle_time = time.time() - session._last_request_time
+            if idle_time < self._interval:
+                wait_time = self._interval - idle_time
+                continue
+            wait_time = self._interval
+            # The keepalive request is sent while holding the logon lock, so
+            # that it cannot overlap with a logoff. If the lock is held by a
+            # logon or logoff, the session is not idle and the keepalive
+            # request is skipped. Not waiting for the lock allows stop() to
+            # wait for this thread while holding the lock.
+            if not session._logon_lock.acquire(False):
+                continue
+            try:
+                if self._stop_event.is_set():
+                    break
+                self._keepalive()
+            finally:
+                session._logon_lock.release()
+
+    def _keepalive(self):
+        """
+        Issue the keepalive request and re-logon if the HMC session token has
+        expired. Must be called while holding the logon lock of the session.
+        """
+        # pylint: disable=protected-access
+        session = self._session
+        session_id = session._session_id
+        try:
+            session._do_get(_KEEPALIVE_URI, logon_required=False,
+                            relogon=False)
+        except ServerAuthError as exc:
+            if exc.details.reason != 5 or not session._keepalive_relogon:
+                HMC_LOGGER.debug("Session keepalive request failed: %s", exc)
+                return
+            HMC_LOGGER.debug("Session keepalive found the HMC session "
+                             "expired; re-logging on")
+            try:
+                session._relogon(session_id)
+            except Error as exc2:
+                HMC_LOGGER.debug("Session keepalive re-logon failed: %s",
+                                 exc2)
+        except Error as exc:
+            HMC_LOGGER.debug("Session keepalive request failed: %s", exc)
+
 
 class Job(object):
     """
@@ -1469,6 +2471,13 @@ class Job(object):
         job_status = job_result_obj['status']
         if job_status == 'complete':
             self.session.delete(self.uri)
+            response_cache = self.session.response_cache
+            if response_cache is not None:
+                # The operation may have changed the target resource
+                response_cache.invalidate(self.op_uri)
+            job_updater = self.session.job_updater
+            if job_updater:
+                job_updater.forget_job(self.uri)
             op_status_code = job_result_obj['job-status-code']
             if op_status_code in (200, 201):
                 op_result_obj = job_result_obj.get('job-results', None)
@@ -1507,6 +2516,16 @@ class Job(object):
         If the job completed in error, an :exc:`~zhmcclient.HTTPError`
         exception is raised.
 
+        The job status is polled with an interval that starts at the
+        :attr:`~zhmcclient.RetryTimeoutConfig.poll_min_interval` attribute of
+        the retry/timeout configuration of the session and is doubled after
+        each poll, up to its
+        :attr:`~zhmcclient.RetryTimeoutConfig.poll_max_interval` attribute.
+        If the session is subscribed for job updates (see
+        :meth:`~zhmcclient.Session.subscribe_job_updates`), a job completion
+        notification from the HMC causes the job status to be retrieved
+        right away.
+
         Parameters:
 
           operation_timeout (:term:`number`):
@@ -1542,11 +2561,12 @@ class Job(object):
             waiting for job completion.
         """
 
+        rt_config = self.session.retry_timeout_config
         if operation_timeout is None:
-            operation_timeout = \
-                self.session.retry_timeout_config.operation_timeout
+            operation_timeout = rt_config.operation_timeout
         if operation_timeout > 0:
             start_time = time.time()
+        poll_interval = rt_config.poll_min_interval
 
         while True:
             job_status, op_result_obj = self.check_for_completion()
@@ -1557,16 +2577,31 @@ class Job(object):
             if job_status == 'complete':
                 return op_result_obj
 
+            wait_time = poll_interval
             if operation_timeout > 0:
                 current_time = time.time()
-                if current_time > start_time + operation_timeout:
+                remaining_time = start_time + operation_timeout - current_time
+                if remaining_time < 0:
                     raise OperationTimeout(
                         "Waiting for completion of job {} timed out "
                         "(operation timeout: {} s)".
                         format(self.uri, operation_timeout),
                         operation_timeout)
+                # Poll one more time when the timeout expires
+                wait_time = min(wait_time, remaining_time)
+
+            job_updater = self.session.job_updater
+            if job_updater:
+                if job_updater.wait_for_job(self.uri, wait_time):
+                    # Consume the job completion notification, so that the
+                    # next wait falls back to the poll interval if the job
+                    # status is not yet 'complete'.
+                    job_updater.forget_job(self.uri)
+            else:
+                time.sleep(wait_time)  # Avoid hot spin loop
 
-            time.sleep(10)  # Avoid hot spin loop
+            poll_interval = min(poll_interval * 2,
+                                rt_config.poll_max_interval)
 
 
 def _text_repr(text, max_len=1000):
@@ -1583,12 +2618,14 @@ def _text_repr(text, max_len=1000):
     return text_repr
 
 
-def _result_object(result):
+def _result_object(result, json_codec=None):
     """
     Return the JSON payload in the HTTP response as a Python dict.
 
     Parameters:
         result (requests.Response): HTTP response object.
+        json_codec (JsonCodec): JSON codec for decoding the payload.
+          `None` uses the JSON support of the Python standard library.
 
     Raises:
         zhmcclient.ParseError: Error parsing the returned JSON.
@@ -1599,7 +2636,7 @@ def _result_object(result):
         # This function is only called when there is content expected.
         # Therefore, a response without content will result in a ParseError.
         try:
-            return result.json(object_pairs_hook=OrderedDict)
+            return json2dict(result.content, json_codec)
         except ValueError as exc:
             new_exc = ParseError(
                 "JSON parse error in HTTP response: {}. "
@@ -1681,12 +2718,278 @@ def _result_object(result):
                _text_repr(result.text, 1000)))
 
 
-def json2dict(json_str):
+# Size of the chunks in which streamed response bodies are read, in Bytes
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+
+
+def _iter_result_items(result, json_codec, retry_timeout_config):
+    """
+    Generator that yields the items of the JSON array in the body of a
+    response that was requested with stream=True, reading the body
+    incrementally.
+
+    Parameters:
+        result (requests.Response): HTTP response object with status 200, or
+          `None` for a response without body.
+        json_codec (JsonCodec): JSON codec for decoding the response.
+        retry_timeout_config (RetryTimeoutConfig): Retry/timeout
+          configuration of the session.
+
+    Raises:
+        zhmcclient.ParseError: Error parsing the returned JSON.
+        zhmcclient.ConnectionError: Error reading the response body.
+    """
+    if result is None:
+        return
+    try:
+        content_type = result.headers.get('content-type', None)
+        if content_type is not None and \
+                not content_type.startswith('application/json'):
+            # Not a JSON array (e.g. HTML error page): Process as a whole.
+            result_object = _result_object(result, json_codec)
+            if not isinstance(result_object, list):
+                result_object = [result_object]
+            for item in result_object:
+                yield item
+            return
+        try:
+            chunks = result.iter_content(chunk_size=_STREAM_CHUNK_SIZE)
+            for item in _iter_json_array(chunks, json_codec):
+                yield item
+        except ValueError as exc:
+            new_exc = ParseError(
+                "JSON parse error in HTTP response: {}. "
+                "HTTP request: {} {}. "
+                "Response status {}.".
+                format(exc.args[0],
+                       result.request.method, result.request.url,
+                       result.status_code))
+            new_exc.__cause__ = None
+            raise new_exc  # zhmcclient.ParseError
+        except requests.exceptions.RequestException as exc:
+            _handle_request_exc(exc, retry_timeout_config)
+    finally:
+        result.close()
+
+
+def _iter_json_array(chunks, json_codec=None):
+    """
+    Generator that parses a JSON array from an iterable of byte strings with
+    UTF-8 encoded JSON text, and yields the array items as soon as they have
+    been completely received.
+
+    Parameters:
+        chunks (iterable of byte string): The pieces of JSON text.
+        json_codec (JsonCodec): JSON codec for decoding the array items.
+          `None` uses the JSON support of the Python standard library.
+
+    Raises:
+        ValueError: The JSON text is invalid or not an array.
+    """
+    parser = _JsonArrayParser(json_codec)
+    utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in chunks:
+        for item in parser.feed(utf8_decoder.decode(chunk)):
+            yield item
+    for item in parser.feed(utf8_decoder.decode(b'', final=True), final=True):
+        yield item
+
+
+# Text up to and including the next character that is relevant for finding
+# the boundaries of the items of a JSON array, skipping complete JSON
+# strings. The character is '"' for a JSON string that is not complete, and
+# is empty at the end of the text. There are separate expressions for the top
+# level of the array and for the nested levels, where ',' is not relevant.
+_STRING_PATTERN = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_TOP_LEVEL_RE = re.compile(
+    r'(?:[^"\[\]{},]+|' + _STRING_PATTERN + r')*([\[\]{},"]?)')
+_NESTED_LEVEL_RE = re.compile(
+    r'(?:[^"\[\]{}]+|' + _STRING_PATTERN + r')*([\[\]{}"]?)')
+
+
+def _nested_value_pattern(levels):
+    """
+    Return a regular expression pattern for a JSON array or object with up
+    to the specified number of nesting levels, without any further nesting.
+
+    The pattern is written such that there is only one way to match a text,
+    so that the time for failing to match is linear in the length of the text.
+    """
+    pattern = r'[^"\[\]{}]*'
+    for _ in range(levels):
+        value = r'{}|\{{{}\}}|\[{}\]'.format(_STRING_PATTERN, pattern, pattern)
+        pattern = r'[^"\[\]{{}}]*(?:(?:{})[^"\[\]{{}}]*)*'.format(value)
+    return r'\{{{0}\}}|\[{0}\]'.format(pattern)
+
+
+# A complete top-level item of a JSON array that is followed by the ',' or
+# ']' that ends it. Items with deeper nesting are not matched.
+_ARRAY_ITEM_RE = re.compile(
+    r'\s*(?:{}|{}|[^"\[\]{{}},\s]+)\s*(?=[,\]])'.format(
+        _STRING_PATTERN, _nested_value_pattern(3)))
+
+# Character that is relevant within a JSON string
+_STRING_SPECIAL_RE = re.compile(r'["\\]')
+
+_CLOSING_BRACKETS = {'[': ']', '{': '}'}
+
+
+class _JsonArrayParser(object):
+    # pylint: disable=too-few-public-methods
+    """
+    Incremental parser for the items of a JSON array.
+
+    The parser scans the JSON text for the boundaries of the top-level array
+    items, i.e. for the ',' and ']' characters that are not nested in JSON
+    strings, arrays or objects. Each piece of text is scanned only once. Only
+    the text of the array item that is currently being received is kept in
+    memory, as a list of pieces that is joined when the item is complete.
+
+    The items that have been completed by a piece of text are decoded
+    together, using the JSON codec. Unbalanced brackets are detected while
+    scanning. Other syntax errors in an item are detected when the item is
+    decoded.
+    """
+
+    # Parser states
+    _START = 0  # Expecting '['
+    _ARRAY = 1  # Within the array
+    _END = 2  # After the closing ']'
+
+    def __init__(self, json_codec=None):
+        if json_codec is None:
+            json_codec = _DEFAULT_JSON_CODEC
+        self._json_codec = json_codec
+        self._state = self._START
+        self._parts = []  # Text pieces of the current item
+        self._stack = []  # Open brackets within the current item
+        self._in_string = False  # Scan position is within a JSON string
+        self._escape = False  # Next character is escaped in a JSON string
+        self._num_items = 0
+
+    def feed(self, text, final=False):
+        """
+        Add the next piece of JSON text and return the list of array items
+        that have been completed by it.
+
+        Parameters:
+            text (unicode string): The next piece of JSON text.
+            final (bool): Indicates that this is the last piece.
+
+        Raises:
+            ValueError: The JSON text is invalid or not an array.
+        """
+        item_texts = []
+        pos = 0
+        if self._state == self._START:
+            pos = _WHITESPACE_RE.match(text, pos).end()
+            if pos < len(text):
+                if text[pos] != '[':
+                    raise ValueError("Expecting JSON array at top level")
+                pos += 1
+                self._state = self._ARRAY
+        if self._state == self._ARRAY:
+            pos = self._scan(text, pos, item_texts)
+        if self._state == self._END:
+            pos = _WHITESPACE_RE.match(text, pos).end()
+            if pos < len(text):
+                raise ValueError("Extra data after JSON array: {!r}".
+                                 format(text[pos:pos + 100]))
+        if final and self._state != self._END:
+            raise ValueError("Incomplete JSON array")
+        if not item_texts:
+            return []
+        return self._json_codec.loads(
+            u'[{}]'.format(u','.join(item_texts)))
+
+    def _scan(self, text, pos, item_texts):
+        """
+        Scan the text within the array starting at a position, and append
+        the text of the completed array items to a list.
+
+        Returns the position after the closing ']' of the array, or the end
+        of the text.
+        """
+        item_start = pos
+        end = len(text)
+        while pos < end:
+            if self._in_string:
+                if self._escape:
+                    pos += 1
+                    self._escape = False
+                    continue
+                m = _STRING_SPECIAL_RE.search(text, pos)
+                if m is None:
+                    pos = end
+                    break
+                pos = m.end()
+                if m.group() == '\\':
+                    self._escape = True
+                else:
+                    self._in_string = False
+                continue
+            if self._stack:
+                m = _NESTED_LEVEL_RE.match(text, pos)
+            else:
+                if pos == item_start and not self._parts:
+                    # Fast path: Skip a complete item with a single match
+                    m = _ARRAY_ITEM_RE.match(text, pos)
+                    if m:
+                        pos = m.end()
+                m = _TOP_LEVEL_RE.match(text, pos)
+            char = m.group(1)
+            pos = m.end()
+            if not char:
+                break  # End of text
+            if char == '"':
+                self._in_string = True
+            elif char in '[{':
+                self._stack.append(char)
+            elif self._stack:
+                if _CLOSING_BRACKETS[self._stack.pop()] != char:
+                    raise ValueError(
+                        "Unexpected {!r} in JSON array item at: {!r}".
+                        format(char, text[pos - 1:pos + 99]))
+            elif char == '}':
+                raise ValueError("Unexpected '}}' in JSON array at: {!r}".
+                                 format(text[pos - 1:pos + 99]))
+            else:
+                # ',' or ']' at the top level of the array ends an item
+                self._parts.append(text[item_start:pos - 1])
+                self._complete_item(char, item_texts)
+                item_start = pos
+                if char == ']':
+                    self._state = self._END
+                    return pos
+        if item_start < end:
+            self._parts.append(text[item_start:end])
+        return end
+
+    def _complete_item(self, char, item_texts):
+        """
+        Append the text of the current item, which is ended by the specified
+        character (',' or ']'), to a list.
+        """
+        item_text = u''.join(self._parts).strip()
+        self._parts = []
+        if not item_text:
+            if char == ']' and self._num_items == 0:
+                return  # Empty array
+            raise ValueError("Missing item in JSON array")
+        item_texts.append(item_text)
+        self._num_items += 1
+
+
+def json2dict(json_str, json_codec=None):
     """
     Convert a JSON string into a dict.
 
     Parameters:
       json_str (string): Unicode or binary string in JSON format.
+      json_codec (JsonCodec): JSON codec for decoding the string.
+        `None` uses the JSON support of the Python standard library.
 
     Returns:
       dict: JSON string converted to a dict.
@@ -1694,24 +2997,26 @@ def json2dict(json_str):
     Raises:
       ValueError: Cannot parse JSON string
     """
-    # In Python 3 up to 3.5, json.loads() requires unicode strings.
-    if sys.version_info[0] == 3 and sys.version_info[1] in (4, 5) and \
-            isinstance(json_str, six.binary_type):
-        json_str = json_str.decode('utf-8')
-    json_dict = json.loads(json_str)  # May raise ValueError
+    if json_codec is None:
+        json_codec = _DEFAULT_JSON_CODEC
+    json_dict = json_codec.loads(json_str)  # May raise ValueError
     return json_dict
 
 
-def dict2json(json_dict):
+def dict2json(json_dict, json_codec=None):
     """
     Convert a dict into a JSON string.
 
     Parameters:
       json_dict (dict): The dict.
+      json_codec (JsonCodec): JSON codec for encoding the dict.
+        `None` uses the JSON support of the Python standard library.
 
     Returns:
       unicode string (py3) or byte string (py2): Dict converted to a JSON
       string.
     """
-    json_str = json.dumps(json_dict)
+    if json_codec is None:
+        json_codec = _DEFAULT_JSON_CODEC
+    json_str = json_codec.dumps(json_dict)
     return json_str
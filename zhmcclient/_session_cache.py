@@ -0,0 +1,230 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A session cache persists the HMC session-ids of
+:class:`~zhmcclient.Session` objects in a file, so that short-lived processes
+(e.g. command line tools or automation scripts) can reuse the HMC session of
+a previous process for the same HMC and userid, instead of logging on again.
+
+The HMC API version information returned by
+:meth:`~zhmcclient.Client.query_api_version` is cached as well, for the HMC
+session it was retrieved with. :meth:`~zhmcclient.Client.version_info` uses it
+when the HMC session is reused, so that no 'Query API Version' operation is
+needed. The cached API version information is removed upon logon, re-logon
+and logoff.
+
+A session-id read from the cache is not verified upfront. If the HMC rejects
+it because it has expired, the session logs on again (using the userid and
+password of the session) and replaces the session-id in the cache.
+
+The cache file contains HMC session-ids, which are credentials. It is created
+with permissions that allow access only by its owner, and it should be
+located in a directory that is not accessible by other users.
+"""
+
+from __future__ import absolute_import
+
+import os
+import errno
+import json
+import threading
+
+from ._logging import get_logger
+from ._constants import HMC_LOGGER_NAME
+
+__all__ = ['SessionCache']
+
+HMC_LOGGER = get_logger(HMC_LOGGER_NAME)
+
+#: Default path name of the session cache file.
+DEFAULT_SESSION_CACHE_FILE = os.path.join(
+    os.path.expanduser('~'), '.zhmcclient_session_cache.json')
+
+
+class SessionCache(object):
+    """
+    A cache of HMC session-ids and HMC API version information in a file,
+    keyed by HMC host, HMC port and userid.
+
+    A session cache object is used by passing it in the `session_cache`
+    parameter of :class:`~zhmcclient.Session`.
+
+    The cache file is read and written on each access, so that multiple
+    processes can share the same cache file. The cache file is created with
+    file permissions 0600 (on systems that support them) and is replaced
+    atomically when written.
+
+    Each cache entry is a dictionary with the following items (all of them
+    optional):
+
+    * ``"session-id"`` (string): HMC session-id.
+    * ``"notification-topic"`` (string): Object notification topic of the
+      HMC session.
+    * ``"job-notification-topic"`` (string): Job notification topic of the
+      HMC session.
+    * ``"api-version"`` (dict): Result of the 'Query API Version' operation.
+    """
+
+    def __init__(self, filepath=None):
+        """
+        Parameters:
+
+          filepath (:term:`string`): Path name of the cache file.
+            `None` means to use the file ``.zhmcclient_session_cache.json``
+            in the home directory of the current user.
+            The file does not need to exist.
+        """
+        if filepath is None:
+            filepath = DEFAULT_SESSION_CACHE_FILE
+        self._filepath = filepath
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "{}(filepath={!r})".format(self.__class__.__name__,
+                                          self._filepath)
+
+    @property
+    def filepath(self):
+        """
+        :term:`string`: Path name of the cache file.
+        """
+        return self._filepath
+
+    @staticmethod
+    def _key(host, port, userid):
+        """
+        Return the key of the cache entry for HMC host, port and userid.
+        """
+        return '{}@{}:{}'.format(userid, host, port)
+
+    def _load(self):
+        """
+        Return the content of the cache file as a dict.
+
+        A missing, unreadable or invalid cache file results in an empty dict.
+        """
+        try:
+            with open(self._filepath, 'r') as fp:
+                data = json.load(fp)
+        except (IOError, OSError) as exc:
+            if exc.errno != errno.ENOENT:
+                HMC_LOGGER.debug("Cannot read session cache file %s: %s",
+                                 self._filepath, exc)
+            return {}
+        except ValueError as exc:
+            HMC_LOGGER.debug("Ignoring invalid session cache file %s: %s",
+                             self._filepath, exc)
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    def _save(self, data):
+        """
+        Write the cache file from a dict, with owner-only file permissions.
+        """
+        tmp_filepath = '{}.{}.tmp'.format(self._filepath, os.getpid())
+        fd = os.open(tmp_filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                     0o600)
+        try:
+            with os.fdopen(fd, 'w') as fp:
+                json.dump(data, fp, indent=2, sort_keys=True)
+            if os.name == 'nt' and os.path.exists(self._filepath):
+                # os.rename() does not replace existing files on Windows
+                os.remove(self._filepath)
+            os.rename(tmp_filepath, self._filepath)
+        except BaseException:
+            if os.path.exists(tmp_filepath):
+                os.remove(tmp_filepath)
+            raise
+
+    def get_entry(self, host, port, userid):
+        """
+        Return the cache entry for an HMC host, port and userid.
+
+        Parameters:
+
+          host (:term:`string`): HMC host.
+
+          port (:term:`integer`): HMC TCP port.
+
+          userid (:term:`string`): HMC userid.
+
+        Returns:
+
+          dict: The cache entry (see class description), or `None` if the
+          cache does not have an entry for the HMC host, port and userid.
+        """
+        with self._lock:
+            data = self._load()
+        return data.get(self._key(host, port, userid), None)
+
+    def update_entry(self, host, port, userid, **items):
+        """
+        Update the cache entry for an HMC host, port and userid with the
+        specified items, creating the entry if needed.
+
+        Parameters:
+
+          host (:term:`string`): HMC host.
+
+          port (:term:`integer`): HMC TCP port.
+
+          userid (:term:`string`): HMC userid.
+
+          **items: Items to be updated in the cache entry, using the keys
+            of the cache entry with underscores instead of hyphens (e.g.
+            `session_id`). A value of `None` removes the item from the cache
+            entry.
+
+        Raises:
+
+          IOError, OSError: The cache file cannot be written.
+        """
+        key = self._key(host, port, userid)
+        with self._lock:
+            data = self._load()
+            entry = data.get(key, {})
+            for name, value in items.items():
+                name = name.replace('_', '-')
+                if value is None:
+                    entry.pop(name, None)
+                else:
+                    entry[name] = value
+            data[key] = entry
+            self._save(data)
+
+    def remove_entry(self, host, port, userid):
+        """
+        Remove the cache entry for an HMC host, port and userid, if it exists.
+
+        Parameters:
+
+          host (:term:`string`): HMC host.
+
+          port (:term:`integer`): HMC TCP port.
+
+          userid (:term:`string`): HMC userid.
+
+        Raises:
+
+          IOError, OSError: The cache file cannot be written.
+        """
+        key = self._key(host, port, userid)
+        with self._lock:
+            data = self._load()
+            if key in data:
+                del data[key]
+                self._save(data)
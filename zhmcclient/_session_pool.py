@@ -0,0 +1,265 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A session pool combines sessions to multiple HMCs that manage the same CPCs
+(e.g. a primary HMC and alternate HMCs), for use by a
+:class:`~zhmcclient.Client` in place of a single :class:`~zhmcclient.Session`.
+
+Read-only requests (HTTP GET) are spread across the available HMCs, preferring
+HMCs with lower response times, and are failed over to another HMC when an HMC
+cannot be reached. All other requests (HTTP POST and DELETE), and thus all
+changes and all asynchronous operations, are performed on the primary HMC and
+are not failed over.
+
+This requires that the resources have the same URIs on all of the HMCs, which
+is the case for the resources of CPCs that are managed by all of the HMCs,
+but not for HMC-specific resources such as the resources of the HMC console
+(e.g. users or tasks).
+
+Example::
+
+    primary = zhmcclient.Session('hmc1', userid, password)
+    alternate = zhmcclient.Session('hmc2', userid, password)
+    pool = zhmcclient.SessionPool([primary, alternate])
+    client = zhmcclient.Client(pool)
+    cpcs = client.cpcs.list()
+"""
+
+from __future__ import absolute_import
+
+import time
+import threading
+
+from ._exceptions import ConnectionError  # pylint: disable=redefined-builtin
+from ._logging import get_logger, logged_api_call
+from ._constants import HMC_LOGGER_NAME
+from ._utils import run_concurrently
+
+__all__ = ['SessionPool']
+
+HMC_LOGGER = get_logger(HMC_LOGGER_NAME)
+
+# Weight of a new response time in the average response time of a session
+_RESPONSE_TIME_WEIGHT = 0.3
+
+
+class _PoolMember(object):
+    # pylint: disable=too-few-public-methods
+    """
+    A session in a session pool, with its health and load data.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.avg_time = None  # Average response time of GETs, in seconds
+        self.in_flight = 0  # Number of GETs in progress
+        self.down_until = None  # Time until which the HMC is considered down
+
+    def cost(self):
+        """
+        Return the expected cost of sending a GET request to the session.
+        """
+        if self.avg_time is None:
+            return 0  # Send a first request, to measure the response time
+        return self.avg_time * (self.in_flight + 1)
+
+
+class SessionPool(object):
+    """
+    A pool of sessions to multiple HMCs that manage the same CPCs, with load
+    balancing and failover of read-only requests.
+
+    A session pool can be used in place of a :class:`~zhmcclient.Session`
+    object when creating a :class:`~zhmcclient.Client` object. It provides
+    the methods and properties of the session to the primary HMC, except
+    for :meth:`get`, :meth:`get_many` and :meth:`iter_get`, which are
+    performed on any of the available HMCs.
+
+    An HMC is considered unavailable for `retry_interval` seconds after a
+    GET request to it failed with :exc:`~zhmcclient.ConnectionError`. If no
+    HMC is available, all HMCs are tried.
+    """
+
+    def __init__(self, sessions, retry_interval=30):
+        """
+        Parameters:
+
+          sessions (iterable of :class:`~zhmcclient.Session`): Sessions to
+            the HMCs. The first session is the session to the primary HMC.
+            Must not be empty.
+
+          retry_interval (:term:`number`): Time in seconds an HMC is
+            considered unavailable after a connection error.
+
+        Raises:
+
+          ValueError: No sessions specified.
+        """
+        self._members = [_PoolMember(s) for s in sessions]
+        if not self._members:
+            raise ValueError("A session pool requires at least one session")
+        self._retry_interval = retry_interval
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "{}(hosts={!r}, primary={!r})". \
+            format(self.__class__.__name__,
+                   [m.session.host for m in self._members],
+                   self.primary.host)
+
+    def __getattr__(self, name):
+        # Everything else is provided by the session to the primary HMC.
+        # Note that this is invoked only for attributes not found otherwise.
+        if name == '_members':
+            raise AttributeError(name)
+        return getattr(self._members[0].session, name)
+
+    @property
+    def primary(self):
+        """
+        :class:`~zhmcclient.Session`: The session to the primary HMC.
+        """
+        return self._members[0].session
+
+    @property
+    def sessions(self):
+        """
+        list of :class:`~zhmcclient.Session`: The sessions to the HMCs,
+        starting with the primary HMC.
+        """
+        return [m.session for m in self._members]
+
+    def is_available(self, session):
+        """
+        Return whether the HMC of a session in this pool is currently
+        considered available.
+
+        Parameters:
+
+          session (:class:`~zhmcclient.Session`): A session in this pool.
+        """
+        for member in self._members:
+            if member.session is session:
+                return member.down_until is None or \
+                    member.down_until <= time.time()
+        raise ValueError("Session is not in the session pool: {!r}".
+                         format(session))
+
+    def _candidates(self):
+        """
+        Return the pool members in the order in which they should be tried
+        for a read-only request.
+        """
+        now = time.time()
+        with self._lock:
+            available = [m for m in self._members
+                         if m.down_until is None or m.down_until <= now]
+            unavailable = [m for m in self._members if m not in available]
+            # sorted() is stable, so the primary HMC is preferred on ties
+            available = sorted(available, key=lambda m: m.cost())
+        return available + unavailable
+
+    def _read(self, func):
+        """
+        Perform a read-only request on the best available HMC, failing over
+        to the other HMCs upon connection errors.
+
+        Parameters:
+
+          func (callable): Function performing the request, called with the
+            session as its argument.
+
+        Returns:
+
+          The return value of `func`.
+
+        Raises:
+
+          The exception raised by `func`, or the last
+          :exc:`~zhmcclient.ConnectionError` if all HMCs failed.
+        """
+        last_exc = None
+        for member in self._candidates():
+            with self._lock:
+                member.in_flight += 1
+            start_time = time.time()
+            try:
+                result = func(member.session)
+            except ConnectionError as exc:
+                HMC_LOGGER.debug("Session pool: HMC %s is unavailable, "
+                                 "failing over: %s", member.session.host, exc)
+                with self._lock:
+                    member.down_until = time.time() + self._retry_interval
+                last_exc = exc
+                continue
+            finally:
+                with self._lock:
+                    member.in_flight -= 1
+            duration = time.time() - start_time
+            with self._lock:
+                member.down_until = None
+                if member.avg_time is None:
+                    member.avg_time = duration
+                else:
+                    member.avg_time += \
+                        (duration - member.avg_time) * _RESPONSE_TIME_WEIGHT
+            return result
+        raise last_exc
+
+    @logged_api_call
+    def get(self, uri, logon_required=True):
+        """
+        Perform the HTTP GET method against the resource identified by a URI,
+        on the best available HMC of the pool.
+
+        For a description of the parameters, return value and exceptions, see
+        :meth:`zhmcclient.Session.get`. A :exc:`~zhmcclient.ConnectionError`
+        is raised only if the request failed on all HMCs.
+        """
+        return self._read(
+            lambda session: session.get(uri, logon_required=logon_required))
+
+    @logged_api_call
+    def get_many(self, uris, logon_required=True, max_workers=None):
+        """
+        Perform the HTTP GET method against each of the resources identified
+        by a list of URIs, on the best available HMCs of the pool.
+
+        For a description of the parameters, return value and exceptions, see
+        :meth:`zhmcclient.Session.get_many`.
+        """
+        uris = list(uris)
+        if max_workers is None:
+            max_workers = self.primary.retry_timeout_config.max_workers
+        return run_concurrently(
+            lambda uri: self.get(uri, logon_required=logon_required),
+            uris, max_workers, return_exceptions=True)
+
+    @logged_api_call
+    def iter_get(self, uri, logon_required=True):
+        """
+        Perform the HTTP GET method against the resource identified by a URI
+        on the best available HMC of the pool, and return an iterator over
+        the items of its JSON array response.
+
+        A failover is performed only for errors when sending the request, not
+        for errors while iterating.
+
+        For a description of the parameters, return value and exceptions, see
+        :meth:`zhmcclient.Session.iter_get`.
+        """
+        return self._read(
+            lambda session: session.iter_get(
+                uri, logon_required=logon_required))
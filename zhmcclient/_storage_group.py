@@ -88,8 +88,8 @@ from ._resource import BaseResource
 from ._storage_volume import StorageVolumeManager
 from ._virtual_storage_resource import VirtualStorageResourceManager
 from ._logging import logged_api_call
-from ._utils import append_query_parms, matches_filters, divide_filter_args, \
-    RC_STORAGE_GROUP
+from ._utils import append_query_parms, matches_filters, Filter, \
+    divide_filter_args, RC_STORAGE_GROUP
 
 __all__ = ['StorageGroupManager', 'StorageGroup']
 
@@ -197,6 +197,7 @@ class StorageGroupManager(BaseManager):
         else:
             query_parms, client_filters = divide_filter_args(
                 self._query_props, filter_args)
+            client_filter = Filter(client_filters)
             uri = '{}{}'.format(self._base_uri, query_parms)
 
             result = self.session.get(uri)
@@ -210,10 +211,10 @@ class StorageGroupManager(BaseManager):
                         name=props.get(self._name_prop, None),
                         properties=props)
 
-                    if matches_filters(resource_obj, client_filters):
+                    if matches_filters(resource_obj, client_filter):
                         resource_obj_list.append(resource_obj)
-                        if full_properties:
-                            resource_obj.pull_full_properties()
+                if full_properties:
+                    self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
@@ -687,8 +688,9 @@ class StorageGroup(BaseResource):
                 port_mgr = adapter.ports
                 port = port_mgr.resource_object(port_uri)
                 port_list.append(port)
-                if full_properties:
-                    port.pull_full_properties()
+            if full_properties:
+                # pylint: disable=protected-access
+                adapter_mgr._pull_full_properties(port_list)
 
         return port_list
 
@@ -33,7 +33,8 @@ from ._manager import BaseManager
 from ._resource import BaseResource
 from ._storage_volume_template import StorageVolumeTemplateManager
 from ._logging import logged_api_call
-from ._utils import matches_filters, divide_filter_args, RC_STORAGE_TEMPLATE
+from ._utils import matches_filters, Filter, divide_filter_args, \
+    RC_STORAGE_TEMPLATE
 
 __all__ = ['StorageGroupTemplateManager', 'StorageGroupTemplate']
 
@@ -139,6 +140,7 @@ class StorageGroupTemplateManager(BaseManager):
         else:
             query_parms, client_filters = divide_filter_args(
                 self._query_props, filter_args)
+            client_filter = Filter(client_filters)
             uri = '{}{}'.format(self._base_uri, query_parms)
 
             result = self.session.get(uri)
@@ -152,10 +154,10 @@ class StorageGroupTemplateManager(BaseManager):
                         name=props.get(self._name_prop, None),
                         properties=props)
 
-                    if matches_filters(resource_obj, client_filters):
+                    if matches_filters(resource_obj, client_filter):
                         resource_obj_list.append(resource_obj)
-                        if full_properties:
-                            resource_obj.pull_full_properties()
+                if full_properties:
+                    self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
@@ -45,7 +45,8 @@ import copy
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._logging import logged_api_call
-from ._utils import matches_filters, divide_filter_args, RC_STORAGE_VOLUME
+from ._utils import matches_filters, Filter, divide_filter_args, \
+    RC_STORAGE_VOLUME
 
 __all__ = ['StorageVolumeManager', 'StorageVolume']
 
@@ -148,6 +149,7 @@ class StorageVolumeManager(BaseManager):
         else:
             query_parms, client_filters = divide_filter_args(
                 self._query_props, filter_args)
+            client_filter = Filter(client_filters)
 
             resources_name = 'storage-volumes'
             uri = '{}/{}{}'.format(self.storage_group.uri, resources_name,
@@ -164,10 +166,10 @@ class StorageVolumeManager(BaseManager):
                         name=props.get(self._name_prop, None),
                         properties=props)
 
-                    if matches_filters(resource_obj, client_filters):
+                    if matches_filters(resource_obj, client_filter):
                         resource_obj_list.append(resource_obj)
-                        if full_properties:
-                            resource_obj.pull_full_properties()
+                if full_properties:
+                    self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
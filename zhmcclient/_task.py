@@ -25,7 +25,7 @@ from __future__ import absolute_import
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._logging import logged_api_call
-from ._utils import matches_filters, divide_filter_args, RC_TASK
+from ._utils import matches_filters, Filter, divide_filter_args, RC_TASK
 
 __all__ = ['TaskManager', 'Task']
 
@@ -116,6 +116,7 @@ class TaskManager(BaseManager):
         resource_obj_list = []
         query_parms, client_filters = divide_filter_args(
             self._query_props, filter_args)
+        client_filter = Filter(client_filters)
         resources_name = 'tasks'
         uri = '{}/{}{}'.format(self.console.uri, resources_name, query_parms)
 
@@ -130,10 +131,10 @@ class TaskManager(BaseManager):
                     name=props.get(self._name_prop, None),
                     properties=props)
 
-                if matches_filters(resource_obj, client_filters):
+                if matches_filters(resource_obj, client_filter):
                     resource_obj_list.append(resource_obj)
-                    if full_properties:
-                        resource_obj.pull_full_properties()
+            if full_properties:
+                self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
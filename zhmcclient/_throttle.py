@@ -0,0 +1,146 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client-side throttling of the HTTP requests of a
+:class:`~zhmcclient.Session`, and backoff for HTTP responses indicating that
+the HMC is busy.
+
+This module is used by the Session class and is not part of the external
+API.
+"""
+
+from __future__ import absolute_import
+
+import time
+import random
+import threading
+import email.utils
+
+__all__ = []
+
+#: HTTP status codes indicating that the HMC is too busy to process the
+#: request, and that the request may be retried later.
+BUSY_STATUSES = (429, 503)
+
+
+class Throttle(object):
+    """
+    Limits the rate of HTTP requests with a token bucket, and the number of
+    HTTP requests in flight with a semaphore.
+
+    An object of this class is used as a context manager around the sending
+    of an HTTP request and the receiving of its response headers. Entering
+    the context blocks until the request may be sent.
+    """
+
+    def __init__(self, rate_limit=None, burst=None, max_in_flight=None):
+        """
+        Parameters:
+
+          rate_limit (:term:`number`): Maximum average number of requests per
+            second. `None` or 0 means no rate limit.
+
+          burst (:term:`integer`): Maximum number of requests that can be sent
+            at once, after a time without requests (i.e. the size of the
+            token bucket). `None` or 0 means 1.
+
+          max_in_flight (:term:`integer`): Maximum number of requests in
+            flight. `None` or 0 means no limit.
+        """
+        self._rate_limit = rate_limit or None
+        self._burst = max(burst or 1, 1)
+        self._tokens = float(self._burst)
+        self._last_time = time.time()
+        self._lock = threading.Lock()
+        if max_in_flight:
+            self._semaphore = threading.BoundedSemaphore(max_in_flight)
+        else:
+            self._semaphore = None
+
+    @property
+    def enabled(self):
+        """
+        bool: Indicates whether this throttle limits any requests.
+        """
+        return self._rate_limit is not None or self._semaphore is not None
+
+    def _take_token(self):
+        """
+        Take a token from the token bucket, waiting until one is available.
+        """
+        while True:
+            with self._lock:
+                now = time.time()
+                self._tokens = min(
+                    self._burst,
+                    self._tokens + (now - self._last_time) * self._rate_limit)
+                self._last_time = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self._rate_limit
+            time.sleep(wait_time)
+
+    def __enter__(self):
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        if self._rate_limit is not None:
+            try:
+                self._take_token()
+            except BaseException:
+                if self._semaphore is not None:
+                    self._semaphore.release()
+                raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+def busy_retry_delay(result, retry, min_interval, max_interval):
+    """
+    Return the time in seconds to wait before retrying a request whose
+    response indicated that the HMC is busy.
+
+    If the response has a 'Retry-After' header (in seconds or as an HTTP
+    date), its value is used, limited to `max_interval`. Otherwise, the delay
+    is an exponential backoff with "full jitter", i.e. a random time between
+    0 and ``min_interval * 2 ** retry``, limited to `max_interval`.
+
+    Parameters:
+
+      result (requests.Response): The HTTP response.
+
+      retry (:term:`integer`): Number of retries that have already been
+        performed for the request.
+
+      min_interval (:term:`number`): Backoff interval for the first retry.
+
+      max_interval (:term:`number`): Maximum backoff interval.
+    """
+    retry_after = result.headers.get('Retry-After', None)
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            date_tuple = email.utils.parsedate_tz(retry_after)
+            if date_tuple is None:
+                delay = None
+            else:
+                delay = email.utils.mktime_tz(date_tuple) - time.time()
+        if delay is not None:
+            return min(max(delay, 0), max_interval)
+    return random.uniform(0, min(min_interval * 2 ** retry, max_interval))
@@ -42,11 +42,18 @@ from __future__ import absolute_import
 
 import time
 import copy
+import threading
 
 from ._logging import logged_api_call
 
 __all__ = ['TimeStatsKeeper', 'TimeStats']
 
+# Lock that serializes updates to the time statistics data, so that the same
+# operation can be measured in multiple threads concurrently. This is a
+# module-level lock because the TimeStats objects are deep-copied when
+# taking a snapshot.
+_STATS_LOCK = threading.RLock()
+
 
 class TimeStats(object):
     """
@@ -78,7 +85,8 @@ class TimeStats(object):
         self._sum = float(0)
         self._min = float('inf')
         self._max = float(0)
-        self._begin_time = None
+        # Begin times of the currently measured invocations, by thread ID
+        self._begin_times = {}
 
     @property
     def name(self):
@@ -154,9 +162,14 @@ class TimeStats(object):
 
         If the statistics keeper holding this time statistics is disabled,
         this method does nothing, in order to save resources.
+
+        The begin time is maintained per thread, so the operation can be
+        measured concurrently in multiple threads.
         """
         if self.keeper.enabled:
-            self._begin_time = time.time()
+            with _STATS_LOCK:
+                self._begin_times[threading.current_thread().ident] = \
+                    time.time()
 
     @logged_api_call
     def end(self):
@@ -181,16 +194,20 @@ class TimeStats(object):
           RuntimeError
         """
         if self.keeper.enabled:
-            if self._begin_time is None:
-                raise RuntimeError("end() called without preceding begin()")
-            dt = time.time() - self._begin_time
-            self._begin_time = None
-            self._count += 1
-            self._sum += dt
-            if dt > self._max:
-                self._max = dt
-            if dt < self._min:
-                self._min = dt
+            end_time = time.time()
+            with _STATS_LOCK:
+                begin_time = self._begin_times.pop(
+                    threading.current_thread().ident, None)
+                if begin_time is None:
+                    raise RuntimeError(
+                        "end() called without preceding begin()")
+                dt = end_time - begin_time
+                self._count += 1
+                self._sum += dt
+                if dt > self._max:
+                    self._max = dt
+                if dt < self._min:
+                    self._min = dt
 
     def __str__(self):
         """
@@ -270,9 +287,10 @@ class TimeStatsKeeper(object):
         """
         if not self.enabled:
             return self._disabled_stats
-        if name not in self._time_stats:
-            self._time_stats[name] = TimeStats(self, name)
-        return self._time_stats[name]
+        with _STATS_LOCK:
+            if name not in self._time_stats:
+                self._time_stats[name] = TimeStats(self, name)
+            return self._time_stats[name]
 
     @logged_api_call
     def snapshot(self):
@@ -291,7 +309,8 @@ class TimeStatsKeeper(object):
           - value (:class:`~zhmcclient.TimeStats`): Time statistics for the
             operation
         """
-        return copy.deepcopy(self._time_stats)
+        with _STATS_LOCK:
+            return copy.deepcopy(self._time_stats)
 
     def __str__(self):
         """
@@ -30,7 +30,7 @@ from __future__ import absolute_import
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._logging import logged_api_call
-from ._utils import matches_filters, divide_filter_args, RC_CPC
+from ._utils import matches_filters, Filter, divide_filter_args, RC_CPC
 
 __all__ = ['UnmanagedCpcManager', 'UnmanagedCpc']
 
@@ -129,6 +129,7 @@ class UnmanagedCpcManager(BaseManager):
         else:
             query_parms, client_filters = divide_filter_args(
                 self._query_props, filter_args)
+            client_filter = Filter(client_filters)
 
             uri = self.parent.uri + '/operations/list-unmanaged-cpcs' + \
                 query_parms
@@ -144,7 +145,7 @@ class UnmanagedCpcManager(BaseManager):
                         name=props.get(self._name_prop, None),
                         properties=props)
 
-                    if matches_filters(resource_obj, client_filters):
+                    if matches_filters(resource_obj, client_filter):
                         resource_obj_list.append(resource_obj)
 
         self._name_uri_cache.update_from(resource_obj_list)
@@ -23,7 +23,7 @@ import copy
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._logging import logged_api_call
-from ._utils import matches_filters, divide_filter_args, RC_USER
+from ._utils import matches_filters, Filter, divide_filter_args, RC_USER
 
 __all__ = ['UserManager', 'User']
 
@@ -120,6 +120,7 @@ class UserManager(BaseManager):
         resource_obj_list = []
         query_parms, client_filters = divide_filter_args(
             self._query_props, filter_args)
+        client_filter = Filter(client_filters)
         resources_name = 'users'
         uri = '{}/{}{}'.format(self.console.uri, resources_name, query_parms)
 
@@ -134,10 +135,10 @@ class UserManager(BaseManager):
                     name=props.get(self._name_prop, None),
                     properties=props)
 
-                if matches_filters(resource_obj, client_filters):
+                if matches_filters(resource_obj, client_filter):
                     resource_obj_list.append(resource_obj)
-                    if full_properties:
-                        resource_obj.pull_full_properties()
+            if full_properties:
+                self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
@@ -37,7 +37,7 @@ import copy
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._logging import logged_api_call
-from ._utils import matches_filters, divide_filter_args, RC_USER_PATTERN
+from ._utils import matches_filters, Filter, divide_filter_args, RC_USER_PATTERN
 
 __all__ = ['UserPatternManager', 'UserPattern']
 
@@ -133,6 +133,7 @@ class UserPatternManager(BaseManager):
         resource_obj_list = []
         query_parms, client_filters = divide_filter_args(
             self._query_props, filter_args)
+        client_filter = Filter(client_filters)
         resources_name = 'user-patterns'
         uri = '{}/{}{}'.format(self.console.uri, resources_name, query_parms)
 
@@ -147,10 +148,10 @@ class UserPatternManager(BaseManager):
                     name=props.get(self._name_prop, None),
                     properties=props)
 
-                if matches_filters(resource_obj, client_filters):
+                if matches_filters(resource_obj, client_filter):
                     resource_obj_list.append(resource_obj)
-                    if full_properties:
-                        resource_obj.pull_full_properties()
+            if full_properties:
+                self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
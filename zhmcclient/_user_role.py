@@ -31,7 +31,7 @@ import six
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._logging import logged_api_call
-from ._utils import matches_filters, divide_filter_args, RC_USER_ROLE
+from ._utils import matches_filters, Filter, divide_filter_args, RC_USER_ROLE
 
 __all__ = ['UserRoleManager', 'UserRole']
 
@@ -127,6 +127,7 @@ class UserRoleManager(BaseManager):
         resource_obj_list = []
         query_parms, client_filters = divide_filter_args(
             self._query_props, filter_args)
+        client_filter = Filter(client_filters)
         resources_name = 'user-roles'
         uri = '{}/{}{}'.format(self.console.uri, resources_name, query_parms)
 
@@ -141,10 +142,10 @@ class UserRoleManager(BaseManager):
                     name=props.get(self._name_prop, None),
                     properties=props)
 
-                if matches_filters(resource_obj, client_filters):
+                if matches_filters(resource_obj, client_filter):
                     resource_obj_list.append(resource_obj)
-                    if full_properties:
-                        resource_obj.pull_full_properties()
+            if full_properties:
+                self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
@@ -26,11 +26,14 @@ except ImportError:
     # pylint: disable=deprecated-class
     from collections import Mapping, MutableSequence, Iterable
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from dateutil import parser
 import six
 import pytz
 from requests.utils import quote
 
+from ._scheduler import with_request_lane
+
 __all__ = ['datetime_from_timestamp', 'timestamp_from_datetime']
 
 
@@ -403,15 +406,21 @@ def matches_filters(obj, filter_args):
       obj (BaseResource):
         Resource object.
 
-      filter_args (dict):
+      filter_args (dict or :class:`Filter`):
         Filter arguments. For details, see :ref:`Filtering`.
         `None` causes the resource to always match.
 
+        If the same filter arguments are used for many resource objects,
+        passing a :class:`Filter` object avoids processing the
+        match values again for each resource object.
+
     Returns:
 
       bool: Boolean indicating whether the resource object matches the
         filter arguments.
     """
+    if isinstance(filter_args, Filter):
+        return filter_args.matches(obj)
     if filter_args is not None:
         for prop_name in filter_args:
             prop_match = filter_args[prop_name]
@@ -491,6 +500,229 @@ def matches_prop(obj, prop_name, prop_match):
     return False
 
 
+# Characters that have a special meaning in regular expressions. Match values
+# without any of these characters are matched by string comparison.
+_REGEXP_SPECIAL_CHARS = frozenset('.^$*+?{}[]\\|()')
+
+
+class _PropertyMatcher(object):
+    # pylint: disable=too-few-public-methods
+    """
+    The compiled match values of a single property in a :class:`Filter`.
+    """
+
+    def __init__(self, prop_match):
+        # Literal string match values, matched by string comparison
+        self.str_values = set()
+        # Compiled regexp match values for string property values
+        self.regexps = []
+        # Non-string match values, matched by value comparison
+        self.values = []
+        self._add(prop_match)
+
+    def _add(self, prop_match):
+        """Classify a match value, recursing into lists."""
+        if isinstance(prop_match, (list, tuple)):
+            for pm in prop_match:
+                self._add(pm)
+        elif isinstance(prop_match, six.string_types):
+            if _REGEXP_SPECIAL_CHARS.isdisjoint(prop_match):
+                self.str_values.add(prop_match)
+            else:
+                # See matches_prop() for why '$' is appended
+                self.regexps.append(re.compile(prop_match + '$'))
+        else:
+            self.values.append(prop_match)
+
+    def matches(self, prop_value):
+        """Return whether a property value matches the match values."""
+        if isinstance(prop_value, six.string_types):
+            if prop_value in self.str_values:
+                return True
+            for regexp in self.regexps:
+                if regexp.match(prop_value):
+                    return True
+            return False
+        for value in self.values:
+            if prop_value == value:
+                return True
+        return False
+
+
+class Filter(object):
+    """
+    A compiled form of filter arguments for client-side filtering of
+    resources.
+
+    The match values in the filter arguments are processed once when the
+    object is created: Regular expressions are compiled, match values that
+    contain no special regular expression characters are matched by string
+    comparison, and nested lists of match values are flattened. The object
+    can then be used to match any number of resources or property
+    dictionaries without processing the filter arguments again.
+
+    The matching rules are the same as described in :ref:`Filtering`.
+
+    This class is used internally by the `list()` methods of the resource
+    managers for their client-side filtering, and can be passed as the
+    `filter_args` parameter of :func:`matches_filters`. It is not part of the
+    external API of the zhmcclient package.
+    """
+
+    def __init__(self, filter_args):
+        """
+        Parameters:
+
+          filter_args (dict):
+            Filter arguments. For details, see :ref:`Filtering`.
+            `None` causes all resources to match.
+        """
+        self._filter_args = filter_args
+        self._matchers = []
+        if filter_args is not None:
+            for prop_name in filter_args:
+                matcher = _PropertyMatcher(filter_args[prop_name])
+                self._matchers.append((prop_name, matcher))
+
+    def __repr__(self):
+        return "{}(filter_args={!r})". \
+            format(self.__class__.__name__, self._filter_args)
+
+    @property
+    def filter_args(self):
+        """
+        dict: The filter arguments this object was created from. May be
+        `None`.
+        """
+        return self._filter_args
+
+    def matches(self, obj):
+        """
+        Return a boolean indicating whether a resource object matches the
+        filter arguments.
+
+        Depending on the properties specified in the filter arguments, this
+        method retrieves the resource properties from the HMC (see
+        :meth:`~zhmcclient.BaseResource.get_property`).
+
+        Parameters:
+
+          obj (:class:`~zhmcclient.BaseResource`):
+            Resource object.
+
+        Returns:
+
+          bool: Boolean indicating whether the resource object matches the
+          filter arguments.
+        """
+        for prop_name, matcher in self._matchers:
+            # If a filter property does not exist on a resource, the resource
+            # does not match.
+            try:
+                prop_value = obj.get_property(prop_name)
+            except KeyError:
+                return False
+            if not matcher.matches(prop_value):
+                return False
+        return True
+
+    def matches_properties(self, properties):
+        """
+        Return a boolean indicating whether a dictionary of resource
+        properties matches the filter arguments.
+
+        Parameters:
+
+          properties (dict):
+            Resource properties, with property names as keys and property
+            values as values.
+
+        Returns:
+
+          bool: Boolean indicating whether the resource properties match the
+          filter arguments. Properties specified in the filter arguments
+          that are not in the dictionary do not match.
+        """
+        for prop_name, matcher in self._matchers:
+            try:
+                prop_value = properties[prop_name]
+            except KeyError:
+                return False
+            if not matcher.matches(prop_value):
+                return False
+        return True
+
+
+def run_concurrently(func, items, max_workers, return_exceptions=False):
+    """
+    Call a function for each of a list of items, using up to a maximum number
+    of concurrently executing worker threads, and return the return values of
+    the function calls in the order of the items.
+
+    This is used for issuing multiple independent HMC requests concurrently.
+
+    Parameters:
+
+      func (callable): The function to be called. It is called with one
+        positional argument, namely the item.
+
+      items (iterable): The items.
+
+      max_workers (int): Maximum number of concurrently executing worker
+        threads. `None` or a value of 1 or less, or less than two items cause
+        the function to be called sequentially in the current thread.
+
+      return_exceptions (bool): Controls how exceptions raised by the function
+        are handled:
+
+        - If `False`, the exception raised for the first item in order of the
+          items is raised by this function. In the sequential case, the
+          function is not called for any subsequent items. In the concurrent
+          case, function calls that have not been started yet are cancelled,
+          and function calls that are executing are waited for.
+
+        - If `True`, the exception object is returned in place of the return
+          value for the item, and the function is called for all items.
+
+    Returns:
+
+      list: Return values (or exception objects) of the function calls, in
+        the order of the items.
+    """
+    items = list(items)
+    results = []
+
+    if not max_workers or max_workers <= 1 or len(items) <= 1:
+        for item in items:
+            if return_exceptions:
+                try:
+                    result = func(item)
+                except Exception as exc:  # pylint: disable=broad-except
+                    result = exc
+            else:
+                result = func(item)
+            results.append(result)
+        return results
+
+    # The worker threads issue their HMC requests in the request lane of the
+    # calling thread
+    func = with_request_lane(func)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) \
+            as executor:
+        futures = [executor.submit(func, item) for item in items]
+        for i, future in enumerate(futures):
+            exc = future.exception()
+            if exc is None:
+                results.append(future.result())
+            elif return_exceptions:
+                results.append(exc)
+            else:
+                for pending_future in futures[i + 1:]:
+                    pending_future.cancel()
+                future.result()  # Raises the exception
+    return results
+
+
 def datetime_from_isoformat(dt_str):
     """
     Return a datetime object representing the date time string in ISO8601
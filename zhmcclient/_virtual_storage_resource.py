@@ -55,7 +55,7 @@ import copy
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._logging import logged_api_call
-from ._utils import matches_filters, divide_filter_args, \
+from ._utils import matches_filters, Filter, divide_filter_args, \
     RC_VIRTUAL_STORAGE_RESOURCE
 
 __all__ = ['VirtualStorageResourceManager', 'VirtualStorageResource']
@@ -158,6 +158,7 @@ class VirtualStorageResourceManager(BaseManager):
         else:
             query_parms, client_filters = divide_filter_args(
                 self._query_props, filter_args)
+            client_filter = Filter(client_filters)
 
             resources_name = 'virtual-storage-resources'
             uri = '{}/{}{}'.format(self.storage_group.uri, resources_name,
@@ -174,7 +175,7 @@ class VirtualStorageResourceManager(BaseManager):
                         name=props.get(self._name_prop, None),
                         properties=props)
 
-                    if matches_filters(resource_obj, client_filters):
+                    if matches_filters(resource_obj, client_filter):
                         resource_obj_list.append(resource_obj)
                         if full_properties:
                             resource_obj.pull_full_properties()
@@ -32,7 +32,8 @@ import copy
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._logging import logged_api_call
-from ._utils import matches_filters, divide_filter_args, RC_VIRTUAL_SWITCH
+from ._utils import matches_filters, Filter, divide_filter_args, \
+    RC_VIRTUAL_SWITCH
 
 __all__ = ['VirtualSwitchManager', 'VirtualSwitch']
 
@@ -131,6 +132,7 @@ class VirtualSwitchManager(BaseManager):
         else:
             query_parms, client_filters = divide_filter_args(
                 self._query_props, filter_args)
+            client_filter = Filter(client_filters)
 
             resources_name = 'virtual-switches'
             uri = '{}/{}{}'.format(self.cpc.uri, resources_name, query_parms)
@@ -146,10 +148,10 @@ class VirtualSwitchManager(BaseManager):
                         name=props.get(self._name_prop, None),
                         properties=props)
 
-                    if matches_filters(resource_obj, client_filters):
+                    if matches_filters(resource_obj, client_filter):
                         resource_obj_list.append(resource_obj)
-                        if full_properties:
-                            resource_obj.pull_full_properties()
+                if full_properties:
+                    self._pull_full_properties(resource_obj_list)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
@@ -0,0 +1,667 @@
+# Copyright 2023 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The :class:`~zhmcclient.JobSet` and :class:`~zhmcclient.StatusWaiter` classes
+wait for the completion of many asynchronous HMC operations, or for many
+resources to reach a desired status, using a single background thread per
+object.
+
+This avoids the need for one thread per waited-for job or resource when
+operating on many resources at once. Completion is exposed as
+:class:`py:concurrent.futures.Future` objects, and as an iterator that
+returns the completed items in completion order.
+
+The background thread polls the pending items in rounds, with an interval
+between rounds that starts at the
+:attr:`~zhmcclient.RetryTimeoutConfig.poll_min_interval` attribute of the
+retry/timeout configuration of the session and is doubled after each round,
+up to its :attr:`~zhmcclient.RetryTimeoutConfig.poll_max_interval` attribute.
+The interval is reset when new items are added. If the session is
+subscribed for job updates (for :class:`~zhmcclient.JobSet`) or for
+auto-updating of resources (for :class:`~zhmcclient.StatusWaiter`), the
+corresponding HMC notifications cause the next round to happen right away.
+
+Example::
+
+    partitions = cpc.partitions.list()
+    with zhmcclient.JobSet(session) as job_set:
+        for partition in partitions:
+            job = partition.stop(wait_for_completion=False)
+            job_set.add(job)
+        for job, future in job_set.as_completed():
+            try:
+                future.result()
+            except zhmcclient.Error as exc:
+                print("Job {} failed: {}".format(job.uri, exc))
+"""
+
+from __future__ import absolute_import
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, as_completed, wait, FIRST_COMPLETED
+
+from ._exceptions import OperationTimeout, StatusTimeout, CeasedExistence
+from ._logging import logged_api_call
+from ._utils import run_concurrently
+
+__all__ = ['JobSet', 'StatusWaiter']
+
+
+class _WaitItem(object):
+    # pylint: disable=too-few-public-methods
+    """
+    A pending item of a waiter, with its future.
+    """
+
+    def __init__(self, obj, target, future, end_time):
+        self.obj = obj
+        self.target = target
+        self.future = future
+        self.end_time = end_time
+        self.updater = None
+
+
+class _BaseWaiter(object):
+    """
+    Base class for waiters that poll many items from a single background
+    thread.
+
+    Derived classes implement :meth:`_poll`, :meth:`_timeout_exc`, and may
+    implement :meth:`_wait_for_notification`, :meth:`_item_added` and
+    :meth:`_item_removed`.
+    """
+
+    def __init__(self, session, timeout):
+        self._session = session
+        self._timeout = timeout
+        self._cond = threading.Condition()
+        self._pending = []  # _WaitItem objects
+        self._futures = OrderedDict()  # key: future, value: added object
+        self._thread = None
+        self._closed = False
+        self._items_added = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def session(self):
+        """
+        :class:`~zhmcclient.Session`: Session with the HMC.
+        """
+        return self._session
+
+    def _add(self, obj, target, timeout):
+        """
+        Add an item to be waited for and return its future.
+        """
+        if timeout > 0:
+            end_time = time.time() + timeout
+        else:
+            end_time = None
+        future = Future()
+        item = _WaitItem(obj, target, future, end_time)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(
+                    "{} has been closed".format(self.__class__.__name__))
+            self._item_added(item)
+            self._pending.append(item)
+            self._futures[future] = obj
+            self._items_added = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+            self._cond.notify_all()
+        return future
+
+    @logged_api_call
+    def close(self):
+        """
+        Stop waiting, and stop the background thread.
+
+        The futures of the items that are still pending are cancelled. This
+        method returns after the background thread has finished its current
+        round.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with self._cond:
+            for item in self._pending:
+                self._item_removed(item)
+                item.future.cancel()
+            self._pending = []
+
+    @logged_api_call
+    def futures(self):
+        """
+        Return the futures of all items that have been added, in the order
+        in which they have been added.
+
+        Returns:
+
+          list of :class:`py:concurrent.futures.Future`: The futures.
+        """
+        with self._cond:
+            return list(self._futures)
+
+    @logged_api_call
+    def as_completed(self, timeout=None):
+        """
+        Iterate over the items that have been added so far, in the order in
+        which they complete.
+
+        Parameters:
+
+          timeout (:term:`number`): Maximum time in seconds to wait for all
+            items to complete. `None` means to wait without time limit.
+            If the timeout expires, :exc:`py:concurrent.futures.TimeoutError`
+            is raised by the iterator.
+
+        Returns:
+
+          iterator: An iterator that returns a tuple (obj, future) for each
+          completed item, where `obj` is the object that has been added and
+          `future` is its :class:`py:concurrent.futures.Future` object.
+        """
+        with self._cond:
+            futures = OrderedDict(self._futures)
+        for future in as_completed(futures, timeout=timeout):
+            yield futures[future], future
+
+    @logged_api_call
+    def wait(self, timeout=None):
+        """
+        Wait for all items that have been added so far to complete.
+
+        Parameters:
+
+          timeout (:term:`number`): Maximum time in seconds to wait.
+            `None` means to wait without time limit.
+
+        Returns:
+
+          tuple: A named 2-tuple of sets (done, not_done) of
+          :class:`py:concurrent.futures.Future` objects, as returned by
+          :func:`py:concurrent.futures.wait`.
+        """
+        with self._cond:
+            futures = list(self._futures)
+        return wait(futures, timeout=timeout)
+
+    def _run(self):
+        """
+        Body of the background thread.
+        """
+        rt_config = self._session.retry_timeout_config
+        poll_interval = rt_config.poll_min_interval
+        while True:
+            with self._cond:
+                while not self._closed and not self._pending:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                if self._items_added:
+                    self._items_added = False
+                    poll_interval = rt_config.poll_min_interval
+                items = [item for item in self._pending
+                         if not item.future.cancelled()]
+
+            done = self._poll(items)
+
+            now = time.time()
+            with self._cond:
+                still_pending = []
+                for item in self._pending:
+                    if item in done:
+                        outcome = done[item]
+                    elif item.future.cancelled():
+                        self._item_removed(item)
+                        continue
+                    elif item.end_time is not None and now > item.end_time:
+                        outcome = self._timeout_exc(item)
+                    else:
+                        still_pending.append(item)
+                        continue
+                    self._item_removed(item)
+                    if item.future.set_running_or_notify_cancel():
+                        if isinstance(outcome, Exception):
+                            item.future.set_exception(outcome)
+                        else:
+                            item.future.set_result(outcome)
+                self._pending = still_pending
+                if not still_pending or self._closed:
+                    continue
+                wait_time = poll_interval
+                end_times = [item.end_time for item in still_pending
+                             if item.end_time is not None]
+                if end_times:
+                    wait_time = min(wait_time, max(min(end_times) - now, 0))
+                if not self._wait_for_notification(still_pending, wait_time):
+                    self._cond.wait(wait_time)
+
+            poll_interval = min(poll_interval * 2, rt_config.poll_max_interval)
+
+    def _poll(self, items):
+        """
+        Poll the specified items once.
+
+        Returns:
+          dict: The completed items, with key: item, value: result object or
+          exception object.
+        """
+        raise NotImplementedError
+
+    def _timeout_exc(self, item):
+        """
+        Return the exception object for an item whose timeout has expired.
+        """
+        raise NotImplementedError
+
+    def _wait_for_notification(self, items, timeout):
+        # pylint: disable=unused-argument,no-self-use
+        """
+        Wait for a notification that may complete one of the specified items,
+        and return whether the waiting was performed.
+
+        Called with the condition lock of this waiter held.
+        """
+        return False
+
+    def _item_added(self, item):
+        """
+        Hook that is called when an item has been added.
+        """
+        pass
+
+    def _item_removed(self, item):
+        """
+        Hook that is called when an item is no longer pending.
+        """
+        pass
+
+
+class JobSet(_BaseWaiter):
+    """
+    A set of jobs on the HMC whose completion is waited for by a single
+    background thread.
+
+    Each job added to the set gets a :class:`py:concurrent.futures.Future`
+    object whose result is the result of the asynchronous HMC operation, as
+    returned by :meth:`zhmcclient.Job.wait_for_completion`. If the job
+    completed in error, the future has the :exc:`~zhmcclient.HTTPError`
+    exception. If the operation timeout expires, the future has an
+    :exc:`~zhmcclient.OperationTimeout` exception.
+
+    Completed jobs are deleted on the HMC, as in
+    :meth:`zhmcclient.Job.check_for_completion`.
+
+    The job status of all pending jobs is retrieved in each round, using up
+    to the number of concurrent HMC requests specified in the
+    :attr:`~zhmcclient.RetryTimeoutConfig.max_workers` attribute of the
+    retry/timeout configuration of the session.
+
+    A job set should be closed using :meth:`~zhmcclient.JobSet.close` when no
+    longer needed, or be used as a context manager.
+    """
+
+    def __init__(self, session, operation_timeout=None):
+        """
+        Parameters:
+
+          session (:class:`~zhmcclient.Session`):
+            Session with the HMC. The jobs added to the job set must have
+            been started with this session.
+
+          operation_timeout (:term:`number`):
+            Timeout in seconds, when waiting for completion of each job,
+            starting when the job is added. The special value 0 means that no
+            timeout is set. `None` means that the default async operation
+            timeout of the session is used.
+        """
+        if operation_timeout is None:
+            operation_timeout = \
+                session.retry_timeout_config.operation_timeout
+        super(JobSet, self).__init__(session, operation_timeout)
+
+    def __repr__(self):
+        """
+        Return a string with the state of this job set, for debug purposes.
+        """
+        ret = (
+            "{classname} at 0x{id:08x} (\n"
+            "  _session={s._session!r},\n"
+            "  _timeout={s._timeout!r},\n"
+            "  _closed={s._closed!r},\n"
+            "  pending jobs={num}\n"
+            ")".format(classname=self.__class__.__name__, id=id(self), s=self,
+                       num=len(self._pending)))
+        return ret
+
+    @logged_api_call
+    def add(self, job):
+        """
+        Add a job to the job set.
+
+        Parameters:
+
+          job (:class:`~zhmcclient.Job`): The job.
+
+        Returns:
+
+          :class:`py:concurrent.futures.Future`: The future for the result of
+          the asynchronous HMC operation performed by the job.
+
+        Raises:
+
+          RuntimeError: The job set has been closed.
+        """
+        return self._add(job, None, self._timeout)
+
+    def _poll(self, items):
+        max_workers = self._session.retry_timeout_config.max_workers
+        outcomes = run_concurrently(
+            lambda item: item.obj.check_for_completion(), items,
+            max_workers, return_exceptions=True)
+        done = {}
+        for item, outcome in zip(items, outcomes):
+            if isinstance(outcome, Exception):
+                done[item] = outcome
+            else:
+                job_status, op_result = outcome
+                if job_status == 'complete':
+                    done[item] = op_result
+        return done
+
+    def _timeout_exc(self, item):
+        return OperationTimeout(
+            "Waiting for completion of job {} timed out "
+            "(operation timeout: {} s)".format(item.obj.uri, self._timeout),
+            self._timeout)
+
+    def _wait_for_notification(self, items, timeout):
+        job_updater = self._session.job_updater
+        if not job_updater:
+            return False
+        # Release our lock while waiting, so that items can be added.
+        self._cond.release()
+        try:
+            notified = job_updater.wait_for_jobs(
+                [item.obj.uri for item in items], timeout)
+            # Consume the job completion notifications, so that the next wait
+            # falls back to the poll interval for jobs whose status is not yet
+            # 'complete'.
+            for job_uri in notified:
+                job_updater.forget_job(job_uri)
+        finally:
+            self._cond.acquire()
+        return True
+
+
+class StatusWaiter(_BaseWaiter):
+    """
+    A waiter for many resources to reach a desired status, using a single
+    background thread.
+
+    This can be used for resources that have a ``status`` property that is
+    returned by the ``list()`` method of their manager, e.g. for
+    :class:`~zhmcclient.Partition` and :class:`~zhmcclient.Lpar` resources.
+
+    Each resource added to the waiter gets a
+    :class:`py:concurrent.futures.Future` object whose result is the
+    reached status value. If the status timeout expires, the future has a
+    :exc:`~zhmcclient.StatusTimeout` exception. If the resource no longer
+    exists, the future has a :exc:`~zhmcclient.CeasedExistence` exception.
+
+    The status of the pending resources is retrieved in each round with one
+    ``list()`` call per resource manager, i.e. the status queries are
+    batched by parent resource (e.g. by CPC). The ``list()`` calls for
+    different managers are issued using up to the number of concurrent HMC
+    requests specified in the
+    :attr:`~zhmcclient.RetryTimeoutConfig.max_workers` attribute of the
+    retry/timeout configuration of the session.
+
+    A status waiter should be closed using
+    :meth:`~zhmcclient.StatusWaiter.close` when no longer needed, or be used
+    as a context manager.
+    """
+
+    def __init__(self, session, status_timeout=None):
+        """
+        Parameters:
+
+          session (:class:`~zhmcclient.Session`):
+            Session with the HMC. The resources added to the waiter must use
+            this session.
+
+          status_timeout (:term:`number`):
+            Timeout in seconds, for waiting that the status of each resource
+            has reached one of its desired status values, starting when the
+            resource is added. The special value 0 means that no timeout is
+            set. `None` means that the default status timeout of the session
+            is used.
+        """
+        if status_timeout is None:
+            status_timeout = session.retry_timeout_config.status_timeout
+        super(StatusWaiter, self).__init__(session, status_timeout)
+        # Last retrieved status, by resource URI
+        self._actual_status = {}
+
+    def __repr__(self):
+        """
+        Return a string with the state of this status waiter, for debug
+        purposes.
+        """
+        ret = (
+            "{classname} at 0x{id:08x} (\n"
+            "  _session={s._session!r},\n"
+            "  _timeout={s._timeout!r},\n"
+            "  _closed={s._closed!r},\n"
+            "  pending resources={num}\n"
+            ")".format(classname=self.__class__.__name__, id=id(self), s=self,
+                       num=len(self._pending)))
+        return ret
+
+    @logged_api_call
+    def add(self, resource, status):
+        """
+        Add a resource to the waiter.
+
+        Parameters:
+
+          resource (:class:`~zhmcclient.BaseResource`):
+            The resource, e.g. a :class:`~zhmcclient.Partition` object.
+
+          status (:term:`string` or iterable of :term:`string`):
+            Desired status or set of status values to reach.
+
+        Returns:
+
+          :class:`py:concurrent.futures.Future`: The future for the reached
+          status value.
+
+        Raises:
+
+          RuntimeError: The waiter has been closed.
+        """
+        if isinstance(status, (list, tuple)):
+            statuses = list(status)
+        else:
+            statuses = [status]
+        return self._add(resource, statuses, self._timeout)
+
+    def _poll(self, items):
+        managers = OrderedDict()  # key: id(manager), value: list of items
+        for item in items:
+            managers.setdefault(id(item.obj.manager), []).append(item)
+
+        def list_statuses(manager_items):
+            """Return the status values of the resources of a manager."""
+            manager = manager_items[0].obj.manager
+            return dict((res.uri, res.get_property('status'))
+                        for res in manager.list())
+
+        max_workers = self._session.retry_timeout_config.max_workers
+        outcomes = run_concurrently(
+            list_statuses, list(managers.values()), max_workers,
+            return_exceptions=True)
+        done = {}
+        for manager_items, outcome in zip(managers.values(), outcomes):
+            for item in manager_items:
+                if isinstance(outcome, Exception):
+                    done[item] = outcome
+                    continue
+                uri = item.obj.uri
+                if uri not in outcome:
+                    done[item] = CeasedExistence(uri)
+                    continue
+                actual_status = outcome[uri]
+                self._actual_status[uri] = actual_status
+                if actual_status in item.target:
+                    done[item] = actual_status
+        return done
+
+    def _timeout_exc(self, item):
+        actual_status = self._actual_status.get(item.obj.uri, None)
+        return StatusTimeout(
+            "Waiting for {} {} to reach status(es) '{}' timed out after {} s "
+            "- current status is '{}'".
+            format(item.obj.manager.class_name, item.obj.name, item.target,
+                   self._timeout, actual_status),
+            actual_status, item.target, self._timeout)
+
+    def _wait_for_notification(self, items, timeout):
+        updater = self._session.resource_updater
+        if not updater:
+            return False
+        targets = {}
+        for item in items:
+            targets.setdefault(item.obj.uri, []).extend(item.target)
+        # Release our lock while waiting, so that items can be added.
+        self._cond.release()
+        try:
+            updater.wait_for_statuses(targets, timeout)
+        finally:
+            self._cond.acquire()
+        return True
+
+    def _item_added(self, item):
+        updater = self._session.resource_updater
+        if updater:
+            updater.watch_status(item.obj.uri)
+            item.updater = updater
+
+    def _item_removed(self, item):
+        if item.updater:
+            item.updater.unwatch_status(item.obj.uri)
+
+
+def run_bulk_operation(session, resources, launch, statuses, max_parallel,
+                       operation_timeout, status_timeout):
+    """
+    Perform an asynchronous HMC operation on multiple resources, wait for
+    completion of the jobs and for the resources to reach a desired status,
+    and return the outcomes.
+
+    This is used to implement the bulk operations of resource managers, e.g.
+    :meth:`zhmcclient.PartitionManager.start_many`.
+
+    Parameters:
+
+      session (:class:`~zhmcclient.Session`): Session with the HMC.
+
+      resources (iterable of resource objects): The resources.
+
+      launch (callable): Function that is called with a resource as its only
+        argument, and that starts the operation on the resource and returns
+        the :class:`~zhmcclient.Job` object.
+
+      statuses (list of :term:`string`): Desired status values after the job
+        has completed.
+
+      max_parallel (:term:`integer`): Maximum number of operations that are in
+        progress at the same time (i.e. started, and not yet completed or
+        reached the desired status). `None` means that there is no limit.
+
+      operation_timeout (:term:`number`): Timeout for the jobs, see
+        :class:`~zhmcclient.JobSet`.
+
+      status_timeout (:term:`number`): Timeout for reaching the desired
+        status, see :class:`~zhmcclient.StatusWaiter`.
+
+    Returns:
+
+      list: One item for each resource, in the order of the resources. Each
+      item is either the reached status value, or the exception object for a
+      failed operation.
+    """
+    resources = list(resources)
+    outcomes = [None] * len(resources)
+    if max_parallel is None or max_parallel < 1:
+        max_parallel = len(resources)
+    max_workers = session.retry_timeout_config.max_workers
+    # In-progress operations, as:
+    #   dict(key: future, value: tuple(index of resource, waiting for status))
+    in_progress = {}
+    next_index = 0
+
+    with JobSet(session, operation_timeout) as job_set, \
+            StatusWaiter(session, status_timeout) as status_waiter:
+        while True:
+
+            # Start the operation on as many resources as permitted
+            num_launch = min(max_parallel - len(in_progress),
+                             len(resources) - next_index)
+            if num_launch > 0:
+                indexes = range(next_index, next_index + num_launch)
+                next_index += num_launch
+                jobs = run_concurrently(
+                    lambda i: launch(resources[i]), indexes, max_workers,
+                    return_exceptions=True)
+                for i, job in zip(indexes, jobs):
+                    if isinstance(job, Exception):
+                        outcomes[i] = job
+                    else:
+                        in_progress[job_set.add(job)] = (i, False)
+
+            if not in_progress:
+                if next_index >= len(resources):
+                    break
+                continue
+
+            done, _ = wait(list(in_progress), return_when=FIRST_COMPLETED)
+            for future in done:
+                i, waiting_for_status = in_progress.pop(future)
+                exc = future.exception()
+                if exc is not None:
+                    outcomes[i] = exc
+                elif waiting_for_status:
+                    outcomes[i] = future.result()
+                else:
+                    # The job has completed; now wait for the status
+                    status_future = status_waiter.add(resources[i], statuses)
+                    in_progress[status_future] = (i, True)
+
+    return outcomes
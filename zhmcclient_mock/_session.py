@@ -1106,6 +1106,84 @@ class FakedSession(zhmcclient.Session):
             new_exc.__cause__ = None
             raise new_exc  # zhmcclient.ConnectionError
 
+    def iter_get(self, uri, logon_required=True):
+        """
+        Perform the HTTP GET method against the resource identified by a URI,
+        for an operation whose response body is a JSON array, on the faked
+        HMC, and return an iterator over the array items.
+
+        The faked HMC returns the result as a whole, so this method does not
+        actually read the result incrementally.
+
+        Parameters:
+
+          uri (:term:`string`):
+            Relative URI path of the resource, e.g.
+            "/api/console/operations/get-audit-log".
+            This URI is relative to the base URL of the session (see
+            the :attr:`~zhmcclient.Session.base_url` property).
+            Must not be `None`.
+
+          logon_required (bool):
+            Boolean indicating whether the operation requires that the session
+            is logged on to the HMC.
+
+        Returns:
+
+          iterator of :term:`json object`: Iterator over the items of the JSON
+          array in the operation result.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError` (not implemented)
+          :exc:`~zhmcclient.AuthError` (not implemented)
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        result = self.get(uri, logon_required)
+        return iter(result or [])
+
+    def iter_post(self, uri, body=None, logon_required=True):
+        """
+        Perform the HTTP POST method against the resource identified by a URI,
+        for a synchronous operation whose response body is a JSON array, on
+        the faked HMC, and return an iterator over the array items.
+
+        The faked HMC returns the result as a whole, so this method does not
+        actually read the result incrementally.
+
+        Parameters:
+
+          uri (:term:`string`):
+            Relative URI path of the resource, e.g. "/api/services/inventory".
+            This URI is relative to the base URL of the session (see the
+            :attr:`~zhmcclient.Session.base_url` property).
+            Must not be `None`.
+
+          body (:term:`json object`):
+            JSON object to be used as the HTTP request body (payload).
+            `None` means the same as an empty dictionary, namely that no HTTP
+            body is included in the request.
+
+          logon_required (bool):
+            Boolean indicating whether the operation requires that the session
+            is logged on to the HMC.
+
+        Returns:
+
+          iterator of :term:`json object`: Iterator over the items of the JSON
+          array in the operation result.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError` (not implemented)
+          :exc:`~zhmcclient.AuthError` (not implemented)
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        result = self.post(uri, body, logon_required)
+        return iter(result or [])
+
     def delete(self, uri, logon_required=True):
         """
         Perform the HTTP DELETE method against the resource identified by a
@@ -254,6 +254,25 @@ def parse_query_parms(method, uri, query_str):
     return query_parms
 
 
+def get_additional_properties(filter_args):
+    """
+    Remove the 'additional-properties' query parameter from the filter
+    arguments returned by parse_query_parms(), and return the list of
+    property names specified in it (an empty list, if not specified).
+    """
+    if not filter_args:
+        return []
+    add_props = filter_args.pop('additional-properties', None)
+    if add_props is None:
+        return []
+    if not isinstance(add_props, list):
+        add_props = [add_props]
+    result = []
+    for item in add_props:
+        result.extend(item.split(','))
+    return result
+
+
 def check_required_fields(method, uri, body, field_names):
     """
     Check required fields in the request body.
@@ -419,10 +438,27 @@ class UriHandler(object):
         """
         if not hmc.enabled:
             raise ConnectionError("HMC is not enabled.")
-        handler_class, uri_parms = self.handler(uri, 'GET')
+        # The 'properties' query parameter of the 'Get <resource> Properties'
+        # operations is not part of the URI patterns of the resource handlers.
+        base_uri, _, query_str = uri.partition('?')
+        handler_class, uri_parms = self.handler(base_uri, 'GET')
+        if query_str and \
+                issubclass(handler_class, GenericGetPropertiesHandler):
+            uri = base_uri
+        else:
+            handler_class, uri_parms = self.handler(uri, 'GET')
+            query_str = None
         if not getattr(handler_class, 'get', None):
             raise InvalidMethodError('GET', uri, handler_class)
-        return handler_class.get('GET', hmc, uri, uri_parms, logon_required)
+        result = handler_class.get('GET', hmc, uri, uri_parms, logon_required)
+        if query_str:
+            query_parms = parse_query_parms('GET', uri, query_str)
+            names = query_parms.get('properties', None)
+            if names is not None:
+                names = names.split(',')
+                result = {name: value for name, value in result.items()
+                          if name in names}
+        return result
 
     def post(self, hmc, uri, body, logon_required, wait_for_completion):
         """
@@ -2392,10 +2428,12 @@ class PartitionsHandler(object):
         result_partitions = []
         if cpc.dpm_enabled:
             filter_args = parse_query_parms(method, uri, query_str)
+            add_props = get_additional_properties(filter_args)
             for partition in cpc.partitions.list(filter_args):
                 result_partition = {}
                 for prop in partition.properties:
-                    if prop in ('object-uri', 'name', 'status', 'type'):
+                    if prop in ('object-uri', 'name', 'status', 'type') or \
+                            prop in add_props:
                         result_partition[prop] = partition.properties[prop]
                 result_partitions.append(result_partition)
         return {'partitions': result_partitions}
@@ -3969,10 +4007,12 @@ class LparsHandler(object):
         result_lpars = []
         if not cpc.dpm_enabled:
             filter_args = parse_query_parms(method, uri, query_str)
+            add_props = get_additional_properties(filter_args)
             for lpar in cpc.lpars.list(filter_args):
                 result_lpar = {}
                 for prop in lpar.properties:
-                    if prop in ('object-uri', 'name', 'status'):
+                    if prop in ('object-uri', 'name', 'status') or \
+                            prop in add_props:
                         result_lpar[prop] = lpar.properties[prop]
                 result_lpars.append(result_lpar)
         return {'logical-partitions': result_lpars}